@@ -18,8 +18,12 @@ from src.config import (
     settings, 
     PROMPT_TYPE_HELP, 
     SUPPORTED_LLM_TYPES, 
-    SUPPORTED_EMBEDDING_TYPES
+    SUPPORTED_EMBEDDING_TYPES,
+    SUPPORTED_LLM_CACHE_MODES,
+    SUPPORTED_CI_METHODS,
+    SUPPORTED_STRATIFY_KEYS
 )
+from src.application.services.sequential_sampling import SequentialSamplingConfig
 from src.container import container
 from src.domain.prompts import PromptType
 from src.utils.paths import get_available_datasets, get_evaluation_data_path
@@ -46,12 +50,40 @@ def create_parser() -> argparse.ArgumentParser:
   # 한국어 기술 문서 프롬프트로 평가
   python cli.py evaluate evaluation_data.json --prompt-type korean_tech
   
+  # LLM 응답 캐시 없이 평가 (항상 API 호출)
+  python cli.py evaluate evaluation_data.json --llm-cache off
+  
+  # 이전 점수를 재사용하지 않고 전체 재평가
+  python cli.py evaluate evaluation_data.json --score-cache off
+  
+  # 누락된 답변을 8개씩 동시에 생성
+  python cli.py evaluate evaluation_data.json --generation-workers 8
+  
+  # 데이터셋을 4개 샤드로 나누어 프로세스별 병렬 평가
+  python cli.py evaluate evaluation_data.json --shards 4
+  
+  # 답변 생성과 평가를 겹쳐 실행 (생성된 항목부터 바로 평가)
+  python cli.py evaluate evaluation_data.json --streaming --generation-workers 4
+  
+  # ragas_score 95% 신뢰구간이 ±0.02 이내가 되면 조기 종료
+  python cli.py evaluate evaluation_data.json --target-ci 0.02 --stratify-by contexts
+  
+  # 30분이 지나면 남은 평가 요청을 중단 (해당 셀은 NaN과 사유로 기록)
+  python cli.py evaluate evaluation_data.json --deadline 1800
+  
+  # 프로바이더 요청/응답을 카세트에 기록한 뒤 네트워크 없이 같은 실행을 재현 (지연 시간 배율 0.5)
+  python cli.py evaluate evaluation_data.json --record-cassette data/cassettes/run.jsonl
+  python cli.py evaluate evaluation_data.json --replay-cassette data/cassettes/run.jsonl --replay-latency-scale 0.5
+  
   # 평가 결과 고급 통계 분석
   python cli.py analyze-results results.json --analysis-type all
   
   # 여러 평가 결과 비교 분석
   python cli.py compare-results model1.json model2.json --labels "Model A" "Model B"
   
+  # 답변만 다른 데이터셋 변형 A/B 비교 (컨텍스트 메트릭은 한 번만 계산)
+  python cli.py compare-variants evaluation_data.json evaluation_data_variant1.json
+  
   # 사용 가능한 데이터셋 목록 보기
   python cli.py list-datasets
   
@@ -90,6 +122,103 @@ def create_parser() -> argparse.ArgumentParser:
         "--output",
         help="결과를 저장할 파일 경로 (선택사항)"
     )
+    eval_parser.add_argument(
+        "--llm-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"LLM 응답 캐시 모드 (기본값: {settings.LLM_CACHE_MODE})"
+    )
+    eval_parser.add_argument(
+        "--score-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"샘플별 점수 캐시 모드 - 변경된 행만 재평가 (기본값: {settings.SCORE_CACHE_MODE})"
+    )
+    eval_parser.add_argument(
+        "--artifact-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"메트릭 간 중간 산출물(문장 분해, 역생성 질문, 임베딩) 공유 모드 (기본값: {settings.ARTIFACT_CACHE_MODE})"
+    )
+    eval_parser.add_argument(
+        "--embedding-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"임베딩 벡터 캐시 모드 - 같은 텍스트는 실행 간에 다시 임베딩하지 않음 (기본값: {settings.EMBEDDING_CACHE_MODE})"
+    )
+    eval_parser.add_argument(
+        "--generation-workers",
+        type=int,
+        default=None,
+        help=f"누락된 답변을 동시에 생성할 워커 수 (기본값: {settings.GENERATION_MAX_WORKERS})"
+    )
+    eval_parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help=f"데이터셋을 나누어 별도 프로세스에서 평가할 샤드 수 (기본값: {settings.EVALUATION_SHARDS})"
+    )
+    eval_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=None,
+        help="답변 생성과 평가를 겹쳐 실행하는 스트리밍 파이프라인 사용"
+    )
+    eval_parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="전체 실행 마감 시간(초) - 지나면 남은 평가 요청을 중단하고 해당 셀을 NaN으로 기록"
+    )
+    cassette_group = eval_parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record-cassette",
+        metavar="PATH",
+        default=None,
+        help="프로바이더 요청/응답과 지연 시간을 카세트 파일(JSONL)에 기록"
+    )
+    cassette_group.add_argument(
+        "--replay-cassette",
+        metavar="PATH",
+        default=None,
+        help="네트워크 없이 카세트 파일의 응답으로 평가 실행 재현 (LLM/점수/임베딩 캐시는 미지정 시 off)"
+    )
+    eval_parser.add_argument(
+        "--replay-latency-scale",
+        type=float,
+        default=None,
+        help=f"재생 시 기록된 응답 지연 시간 배율, 0이면 지연 없음 (기본값: {settings.CASSETTE_LATENCY_SCALE})"
+    )
+    eval_parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=None,
+        help="신뢰구간 반폭 목표 (예: 0.02) - 지정하면 무작위 순서로 평가하다 목표 도달 시 조기 종료"
+    )
+    eval_parser.add_argument(
+        "--ci-metrics",
+        nargs="+",
+        default=["ragas_score"],
+        help="목표 신뢰구간을 적용할 메트릭 (기본값: ragas_score)"
+    )
+    eval_parser.add_argument(
+        "--ci-method",
+        choices=SUPPORTED_CI_METHODS,
+        default="t",
+        help="신뢰구간 계산 방법 (기본값: t)"
+    )
+    eval_parser.add_argument(
+        "--stratify-by",
+        choices=SUPPORTED_STRATIFY_KEYS,
+        default=None,
+        help="층화 표본 추출 기준 (기본값: 단순 무작위)"
+    )
+    eval_parser.add_argument(
+        "--sample-seed",
+        type=int,
+        default=42,
+        help="표본 추출 순서 시드 (기본값: 42)"
+    )
     eval_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -172,6 +301,54 @@ def create_parser() -> argparse.ArgumentParser:
         default="quick_results",
         help="결과 저장 디렉토리 (기본값: quick_results)"
     )
+    quick_parser.add_argument(
+        "--llm-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"LLM 응답 캐시 모드 (기본값: {settings.LLM_CACHE_MODE})"
+    )
+    quick_parser.add_argument(
+        "--score-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"샘플별 점수 캐시 모드 - 변경된 행만 재평가 (기본값: {settings.SCORE_CACHE_MODE})"
+    )
+    quick_parser.add_argument(
+        "--artifact-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"메트릭 간 중간 산출물(문장 분해, 역생성 질문, 임베딩) 공유 모드 (기본값: {settings.ARTIFACT_CACHE_MODE})"
+    )
+    quick_parser.add_argument(
+        "--embedding-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"임베딩 벡터 캐시 모드 - 같은 텍스트는 실행 간에 다시 임베딩하지 않음 (기본값: {settings.EMBEDDING_CACHE_MODE})"
+    )
+    quick_parser.add_argument(
+        "--generation-workers",
+        type=int,
+        default=None,
+        help=f"누락된 답변을 동시에 생성할 워커 수 (기본값: {settings.GENERATION_MAX_WORKERS})"
+    )
+    quick_parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help=f"데이터셋을 나누어 별도 프로세스에서 평가할 샤드 수 (기본값: {settings.EVALUATION_SHARDS})"
+    )
+    quick_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=None,
+        help="답변 생성과 평가를 겹쳐 실행하는 스트리밍 파이프라인 사용"
+    )
+    quick_parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="전체 실행 마감 시간(초) - 지나면 남은 평가 요청을 중단하고 해당 셀을 NaN으로 기록"
+    )
     quick_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -219,6 +396,56 @@ def create_parser() -> argparse.ArgumentParser:
         help="각 결과 파일의 라벨 (미지정 시 파일명 사용)"
     )
     
+    # compare-variants 서브커맨드
+    variants_parser = subparsers.add_parser(
+        "compare-variants",
+        help="답변 변형 데이터셋 A/B/n 평가 및 비교 (답변과 무관한 메트릭 재사용)"
+    )
+    variants_parser.add_argument(
+        "datasets",
+        nargs="+",
+        help="비교할 데이터셋들 (첫 번째가 기준)"
+    )
+    variants_parser.add_argument(
+        "--llm",
+        choices=SUPPORTED_LLM_TYPES,
+        default=settings.DEFAULT_LLM,
+        help=f"평가에 사용할 LLM (기본값: {settings.DEFAULT_LLM})"
+    )
+    variants_parser.add_argument(
+        "--embedding",
+        choices=SUPPORTED_EMBEDDING_TYPES,
+        default=None,
+        help=f"평가에 사용할 임베딩 모델 (기본값: {settings.DEFAULT_EMBEDDING})"
+    )
+    variants_parser.add_argument(
+        "--prompt-type",
+        choices=[pt.value for pt in PromptType],
+        default=None,
+        help="사용할 프롬프트 타입"
+    )
+    variants_parser.add_argument(
+        "--labels",
+        nargs="*",
+        help="각 변형의 라벨 (미지정 시 파일명 사용)"
+    )
+    variants_parser.add_argument(
+        "--output-dir",
+        default="comparison_results",
+        help="평가 및 비교 결과 저장 디렉토리 (기본값: comparison_results)"
+    )
+    variants_parser.add_argument(
+        "--llm-cache",
+        choices=SUPPORTED_LLM_CACHE_MODES,
+        default=None,
+        help=f"LLM 응답 캐시 모드 (기본값: {settings.LLM_CACHE_MODE})"
+    )
+    variants_parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="상세한 로그 출력"
+    )
+    
     return parser
 
 
@@ -361,8 +588,60 @@ def import_data(input_file: str, output_file: Optional[str] = None,
 
 def evaluate_dataset(dataset_name: str, llm: str, embedding: Optional[str] = None, 
                     prompt_type: Optional[str] = None, output_file: Optional[str] = None, 
-                    verbose: bool = False):
+                    verbose: bool = False, llm_cache: Optional[str] = None,
+                    generation_workers: Optional[int] = None, score_cache: Optional[str] = None,
+                    shards: Optional[int] = None, streaming: Optional[bool] = None,
+                    sampling: Optional[SequentialSamplingConfig] = None,
+                    deadline: Optional[float] = None, artifact_cache: Optional[str] = None,
+                    embedding_cache: Optional[str] = None,
+                    cassette_mode: Optional[str] = None, cassette_path: Optional[str] = None,
+                    cassette_latency_scale: Optional[float] = None):
     """데이터셋 평가 실행"""
+    from src.infrastructure.cache import (
+        configure_artifact_store,
+        configure_embedding_cache,
+        configure_llm_cache,
+        configure_score_cache,
+        get_artifact_store,
+        get_embedding_cache,
+        get_llm_cache,
+        get_score_cache,
+    )
+    from src.infrastructure.network import (
+        configure_cassette,
+        get_transport,
+        print_rate_limiter_stats,
+        run_deadline_scope,
+    )
+    from src.infrastructure.llm.json_repair import get_json_repair_stats
+    from src.infrastructure.llm.output_budget import get_output_budget_stats
+    
+    # 카세트 기록/재생 - 캐시 적중 요청은 기록/재생되지 않으므로 미지정 캐시는 끔
+    if cassette_mode:
+        llm_cache = llm_cache or "off"
+        score_cache = score_cache or "off"
+        embedding_cache = embedding_cache or "off"
+        artifact_cache = artifact_cache or "off"
+        try:
+            configure_cassette(
+                cassette_mode,
+                cassette_path or settings.CASSETTE_PATH,
+                settings.CASSETTE_LATENCY_SCALE if cassette_latency_scale is None else cassette_latency_scale,
+            )
+        except FileNotFoundError:
+            print(f"❌ 카세트 파일을 찾을 수 없습니다: {cassette_path or settings.CASSETTE_PATH}")
+            return False
+        print(f"📼 카세트 {cassette_mode}: {cassette_path or settings.CASSETTE_PATH}")
+
+    # LLM 응답 캐시 모드 설정 (미지정 시 설정 파일 값 사용)
+    if llm_cache:
+        configure_llm_cache(llm_cache)
+    if score_cache:
+        configure_score_cache(score_cache)
+    if artifact_cache:
+        configure_artifact_store(artifact_cache)
+    if embedding_cache:
+        configure_embedding_cache(embedding_cache)
     
     # CSV/Excel 파일인 경우 자동 변환
     if dataset_name.endswith(('.csv', '.xlsx', '.xls')):
@@ -414,7 +693,11 @@ def evaluate_dataset(dataset_name: str, llm: str, embedding: Optional[str] = Non
         request = EvaluationRequest(
             llm_type=llm,
             embedding_type=embedding_choice,
-            prompt_type=PromptType(prompt_type) if prompt_type else settings.get_prompt_type()
+            prompt_type=PromptType(prompt_type) if prompt_type else settings.get_prompt_type(),
+            generation_workers=generation_workers,
+            shards=shards,
+            streaming=streaming,
+            sampling=sampling
         )
         
         evaluation_use_case, _, _ = container.create_evaluation_use_case(request)
@@ -450,9 +733,14 @@ def evaluate_dataset(dataset_name: str, llm: str, embedding: Optional[str] = Non
             
         print(f"📊 데이터셋: {dataset_name}")
 
-        result = evaluation_use_case.execute(
-            dataset_name=dataset_name,
-        )
+        # 전체 실행 마감 시간 설정 (모든 HTTP 요청과 평가 셀 타임아웃이 남은 시간 이하로 제한됨)
+        run_deadline = deadline if deadline is not None else settings.EVALUATION_RUN_DEADLINE
+        if run_deadline:
+            print(f"⏱️ 전체 실행 마감 시간: {run_deadline:.0f}초")
+        with run_deadline_scope(run_deadline):
+            result = evaluation_use_case.execute(
+                dataset_name=dataset_name,
+            )
         
         if not result:
             print("❌ 평가 실행에 실패했습니다.")
@@ -472,7 +760,24 @@ def evaluate_dataset(dataset_name: str, llm: str, embedding: Optional[str] = Non
         if hasattr(result, 'answer_correctness') and result.answer_correctness is not None:
             print(f"answer_correctness: {result.answer_correctness:.4f}")
         
+        sampling_info = (result.metadata or {}).get("sequential_sampling")
+        if sampling_info:
+            print(
+                f"🎲 순차 표본: {sampling_info['evaluated_rows']}/{sampling_info['total_rows']}개 행 평가 "
+                f"({sampling_info['confidence']:.0%} 신뢰구간)"
+            )
+            for name, interval in sampling_info["confidence_intervals"].items():
+                print(f"   {name}: {interval['mean']:.4f} [{interval['lower']:.4f}, {interval['upper']:.4f}]")
+        
         print("="*50)
+        get_llm_cache().print_stats()
+        get_score_cache().print_stats()
+        get_artifact_store().print_stats()
+        get_embedding_cache().print_stats()
+        get_json_repair_stats().print_stats()
+        get_output_budget_stats().print_stats()
+        print_rate_limiter_stats()
+        get_transport().print_stats()
 
         # 자동 보고서 생성
         from src.application.services.result_exporter import ResultExporter
@@ -866,7 +1171,15 @@ def quick_eval(args):
             embedding="bge_m3",
             prompt_type=None,
             output_file=str(result_path),
-            verbose=args.verbose
+            verbose=args.verbose,
+            llm_cache=args.llm_cache,
+            generation_workers=args.generation_workers,
+            score_cache=args.score_cache,
+            shards=args.shards,
+            streaming=args.streaming,
+            deadline=args.deadline,
+            artifact_cache=args.artifact_cache,
+            embedding_cache=args.embedding_cache
         )
         
         if not success:
@@ -941,13 +1254,34 @@ def main():
         list_prompts()
         
     elif args.command == "evaluate":
+        sampling = None
+        if args.target_ci:
+            sampling = SequentialSamplingConfig(
+                target_half_width=args.target_ci,
+                metrics=args.ci_metrics,
+                method=args.ci_method,
+                stratify_by=args.stratify_by,
+                seed=args.sample_seed
+            )
         success = evaluate_dataset(
             dataset_name=args.dataset,
             llm=args.llm,
             embedding=args.embedding,
             prompt_type=args.prompt_type,
             output_file=args.output,
-            verbose=args.verbose
+            verbose=args.verbose,
+            llm_cache=args.llm_cache,
+            generation_workers=args.generation_workers,
+            score_cache=args.score_cache,
+            shards=args.shards,
+            streaming=args.streaming,
+            sampling=sampling,
+            deadline=args.deadline,
+            artifact_cache=args.artifact_cache,
+            embedding_cache=args.embedding_cache,
+            cassette_mode="record" if args.record_cassette else "replay" if args.replay_cassette else None,
+            cassette_path=args.record_cassette or args.replay_cassette,
+            cassette_latency_scale=args.replay_latency_scale
         )
         if not success:
             sys.exit(1)
@@ -995,6 +1329,11 @@ def main():
         if not success:
             sys.exit(1)
     
+    elif args.command == "compare-variants":
+        success = compare_variants(args)
+        if not success:
+            sys.exit(1)
+    
     else:
         print(f"❌ 알 수 없는 명령어: {args.command}")
         parser.print_help()
@@ -1092,6 +1431,70 @@ def compare_results(args) -> bool:
         return False
 
 
+def compare_variants(args) -> bool:
+    """답변 변형 데이터셋 A/B/n 평가 후 비교 분석
+
+    점수 캐시 키가 메트릭이 의존하는 필드만 포함하므로, 첫 번째 변형에서 계산한
+    컨텍스트 메트릭(context_recall, context_precision)은 이후 변형에서 재사용되고
+    답변에 의존하는 메트릭만 변형마다 새로 계산됩니다.
+    """
+    from src.infrastructure.cache import configure_score_cache, get_score_cache
+
+    try:
+        if args.labels and len(args.labels) == len(args.datasets):
+            labels = args.labels
+        else:
+            labels = [Path(d).stem for d in args.datasets]
+
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(exist_ok=True)
+
+        # 변형 간 점수 재사용을 위해 점수 캐시는 항상 읽기/쓰기로 사용
+        if not get_score_cache().writable:
+            print("ℹ️ 변형 간 점수 재사용을 위해 점수 캐시를 read-write 모드로 전환합니다.")
+            configure_score_cache("read-write")
+
+        print(f"🔀 {len(args.datasets)}개 변형 평가: {', '.join(labels)}")
+        results_data = []
+        for dataset_name, label in zip(args.datasets, labels, strict=True):
+            print(f"\n{'=' * 50}\n🧪 변형 평가: {label} ({dataset_name})\n{'=' * 50}")
+            cache = get_score_cache()
+            hits_before, misses_before = cache.hits, cache.misses
+            result_path = output_dir / f"{label}.json"
+
+            success = evaluate_dataset(
+                dataset_name=dataset_name,
+                llm=args.llm,
+                embedding=args.embedding,
+                prompt_type=args.prompt_type,
+                output_file=str(result_path),
+                verbose=args.verbose,
+                llm_cache=args.llm_cache
+            )
+            if not success:
+                print(f"❌ 변형 '{label}' 평가 실패")
+                return False
+
+            print(
+                f"♻️ {label}: 점수 {cache.hits - hits_before}건 재사용, "
+                f"{cache.misses - misses_before}건 계산"
+            )
+            with open(result_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data['label'] = label
+            results_data.append(data)
+
+        comparison_stats = perform_comparison_analysis(results_data)
+        save_comparison_analysis(comparison_stats, output_dir, labels)
+
+        print(f"\n✅ 변형 비교 완료! 결과가 {output_dir}에 저장되었습니다.")
+        return True
+
+    except Exception as e:
+        print(f"❌ 변형 비교 중 오류 발생: {e}")
+        return False
+
+
 def perform_basic_analysis(result_data: dict, individual_scores: list) -> dict:
     """기초 통계 분석 수행"""
     print("  📋 메트릭별 기초 통계 계산 중...")
@@ -177,6 +177,60 @@ def prepare_bge_m3_model(force_download=False):
         print("   3. sentence-transformers 설치: uv pip install sentence-transformers")
         return False
 
+def prepare_bge_m3_onnx(force_export=False, quantize=True):
+    """BGE-M3 모델을 ONNX로 내보내고 PyTorch 백엔드와의 일치도 검증 (CPU 전용 서버용)"""
+    print("\n⚡ BGE-M3 ONNX 내보내기")
+    print("=" * 40)
+    
+    bge_m3_dir = Path("models") / "bge-m3"
+    onnx_dir = Path("models") / "bge-m3-onnx"
+    
+    try:
+        from src.config import settings
+        from src.infrastructure.embedding.bge_m3_onnx import check_onnx_export, export_bge_m3_onnx
+    except ImportError as e:
+        print(f"❌ 모듈 임포트 실패: {e}")
+        return False
+    
+    # 이미 내보냈고 현재 기준(BGE_M3_ONNX_MIN_COSINE)을 만족하면 건너뜀
+    if not force_export:
+        try:
+            validation = check_onnx_export(onnx_dir, settings.BGE_M3_ONNX_MIN_COSINE)["validation"]
+            print(f"✅ ONNX 모델이 이미 존재: {onnx_dir} (최소 코사인 {validation.get('min_cosine')})")
+            return True
+        except (FileNotFoundError, ValueError):
+            pass
+    
+    try:
+        import onnxruntime  # noqa: F401
+        import onnx  # noqa: F401
+    except ImportError:
+        print("❌ onnxruntime/onnx가 설치되지 않음")
+        print("💡 설치 명령어: uv pip install -e '.[onnx]'")
+        return False
+    
+    model_path = str(bge_m3_dir) if bge_m3_dir.exists() else "BAAI/bge-m3"
+    try:
+        config = export_bge_m3_onnx(
+            model_path,
+            onnx_dir,
+            quantize=quantize,
+            min_cosine=settings.BGE_M3_ONNX_MIN_COSINE,
+        )
+    except Exception as e:
+        print(f"❌ ONNX 내보내기 실패: {e}")
+        print("💡 해결 방법:")
+        print("   1. BGE-M3 모델 준비: python hello.py --prepare-models")
+        print("   2. 디스크 공간 확인 (fp32 ONNX 약 2.2GB + int8 약 0.6GB)")
+        return False
+    
+    if not config["validation"]["passed"]:
+        print("❌ ONNX 모델이 PyTorch 백엔드와의 일치도 기준을 통과하지 못했습니다.")
+        if quantize:
+            print("💡 양자화 없이 다시 내보내기: python hello.py --export-onnx --no-quantize --force-download")
+        return False
+    return True
+
 def detect_best_device():
     """최적의 디바이스 자동 감지"""
     try:
@@ -205,7 +259,11 @@ def main():
     parser.add_argument("--prepare-models", action="store_true", 
                        help="BGE-M3 모델 자동 다운로드")
     parser.add_argument("--force-download", action="store_true",
-                       help="기존 모델이 있어도 강제로 다시 다운로드")
+                       help="기존 모델(ONNX 내보내기 포함)이 있어도 강제로 다시 생성")
+    parser.add_argument("--export-onnx", action="store_true",
+                       help="BGE-M3 모델을 ONNX Runtime 백엔드용으로 내보내고 PyTorch 결과와 일치도 검증")
+    parser.add_argument("--no-quantize", action="store_true",
+                       help="ONNX 내보내기 시 int8 동적 양자화 생략")
     parser.add_argument("--skip-tests", action="store_true",
                        help="환경 테스트 건너뛰고 모델만 다운로드")
     
@@ -236,12 +294,29 @@ def main():
                 print("❌ BGE-M3 모델 준비 실패")
                 sys.exit(1)
         
+        # BGE-M3 ONNX 내보내기
+        if args.export_onnx:
+            success = prepare_bge_m3_onnx(
+                force_export=args.force_download,
+                quantize=not args.no_quantize,
+            )
+            if success:
+                update_env_values({
+                    "BGE_M3_BACKEND": "onnx",
+                    "BGE_M3_ONNX_PATH": "./models/bge-m3-onnx",
+                })
+            else:
+                print("❌ BGE-M3 ONNX 내보내기 실패")
+                sys.exit(1)
+        
         if not args.skip_tests:
             print("\n🎉 테스트 완료!")
         
         print("\n📋 다음 단계:")
         if not args.prepare_models:
             print("• BGE-M3 모델 준비: python hello.py --prepare-models")
+        if not args.export_onnx:
+            print("• CPU 전용 서버 BGE-M3 가속: python hello.py --export-onnx")
         print("• .env 파일에 API 키 설정")
         print("• 웹 대시보드 실행: uv run streamlit run src/presentation/web/main.py")
         print("• CLI 평가 실행: uv run python cli.py evaluate evaluation_data --embedding bge_m3")
@@ -293,5 +368,36 @@ def update_env_for_local_bge_m3():
     print(f"   DEFAULT_EMBEDDING='bge_m3'")
     print("💡 이제 BGE-M3 로컬 모델을 사용할 수 있습니다!")
 
+def update_env_values(values):
+    """.env 파일의 설정값 갱신 (없는 키는 추가)"""
+    print("\n⚙️  .env 파일 업데이트")
+    print("=" * 40)
+    
+    env_path = Path(".env")
+    if not env_path.exists():
+        print("❌ .env 파일이 없습니다. 먼저 .env 파일을 생성하세요.")
+        return
+    
+    with open(env_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    
+    remaining = dict(values)
+    new_lines = []
+    for line in lines:
+        key = line.lstrip('# ').split('=', 1)[0].strip()
+        if '=' in line and key in remaining:
+            new_lines.append(f'{key}="{remaining.pop(key)}"\n')
+        else:
+            new_lines.append(line)
+    for key, value in remaining.items():
+        new_lines.append(f'{key}="{value}"\n')
+    
+    with open(env_path, 'w', encoding='utf-8') as f:
+        f.writelines(new_lines)
+    
+    print("✅ .env 파일 업데이트 완료")
+    for key, value in values.items():
+        print(f"   {key}='{value}'")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+BGE-M3 문서 임베딩 배치 방식 처리량 비교
+기존 고정 배치(입력 전체를 batch_size 16/32/64, 모델 기본 최대 길이로 인코딩)와
+토큰 길이순 버킷 + 토큰 예산 배치(BgeM3EmbeddingAdapter.embed_documents)의 docs/sec를 측정합니다.
+
+사용 예:
+    uv run python scripts/benchmark_bge_m3_batching.py
+    uv run python scripts/benchmark_bge_m3_batching.py data/korean_tech_evaluation_converted_*.json \\
+        --max-seq-length 1024 --token-budget 8192 --repeat 20
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.config import settings
+from src.infrastructure.embedding.bge_m3_adapter import BgeM3EmbeddingAdapter
+from src.infrastructure.embedding.bge_m3_onnx import cosine_agreement
+from src.infrastructure.embedding.length_buckets import padded_tokens, plan_token_batches
+
+DEFAULT_DATASETS = [
+    "data/korean_tech_evaluation_converted_*.json",
+    "data/evaluation_data.json",
+]
+
+# 기존 embed_documents의 디바이스별 고정 배치 크기
+LEGACY_BATCH_SIZES = {"cuda": 64, "mps": 32, "cpu": 16}
+
+
+def load_texts(patterns: List[str]) -> List[str]:
+    """평가 데이터셋의 질문, 컨텍스트, 답변, 정답을 임베딩 대상 텍스트로 수집 (중복 제거)"""
+    texts = []
+    for pattern in patterns:
+        paths = sorted(project_root.glob(pattern)) if not Path(pattern).is_absolute() else [Path(pattern)]
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                for item in json.load(f):
+                    texts.append(item["question"])
+                    texts.extend(item.get("contexts", []))
+                    texts.append(item.get("answer", ""))
+                    texts.append(item.get("ground_truth", ""))
+    return [text for text in dict.fromkeys(texts) if text]
+
+
+def legacy_batches(texts: List[str], batch_size: int) -> List[List[int]]:
+    """sentence-transformers 고정 배치 (문자 수 역순 정렬 후 batch_size개씩)"""
+    order = sorted(range(len(texts)), key=lambda index: -len(texts[index]))
+    return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+
+def report(name: str, docs: int, seconds: float, lengths: List[int], batches: List[List[int]]):
+    padded = padded_tokens(lengths, batches)
+    print(f"{name:<10} {docs:>6} {len(batches):>7} {seconds:>9.2f} {docs / seconds:>10.1f} "
+          f"{padded:>12,} {sum(lengths) / padded if padded else 1:>8.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BGE-M3 길이별 배치 처리량 비교")
+    parser.add_argument("datasets", nargs="*", default=DEFAULT_DATASETS, help="평가 데이터 JSON 경로 (glob 가능)")
+    parser.add_argument("--model-path", default=settings.BGE_M3_MODEL_PATH, help="BGE-M3 모델 경로")
+    parser.add_argument("--device", default=settings.BGE_M3_DEVICE, help="실행 디바이스 (cpu, cuda, mps)")
+    parser.add_argument("--backend", default=settings.BGE_M3_BACKEND, help="추론 백엔드 (torch, onnx)")
+    parser.add_argument("--max-seq-length", type=int, default=settings.BGE_M3_MAX_SEQ_LENGTH,
+                        help="버킷 배치의 최대 토큰 수 (기본값: 모델 기본값)")
+    parser.add_argument("--token-budget", type=int, default=settings.BGE_M3_BATCH_TOKEN_BUDGET,
+                        help="배치당 패딩 포함 최대 토큰 수 (기본값: 디바이스별)")
+    parser.add_argument("--repeat", type=int, default=1, help="텍스트 목록 반복 횟수 (작은 데이터셋 확대용)")
+    args = parser.parse_args()
+
+    texts = load_texts(args.datasets) * args.repeat
+    if not texts:
+        print("❌ 임베딩할 텍스트가 없습니다.")
+        return 1
+
+    adapter = BgeM3EmbeddingAdapter(
+        model_path=args.model_path,
+        device=args.device,
+        backend=args.backend,
+        onnx_path=settings.BGE_M3_ONNX_PATH,
+        batch_token_budget=args.token_budget,
+    )
+    adapter._ensure_model_loaded()
+    model = adapter.model
+    default_max_length = model.max_seq_length
+
+    # 워밍업 (첫 호출의 그래프 준비 시간 제외)
+    model.encode(texts[:4], show_progress_bar=False, normalize_embeddings=True)
+
+    print(f"\n📚 텍스트 {len(texts)}개, 디바이스 {adapter.device}, 백엔드 {adapter.backend}")
+    print(f"{'방식':<10} {'docs':>6} {'batches':>7} {'seconds':>9} {'docs/sec':>10} {'padded_tok':>12} {'효율':>8}")
+
+    legacy_size = LEGACY_BATCH_SIZES.get(adapter.device, 16)
+    lengths = adapter._token_lengths(texts)
+    start = time.perf_counter()
+    legacy = model.encode(texts, batch_size=legacy_size, show_progress_bar=False, normalize_embeddings=True)
+    report("fixed", len(texts), time.perf_counter() - start, lengths, legacy_batches(texts, legacy_size))
+
+    adapter.max_seq_length = args.max_seq_length
+    adapter._apply_max_seq_length()
+    lengths = adapter._token_lengths(texts)
+    max_batch_size, token_budget = adapter._batch_limits()
+    start = time.perf_counter()
+    bucketed = adapter.embed_documents(texts)
+    report("bucketed", len(texts), time.perf_counter() - start, lengths,
+           plan_token_batches(lengths, token_budget, max_batch_size))
+
+    agreement = cosine_agreement(np.asarray(legacy), np.asarray(bucketed))
+    print(f"\n📐 최대 길이 {default_max_length} → {model.max_seq_length}, 토큰 예산 {token_budget}, 최대 배치 {max_batch_size}")
+    print(f"🔍 고정 배치 대비 코사인 일치도: 최소 {agreement.min():.5f}, 평균 {agreement.mean():.5f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
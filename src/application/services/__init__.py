@@ -3,10 +3,12 @@
 from .data_validator import DataContentValidator
 from .generation_service import GenerationService, GenerationResult
 from .result_conversion_service import ResultConversionService
+from .sequential_sampling import SequentialSamplingConfig
 
 __all__ = [
     "DataContentValidator",
     "GenerationService", 
     "GenerationResult",
     "ResultConversionService",
+    "SequentialSamplingConfig",
 ]
\ No newline at end of file
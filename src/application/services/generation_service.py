@@ -1,16 +1,32 @@
 """답변 생성 서비스"""
 
-from typing import List
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from src.application.ports.llm import AnswerGeneratorPort
 from src.domain.entities.evaluation_data import EvaluationData
+from src.domain.exceptions import ProviderError, ProviderResponseError
+
+
+def generation_failure_reason(failure: dict) -> str:
+    """답변 생성 실패 상세 정보로 평가 제외 사유 생성"""
+    return f"generation_failed: {failure['error_type']}"
 
 
 class GenerationService:
     """답변 생성을 담당하는 애플리케이션 서비스"""
     
-    def __init__(self, answer_generator: AnswerGeneratorPort):
+    def __init__(self, answer_generator: AnswerGeneratorPort, max_workers: int = 1):
+        """
+        Args:
+            answer_generator: 답변 생성기
+            max_workers: 동시에 생성할 최대 답변 수 (1이면 순차 생성)
+        """
         self.answer_generator = answer_generator
+        self.max_workers = max(1, max_workers)
     
     def generate_missing_answers(
         self, 
@@ -19,50 +35,196 @@ class GenerationService:
         """
         평가 데이터 목록에서 누락된 답변을 생성합니다.
         
+        max_workers가 2 이상이면 스레드 풀로 동시에 생성합니다. 요청 속도는
+        LLM 어댑터의 프로바이더별 속도 제한기(hcx.chat, gemini.chat)가 조절하며,
+        결과는 항목 순서대로 기록됩니다.
+        
         Args:
             evaluation_data_list: 평가 데이터 목록
             
         Returns:
             GenerationResult: 생성 결과 (성공/실패 통계 포함)
         """
-        generation_failures = 0
-        generation_successes = 0
-        api_failure_details = []
-        
         total_items = len(evaluation_data_list)
+        missing_indices = [i for i, data in enumerate(evaluation_data_list) if not data.answer]
+        existing_answers = total_items - len(missing_indices)
         
-        for i, data in enumerate(evaluation_data_list):
-            if not data.answer:  # 답변이 없는 경우에만 생성
-                try:
-                    generated_answer = self.answer_generator.generate_answer(
-                        question=data.question,
-                        contexts=data.contexts
-                    )
-                    data.answer = generated_answer
-                    generation_successes += 1
-                    print(f"답변 생성 완료 ({i+1}/{total_items})")
-                except Exception as e:
-                    generation_failures += 1
-                    # 상세한 실패 정보 수집
-                    failure_detail = {
-                        "item_index": i + 1,
-                        "question": data.question[:100] + "..." if len(data.question) > 100 else data.question,
-                        "error_type": type(e).__name__,
-                        "error_message": str(e)
-                    }
-                    api_failure_details.append(failure_detail)
-                    
-                    print(f"답변 생성 실패 ({i+1}/{total_items}): {e}")
-                    # 실패한 경우 빈 답변으로 설정
-                    data.answer = ""
-            else:
-                generation_successes += 1
+        if self.max_workers > 1 and len(missing_indices) > 1:
+            failure_details = self._generate_concurrently(evaluation_data_list, missing_indices)
+        else:
+            failure_details = []
+            for i in missing_indices:
+                failure = self._generate_one(evaluation_data_list[i], i, total_items)
+                if failure:
+                    failure_details.append(failure)
+        failure_details = self._retry_transient_failures(evaluation_data_list, failure_details)
         
+        generation_failures = len(failure_details)
         return GenerationResult(
             failures=generation_failures,
-            successes=generation_successes,
-            failure_details=api_failure_details
+            successes=existing_answers + len(missing_indices) - generation_failures,
+            failure_details=failure_details
         )
+    
+    def iter_generated(
+        self,
+        evaluation_data_list: List[EvaluationData]
+    ) -> Iterator[Tuple[int, Optional[dict]]]:
+        """
+        답변이 준비된 항목을 완료 순서대로 내보냅니다 (스트리밍 파이프라인용).
+        
+        이미 답변이 있는 항목을 먼저 내보내고, 누락된 답변은 생성이 끝나는 대로
+        내보냅니다. 동시에 진행 중인 생성 요청은 max_workers개로 제한되므로
+        소비자가 느리면 생성도 함께 멈춥니다.
+        
+        Args:
+            evaluation_data_list: 평가 데이터 목록
+            
+        Yields:
+            (항목 인덱스, 실패 상세 정보 또는 None) 튜플
+        """
+        total_items = len(evaluation_data_list)
+        # 일시적 오류(한도 초과, 네트워크)로 실패한 항목은 나머지를 모두 처리한 뒤 한 번 더 시도
+        deferred = []
+        for index, failure in self._iter_first_pass(evaluation_data_list):
+            if failure and failure.get("retryable"):
+                deferred.append(index)
+                continue
+            yield index, failure
+        if deferred:
+            print(f"🔁 일시적 오류로 실패한 {len(deferred)}개 항목 재시도")
+        for index in deferred:
+            yield index, self._generate_one(evaluation_data_list[index], index, total_items)
+    
+    def _iter_first_pass(
+        self,
+        evaluation_data_list: List[EvaluationData]
+    ) -> Iterator[Tuple[int, Optional[dict]]]:
+        """iter_generated의 첫 번째 생성 시도 (완료 순서대로)"""
+        total_items = len(evaluation_data_list)
+        missing_indices = []
+        for i, data in enumerate(evaluation_data_list):
+            if data.answer:
+                yield i, None
+            else:
+                missing_indices.append(i)
+        
+        if self.max_workers <= 1:
+            for i in missing_indices:
+                yield i, self._generate_one(evaluation_data_list[i], i, total_items)
+            return
+        
+        pending = iter(missing_indices)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="generation") as executor:
+            in_flight = {}
+            for i in pending:
+                in_flight[self._submit(executor, evaluation_data_list[i], i, total_items)] = i
+                if len(in_flight) >= self.max_workers:
+                    break
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    yield index, future.result()
+                    next_index = next(pending, None)
+                    if next_index is not None:
+                        in_flight[self._submit(
+                            executor, evaluation_data_list[next_index], next_index, total_items
+                        )] = next_index
+    
+    def _submit(self, executor: ThreadPoolExecutor, data: EvaluationData, index: int, total_items: int):
+        """현재 컨텍스트(실행 마감 시간 등)를 이어받아 작업 스레드에서 답변 1건 생성"""
+        return executor.submit(contextvars.copy_context().run, self._generate_one, data, index, total_items)
+    
+    def _generate_one(
+        self, data: EvaluationData, index: int, total_items: int, report_progress: bool = True
+    ) -> Optional[dict]:
+        """항목 하나의 답변 생성
+        
+        Args:
+            report_progress: 성공 시 항목별 완료 메시지 출력 여부 (동시 생성은 전체 진행률을 따로 출력)
+        
+        Returns:
+            실패 시 실패 상세 정보, 성공 시 None
+        """
+        try:
+            generated_answer = self.answer_generator.generate_answer(
+                question=data.question,
+                contexts=data.contexts
+            )
+            if not generated_answer or not generated_answer.strip():
+                raise ProviderResponseError("빈 답변이 생성되었습니다.")
+            data.answer = generated_answer
+            if report_progress:
+                print(f"답변 생성 완료 ({index+1}/{total_items})")
+            return None
+        except Exception as e:
+            print(f"답변 생성 실패 ({index+1}/{total_items}): {e}")
+            # 실패한 경우 빈 답변으로 설정
+            data.answer = ""
+            # 상세한 실패 정보 수집
+            return {
+                "item_index": index + 1,
+                "question": data.question[:100] + "..." if len(data.question) > 100 else data.question,
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "retryable": isinstance(e, ProviderError) and e.retryable,
+            }
+    
+    def _retry_transient_failures(
+        self,
+        evaluation_data_list: List[EvaluationData],
+        failure_details: List[dict]
+    ) -> List[dict]:
+        """일시적 오류로 실패한 항목을 한 번 더 생성하고 남은 실패 목록 반환"""
+        retry_indices = [failure["item_index"] - 1 for failure in failure_details if failure.get("retryable")]
+        if not retry_indices:
+            return failure_details
+        
+        print(f"🔁 일시적 오류로 실패한 {len(retry_indices)}개 항목 재시도")
+        total_items = len(evaluation_data_list)
+        retried = {index: self._generate_one(evaluation_data_list[index], index, total_items) for index in retry_indices}
+        remaining = [failure for failure in failure_details if not failure.get("retryable")]
+        remaining.extend(failure for failure in retried.values() if failure)
+        remaining.sort(key=lambda failure: failure["item_index"])
+        return remaining
+    
+    def _generate_concurrently(
+        self,
+        evaluation_data_list: List[EvaluationData],
+        missing_indices: List[int]
+    ) -> List[dict]:
+        """누락된 답변을 스레드 풀로 동시에 생성하고 실패 상세 정보를 항목 순서로 반환"""
+        total_items = len(evaluation_data_list)
+        total_missing = len(missing_indices)
+        completed = 0
+        progress_lock = threading.Lock()
+        start_time = time.time()
+        
+        print(f"⚡ 답변 동시 생성 시작: {total_missing}개 항목, 워커 {self.max_workers}개")
+        
+        def generate(index: int) -> Optional[dict]:
+            nonlocal completed
+            failure = self._generate_one(evaluation_data_list[index], index, total_items, report_progress=False)
+            with progress_lock:
+                completed += 1
+                elapsed = time.time() - start_time
+                throughput = completed / elapsed if elapsed > 0 else 0.0
+                print(f"   진행: {completed}/{total_missing} ({throughput:.2f}건/초)")
+            return failure
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="generation") as executor:
+            # 입력 순서대로 결과를 모아 실패 목록도 항목 순서를 유지
+            # (실행 마감 시간 등 컨텍스트 변수가 작업 스레드에도 적용되도록 제출 시점의 컨텍스트에서 실행)
+            futures = [
+                executor.submit(contextvars.copy_context().run, generate, index) for index in missing_indices
+            ]
+            failures = [future.result() for future in futures]
+        
+        elapsed = time.time() - start_time
+        if elapsed > 0:
+            print(f"✅ 답변 동시 생성 완료: {total_missing}개, {elapsed:.1f}초 ({total_missing / elapsed:.2f}건/초)")
+        return [failure for failure in failures if failure]
 
 
 class GenerationResult:
@@ -97,4 +259,11 @@ class GenerationResult:
     
     def has_failures(self) -> bool:
         """실패가 있는지 여부"""
-        return self.failures > 0
\ No newline at end of file
+        return self.failures > 0
+    
+    def failed_row_reasons(self) -> Dict[int, str]:
+        """답변 생성에 실패한 행 (0부터 시작하는 인덱스 → 평가 제외 사유)"""
+        return {
+            failure["item_index"] - 1: generation_failure_reason(failure)
+            for failure in self.failure_details
+        }
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""순차 표본 추출 평가 서비스
+
+전체 행을 평가하지 않고 무작위(선택적으로 층화) 순서로 평가하면서 메트릭별
+신뢰구간을 갱신하고, 요청한 메트릭의 신뢰구간 반폭이 목표 이하가 되면 멈춥니다.
+"""
+
+import hashlib
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+from src.domain.entities.evaluation_data import EvaluationData
+
+RAGAS_SCORE = "ragas_score"
+
+
+@dataclass
+class SequentialSamplingConfig:
+    """순차 표본 추출 설정"""
+
+    target_half_width: float
+    metrics: Sequence[str] = (RAGAS_SCORE,)
+    confidence: float = 0.95
+    method: str = "t"  # t 또는 bootstrap
+    min_samples: int = 30
+    batch_size: int = 20
+    stratify_by: Optional[str] = None  # contexts 또는 question_length
+    seed: int = 42
+    bootstrap_resamples: int = 1000
+
+    def __post_init__(self):
+        if self.target_half_width <= 0:
+            raise ValueError("목표 신뢰구간 반폭은 0보다 커야 합니다.")
+        if not 0 < self.confidence < 1:
+            raise ValueError("신뢰수준은 0과 1 사이여야 합니다.")
+        if self.method not in ("t", "bootstrap"):
+            raise ValueError(f"지원하지 않는 신뢰구간 방법: {self.method}")
+
+
+def sampling_order(
+    data_list: List[EvaluationData], stratify_by: Optional[str] = None, seed: int = 42
+) -> List[int]:
+    """평가 순서 생성
+
+    층화 시 각 층을 섞은 뒤 층 크기에 비례하도록 번갈아 뽑아, 어느 시점에서
+    멈추더라도 평가한 표본의 층 구성이 전체와 비슷하게 유지됩니다.
+    """
+    rng = random.Random(seed)
+    indices = list(range(len(data_list)))
+    if not stratify_by:
+        rng.shuffle(indices)
+        return indices
+
+    strata: Dict[str, List[int]] = defaultdict(list)
+    for index in indices:
+        strata[_stratum_key(data_list[index], stratify_by)].append(index)
+    for members in strata.values():
+        rng.shuffle(members)
+
+    # 각 층 안에서의 상대 위치(0~1)로 정렬하면 층 비율이 유지됨
+    positioned = [
+        ((position + rng.random()) / len(members), index)
+        for members in strata.values()
+        for position, index in enumerate(members)
+    ]
+    return [index for _, index in sorted(positioned)]
+
+
+def _stratum_key(data: EvaluationData, stratify_by: str) -> str:
+    """층화 키 계산"""
+    if stratify_by == "contexts":
+        return hashlib.sha256("\n".join(data.contexts).encode("utf-8")).hexdigest()
+    if stratify_by == "question_length":
+        length = len(data.question)
+        return "short" if length < 30 else "medium" if length < 100 else "long"
+    raise ValueError(f"지원하지 않는 층화 기준: {stratify_by}")
+
+
+def _nanmean(values: np.ndarray, axis: int) -> np.ndarray:
+    """NaN을 제외한 평균 (유효 값이 없으면 NaN, 경고 없음)"""
+    counts = np.count_nonzero(~np.isnan(values), axis=axis)
+    sums = np.nansum(values, axis=axis)
+    return np.divide(sums, counts, out=np.full(sums.shape, np.nan), where=counts > 0)
+
+
+def _ragas_score(metric_means: Dict[str, float]) -> float:
+    """RunEvaluationCommand와 같은 방식으로 ragas_score 계산 (0인 메트릭 제외)"""
+    values = [v for v in metric_means.values() if v > 0]
+    return sum(values) / len(values) if values else 0.0
+
+
+def confidence_intervals(
+    individual_scores: List[Dict[str, Optional[float]]],
+    metric_names: Sequence[str],
+    confidence: float = 0.95,
+    method: str = "t",
+    bootstrap_resamples: int = 1000,
+    seed: int = 42,
+) -> Dict[str, Dict[str, float]]:
+    """메트릭별 및 ragas_score 신뢰구간 계산
+
+    Returns:
+        {이름: {"mean", "lower", "upper", "half_width", "n"}} - 유효 표본이 2개 미만이면 half_width는 inf
+    """
+    matrix = np.array(
+        [[np.nan if row.get(name) is None else row[name] for name in metric_names] for row in individual_scores],
+        dtype=float,
+    ).reshape(len(individual_scores), len(metric_names))
+
+    if method == "bootstrap":
+        return _bootstrap_intervals(matrix, metric_names, confidence, bootstrap_resamples, seed)
+
+    intervals = {
+        name: _t_interval(matrix[:, column], confidence) for column, name in enumerate(metric_names)
+    }
+    intervals[RAGAS_SCORE] = _ragas_score_t_interval(matrix, confidence)
+    return intervals
+
+
+def _interval(mean: float, half_width: float, n: int) -> Dict[str, float]:
+    """평균과 반폭으로 신뢰구간 구성 (점수 범위 [0, 1]로 경계 제한)"""
+    return {
+        "mean": mean,
+        "lower": float(np.clip(mean - half_width, 0.0, 1.0)),
+        "upper": float(np.clip(mean + half_width, 0.0, 1.0)),
+        "half_width": half_width,
+        "n": n,
+    }
+
+
+def _t_interval(values: np.ndarray, confidence: float) -> Dict[str, float]:
+    """t 분포 기반 평균 신뢰구간"""
+    values = values[~np.isnan(values)]
+    n = len(values)
+    mean = float(values.mean()) if n else 0.0
+    if n < 2:
+        return _interval(mean, float("inf"), n)
+    half_width = float(stats.t.ppf((1 + confidence) / 2, n - 1) * values.std(ddof=1) / np.sqrt(n))
+    return _interval(mean, half_width, n)
+
+
+def _ragas_score_t_interval(matrix: np.ndarray, confidence: float) -> Dict[str, float]:
+    """메트릭 평균들의 평균(보고하는 ragas_score)에 대한 델타 방법 신뢰구간
+
+    ragas_score = (평균이 0보다 큰 메트릭 k개의 평균의 합) / k 이므로 분산은
+    메트릭 평균 간 공분산 합 / k²입니다. 메트릭마다 유효 행이 다를 수 있어 공분산은
+    두 메트릭이 모두 있는 행으로 추정합니다 (Cov(평균_i, 평균_j) ≈ n_ij · s_ij / (n_i · n_j)).
+    """
+    means = np.nan_to_num(_nanmean(matrix, axis=0))
+    positive = means > 0
+    mean = float(means[positive].mean()) if positive.any() else 0.0
+    n = int(np.count_nonzero((~np.isnan(matrix)).any(axis=1)))
+
+    valid = ~np.isnan(matrix[:, positive])
+    counts = valid.sum(axis=0)
+    if not positive.any() or counts.min() < 2:
+        return _interval(mean, float("inf"), n)
+
+    centered = np.where(valid, matrix[:, positive] - means[positive], 0.0)
+    pair_counts = valid.T.astype(float) @ valid.astype(float)
+    covariances = np.divide(
+        centered.T @ centered, pair_counts - 1, out=np.zeros_like(pair_counts), where=pair_counts > 1
+    )
+    variance = float((pair_counts * covariances / np.outer(counts, counts)).sum()) / positive.sum() ** 2
+    half_width = float(stats.t.ppf((1 + confidence) / 2, counts.min() - 1) * np.sqrt(max(variance, 0.0)))
+    return _interval(mean, half_width, n)
+
+
+def _bootstrap_intervals(
+    matrix: np.ndarray, metric_names: Sequence[str], confidence: float, resamples: int, seed: int
+) -> Dict[str, Dict[str, float]]:
+    """행 단위 부트스트랩 백분위 신뢰구간 (ragas_score 포함)"""
+    n = len(matrix)
+    names = list(metric_names) + [RAGAS_SCORE]
+    means = {
+        name: float(np.nan_to_num(value))
+        for name, value in zip(metric_names, _nanmean(matrix, axis=0), strict=True)
+    }
+    means[RAGAS_SCORE] = _ragas_score(means)
+    if n < 2:
+        return {
+            name: {"mean": means[name], "lower": means[name], "upper": means[name], "half_width": float("inf"), "n": n}
+            for name in names
+        }
+
+    rng = np.random.default_rng(seed)
+    samples = matrix[rng.integers(0, n, size=(resamples, n))]
+    metric_means = np.nan_to_num(_nanmean(samples, axis=1))
+    ragas_scores = np.nan_to_num(_nanmean(np.where(metric_means > 0, metric_means, np.nan), axis=1))
+    distributions = np.column_stack([metric_means, ragas_scores])
+
+    alpha = (1 - confidence) / 2
+    intervals = {}
+    for column, name in enumerate(names):
+        lower, upper = np.quantile(distributions[:, column], [alpha, 1 - alpha])
+        counts = np.count_nonzero(~np.isnan(matrix[:, column])) if column < len(metric_names) else n
+        intervals[name] = {
+            "mean": means[name],
+            "lower": float(lower),
+            "upper": float(upper),
+            "half_width": float(upper - lower) / 2,
+            "n": int(counts),
+        }
+    return intervals
+
+
+def targets_reached(
+    intervals: Dict[str, Dict[str, float]], config: SequentialSamplingConfig, evaluated: int
+) -> bool:
+    """최소 표본 수를 넘고 요청한 모든 메트릭의 반폭이 목표 이하인지 여부"""
+    if evaluated < config.min_samples:
+        return False
+    return all(
+        intervals.get(name, {}).get("half_width", float("inf")) <= config.target_half_width
+        for name in config.metrics
+    )
@@ -10,6 +10,8 @@ from .validate_data_command import ValidateDataCommand
 from .generate_answers_command import GenerateAnswersCommand
 from .run_evaluation_command import RunEvaluationCommand
 from .convert_result_command import ConvertResultCommand
+from .streaming_evaluation_command import StreamingEvaluationCommand
+from .sequential_sampling_command import SequentialSamplingEvaluationCommand
 from .evaluation_pipeline import EvaluationPipeline
 
 __all__ = [
@@ -20,5 +22,7 @@ __all__ = [
     'GenerateAnswersCommand',
     'RunEvaluationCommand',
     'ConvertResultCommand',
+    'StreamingEvaluationCommand',
+    'SequentialSamplingEvaluationCommand',
     'EvaluationPipeline'
 ]
\ No newline at end of file
@@ -37,7 +37,8 @@ class GenerateAnswersCommand(EvaluationCommand):
         except Exception as e:
             self.log_error(e)
     
-    def _convert_to_dataset(self, evaluation_data_list: list[EvaluationData]) -> Dataset:
+    @staticmethod
+    def _convert_to_dataset(evaluation_data_list: list[EvaluationData]) -> Dataset:
         """평가 데이터를 Ragas Dataset 형식으로 변환"""
         data_dict = {
             "question": [d.question for d in evaluation_data_list],
@@ -6,7 +6,9 @@ Run Evaluation Command
 
 import uuid
 import datetime
-from typing import Any
+from typing import Any, Dict
+
+from datasets import Dataset
 
 from .base_command import EvaluationCommand, EvaluationContext
 
@@ -25,8 +27,9 @@ class RunEvaluationCommand(EvaluationCommand):
             if not context.ragas_dataset:
                 raise ValueError("RAGAS 데이터셋이 준비되지 않았습니다.")
             
-            # 1. 평가 실행 (어댑터는 예외를 그대로 전달)
-            parsed_result = self.evaluation_runner.evaluate(dataset=context.ragas_dataset)
+            # 1. 평가 실행 (어댑터는 예외를 그대로 전달, 답변 생성에 실패한 행은 제외)
+            excluded = context.generation_result.failed_row_reasons() if context.generation_result else {}
+            parsed_result = self._evaluate_excluding(context.ragas_dataset, excluded)
             
             # 2. 최종 리포트 생성
             final_report = self._create_final_report(parsed_result, context)
@@ -40,8 +43,49 @@ class RunEvaluationCommand(EvaluationCommand):
             # 파이프라인의 다음 단계를 위해 빈 결과 생성
             context.evaluation_result_dict = self._create_error_report()
             
+    def _evaluate_excluding(self, dataset: Dataset, excluded: Dict[int, str]) -> dict:
+        """제외할 행을 빼고 평가한 뒤 개별 점수와 실패 사유를 원래 행 순서로 복원
+
+        답변 생성에 실패한 행은 평가 LLM을 호출하지 않고 모든 메트릭을 None으로,
+        실패 사유를 cell_failures에 기록합니다.
+
+        Args:
+            dataset: 평가할 전체 데이터셋
+            excluded: 제외할 행 인덱스 → 사유
+        """
+        if not excluded:
+            return self.evaluation_runner.evaluate(dataset=dataset)
+
+        metric_names = [metric.name for metric in self.evaluation_runner.evaluation_context.get_metrics()]
+        keep = [index for index in range(len(dataset)) if index not in excluded]
+        print(f"⏭️ 답변 생성에 실패한 {len(excluded)}개 행은 평가에서 제외")
+
+        if keep:
+            result = self.evaluation_runner.evaluate(dataset=dataset.select(keep))
+        else:
+            result = {name: 0.0 for name in metric_names}
+        scores = iter(result.get("individual_scores") or [{} for _ in keep])
+        failures = iter(result.get("cell_failures") or [{} for _ in keep])
+
+        individual_scores, cell_failures = [], []
+        for index in range(len(dataset)):
+            if index in excluded:
+                individual_scores.append({name: None for name in metric_names})
+                cell_failures.append({name: excluded[index] for name in metric_names})
+            else:
+                individual_scores.append(next(scores))
+                cell_failures.append(next(failures))
+        result["individual_scores"] = individual_scores
+        result["cell_failures"] = cell_failures
+        return result
+
     def _create_final_report(self, result_dict: dict, context: EvaluationContext) -> dict:
-        """최종 리포트 생성"""
+        """최종 리포트 생성
+
+        어댑터가 행별 실패 사유(cell_failures)를 주면 metadata.abandoned_cells로 옮깁니다.
+        """
+        cell_failures = result_dict.pop("cell_failures", None) or []
+
         # ragas_score 계산
         metric_values = [v for k, v in result_dict.items() if k != "individual_scores" and v > 0]
         result_dict["ragas_score"] = sum(metric_values) / len(metric_values) if metric_values else 0.0
@@ -56,6 +100,14 @@ class RunEvaluationCommand(EvaluationCommand):
             "dataset_size": len(context.ragas_dataset),
             "strategy": self.evaluation_runner.evaluation_context.primary_strategy.get_strategy_name(),
         }
+        abandoned_cells = [
+            {"row": row, "metric": metric, "reason": reason}
+            for row, reasons in enumerate(cell_failures)
+            for metric, reason in reasons.items()
+        ]
+        if abandoned_cells:
+            result_dict["metadata"]["abandoned_cells"] = abandoned_cells
+            print(f"⏱️ 점수를 얻지 못한 셀 {len(abandoned_cells)}개 (NaN, 사유는 metadata.abandoned_cells)")
         
         print(f"✅ 평가 완료!")
         print(f"📊 최종 결과: RAGAS Score = {result_dict['ragas_score']:.4f}")
@@ -0,0 +1,146 @@
+"""
+Sequential Sampling Evaluation Command
+
+신뢰구간 목표에 도달하면 조기 종료하는 순차 표본 평가 명령입니다.
+무작위(선택적으로 층화) 순서로 배치 단위 답변 생성과 평가를 반복하고,
+요청한 메트릭의 신뢰구간 반폭이 목표 이하가 되면 나머지 행은 평가하지 않습니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from src.application.services.generation_service import GenerationResult, GenerationService
+from src.application.services.sequential_sampling import (
+    SequentialSamplingConfig,
+    confidence_intervals,
+    sampling_order,
+    targets_reached,
+)
+from .base_command import EvaluationContext
+from .generate_answers_command import GenerateAnswersCommand
+from .run_evaluation_command import RunEvaluationCommand
+
+
+class SequentialSamplingEvaluationCommand(RunEvaluationCommand):
+    """순차 표본 평가 명령 (GenerateAnswersCommand + RunEvaluationCommand 대체)"""
+
+    def __init__(
+        self,
+        generation_service: GenerationService,
+        evaluation_runner: Any,
+        config: SequentialSamplingConfig,
+    ):
+        """
+        Args:
+            generation_service: 답변 생성 서비스
+            evaluation_runner: 평가 어댑터 (RagasEvalAdapter)
+            config: 순차 표본 추출 설정
+        """
+        super().__init__(evaluation_runner)
+        self.generation_service = generation_service
+        self.config = config
+
+    def execute(self, context: EvaluationContext) -> None:
+        """목표 신뢰구간에 도달할 때까지 배치 단위로 생성 및 평가"""
+        self.log_start()
+
+        if not context.raw_data:
+            self.log_error(ValueError("로드된 데이터가 없습니다."))
+
+        config = self.config
+        data_list = context.raw_data
+        order = sampling_order(data_list, config.stratify_by, config.seed)
+        metric_names = [metric.name for metric in self.evaluation_runner.evaluation_context.get_metrics()]
+        print(
+            f"🎲 순차 표본 평가: 목표 ±{config.target_half_width} ({config.confidence:.0%} 신뢰수준, "
+            f"{config.method}), 대상 메트릭 {', '.join(config.metrics)}"
+        )
+
+        scores_by_index: Dict[int, Dict[str, Optional[float]]] = {}
+        failures_by_index: Dict[int, Dict[str, str]] = {}
+        failure_details: List[dict] = []
+        generation_successes = 0
+        intervals: Dict[str, Dict[str, float]] = {}
+        stopped_early = False
+
+        for start in range(0, len(order), config.batch_size):
+            batch = order[start:start + config.batch_size]
+            rows = [data_list[index] for index in batch]
+
+            generation = self.generation_service.generate_missing_answers(rows)
+            generation_successes += generation.successes
+            for failure in generation.failure_details:
+                # 배치 내 위치를 원래 항목 번호로 변환
+                failure_details.append(dict(failure, item_index=batch[failure["item_index"] - 1] + 1))
+
+            try:
+                # 답변 생성에 실패한 행은 평가하지 않고 사유만 기록
+                result = self._evaluate_excluding(
+                    GenerateAnswersCommand._convert_to_dataset(rows), generation.failed_row_reasons()
+                )
+                batch_scores = result["individual_scores"]
+                batch_failures = result.get("cell_failures") or [{} for _ in batch]
+            except Exception as e:
+                print(f"⚠️ 배치 평가 실패 (항목 {[index + 1 for index in batch]}): {e}")
+                batch_scores = [{name: None for name in metric_names} for _ in batch]
+                batch_failures = [{name: f"batch_failed: {e}" for name in metric_names} for _ in batch]
+            scores_by_index.update(zip(batch, batch_scores, strict=True))
+            failures_by_index.update(zip(batch, batch_failures, strict=True))
+
+            intervals = confidence_intervals(
+                list(scores_by_index.values()),
+                metric_names,
+                confidence=config.confidence,
+                method=config.method,
+                bootstrap_resamples=config.bootstrap_resamples,
+                seed=config.seed,
+            )
+            progress = ", ".join(
+                f"{name} {intervals[name]['mean']:.4f}±{intervals[name]['half_width']:.4f}"
+                for name in config.metrics if name in intervals
+            )
+            print(f"📐 {len(scores_by_index)}/{len(data_list)}개 평가: {progress}")
+
+            if targets_reached(intervals, config, len(scores_by_index)):
+                stopped_early = len(scores_by_index) < len(data_list)
+                break
+
+        if stopped_early:
+            print(f"⏹️ 목표 신뢰구간 도달 - {len(scores_by_index)}/{len(data_list)}개 행만 평가하고 종료")
+        else:
+            print("ℹ️ 모든 행을 평가했습니다.")
+
+        # 평가한 행만 원래 순서로 정리
+        sampled_indices = sorted(scores_by_index)
+        sampled_rows = [data_list[index] for index in sampled_indices]
+        individual_scores = [scores_by_index[index] for index in sampled_indices]
+
+        failure_details.sort(key=lambda failure: failure["item_index"])
+        context.generation_result = GenerationResult(
+            failures=len(failure_details),
+            successes=generation_successes,
+            failure_details=failure_details,
+        )
+        context.ragas_dataset = GenerateAnswersCommand._convert_to_dataset(sampled_rows)
+
+        result_dict = {name: intervals[name]["mean"] for name in metric_names}
+        result_dict["individual_scores"] = individual_scores
+        result_dict["cell_failures"] = [failures_by_index[index] for index in sampled_indices]
+        report = self._create_final_report(result_dict, context)
+        report["metadata"]["sequential_sampling"] = {
+            "target_half_width": config.target_half_width,
+            "confidence": config.confidence,
+            "method": config.method,
+            "metrics": list(config.metrics),
+            "stratify_by": config.stratify_by,
+            "seed": config.seed,
+            "evaluated_rows": len(sampled_indices),
+            "total_rows": len(data_list),
+            "stopped_early": stopped_early,
+            "sample_indices": sampled_indices,
+            "confidence_intervals": intervals,
+        }
+        context.evaluation_result_dict = report
+        self.log_success()
+
+    def get_command_name(self) -> str:
+        return "답변 생성 및 순차 표본 평가"
@@ -0,0 +1,172 @@
+"""
+Streaming Evaluation Command
+
+답변 생성과 평가를 겹쳐 실행하는 스트리밍 명령입니다.
+생성이 끝난 항목은 제한된 크기의 큐를 거쳐 소규모 배치로 바로 평가되므로
+평가 LLM이 생성 단계가 끝날 때까지 기다리지 않고 첫 결과도 일찍 나옵니다.
+"""
+
+import contextvars
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.application.services.generation_service import (
+    GenerationResult,
+    GenerationService,
+    generation_failure_reason,
+)
+from .base_command import EvaluationContext
+from .generate_answers_command import GenerateAnswersCommand
+from .run_evaluation_command import RunEvaluationCommand
+
+# 생성 스레드 종료 표시
+_DONE = object()
+
+
+class StreamingEvaluationCommand(RunEvaluationCommand):
+    """답변 생성 → 평가 스트리밍 명령 (GenerateAnswersCommand + RunEvaluationCommand 대체)"""
+
+    def __init__(
+        self,
+        generation_service: GenerationService,
+        evaluation_runner: Any,
+        batch_size: int = 8,
+        queue_size: int = 32,
+        flush_interval: float = 2.0,
+    ):
+        """
+        Args:
+            generation_service: 답변 생성 서비스
+            evaluation_runner: 평가 어댑터 (RagasEvalAdapter)
+            batch_size: 한 번에 평가할 최대 항목 수
+            queue_size: 생성과 평가 사이 큐의 최대 크기 (가득 차면 생성 대기)
+            flush_interval: 배치가 가득 차지 않아도 평가를 시작할 대기 시간 (초)
+        """
+        super().__init__(evaluation_runner)
+        self.generation_service = generation_service
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.flush_interval = flush_interval
+
+    def execute(self, context: EvaluationContext) -> None:
+        """생성과 평가를 겹쳐 실행하고 최종 리포트 생성"""
+        self.log_start()
+
+        if not context.raw_data:
+            self.log_error(ValueError("로드된 데이터가 없습니다."))
+
+        data_list = context.raw_data
+        ready: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        failure_details: List[dict] = []
+        # 답변 생성에 실패한 항목 → 평가 제외 사유 (큐에 넣기 전에 기록)
+        failed_reasons: Dict[int, str] = {}
+        producer_errors: List[Exception] = []
+
+        def produce():
+            try:
+                for index, failure in self.generation_service.iter_generated(data_list):
+                    if failure:
+                        failure_details.append(failure)
+                        failed_reasons[index] = generation_failure_reason(failure)
+                    ready.put(index)
+            except Exception as e:
+                producer_errors.append(e)
+            finally:
+                ready.put(_DONE)
+
+        # 생성 스레드도 같은 실행 컨텍스트(실행 마감 시간 등)를 사용
+        producer = threading.Thread(
+            target=contextvars.copy_context().run, args=(produce,), name="streaming-generation", daemon=True
+        )
+        start_time = time.time()
+        producer.start()
+
+        metrics = self.evaluation_runner.evaluation_context.get_metrics()
+        individual_scores: List[Optional[Dict[str, Optional[float]]]] = [None] * len(data_list)
+        cell_failures: List[Dict[str, str]] = [{} for _ in data_list]
+        evaluated = 0
+        done = False
+        while not done:
+            batch, done = self._next_batch(ready)
+            if not batch:
+                continue
+            scores, failures = self._evaluate_batch(data_list, batch, metrics, failed_reasons)
+            for index, row_scores, row_failures in zip(batch, scores, failures, strict=True):
+                individual_scores[index] = row_scores
+                cell_failures[index] = row_failures
+            evaluated += len(batch)
+            print(f"📈 스트리밍 평가 진행: {evaluated}/{len(data_list)} ({time.time() - start_time:.1f}초)")
+
+        producer.join()
+        if producer_errors:
+            self.log_error(producer_errors[0])
+
+        failure_details.sort(key=lambda failure: failure["item_index"])
+        context.generation_result = GenerationResult(
+            failures=len(failure_details),
+            successes=len(data_list) - len(failure_details),
+            failure_details=failure_details,
+        )
+        context.ragas_dataset = GenerateAnswersCommand._convert_to_dataset(data_list)
+
+        result_dict = self._summarize(individual_scores, metrics)
+        result_dict["cell_failures"] = cell_failures
+        context.evaluation_result_dict = self._create_final_report(result_dict, context)
+        self.log_success()
+
+    def _next_batch(self, ready: "queue.Queue") -> tuple:
+        """큐에서 다음 배치 수집 - (인덱스 목록, 생성 종료 여부) 반환
+
+        첫 항목을 받은 뒤 batch_size개가 모이거나 flush_interval이 지나면 반환합니다.
+        """
+        batch: List[int] = []
+        deadline = None
+        while len(batch) < self.batch_size:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = ready.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+        return batch, False
+
+    def _evaluate_batch(
+        self, data_list: list, batch: List[int], metrics: list, failed_reasons: Optional[Dict[int, str]] = None
+    ) -> tuple:
+        """배치 평가 - (개별 점수, 행별 실패 사유) 반환, 실패하면 해당 항목의 점수를 None으로 기록
+
+        답변 생성에 실패한 항목(failed_reasons)은 평가하지 않습니다.
+        """
+        rows = [data_list[index] for index in batch]
+        failed_reasons = failed_reasons or {}
+        excluded = {position: failed_reasons[index] for position, index in enumerate(batch) if index in failed_reasons}
+        try:
+            result = self._evaluate_excluding(GenerateAnswersCommand._convert_to_dataset(rows), excluded)
+            return result["individual_scores"], result.get("cell_failures") or [{} for _ in batch]
+        except Exception as e:
+            print(f"⚠️ 배치 평가 실패 (항목 {[index + 1 for index in batch]}): {e}")
+            return (
+                [{metric.name: None for metric in metrics} for _ in batch],
+                [{metric.name: f"batch_failed: {e}" for metric in metrics} for _ in batch],
+            )
+
+    def _summarize(self, individual_scores: List[dict], metrics: list) -> dict:
+        """개별 점수로 메트릭별 평균 계산 - 실패한 항목(None)은 제외"""
+        result_dict = {}
+        for metric in metrics:
+            valid_scores = [
+                scores[metric.name] for scores in individual_scores if scores.get(metric.name) is not None
+            ]
+            result_dict[metric.name] = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
+            print(f"📊 {metric.name}: {result_dict[metric.name]:.4f} ({len(valid_scores)}/{len(individual_scores)}개 성공)")
+        result_dict["individual_scores"] = individual_scores
+        return result_dict
+
+    def get_command_name(self) -> str:
+        return "답변 생성 및 평가 (스트리밍)"
@@ -10,6 +10,7 @@ from src.application.ports import LlmPort
 from src.application.services.data_validator import DataContentValidator
 from src.application.services.generation_service import GenerationService
 from src.application.services.result_conversion_service import ResultConversionService
+from src.application.services.sequential_sampling import SequentialSamplingConfig
 from src.domain import EvaluationResult
 from src.domain.prompts import PromptType
 
@@ -19,7 +20,9 @@ from .commands import (
     ValidateDataCommand,
     GenerateAnswersCommand,
     RunEvaluationCommand,
-    ConvertResultCommand
+    ConvertResultCommand,
+    StreamingEvaluationCommand,
+    SequentialSamplingEvaluationCommand
 )
 
 if TYPE_CHECKING:
@@ -37,6 +40,9 @@ class RunEvaluationUseCase:
         data_validator: DataContentValidator,
         generation_service: GenerationService,
         result_conversion_service: ResultConversionService,
+        streaming: bool = False,
+        streaming_batch_size: int = 8,
+        sampling_config: Optional[SequentialSamplingConfig] = None,
     ):
         self.llm_port = llm_port
         self.evaluation_runner_factory = evaluation_runner_factory
@@ -44,18 +50,38 @@ class RunEvaluationUseCase:
         self.data_validator = data_validator
         self.generation_service = generation_service
         self.result_conversion_service = result_conversion_service
+        self.streaming = streaming
+        self.streaming_batch_size = streaming_batch_size
+        self.sampling_config = sampling_config
         
         # 파이프라인 초기화
         self.pipeline = self._create_pipeline()
 
     def _create_pipeline(self) -> EvaluationPipeline:
-        """평가 파이프라인 생성"""
-        return (EvaluationPipeline()
-                .add_command(LoadDataCommand(self.repository_factory))
-                .add_command(ValidateDataCommand(self.data_validator))
-                .add_command(GenerateAnswersCommand(self.generation_service))
-                .add_command(RunEvaluationCommand(self.evaluation_runner_factory))
-                .add_command(ConvertResultCommand(self.result_conversion_service)))
+        """평가 파이프라인 생성
+
+        순차 표본 모드나 스트리밍 모드면 생성과 평가를 한 단계에서 실행합니다.
+        """
+        pipeline = (EvaluationPipeline()
+                    .add_command(LoadDataCommand(self.repository_factory))
+                    .add_command(ValidateDataCommand(self.data_validator)))
+        if self.sampling_config:
+            pipeline.add_command(SequentialSamplingEvaluationCommand(
+                self.generation_service,
+                self.evaluation_runner_factory,
+                self.sampling_config
+            ))
+        elif self.streaming:
+            pipeline.add_command(StreamingEvaluationCommand(
+                self.generation_service,
+                self.evaluation_runner_factory,
+                batch_size=self.streaming_batch_size
+            ))
+        else:
+            (pipeline
+             .add_command(GenerateAnswersCommand(self.generation_service))
+             .add_command(RunEvaluationCommand(self.evaluation_runner_factory)))
+        return pipeline.add_command(ConvertResultCommand(self.result_conversion_service))
 
     def execute(
         self, 
@@ -6,7 +6,7 @@ RAGAS 프롬프트 커스터마이징 설정도 포함합니다.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -34,10 +34,29 @@ class Settings(BaseSettings):
     # BGE-M3 로컬 임베딩 설정
     BGE_M3_MODEL_PATH: Optional[str] = Field(default=None, description="BGE-M3 로컬 모델 경로")
     BGE_M3_DEVICE: Optional[str] = Field(default=None, description="BGE-M3 실행 디바이스 (None=자동감지, cpu, cuda, mps)")
+    BGE_M3_BACKEND: str = Field(
+        default="torch",
+        description="BGE-M3 추론 백엔드 (torch, onnx - onnx는 CPU 전용, python hello.py --export-onnx로 먼저 내보내기)"
+    )
+    BGE_M3_ONNX_PATH: str = Field(default="./models/bge-m3-onnx", description="ONNX로 내보낸 BGE-M3 모델 디렉토리")
+    BGE_M3_ONNX_QUANTIZE: bool = Field(default=True, description="ONNX 내보내기 시 가중치 int8 동적 양자화 여부")
+    BGE_M3_ONNX_MIN_COSINE: float = Field(
+        default=0.99, description="ONNX 내보내기 검증 시 PyTorch 백엔드와 요구하는 최소 코사인 유사도"
+    )
+    BGE_M3_ONNX_INTRA_OP_THREADS: Optional[int] = Field(
+        default=None, description="ONNX Runtime 연산 내부 스레드 수 (None=물리 코어 수)"
+    )
+    BGE_M3_ONNX_INTER_OP_THREADS: int = Field(default=1, description="ONNX Runtime 연산 간 스레드 수")
+    BGE_M3_MAX_SEQ_LENGTH: Optional[int] = Field(
+        default=None, description="BGE-M3 최대 토큰 수, 초과분은 잘림 (None=모델 기본값 8192)"
+    )
+    BGE_M3_BATCH_TOKEN_BUDGET: Optional[int] = Field(
+        default=None, description="문서 임베딩 배치당 패딩 포함 최대 토큰 수 (None=디바이스별 기본값: cuda 65536, mps 32768, cpu 8192)"
+    )
 
     # LLM/Embedding 선택 설정
-    DEFAULT_LLM: str = Field(default="gemini", description="사용할 기본 LLM (gemini 또는 hcx)")
-    DEFAULT_EMBEDDING: str = Field(default="gemini", description="사용할 기본 임베딩 (gemini, hcx, bge_m3)")
+    DEFAULT_LLM: str = Field(default="gemini", description="사용할 기본 LLM (gemini, hcx, simulated)")
+    DEFAULT_EMBEDDING: str = Field(default="gemini", description="사용할 기본 임베딩 (gemini, hcx, bge_m3, simulated)")
 
     # 프롬프트 커스터마이징 설정
     DEFAULT_PROMPT_TYPE: str = Field(
@@ -51,6 +70,145 @@ class Settings(BaseSettings):
         description="CLI나 환경변수로 지정하는 프롬프트 타입"
     )
 
+    # 답변 생성 설정
+    GENERATION_MAX_WORKERS: int = Field(
+        default=1, description="누락된 답변을 동시에 생성할 최대 워커 수 (1이면 순차 생성)"
+    )
+    LLM_GENERATION_TIMEOUT: float = Field(
+        default=60.0, description="답변 생성 LLM HTTP 요청 1건의 타임아웃 (초) - 평가 요청은 JUDGE_CALL_TIMEOUT 사용"
+    )
+
+    # 실패 셀 재평가 설정
+    EVALUATION_REPAIR_FAILED: bool = Field(
+        default=True, description="평가 실패(NaN)한 (행, 메트릭) 셀만 폴백 설정으로 다시 평가할지 여부"
+    )
+
+    # 평가 마감 시간 설정
+    JUDGE_CALL_TIMEOUT: float = Field(
+        default=60.0, description="평가 LLM HTTP 요청 1건의 타임아웃 (초)"
+    )
+    JUDGE_CELL_DEADLINE: float = Field(
+        default=180.0, description="(행, 메트릭) 셀 1개 평가의 마감 시간 (초) - 초과하면 취소하고 NaN으로 기록"
+    )
+    EVALUATION_RUN_DEADLINE: Optional[float] = Field(
+        default=None, description="전체 실행 마감 시간 (초) - 지나면 남은 요청을 중단 (None이면 제한 없음)"
+    )
+    JUDGE_HEDGE_PERCENTILE: Optional[float] = Field(
+        default=None,
+        description="비동기 LLM 요청이 호스트 지연 시간의 이 백분위를 넘으면 중복 요청을 보내 먼저 끝난 응답 사용 "
+                    "(None이면 사용 안 함 - 유료 호출이 두 번 나갈 수 있으므로 선택 사항)"
+    )
+    EMBEDDING_HEDGE_PERCENTILE: Optional[float] = Field(
+        default=None,
+        description="비동기 임베딩 요청이 호스트 지연 시간의 이 백분위를 넘으면 중복 요청 사용 (예: 0.95) "
+                    "(None이면 사용 안 함 - 중복 요청도 과금되고 속도 제한 토큰을 쓰므로 선택 사항)"
+    )
+    JUDGE_HEDGE_MIN_SAMPLES: int = Field(
+        default=20, description="중복 요청 기준 백분위를 계산하기 위한 최소 지연 시간 표본 수"
+    )
+
+    # 스트리밍 파이프라인 설정
+    EVALUATION_STREAMING: bool = Field(
+        default=False, description="답변 생성과 평가를 겹쳐 실행하는 스트리밍 파이프라인 사용 여부"
+    )
+    STREAMING_BATCH_SIZE: int = Field(
+        default=8, description="스트리밍 모드에서 한 번에 평가할 최대 항목 수"
+    )
+
+    # 샤드 평가 설정
+    EVALUATION_SHARDS: int = Field(
+        default=1, description="데이터셋을 나누어 별도 프로세스에서 평가할 샤드 수 (1이면 단일 프로세스)"
+    )
+
+    # LLM 응답 캐시 설정
+    LLM_CACHE_MODE: str = Field(
+        default="read-write",
+        description="LLM 응답 캐시 모드 (read-write, read-only, off)"
+    )
+    LLM_CACHE_MAX_SIZE_MB: float = Field(default=512.0, description="LLM 응답 캐시 최대 크기 (MB)")
+    LLM_CACHE_MAX_AGE_DAYS: float = Field(default=30.0, description="LLM 응답 캐시 보존 기간 (일)")
+
+    # 샘플별 메트릭 점수 캐시 설정
+    SCORE_CACHE_MODE: str = Field(
+        default="read-write",
+        description="샘플별 점수 캐시 모드 (read-write, read-only, off) - 변경된 행만 재평가"
+    )
+    ARTIFACT_CACHE_MODE: str = Field(
+        default="read-write",
+        description="메트릭 간 중간 산출물(문장 분해, NLI 판정, 역생성 질문, 임베딩) 공유 모드 (read-write, read-only, off)"
+    )
+    EMBEDDING_CACHE_MODE: str = Field(
+        default="read-write",
+        description="임베딩 벡터 캐시 모드 (read-write, read-only, off) - 같은 텍스트는 실행 간에 다시 임베딩하지 않음"
+    )
+    EMBEDDING_CACHE_DTYPE: str = Field(
+        default="float32", description="임베딩 캐시 저장 형식 (float32, float16 - float16은 용량 절반)"
+    )
+
+    # 임베딩 쿼리 마이크로 배치 설정 (동시에 들어온 embed_query 요청을 한 번에 임베딩)
+    EMBEDDING_MICRO_BATCH_SIZE: int = Field(
+        default=32, description="마이크로 배치 최대 텍스트 수 (1이면 배치하지 않음)"
+    )
+    EMBEDDING_MICRO_BATCH_WAIT_MS: float = Field(
+        default=10.0, description="첫 쿼리 후 배치를 보내기까지 기다리는 최대 시간 (ms)"
+    )
+
+    # 평가 프롬프트 출력 토큰 예산 (RAGAS 출력 스키마 기준, 어댑터 최대값을 넘지 않음)
+    # 예: JUDGE_OUTPUT_TOKEN_BUDGETS='{"NLIStatementOutput": 3072, "Verification": 256}'
+    JUDGE_OUTPUT_TOKEN_BUDGETS: Dict[str, int] = Field(
+        default_factory=dict,
+        description="RAGAS 출력 모델 이름별 최대 출력 토큰 (기본 예산보다 우선)"
+    )
+    JUDGE_SCALAR_OUTPUT_TOKENS: int = Field(
+        default=512, description="배열이 없는 출력 스키마(분류, 단일 질문)의 최대 출력 토큰"
+    )
+    JUDGE_LIST_OUTPUT_TOKENS: int = Field(
+        default=1536, description="문장/판정 목록을 반환하는 출력 스키마의 최대 출력 토큰"
+    )
+
+    # API 요청 속도 제한 설정
+    # 예: RATE_LIMITS='{"hcx.chat": {"initial_rate": 2.0, "max_rate": 20.0}}'
+    # 키는 "프로바이더" 또는 "프로바이더.엔드포인트", 값은 AdaptiveRateLimiter 인자
+    RATE_LIMITS: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description="프로바이더/엔드포인트별 속도 제한 설정 (initial_rate, min_rate, max_rate, burst, increase_step, decrease_factor)"
+    )
+
+    RATE_LIMIT_BACKEND: str = Field(
+        default="local",
+        description="속도 제한 상태 공유 방식 (local: 프로세스별, shared: data/cache의 SQLite 장부를 모든 프로세스가 공유)"
+    )
+
+    # HTTP 연결 풀 설정
+    HTTP_DEFAULT_POOL_SIZE: int = Field(default=10, description="호스트별 기본 HTTP 연결 풀 크기")
+    HTTP_POOL_SIZES: Dict[str, int] = Field(
+        default_factory=dict,
+        description="호스트별 HTTP 연결 풀 크기 (예: {\"clovastudio.stream.ntruss.com\": 20})"
+    )
+
+    # 시뮬레이션 프로바이더 설정 (--llm simulated / --embedding simulated, 외부 호출 없음)
+    SIMULATED_LATENCY_MS: float = Field(default=200.0, description="시뮬레이션 응답 지연 시간 중앙값 (ms)")
+    SIMULATED_LATENCY_SIGMA: float = Field(
+        default=0.5, description="시뮬레이션 지연 시간 로그 정규 분포 표준편차 (0이면 고정 지연)"
+    )
+    SIMULATED_RATE_LIMIT_RATE: float = Field(default=0.0, description="시뮬레이션 요청 중 429를 주입할 비율 (0~1)")
+    SIMULATED_TIMEOUT_RATE: float = Field(default=0.0, description="시뮬레이션 요청 중 타임아웃을 주입할 비율 (0~1)")
+    SIMULATED_TIMEOUT_SECONDS: float = Field(default=5.0, description="타임아웃 주입 시 응답 없이 기다리는 시간 (초)")
+    SIMULATED_SEED: int = Field(default=0, description="시뮬레이션 응답 내용과 지연 시간 난수 시드")
+    SIMULATED_EMBEDDING_DIM: int = Field(default=1024, description="시뮬레이션 임베딩 차원")
+
+    # 요청/응답 카세트 설정 (실제 API 없이 평가 실행을 재현)
+    CASSETTE_MODE: str = Field(
+        default="off",
+        description="프로바이더 요청/응답 카세트 모드 (off, record: 기록, replay: 네트워크 없이 재생)"
+    )
+    CASSETTE_PATH: str = Field(
+        default="data/cassettes/default.jsonl", description="카세트 파일 경로 (JSONL)"
+    )
+    CASSETTE_LATENCY_SCALE: float = Field(
+        default=1.0, description="재생 시 기록된 응답 지연 시간에 곱할 배율 (0이면 지연 없이 재생)"
+    )
+
     # 데이터베이스 설정
     DATABASE_URL: str = Field(
         default="sqlite:///ragas_evaluation_history.db",
@@ -110,20 +268,28 @@ PROMPT_TYPE_HELP = {
 }
 
 # 지원되는 LLM 및 임베딩 모델 목록 (중앙 관리)
-SUPPORTED_LLM_TYPES = ["gemini", "hcx"]
-SUPPORTED_EMBEDDING_TYPES = ["gemini", "hcx", "bge_m3"]
+SUPPORTED_LLM_TYPES = ["gemini", "hcx", "simulated"]
+SUPPORTED_EMBEDDING_TYPES = ["gemini", "hcx", "bge_m3", "simulated"]
 SUPPORTED_DEVICE_TYPES = ["cpu", "cuda", "mps"]
+SUPPORTED_BGE_M3_BACKENDS = ["torch", "onnx"]
+SUPPORTED_LLM_CACHE_MODES = ["read-write", "read-only", "off"]
+SUPPORTED_EMBEDDING_CACHE_DTYPES = ["float32", "float16"]
+SUPPORTED_RATE_LIMIT_BACKENDS = ["local", "shared"]
+SUPPORTED_CI_METHODS = ["t", "bootstrap"]
+SUPPORTED_STRATIFY_KEYS = ["contexts", "question_length"]
 
 # 웹 UI용 모델 표시명
 LLM_DISPLAY_NAMES = {
     "gemini": "🔥 Google Gemini 2.5 Flash",
-    "hcx": "🚀 NAVER HyperCLOVA X"
+    "hcx": "🚀 NAVER HyperCLOVA X",
+    "simulated": "🧪 Simulated LLM (부하 테스트)"
 }
 
 EMBEDDING_DISPLAY_NAMES = {
     "gemini": "🌐 Google Gemini Embedding",
     "hcx": "🚀 NAVER HCX Embedding", 
-    "bge_m3": "🎯 BGE-M3 Local Embedding"
+    "bge_m3": "🎯 BGE-M3 Local Embedding",
+    "simulated": "🧪 Simulated Embedding (부하 테스트)"
 }
 
 
@@ -25,6 +25,10 @@ class ConfigurationContainer:
                 "api_key": self.config.CLOVA_STUDIO_API_KEY,
                 "model_name": self.config.HCX_MODEL_NAME,
             }
+        elif llm_type == "simulated":
+            return {
+                "model_name": "simulated",
+            }
         else:
             raise ValueError(f"지원하지 않는 LLM 타입: {llm_type}")
     
@@ -43,6 +47,17 @@ class ConfigurationContainer:
             return {
                 "model_path": self.config.BGE_M3_MODEL_PATH,
                 "device": self.config.BGE_M3_DEVICE,
+                "backend": self.config.BGE_M3_BACKEND,
+                "onnx_path": self.config.BGE_M3_ONNX_PATH,
+                "intra_op_threads": self.config.BGE_M3_ONNX_INTRA_OP_THREADS,
+                "inter_op_threads": self.config.BGE_M3_ONNX_INTER_OP_THREADS,
+                "onnx_min_cosine": self.config.BGE_M3_ONNX_MIN_COSINE,
+                "max_seq_length": self.config.BGE_M3_MAX_SEQ_LENGTH,
+                "batch_token_budget": self.config.BGE_M3_BATCH_TOKEN_BUDGET,
+            }
+        elif embedding_type == "simulated":
+            return {
+                "dimension": self.config.SIMULATED_EMBEDDING_DIM,
             }
         else:
             raise ValueError(f"지원하지 않는 임베딩 타입: {embedding_type}")
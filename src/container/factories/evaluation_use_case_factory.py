@@ -6,12 +6,25 @@ Evaluation Use Case Factory
 
 from typing import Optional, Tuple
 from dataclasses import dataclass
+from functools import partial
 
 from src.config import settings
 from src.domain.prompts import PromptType
 from src.application.use_cases import RunEvaluationUseCase
 from src.application.services.generation_service import GenerationService
-from src.infrastructure.evaluation import RagasEvalAdapter
+from src.application.services.sequential_sampling import SequentialSamplingConfig
+from src.infrastructure.cache import (
+    configure_artifact_store,
+    configure_embedding_cache,
+    configure_llm_cache,
+    configure_score_cache,
+    get_artifact_store,
+    get_embedding_cache,
+    get_llm_cache,
+    get_score_cache,
+)
+from src.infrastructure.evaluation import RagasEvalAdapter, ShardedEvalAdapter
+from src.infrastructure.network import configure_cassette, current_cassette_config
 from src.application.ports.llm import LlmPort
 from langchain_core.embeddings import Embeddings
 
@@ -22,6 +35,43 @@ class EvaluationRequest:
     llm_type: Optional[str] = None
     embedding_type: Optional[str] = None
     prompt_type: Optional[PromptType] = None
+    generation_workers: Optional[int] = None
+    shards: Optional[int] = None
+    streaming: Optional[bool] = None
+    sampling: Optional[SequentialSamplingConfig] = None
+
+
+def build_shard_adapter(
+    llm_type: str,
+    embedding_type: str,
+    prompt_type: Optional[PromptType],
+    llm_cache_mode: str,
+    score_cache_mode: str,
+    artifact_cache_mode: str,
+    embedding_cache_mode: str,
+    cassette: Optional[Tuple[str, str, float]] = None,
+) -> RagasEvalAdapter:
+    """샤드 워커 프로세스에서 평가 어댑터를 새로 생성
+
+    워커는 별도 프로세스이므로 메인 프로세스의 캐시 모드와 카세트 설정(mode, path, latency_scale)을 다시 적용합니다.
+    """
+    from src.container.configuration_container import ConfigurationContainer
+    from src.container.providers.embedding_provider_factory import EmbeddingProviderFactory
+    from src.container.providers.llm_provider_factory import LlmProviderFactory
+
+    configure_llm_cache(llm_cache_mode)
+    configure_score_cache(score_cache_mode)
+    configure_artifact_store(artifact_cache_mode)
+    configure_embedding_cache(embedding_cache_mode)
+    if cassette:
+        configure_cassette(*cassette)
+
+    configuration = ConfigurationContainer()
+    return RagasEvalAdapter(
+        llm=LlmProviderFactory(configuration).create_provider(llm_type),
+        embeddings=EmbeddingProviderFactory(configuration).create_provider(embedding_type),
+        prompt_type=prompt_type
+    )
 
 
 class EvaluationUseCaseFactory:
@@ -53,7 +103,10 @@ class EvaluationUseCaseFactory:
         embedding_adapter = self._embedding_factory.create_provider(embedding_type)
         
         # GenerationService 생성
-        generation_service = GenerationService(answer_generator=llm_adapter)
+        generation_service = GenerationService(
+            answer_generator=llm_adapter,
+            max_workers=request.generation_workers or settings.GENERATION_MAX_WORKERS
+        )
         
         # RagasEvalAdapter 생성
         ragas_adapter = RagasEvalAdapter(
@@ -62,6 +115,25 @@ class EvaluationUseCaseFactory:
             prompt_type=prompt_type
         )
         
+        # 샤드 수가 2 이상이면 프로세스별 병렬 평가 어댑터로 감싸기
+        shards = request.shards or settings.EVALUATION_SHARDS
+        if shards > 1:
+            ragas_adapter = ShardedEvalAdapter(
+                base_adapter=ragas_adapter,
+                adapter_builder=partial(
+                    build_shard_adapter,
+                    llm_type,
+                    embedding_type,
+                    prompt_type,
+                    get_llm_cache().mode.value,
+                    get_score_cache().mode.value,
+                    get_artifact_store().mode.value,
+                    get_embedding_cache().mode.value,
+                    current_cassette_config(),
+                ),
+                num_shards=shards
+            )
+        
         # RunEvaluationUseCase 생성
         use_case = RunEvaluationUseCase(
             llm_port=llm_adapter,
@@ -70,6 +142,9 @@ class EvaluationUseCaseFactory:
             data_validator=self._service_registry.get_data_validator(),
             generation_service=generation_service,
             result_conversion_service=self._service_registry.get_result_conversion_service(),
+            streaming=settings.EVALUATION_STREAMING if request.streaming is None else request.streaming,
+            streaming_batch_size=settings.STREAMING_BATCH_SIZE,
+            sampling_config=request.sampling,
         )
         
         return use_case, llm_adapter, embedding_adapter
@@ -8,9 +8,12 @@ from typing import Any
 from langchain_core.embeddings import Embeddings
 
 from src.config import SUPPORTED_EMBEDDING_TYPES
+from src.infrastructure.cache import CachedEmbeddings
 from src.infrastructure.embedding.gemini_http_adapter import GeminiHttpEmbeddingAdapter
 from src.infrastructure.embedding.hcx_adapter import HcxEmbeddingAdapter
 from src.infrastructure.embedding.bge_m3_adapter import BgeM3EmbeddingAdapter
+from src.infrastructure.embedding.micro_batcher import MicroBatchingEmbeddings
+from src.infrastructure.embedding.simulated_adapter import SimulatedEmbeddingAdapter
 from .base_provider_factory import BaseProviderFactory
 
 
@@ -47,11 +50,29 @@ class EmbeddingProviderFactory(BaseProviderFactory):
         elif embedding_type == "bge_m3":
             instance = BgeM3EmbeddingAdapter(
                 model_path=config["model_path"],
-                device=config["device"]
+                device=config["device"],
+                backend=config["backend"],
+                onnx_path=config["onnx_path"],
+                intra_op_threads=config["intra_op_threads"],
+                inter_op_threads=config["inter_op_threads"],
+                onnx_min_cosine=config["onnx_min_cosine"],
+                max_seq_length=config["max_seq_length"],
+                batch_token_budget=config["batch_token_budget"]
             )
+        elif embedding_type == "simulated":
+            instance = SimulatedEmbeddingAdapter(dimension=config["dimension"])
         else:
             raise ValueError(f"지원하지 않는 임베딩 타입: {embedding_type}")
         
+        # 동시에 들어온 단일 쿼리를 한 번의 배치로 임베딩
+        settings = self._config_container.config
+        instance = MicroBatchingEmbeddings(
+            instance,
+            max_batch_size=settings.EMBEDDING_MICRO_BATCH_SIZE,
+            max_wait_ms=settings.EMBEDDING_MICRO_BATCH_WAIT_MS,
+        )
+        # 같은 텍스트는 실행 간에 다시 임베딩하지 않도록 영구 임베딩 캐시로 감싸기 (캐시 적중은 배치 대기 없음)
+        instance = CachedEmbeddings(instance)
         self._instances[embedding_type] = instance
         return instance
     
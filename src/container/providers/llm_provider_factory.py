@@ -9,6 +9,7 @@ from typing import Dict, Any
 from src.config import SUPPORTED_LLM_TYPES
 from src.infrastructure.llm.gemini_adapter import GeminiAdapter
 from src.infrastructure.llm.hcx_adapter import HcxAdapter
+from src.infrastructure.llm.simulated_adapter import SimulatedLlmAdapter
 from src.application.ports.llm import LlmPort
 from .base_provider_factory import BaseProviderFactory
 
@@ -44,6 +45,8 @@ class LlmProviderFactory(BaseProviderFactory):
                 api_key=config["api_key"],
                 model_name=config["model_name"]
             )
+        elif llm_type == "simulated":
+            instance = SimulatedLlmAdapter(model_name=config["model_name"])
         else:
             raise ValueError(f"지원하지 않는 LLM 타입: {llm_type}")
         
@@ -6,6 +6,7 @@ from .exceptions import (
     EvaluationTimeoutError,
     InvalidEvaluationDataError,
     LLMConnectionError,
+    ProviderError,
 )
 from .value_objects import DEFAULT_THRESHOLDS, MetricScore, MetricThresholds
 
@@ -19,4 +20,5 @@ __all__ = [
     "InvalidEvaluationDataError",
     "EvaluationTimeoutError",
     "LLMConnectionError",
+    "ProviderError",
 ]
@@ -8,6 +8,12 @@ from .evaluation_exceptions import (
     InvalidDataFormatError,
     InvalidEvaluationDataError,
     LLMConnectionError,
+    ProviderAuthError,
+    ProviderError,
+    ProviderNetworkError,
+    ProviderRateLimitError,
+    ProviderResponseError,
+    provider_error_for_status,
 )
 
 __all__ = [
@@ -18,4 +24,10 @@ __all__ = [
     "EvaluationTimeoutError",
     "LLMConnectionError",
     "APIFailureError",
+    "ProviderError",
+    "ProviderAuthError",
+    "ProviderRateLimitError",
+    "ProviderNetworkError",
+    "ProviderResponseError",
+    "provider_error_for_status",
 ]
@@ -57,3 +57,49 @@ class APIFailureError(EvaluationError):
         self.total_count = total_count
         self.api_type = api_type
         super().__init__(message)
+
+
+class ProviderError(LLMConnectionError):
+    """LLM 프로바이더 호출 실패
+
+    오류 메시지가 답변으로 저장되어 평가되지 않도록 어댑터는 실패를 문자열 대신 이 예외로 전달합니다.
+    retryable이 True이면 잠시 후 다시 시도할 수 있는 일시적 실패입니다.
+    """
+
+    retryable = False
+
+    def __init__(self, message: str, provider: str = "unknown", status_code: int | None = None):
+        self.provider = provider
+        self.status_code = status_code
+        super().__init__(message, error_code=str(status_code) if status_code is not None else None)
+
+
+class ProviderAuthError(ProviderError):
+    """API 키/권한 오류 (401, 403)"""
+
+
+class ProviderRateLimitError(ProviderError):
+    """사용량 한도 초과 (429)"""
+
+    retryable = True
+
+
+class ProviderNetworkError(ProviderError):
+    """네트워크 오류 또는 서버 오류 (5xx)"""
+
+    retryable = True
+
+
+class ProviderResponseError(ProviderError):
+    """응답 구조를 해석할 수 없거나 빈 응답"""
+
+
+def provider_error_for_status(status_code: int, message: str, provider: str) -> ProviderError:
+    """HTTP 상태 코드에 맞는 프로바이더 예외 생성"""
+    if status_code in (401, 403):
+        return ProviderAuthError(message, provider, status_code)
+    if status_code == 429:
+        return ProviderRateLimitError(message, provider, status_code)
+    if status_code >= 500:
+        return ProviderNetworkError(message, provider, status_code)
+    return ProviderError(message, provider, status_code)
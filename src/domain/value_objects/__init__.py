@@ -1,5 +1,19 @@
 """Domain value objects module"""
 
-from .metrics import DEFAULT_THRESHOLDS, MetricScore, MetricThresholds
+from .metrics import (
+    DEFAULT_THRESHOLDS,
+    METRIC_INPUT_FIELDS,
+    MetricScore,
+    MetricThresholds,
+    depends_on_answer,
+    get_metric_input_fields,
+)
 
-__all__ = ["MetricScore", "MetricThresholds", "DEFAULT_THRESHOLDS"]
+__all__ = [
+    "MetricScore",
+    "MetricThresholds",
+    "DEFAULT_THRESHOLDS",
+    "METRIC_INPUT_FIELDS",
+    "depends_on_answer",
+    "get_metric_input_fields",
+]
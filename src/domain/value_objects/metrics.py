@@ -59,3 +59,26 @@ DEFAULT_THRESHOLDS: dict[str, MetricThresholds] = {
     "context_recall": MetricThresholds(excellent=0.95, good=0.85, fair=0.7),
     "context_precision": MetricThresholds(excellent=0.9, good=0.8, fair=0.6),
 }
+
+
+# 메트릭별로 점수에 영향을 주는 입력 필드
+# (답변과 무관한 컨텍스트 메트릭은 답변 변형(A/B) 간에 재사용 가능)
+METRIC_INPUT_FIELDS: dict[str, tuple[str, ...]] = {
+    "faithfulness": ("question", "contexts", "answer"),
+    "answer_relevancy": ("question", "answer"),
+    "context_recall": ("question", "contexts", "ground_truth"),
+    "context_precision": ("question", "contexts", "ground_truth"),
+    "answer_correctness": ("question", "answer", "ground_truth"),
+}
+
+ALL_INPUT_FIELDS: tuple[str, ...] = ("question", "contexts", "answer", "ground_truth")
+
+
+def get_metric_input_fields(metric_name: str) -> tuple[str, ...]:
+    """메트릭이 의존하는 입력 필드 반환 (알 수 없는 메트릭은 모든 필드)"""
+    return METRIC_INPUT_FIELDS.get(metric_name, ALL_INPUT_FIELDS)
+
+
+def depends_on_answer(metric_name: str) -> bool:
+    """메트릭 점수가 답변에 따라 달라지는지 여부"""
+    return "answer" in get_metric_input_fields(metric_name)
@@ -0,0 +1,33 @@
+"""Infrastructure cache module"""
+
+from .artifact_store import ArtifactStore, configure_artifact_store, get_artifact_store
+from .embedding_cache import (
+    CachedEmbeddings,
+    EmbeddingCache,
+    configure_embedding_cache,
+    get_embedding_cache,
+)
+from .llm_response_cache import (
+    LlmCacheMode,
+    LlmResponseCache,
+    configure_llm_cache,
+    get_llm_cache,
+)
+from .score_cache import ScoreCache, configure_score_cache, get_score_cache
+
+__all__ = [
+    "ArtifactStore",
+    "CachedEmbeddings",
+    "EmbeddingCache",
+    "LlmCacheMode",
+    "LlmResponseCache",
+    "ScoreCache",
+    "configure_artifact_store",
+    "configure_embedding_cache",
+    "configure_llm_cache",
+    "configure_score_cache",
+    "get_artifact_store",
+    "get_embedding_cache",
+    "get_llm_cache",
+    "get_score_cache",
+]
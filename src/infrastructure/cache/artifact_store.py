@@ -0,0 +1,299 @@
+"""
+샘플별 중간 산출물 저장소
+
+RAGAS 메트릭이 계산 과정에서 만드는 중간 산출물(답변 문장 분해, NLI 판정,
+역생성 질문, 임베딩)을 (종류, 평가 모델, 프롬프트, 입력)의 해시로 저장합니다.
+같은 실행 안에서는 메트릭끼리 한 번 계산한 결과를 공유하고(동시에 요청되면 먼저 시작한
+계산을 기다림), read-write 모드에서는 SQLite에 저장하여 재실행 시 다시 사용합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from src.infrastructure.cache.llm_response_cache import LlmCacheMode
+from src.utils.paths import CACHE_DIR, ensure_directory_exists
+
+
+ARTIFACT_STORE_PATH = CACHE_DIR / "sample_artifacts.db"
+
+
+class ArtifactStore:
+    """메모리 + SQLite 2단계 중간 산출물 저장소
+
+    값은 JSON으로 직렬화 가능한 객체입니다. 계산에 실패하면 저장하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        mode: LlmCacheMode | str = LlmCacheMode.READ_WRITE,
+        max_memory_entries: int = 10000,
+    ):
+        """중간 산출물 저장소 초기화
+
+        Args:
+            db_path: 데이터베이스 경로 (None이면 data/cache/sample_artifacts.db)
+            mode: 저장소 모드 (read-write, read-only, off)
+            max_memory_entries: 메모리에 보관할 최대 항목 수 (오래 사용하지 않은 항목부터 제거)
+        """
+        self.db_path = Path(db_path) if db_path else ARTIFACT_STORE_PATH
+        self.mode = LlmCacheMode(mode)
+        self.max_memory_entries = max_memory_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        # 계산 중인 키 -> 결과 Future (Future는 생성된 이벤트 루프에서만 기다릴 수 있음)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        if self.enabled:
+            self._init_db()
+
+    @property
+    def enabled(self) -> bool:
+        """저장소 사용 여부"""
+        return self.mode != LlmCacheMode.OFF
+
+    @property
+    def writable(self) -> bool:
+        """디스크 저장 가능 여부"""
+        return self.mode == LlmCacheMode.READ_WRITE
+
+    @staticmethod
+    def make_key(kind: str, model: str, fingerprint: str, payload: Any) -> str:
+        """산출물 키 생성 (종류, 모델, 프롬프트 식별값, 입력의 해시)"""
+        serialized = json.dumps(
+            {"kind": kind, "model": model, "fingerprint": fingerprint, "payload": payload},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _get_connection(self):
+        """데이터베이스 연결을 context manager로 관리"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """산출물 테이블 초기화"""
+        ensure_directory_exists(self.db_path.parent)
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sample_artifacts (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """
+            )
+
+    def _remember(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[Any]:
+        """메모리에 있는 산출물 조회 (없으면 None)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """산출물 조회 (메모리 → SQLite 순, 없으면 None)"""
+        if not self.enabled:
+            return None
+
+        value = self._recall(key)
+        if value is not None:
+            return value
+
+        value = None
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute("SELECT value FROM sample_artifacts WHERE key = ?", (key,)).fetchone()
+            if row:
+                value = json.loads(row[0])
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            print(f"⚠️ 중간 산출물 조회 실패: {e}")
+
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        self._remember(key, value)
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, kind: str, value: Any) -> None:
+        """산출물 저장 (메모리는 항상, SQLite는 read-write 모드에서만)"""
+        if not self.enabled or value is None:
+            return
+        self._remember(key, value)
+        if not self.writable:
+            return
+
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sample_artifacts (key, kind, value, created_at) VALUES (?, ?, ?, ?)",
+                    (key, kind, json.dumps(value, ensure_ascii=False), time.time()),
+                )
+        except (sqlite3.Error, TypeError) as e:
+            print(f"⚠️ 중간 산출물 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self.writes += 1
+
+    async def aget_or_compute(
+        self,
+        key: str,
+        kind: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_store: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """저장된 산출물을 반환하고, 없으면 계산하여 저장
+
+        같은 이벤트 루프에서 같은 키를 동시에 요청하면 먼저 시작한 계산 결과를 공유합니다.
+        계산이 실패하거나 취소되면 기다리던 요청은 각자 다시 계산합니다.
+
+        Args:
+            key: 산출물 키
+            kind: 산출물 종류 (statements, nli_verdicts, generated_questions, embedding)
+            compute: 산출물을 계산하는 코루틴 함수 (JSON 직렬화 가능한 값 반환)
+            should_store: 계산 결과를 저장할지 판단하는 함수
+        """
+        if not self.enabled:
+            return await compute()
+
+        # 메모리 적중은 바로 반환하고, SQLite 조회/저장은 이벤트 루프 밖에서 실행
+        value = self._recall(key)
+        if value is None:
+            value = await asyncio.to_thread(self.get, key)
+        if value is not None:
+            return value
+
+        # 진행 중인 계산 확인과 등록은 await 없이 루프 스레드에서 처리
+        future, owner = self._claim(key)
+        if not owner:
+            if future is not None:
+                value = await asyncio.shield(future)
+                if value is not None:
+                    with self._lock:
+                        self.shared += 1
+                    return value
+            return await compute()
+
+        try:
+            value = await compute()
+            if not future.done():
+                future.set_result(value)
+            if should_store(value):
+                await asyncio.to_thread(self.put, key, kind, value)
+            return value
+        finally:
+            if not future.done():
+                future.set_result(None)
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def _claim(self, key: str) -> Tuple[Optional[asyncio.Future], bool]:
+        """키 계산 담당 여부 결정 - (기다릴 Future, 직접 계산 여부)
+
+        다른 이벤트 루프(다른 스레드의 평가)가 계산 중이면 기다리지 않고 직접 계산합니다.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._inflight[key] = future
+                return future, True
+        if future.get_loop() is loop:
+            return future, False
+        return None, False
+
+    def clear(self) -> None:
+        """저장소 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+        if not self.enabled:
+            return
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM sample_artifacts")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode.value,
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "writes": self.writes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def print_stats(self) -> None:
+        """저장소 통계 출력"""
+        if not self.enabled:
+            return
+        stats = self.get_stats()
+        print(
+            f"🧱 중간 산출물 ({stats['mode']}): 재사용 {stats['hits']}건, 동시 요청 공유 {stats['shared']}건, "
+            f"계산 {stats['misses']}건 (재사용률 {stats['hit_rate'] * 100:.1f}%), 저장 {stats['writes']}건"
+        )
+
+
+# 프로세스 전역 저장소 인스턴스 (지연 초기화)
+_artifact_store: Optional[ArtifactStore] = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """전역 중간 산출물 저장소 반환 (설정값으로 지연 생성)"""
+    global _artifact_store
+    if _artifact_store is None:
+        with _artifact_store_lock:
+            if _artifact_store is None:
+                from src.config import settings
+
+                _artifact_store = ArtifactStore(mode=settings.ARTIFACT_CACHE_MODE)
+    return _artifact_store
+
+
+def configure_artifact_store(mode: LlmCacheMode | str) -> ArtifactStore:
+    """전역 중간 산출물 저장소 모드 변경 (CLI 옵션용)"""
+    global _artifact_store
+    with _artifact_store_lock:
+        _artifact_store = ArtifactStore(mode=mode)
+    return _artifact_store
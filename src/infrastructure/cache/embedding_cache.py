@@ -0,0 +1,366 @@
+"""
+영구 임베딩 캐시
+
+컨텍스트, 정답, 역생성 질문처럼 실행마다 반복되는 텍스트의 임베딩을 저장합니다.
+벡터는 float32/float16 배열로 추가 전용 파일(data/cache/embeddings_<dtype>.bin)에 이어 붙이고,
+SQLite 색인에 (텍스트 해시 → 오프셋, 모델, 차원)을 기록합니다. 조회는 파일을 메모리 매핑하여
+복사 없이 읽고, 한 번의 색인 질의로 배치 전체를 찾은 뒤 없는 텍스트만 원래 임베딩 모델로 보냅니다.
+
+파일 추가와 색인 기록은 SQLite 쓰기 트랜잭션 안에서 하므로 여러 프로세스(샤드)가 같은 캐시에
+동시에 기록해도 오프셋이 겹치지 않습니다.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.cache.llm_response_cache import LlmCacheMode
+from src.utils.paths import CACHE_DIR, ensure_directory_exists
+
+
+EMBEDDING_CACHE_DIR = CACHE_DIR
+SUPPORTED_DTYPES = {"float32": np.float32, "float16": np.float16}
+# SQLite IN 절 하나에 넣을 최대 키 수
+_LOOKUP_CHUNK = 500
+
+
+class EmbeddingCache:
+    """메모리 매핑 벡터 파일 + SQLite 색인 임베딩 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        mode: LlmCacheMode | str = LlmCacheMode.READ_WRITE,
+        dtype: str = "float32",
+    ):
+        """임베딩 캐시 초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 data/cache)
+            mode: 캐시 모드 (read-write, read-only, off)
+            dtype: 벡터 저장 형식 (float32, float16 - float16은 용량 절반, 정밀도 약 3자리)
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"지원하지 않는 임베딩 캐시 형식: {dtype}. 지원되는 형식: {list(SUPPORTED_DTYPES)}")
+        cache_dir = Path(cache_dir) if cache_dir else EMBEDDING_CACHE_DIR
+        self.db_path = cache_dir / "embeddings.db"
+        self.data_path = cache_dir / f"embeddings_{dtype}.bin"
+        self.mode = LlmCacheMode(mode)
+        self.dtype = dtype
+        self._np_dtype = np.dtype(SUPPORTED_DTYPES[dtype])
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._mmap: Optional[np.memmap] = None
+
+        if self.enabled:
+            self._init_db()
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.mode != LlmCacheMode.OFF
+
+    @property
+    def writable(self) -> bool:
+        """디스크 저장 가능 여부"""
+        return self.mode == LlmCacheMode.READ_WRITE
+
+    @staticmethod
+    def make_key(model_id: str, text: str) -> str:
+        """(모델, 텍스트) 해시 키"""
+        return hashlib.sha256(f"{model_id}\x00{text}".encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _get_connection(self):
+        """데이터베이스 연결을 context manager로 관리"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """색인 테이블 초기화"""
+        ensure_directory_exists(self.db_path.parent)
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_index (
+                    key TEXT NOT NULL,
+                    dtype TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    PRIMARY KEY (key, dtype)
+                )
+            """
+            )
+
+    def _mapped(self, end: int) -> Optional[np.memmap]:
+        """end 바이트까지 포함하는 벡터 파일 메모리 매핑 (다른 프로세스가 파일을 늘렸으면 다시 매핑)"""
+        with self._lock:
+            if self._mmap is None or len(self._mmap) < end:
+                if not self.data_path.exists() or self.data_path.stat().st_size < end:
+                    return None
+                self._mmap = np.memmap(self.data_path, dtype=np.uint8, mode="r")
+            return self._mmap
+
+    def get_many(self, model_id: str, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """텍스트별 저장된 벡터 일괄 조회 (없는 텍스트는 결과에서 빠짐)"""
+        texts = list(dict.fromkeys(texts))
+        if not self.enabled or not texts:
+            return {}
+
+        keys = {self.make_key(model_id, text): text for text in texts}
+        rows = []
+        try:
+            with self._get_connection() as conn:
+                key_list = list(keys)
+                for start in range(0, len(key_list), _LOOKUP_CHUNK):
+                    chunk = key_list[start:start + _LOOKUP_CHUNK]
+                    # 문자열에는 자리표시자(?)만 넣고 키 값은 매개변수로 전달
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(
+                        conn.execute(
+                            f"SELECT key, dim, offset FROM embedding_index WHERE dtype = ? AND key IN ({placeholders})",  # noqa: S608
+                            (self.dtype, *chunk),
+                        ).fetchall()
+                    )
+        except sqlite3.Error as e:
+            print(f"⚠️ 임베딩 캐시 조회 실패: {e}")
+            rows = []
+
+        found: Dict[str, List[float]] = {}
+        for key, dim, offset in rows:
+            nbytes = dim * self._np_dtype.itemsize
+            mapped = self._mapped(offset + nbytes)
+            if mapped is None:
+                continue
+            vector = mapped[offset:offset + nbytes].view(self._np_dtype)
+            found[keys[key]] = vector.astype(np.float32).tolist()
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(texts) - len(found)
+            # 다시 계산(요청)하지 않은 벡터의 float32 크기
+            self.bytes_saved += sum(len(vector) * 4 for vector in found.values())
+        return found
+
+    def put_many(self, model_id: str, vectors: Dict[str, List[float]]) -> None:
+        """텍스트별 벡터 저장 (read-write 모드에서만, 이미 있는 텍스트는 건너뜀)"""
+        if not self.writable or not vectors:
+            return
+
+        items = {self.make_key(model_id, text): vector for text, vector in vectors.items()}
+        try:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            try:
+                # 쓰기 잠금을 먼저 잡아 파일 끝 오프셋을 프로세스 간에 독점
+                conn.execute("BEGIN IMMEDIATE")
+                key_list = list(items)
+                existing = set()
+                for start in range(0, len(key_list), _LOOKUP_CHUNK):
+                    chunk = key_list[start:start + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    existing.update(
+                        row[0] for row in conn.execute(
+                            f"SELECT key FROM embedding_index WHERE dtype = ? AND key IN ({placeholders})",  # noqa: S608
+                            (self.dtype, *chunk),
+                        )
+                    )
+                rows = []
+                with open(self.data_path, "ab") as f:
+                    offset = f.tell()
+                    for key, vector in items.items():
+                        if key in existing:
+                            continue
+                        data = np.asarray(vector, dtype=self._np_dtype).tobytes()
+                        f.write(data)
+                        rows.append((key, self.dtype, model_id, len(vector), offset))
+                        offset += len(data)
+                conn.executemany(
+                    "INSERT INTO embedding_index (key, dtype, model, dim, offset) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self.writes += len(rows)
+
+    def clear(self) -> None:
+        """현재 형식(dtype)의 캐시 전체 삭제"""
+        with self._lock:
+            self._mmap = None
+        if not self.enabled:
+            return
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM embedding_index WHERE dtype = ?", (self.dtype,))
+        self.data_path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode.value,
+            "dtype": self.dtype,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "bytes_saved": self.bytes_saved,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "file_bytes": self.data_path.stat().st_size if self.data_path.exists() else 0,
+        }
+
+    def print_stats(self) -> None:
+        """캐시 통계 출력"""
+        if not self.enabled:
+            return
+        stats = self.get_stats()
+        print(
+            f"🧮 임베딩 캐시 ({stats['mode']}, {stats['dtype']}): 적중 {stats['hits']}건, 계산 {stats['misses']}건 "
+            f"(적중률 {stats['hit_rate'] * 100:.1f}%), 재계산 생략 {stats['bytes_saved'] / 1024 / 1024:.2f}MB, "
+            f"저장 {stats['writes']}건 (파일 {stats['file_bytes'] / 1024 / 1024:.1f}MB)"
+        )
+
+
+class CachedEmbeddings(Embeddings):
+    """임베딩 캐시를 거쳐 없는 텍스트만 원래 모델로 보내는 LangChain Embeddings 래퍼
+
+    store가 None이면 호출 시점의 전역 캐시를 사용하므로, 어댑터를 만든 뒤 CLI 옵션으로
+    캐시 모드를 바꿔도 반영됩니다. 그 외 속성(model_name, device 등)은 원래 임베딩으로 전달합니다.
+    """
+
+    def __init__(self, embeddings: Embeddings, store: Optional[EmbeddingCache] = None):
+        self.embeddings = embeddings
+        self._store = store
+        # 마이크로 배치 등 다른 래퍼 안의 실제 어댑터로 모델 식별
+        source = embeddings
+        while isinstance(source.__dict__.get("embeddings"), Embeddings):
+            source = source.__dict__["embeddings"]
+        name = (
+            getattr(source, "model_name", None)
+            or getattr(source, "model_path", None)
+            or getattr(source, "model", None)
+        )
+        self.model_id = f"{type(source).__name__}:{name}"
+
+    def __getattr__(self, name):
+        # 원래 임베딩의 속성(model_name, device 등)으로 전달
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    @property
+    def store(self) -> EmbeddingCache:
+        """사용할 임베딩 캐시"""
+        return self._store or get_embedding_cache()
+
+    def _lookup(self, texts: List[str]) -> tuple:
+        """(저장된 벡터, 계산할 텍스트 목록)"""
+        cached = self.store.get_many(self.model_id, texts)
+        missing = list(dict.fromkeys(text for text in texts if text not in cached))
+        return cached, missing
+
+    def _store_computed(self, texts: List[str], vectors: List[List[float]], cached: Dict[str, List[float]]) -> None:
+        computed = {}
+        for text, vector in zip(texts, vectors, strict=True):
+            vector = list(vector)
+            cached[text] = vector
+            # 어댑터가 실패 시 돌려주는 0 벡터는 저장하지 않음
+            if any(vector):
+                computed[text] = vector
+        self.store.put_many(self.model_id, computed)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (캐시에 없는 텍스트만 한 번의 배치로 계산)"""
+        if not self.store.enabled:
+            return self.embeddings.embed_documents(texts)
+        cached, missing = self._lookup(texts)
+        if missing:
+            self._store_computed(missing, self.embeddings.embed_documents(missing), cached)
+        return [cached[text] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩"""
+        if not self.store.enabled:
+            return self.embeddings.embed_query(text)
+        cached, missing = self._lookup([text])
+        if missing:
+            self._store_computed(missing, [self.embeddings.embed_query(text)], cached)
+        return cached[text]
+
+    # 비동기 경로는 SQLite 조회/저장(쓰기 잠금 대기 포함)을 스레드에서 실행하여 이벤트 루프를 막지 않음
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """비동기 문서 임베딩"""
+        if not self.store.enabled:
+            return await self.embeddings.aembed_documents(texts)
+        cached, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents(missing)
+            await asyncio.to_thread(self._store_computed, missing, vectors, cached)
+        return [cached[text] for text in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """비동기 쿼리 임베딩"""
+        if not self.store.enabled:
+            return await self.embeddings.aembed_query(text)
+        cached, missing = await asyncio.to_thread(self._lookup, [text])
+        if missing:
+            vector = await self.embeddings.aembed_query(text)
+            await asyncio.to_thread(self._store_computed, missing, [vector], cached)
+        return cached[text]
+
+
+# 프로세스 전역 캐시 인스턴스 (지연 초기화)
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """전역 임베딩 캐시 반환 (설정값으로 지연 생성)"""
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                from src.config import settings
+
+                _embedding_cache = EmbeddingCache(
+                    mode=settings.EMBEDDING_CACHE_MODE, dtype=settings.EMBEDDING_CACHE_DTYPE
+                )
+    return _embedding_cache
+
+
+def configure_embedding_cache(mode: LlmCacheMode | str, dtype: Optional[str] = None) -> EmbeddingCache:
+    """전역 임베딩 캐시 모드 변경 (CLI 옵션용)"""
+    global _embedding_cache
+    from src.config import settings
+
+    with _embedding_cache_lock:
+        _embedding_cache = EmbeddingCache(mode=mode, dtype=dtype or settings.EMBEDDING_CACHE_DTYPE)
+    return _embedding_cache
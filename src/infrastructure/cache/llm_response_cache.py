@@ -0,0 +1,312 @@
+"""
+LLM 응답 캐시
+
+모델/프롬프트/생성 파라미터가 동일한 LLM 호출의 응답을 SQLite에 저장하여
+같은 데이터셋을 다시 평가할 때 네트워크 호출을 생략합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.paths import CACHE_DIR, ensure_directory_exists
+
+
+LLM_CACHE_PATH = CACHE_DIR / "llm_responses.db"
+
+
+class LlmCacheMode(str, Enum):
+    """LLM 응답 캐시 동작 모드"""
+
+    READ_WRITE = "read-write"
+    READ_ONLY = "read-only"
+    OFF = "off"
+
+
+class LlmResponseCache:
+    """SQLite 기반 content-addressed LLM 응답 캐시
+
+    키는 (모델, 프롬프트, temperature, maxTokens, stop)의 SHA-256 해시입니다.
+    용량(MB)과 보존 기간(일)을 기준으로 오래된 항목부터 정리합니다.
+    """
+
+    # 이 횟수만큼 저장할 때마다 정리 작업 수행
+    EVICTION_INTERVAL = 100
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        mode: LlmCacheMode | str = LlmCacheMode.READ_WRITE,
+        max_size_mb: float = 512.0,
+        max_age_days: float = 30.0,
+    ):
+        """LLM 응답 캐시 초기화
+
+        Args:
+            db_path: 캐시 데이터베이스 경로 (None이면 data/cache/llm_responses.db)
+            mode: 캐시 모드 (read-write, read-only, off)
+            max_size_mb: 최대 캐시 크기 (MB, 0 이하면 제한 없음)
+            max_age_days: 최대 보존 기간 (일, 0 이하면 제한 없음)
+        """
+        self.db_path = Path(db_path) if db_path else LLM_CACHE_PATH
+        self.mode = LlmCacheMode(mode)
+        self.max_size_mb = max_size_mb
+        self.max_age_days = max_age_days
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self._init_db()
+            if self.writable:
+                self.evict()
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.mode != LlmCacheMode.OFF
+
+    @property
+    def writable(self) -> bool:
+        """캐시 저장 가능 여부"""
+        return self.mode == LlmCacheMode.READ_WRITE
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+    ) -> str:
+        """캐시 키 생성 (요청 내용의 해시)"""
+        payload = json.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stop": list(stop) if stop else [],
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _get_connection(self):
+        """데이터베이스 연결을 context manager로 관리"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """캐시 테이블 초기화"""
+        ensure_directory_exists(self.db_path.parent)
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access "
+                "ON llm_responses(last_access)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (없으면 None)"""
+        if not self.enabled:
+            return None
+
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row and self._is_expired(row[1]):
+                    row = None
+                if row and self.writable:
+                    conn.execute(
+                        "UPDATE llm_responses SET last_access = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 조회 실패: {e}")
+            row = None
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """응답 저장 (read-write 모드에서만)"""
+        if not self.writable or not response:
+            return
+
+        now = time.time()
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_responses
+                    (key, model, response, size_bytes, created_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (key, model, response, len(response.encode("utf-8")), now, now),
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self.writes += 1
+            run_eviction = self.writes % self.EVICTION_INTERVAL == 0
+        if run_eviction:
+            self.evict()
+
+    def _is_expired(self, created_at: float) -> bool:
+        """보존 기간 초과 여부"""
+        if self.max_age_days <= 0:
+            return False
+        return time.time() - created_at > self.max_age_days * 86400
+
+    def evict(self) -> int:
+        """보존 기간이 지났거나 용량을 초과한 항목 정리
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        if not self.writable:
+            return 0
+
+        removed = 0
+        try:
+            with self._get_connection() as conn:
+                if self.max_age_days > 0:
+                    cutoff = time.time() - self.max_age_days * 86400
+                    removed += conn.execute(
+                        "DELETE FROM llm_responses WHERE created_at < ?", (cutoff,)
+                    ).rowcount
+
+                if self.max_size_mb > 0:
+                    max_bytes = int(self.max_size_mb * 1024 * 1024)
+                    total = conn.execute(
+                        "SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+                    ).fetchone()[0]
+                    if total > max_bytes:
+                        # 최근에 사용되지 않은 항목부터 삭제
+                        rows = conn.execute(
+                            "SELECT key, size_bytes FROM llm_responses ORDER BY last_access ASC"
+                        ).fetchall()
+                        stale_keys = []
+                        for key, size in rows:
+                            if total <= max_bytes:
+                                break
+                            stale_keys.append((key,))
+                            total -= size
+                        conn.executemany("DELETE FROM llm_responses WHERE key = ?", stale_keys)
+                        removed += len(stale_keys)
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 정리 실패: {e}")
+        return removed
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        if not self.enabled:
+            return
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM llm_responses")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        stats: Dict[str, Any] = {
+            "mode": self.mode.value,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+        if self.enabled:
+            try:
+                with self._get_connection() as conn:
+                    count, size = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+                    ).fetchone()
+                stats["entries"] = count
+                stats["size_mb"] = round(size / (1024 * 1024), 2)
+            except sqlite3.Error:
+                pass
+        return stats
+
+    def print_stats(self) -> None:
+        """캐시 통계 출력"""
+        if not self.enabled:
+            return
+        stats = self.get_stats()
+        print(
+            f"🗃️ LLM 캐시 ({stats['mode']}): 적중 {stats['hits']}회, 미스 {stats['misses']}회 "
+            f"(적중률 {stats['hit_rate'] * 100:.1f}%), 저장 {stats['writes']}건"
+        )
+
+
+# 프로세스 전역 캐시 인스턴스 (지연 초기화)
+_llm_cache: Optional[LlmResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LlmResponseCache:
+    """전역 LLM 응답 캐시 반환 (설정값으로 지연 생성)"""
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                from src.config import settings
+
+                _llm_cache = LlmResponseCache(
+                    mode=settings.LLM_CACHE_MODE,
+                    max_size_mb=settings.LLM_CACHE_MAX_SIZE_MB,
+                    max_age_days=settings.LLM_CACHE_MAX_AGE_DAYS,
+                )
+    return _llm_cache
+
+
+def configure_llm_cache(mode: LlmCacheMode | str) -> LlmResponseCache:
+    """전역 LLM 응답 캐시 모드 변경 (CLI 옵션용)"""
+    global _llm_cache
+    from src.config import settings
+
+    with _llm_cache_lock:
+        _llm_cache = LlmResponseCache(
+            mode=mode,
+            max_size_mb=settings.LLM_CACHE_MAX_SIZE_MB,
+            max_age_days=settings.LLM_CACHE_MAX_AGE_DAYS,
+        )
+    return _llm_cache
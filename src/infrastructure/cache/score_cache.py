@@ -0,0 +1,223 @@
+"""
+샘플별 메트릭 점수 캐시
+
+(메트릭이 의존하는 샘플 필드, 메트릭, 평가 LLM, 임베딩 모델, 프롬프트 타입)이
+동일한 평가 결과를 SQLite에 저장하여 재평가 시 변경된 행만 계산하도록 합니다.
+컨텍스트 메트릭처럼 답변과 무관한 점수는 답변만 다른 변형(A/B) 간에 재사용됩니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.domain.value_objects.metrics import get_metric_input_fields
+from src.infrastructure.cache.llm_response_cache import LlmCacheMode
+from src.utils.paths import CACHE_DIR, ensure_directory_exists
+
+
+SCORE_CACHE_PATH = CACHE_DIR / "sample_scores.db"
+
+
+class ScoreCache:
+    """SQLite 기반 (샘플, 메트릭) 단위 점수 캐시
+
+    실패한 평가(None/NaN)는 저장하지 않으므로 다음 실행에서 다시 평가됩니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        mode: LlmCacheMode | str = LlmCacheMode.READ_WRITE,
+    ):
+        """점수 캐시 초기화
+
+        Args:
+            db_path: 캐시 데이터베이스 경로 (None이면 data/cache/sample_scores.db)
+            mode: 캐시 모드 (read-write, read-only, off)
+        """
+        self.db_path = Path(db_path) if db_path else SCORE_CACHE_PATH
+        self.mode = LlmCacheMode(mode)
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self._init_db()
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.mode != LlmCacheMode.OFF
+
+    @property
+    def writable(self) -> bool:
+        """캐시 저장 가능 여부"""
+        return self.mode == LlmCacheMode.READ_WRITE
+
+    @staticmethod
+    def make_key(
+        sample: Dict[str, Any],
+        metric_name: str,
+        judge_model: str,
+        embedding_model: str,
+        prompt_type: str,
+    ) -> str:
+        """점수 키 생성 (메트릭이 의존하는 샘플 필드와 평가 설정의 해시)"""
+        fields = get_metric_input_fields(metric_name)
+        payload = json.dumps(
+            {
+                "sample": {field: sample.get(field) for field in fields},
+                "metric": metric_name,
+                "judge_model": judge_model,
+                "embedding_model": embedding_model,
+                "prompt_type": prompt_type,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _get_connection(self):
+        """데이터베이스 연결을 context manager로 관리"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """캐시 테이블 초기화"""
+        ensure_directory_exists(self.db_path.parent)
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sample_scores (
+                    key TEXT PRIMARY KEY,
+                    metric TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """
+            )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, float]:
+        """여러 키의 점수 조회 (캐시에 있는 키만 반환)"""
+        keys = list(dict.fromkeys(keys))
+        if not self.enabled or not keys:
+            return {}
+
+        found: Dict[str, float] = {}
+        try:
+            with self._get_connection() as conn:
+                # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    # 문자열에는 자리표시자(?)만 넣고 키 값은 매개변수로 전달
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, score FROM sample_scores WHERE key IN ({placeholders})",  # noqa: S608
+                        chunk,
+                    ).fetchall()
+                    found.update(rows)
+        except sqlite3.Error as e:
+            print(f"⚠️ 점수 캐시 조회 실패: {e}")
+            found = {}
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, str, Optional[float]]]) -> None:
+        """(키, 메트릭 이름, 점수) 목록 저장 (read-write 모드에서만, 실패 점수 제외)"""
+        if not self.writable:
+            return
+
+        now = time.time()
+        rows = [
+            (key, metric, float(score), now)
+            for key, metric, score in entries
+            if score is not None and score == score  # None과 NaN 제외
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sample_scores (key, metric, score, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ 점수 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self.writes += len(rows)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        if not self.enabled:
+            return
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM sample_scores")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode.value,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def print_stats(self) -> None:
+        """캐시 통계 출력"""
+        if not self.enabled:
+            return
+        stats = self.get_stats()
+        print(
+            f"🗃️ 점수 캐시 ({stats['mode']}): 재사용 {stats['hits']}건, 계산 {stats['misses']}건 "
+            f"(재사용률 {stats['hit_rate'] * 100:.1f}%), 저장 {stats['writes']}건"
+        )
+
+
+# 프로세스 전역 캐시 인스턴스 (지연 초기화)
+_score_cache: Optional[ScoreCache] = None
+_score_cache_lock = threading.Lock()
+
+
+def get_score_cache() -> ScoreCache:
+    """전역 점수 캐시 반환 (설정값으로 지연 생성)"""
+    global _score_cache
+    if _score_cache is None:
+        with _score_cache_lock:
+            if _score_cache is None:
+                from src.config import settings
+
+                _score_cache = ScoreCache(mode=settings.SCORE_CACHE_MODE)
+    return _score_cache
+
+
+def configure_score_cache(mode: LlmCacheMode | str) -> ScoreCache:
+    """전역 점수 캐시 모드 변경 (CLI 옵션용)"""
+    global _score_cache
+    with _score_cache_lock:
+        _score_cache = ScoreCache(mode=mode)
+    return _score_cache
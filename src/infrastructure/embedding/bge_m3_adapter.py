@@ -2,29 +2,62 @@
 BGE-M3 로컬 임베딩 모델 어댑터
 sentence-transformers를 사용한 로컬 임베딩 처리
 CUDA GPU 자동 감지 및 최적화 지원
+CPU 전용 서버용 ONNX Runtime(int8 양자화) 백엔드 지원 (BGE_M3_BACKEND=onnx)
+문서 임베딩은 토큰 길이순 버킷과 토큰 예산 기반 배치 크기로 패딩 낭비를 줄임
 """
 
+import asyncio
 import os
 import time
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from langchain_core.embeddings import Embeddings
 from sentence_transformers import SentenceTransformer
-from src.config import SUPPORTED_DEVICE_TYPES
+from src.config import SUPPORTED_BGE_M3_BACKENDS, SUPPORTED_DEVICE_TYPES
+from src.infrastructure.embedding.length_buckets import padded_tokens, plan_token_batches
 
 
 class BgeM3EmbeddingAdapter(Embeddings):
     """BGE-M3 로컬 임베딩 모델 어댑터 (GPU 자동 감지)"""
     
-    def __init__(self, model_path: Optional[str] = None, device: Optional[str] = None):
+    # 디바이스별 (배치당 최대 문서 수, 배치당 패딩 포함 토큰 예산)
+    BATCH_LIMITS = {
+        "cuda": (256, 65536),
+        "mps": (128, 32768),
+        "cpu": (128, 8192),
+    }
+    
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        device: Optional[str] = None,
+        backend: str = "torch",
+        onnx_path: Optional[str] = None,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+        max_seq_length: Optional[int] = None,
+        batch_token_budget: Optional[int] = None,
+        onnx_min_cosine: Optional[float] = None,
+    ):
         """
         BGE-M3 모델을 초기화합니다.
         
         Args:
             model_path: 로컬 모델 경로 (None이면 자동 다운로드)
             device: 실행 디바이스 (None이면 자동 감지, "cpu", "cuda", "mps")
+            backend: 추론 백엔드 ("torch", "onnx" - onnx는 CPU에서 ONNX Runtime으로 실행)
+            onnx_path: ONNX로 내보낸 모델 디렉토리 (onnx 백엔드용)
+            intra_op_threads: ONNX Runtime 연산 내부 스레드 수 (None이면 물리 코어 수)
+            inter_op_threads: ONNX Runtime 연산 간 스레드 수
+            max_seq_length: 최대 토큰 수, 초과분은 잘림 (None이면 모델 기본값 8192)
+            batch_token_budget: 문서 임베딩 배치당 패딩 포함 최대 토큰 수 (None이면 디바이스별 기본값)
+            onnx_min_cosine: ONNX 모델에 요구하는 PyTorch 백엔드와의 최소 코사인 유사도 (None이면 내보낼 때의 기준)
         """
+        if backend not in SUPPORTED_BGE_M3_BACKENDS:
+            raise ValueError(f"지원하지 않는 BGE-M3 백엔드: {backend}. 지원되는 백엔드: {SUPPORTED_BGE_M3_BACKENDS}")
         # model_path가 None이거나 비어있으면 Hugging Face 기본값 사용
         if not model_path or model_path.strip() == "":
             self.model_path = "BAAI/bge-m3"
@@ -32,20 +65,41 @@ class BgeM3EmbeddingAdapter(Embeddings):
             self.model_path = model_path
             
         self.device = device  # 지연 감지로 변경
+        self.onnx_path = onnx_path or "./models/bge-m3-onnx"
+        self.onnx_min_cosine = onnx_min_cosine
+        # 캐시 식별자가 실제로 쓰는 백엔드를 따르도록 모델 로딩 전에 ONNX 사용 가능 여부 결정
+        self.backend = self._resolve_onnx_backend() if backend == "onnx" else backend
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.max_seq_length = max_seq_length
+        self.batch_token_budget = batch_token_budget
+        # 임베딩 캐시 키용 모델 식별자 (ONNX 벡터는 PyTorch와 근사값이고, 잘림 길이가 다르면 벡터도 다르므로 따로 저장)
+        self.model_name = self.model_path if self.backend == "torch" else f"{self.model_path}@onnx"
+        if max_seq_length:
+            self.model_name += f"@max{max_seq_length}"
         self.model = None
         self.device_info = {}
         self._initialized = False
+        self._init_lock = threading.Lock()
+        # 비동기 임베딩 전용 인코딩 스레드 (지연 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
         
-        print(f"🔧 BGE-M3 어댑터 초기화됨 (모델 로딩은 지연됨)")
+        print(f"🔧 BGE-M3 어댑터 초기화됨 (백엔드: {self.backend}, 모델 로딩은 지연됨)")
     
     def _ensure_model_loaded(self):
-        """모델이 로딩되지 않았다면 로딩합니다."""
+        """모델이 로딩되지 않았다면 로딩합니다. (동기/비동기 경로가 동시에 호출해도 한 번만 로딩)"""
         if not self._initialized:
-            self._initialize_model()
-            self._initialized = True
+            with self._init_lock:
+                if not self._initialized:
+                    self._initialize_model()
+                    self._initialized = True
     
     def _initialize_model(self):
         """실제 모델 초기화 및 로딩"""
+        if self.backend == "onnx":
+            self._load_onnx_model()
+            return
+        
         # 디바이스 감지
         if self.device is None:
             self.device = self._detect_best_device()
@@ -176,6 +230,7 @@ class BgeM3EmbeddingAdapter(Embeddings):
             print(f"📊 모델 정보:")
             print(f"   - 모델명: {self.model_path}")
             print(f"   - 디바이스: {self.device}")
+            self._apply_max_seq_length()
             print(f"   - 최대 시퀀스 길이: {self.model.max_seq_length}")
             
             # GPU 메모리 사용량 확인
@@ -192,6 +247,68 @@ class BgeM3EmbeddingAdapter(Embeddings):
                 print("   4. GPU 메모리 부족 시 CPU로 폴백: device='cpu'")
             raise
     
+    def _resolve_onnx_backend(self) -> str:
+        """ONNX 백엔드를 쓸 수 있는지 확인하고 실제로 사용할 백엔드 반환 (없거나 기준 미달이면 torch)"""
+        from src.infrastructure.embedding.bge_m3_onnx import check_onnx_export, onnxruntime_available
+        
+        if not onnxruntime_available():
+            print("⚠️ onnxruntime이 설치되지 않아 PyTorch 백엔드를 사용합니다.")
+            print("💡 설치 명령어: uv pip install -e '.[onnx]'")
+            return "torch"
+        try:
+            check_onnx_export(self.onnx_path, self.onnx_min_cosine)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"⚠️ ONNX 백엔드를 사용할 수 없어 PyTorch 백엔드를 사용합니다: {e}")
+            return "torch"
+        return "onnx"
+    
+    def _load_onnx_model(self):
+        """ONNX Runtime 백엔드 로드
+        
+        백엔드는 생성 시 확인했으므로 여기서 실패하면 PyTorch로 바꾸지 않고 예외를 전파합니다
+        (바꾸면 PyTorch 벡터가 ONNX 캐시 식별자로 저장됨).
+        """
+        from src.infrastructure.embedding.bge_m3_onnx import OnnxBgeM3Encoder
+        
+        print(f"🔄 BGE-M3 ONNX 모델 로딩 중... ({self.onnx_path})")
+        start_time = time.time()
+        self.model = OnnxBgeM3Encoder.load(
+            self.onnx_path,
+            intra_op_threads=self.intra_op_threads,
+            inter_op_threads=self.inter_op_threads,
+            min_cosine=self.onnx_min_cosine,
+        )
+        self.device = "cpu"
+        self.device_info = {"type": "cpu", "cores": os.cpu_count(), "backend": "onnx"}
+        
+        load_time = time.time() - start_time
+        print(f"✅ BGE-M3 ONNX 모델 로드 완료 ({load_time:.2f}초)")
+        print(f"   - 스레드: intra {self.model.session.get_session_options().intra_op_num_threads}, "
+              f"inter {self.inter_op_threads}")
+        self._apply_max_seq_length()
+        print(f"   - 최대 시퀀스 길이: {self.model.max_seq_length}")
+    
+    def _apply_max_seq_length(self):
+        """설정된 최대 토큰 수를 모델에 적용 (긴 컨텍스트는 잘라서 인코딩)"""
+        if self.max_seq_length:
+            self.model.max_seq_length = self.max_seq_length
+    
+    def _token_lengths(self, texts: List[str]) -> List[int]:
+        """텍스트별 토큰 수 (잘림 적용, 토크나이저가 없으면 문자 수로 근사)"""
+        tokenizer = getattr(self.model, "tokenizer", None)
+        max_length = getattr(self.model, "max_seq_length", None)
+        if tokenizer is None:
+            return [min(len(text), max_length or len(text)) for text in texts]
+        input_ids = tokenizer(
+            texts, add_special_tokens=True, truncation=bool(max_length), max_length=max_length
+        )["input_ids"]
+        return [len(ids) for ids in input_ids]
+    
+    def _batch_limits(self):
+        """배치당 최대 문서 수와 토큰 예산"""
+        max_batch_size, token_budget = self.BATCH_LIMITS.get(self.device, self.BATCH_LIMITS["cpu"])
+        return max_batch_size, self.batch_token_budget or token_budget
+    
     def _print_gpu_memory_usage(self):
         """GPU 메모리 사용량을 출력합니다."""
         try:
@@ -219,25 +336,27 @@ class BgeM3EmbeddingAdapter(Embeddings):
             print(f"🔄 {len(texts)}개 문서 임베딩 중...")
             start_time = time.time()
             
-            # 디바이스별 배치 크기 최적화
-            if self.device == "cuda":
-                batch_size = 64  # GPU는 큰 배치 크기
-                show_progress = len(texts) > 20
-            elif self.device == "mps":
-                batch_size = 32  # Apple Silicon 최적화
-                show_progress = len(texts) > 15
-            else:
-                batch_size = 16  # CPU는 작은 배치 크기
-                show_progress = len(texts) > 10
+            # 토큰 길이순 버킷으로 나누고 버킷마다 토큰 예산 안에서 배치 크기 결정
+            lengths = self._token_lengths(texts)
+            max_batch_size, token_budget = self._batch_limits()
+            batches = plan_token_batches(lengths, token_budget, max_batch_size)
+            real_tokens = sum(lengths)
+            padded = padded_tokens(lengths, batches)
+            print(f"   - 배치 {len(batches)}개, 토큰 {real_tokens:,}개 (패딩 포함 {padded:,}개, "
+                  f"효율 {real_tokens / padded if padded else 1:.0%})")
             
-            # BGE-M3으로 임베딩 생성
-            embeddings = self.model.encode(
-                texts,
-                convert_to_tensor=False,
-                show_progress_bar=show_progress,
-                batch_size=batch_size,
-                normalize_embeddings=True  # 코사인 유사도 최적화
-            )
+            # BGE-M3으로 임베딩 생성 후 원래 순서로 복원
+            embeddings: List[Optional[List[float]]] = [None] * len(texts)
+            for indices in batches:
+                vectors = self.model.encode(
+                    [texts[index] for index in indices],
+                    convert_to_tensor=False,
+                    show_progress_bar=False,
+                    batch_size=len(indices),
+                    normalize_embeddings=True  # 코사인 유사도 최적화
+                )
+                for index, vector in zip(indices, vectors, strict=True):
+                    embeddings[index] = vector.tolist() if hasattr(vector, 'tolist') else list(vector)
             
             embed_time = time.time() - start_time
             throughput = len(texts) / embed_time if embed_time > 0 else 0
@@ -251,16 +370,12 @@ class BgeM3EmbeddingAdapter(Embeddings):
                 except:
                     pass
             
-            # numpy array를 list로 변환
-            if hasattr(embeddings, 'tolist'):
-                return embeddings.tolist()
-            else:
-                return [emb.tolist() if hasattr(emb, 'tolist') else emb for emb in embeddings]
-                
+            return embeddings
+            
         except Exception as e:
             print(f"❌ 문서 임베딩 실패: {e}")
             if self.device == "cuda" and "out of memory" in str(e).lower():
-                print("💡 GPU 메모리 부족 시 배치 크기를 줄이거나 CPU로 전환하세요.")
+                print("💡 GPU 메모리 부족 시 BGE_M3_BATCH_TOKEN_BUDGET을 줄이거나 CPU로 전환하세요.")
             # 실패한 경우 빈 벡터로 처리 (BGE-M3는 1024차원)
             return [[0.0] * 1024 for _ in texts]
     
@@ -314,13 +429,27 @@ class BgeM3EmbeddingAdapter(Embeddings):
             # 실패한 경우 기본값 반환
             return [[0.0] * len(embeddings2) for _ in embeddings1]
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """비동기 임베딩 전용 인코딩 스레드 풀
+        
+        인코딩은 PyTorch/ONNX Runtime이 내부 스레드로 병렬화하므로 작업자는 1개로 두어
+        요청을 순서대로 처리합니다. 연산 중에는 GIL이 풀리므로 이벤트 루프의 LLM 호출은 계속 진행됩니다.
+        """
+        if self._executor is None:
+            with self._init_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bge-m3-encode")
+        return self._executor
+    
     async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
-        """비동기 문서 임베딩 (동기 버전으로 폴백)"""
-        return self.embed_documents(texts)
+        """비동기 문서 임베딩 (전용 스레드에서 인코딩하여 이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.embed_documents, texts)
     
     async def aembed_query(self, text: str) -> List[float]:
-        """비동기 쿼리 임베딩 (동기 버전으로 폴백)"""
-        return self.embed_query(text)
+        """비동기 쿼리 임베딩 (전용 스레드에서 인코딩하여 이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.embed_query, text)
     
     def save_model_locally(self, save_path: str):
         """모델을 로컬에 저장합니다."""
@@ -346,6 +475,7 @@ class BgeM3EmbeddingAdapter(Embeddings):
             "max_seq_length": getattr(self.model, 'max_seq_length', 'unknown'),
             "embedding_dimension": 1024,  # BGE-M3 고정 차원
             "model_type": "BGE-M3",
+            "backend": self.backend,
             "device_info": self.device_info
         }
         
@@ -0,0 +1,339 @@
+"""
+BGE-M3 ONNX Runtime 백엔드
+
+CPU 전용 서버에서 PyTorch fp32 `SentenceTransformer.encode` 대신 사용하는 추론 경로입니다.
+`export_bge_m3_onnx`로 한 번 ONNX로 내보내고(선택적으로 가중치 int8 동적 양자화),
+PyTorch 백엔드와의 코사인 일치도를 검증한 결과를 함께 저장합니다. 실행 시에는
+`OnnxBgeM3Encoder.load`가 저장된 최소 코사인이 현재 기준 이상인 모델만 ONNX Runtime 세션(스레드 수 조정)으로 엽니다.
+
+onnxruntime은 선택 의존성이며 ONNX 백엔드를 사용할 때만 필요합니다.
+"""
+
+import importlib.util
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# 내보낸 디렉토리 구성
+ONNX_MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_int8.onnx"
+ONNX_CONFIG_FILE = "onnx_config.json"
+SUPPORTED_POOLING = ["cls", "mean"]
+# 내보내기 후 PyTorch 백엔드와 비교할 문장 (한국어/영어/혼용, 길이 다양)
+VALIDATION_TEXTS = [
+    "원자력 발전소의 냉각 계통은 노심에서 발생한 열을 제거한다.",
+    "수력 발전은 물의 위치 에너지를 전기 에너지로 변환하는 방식이다.",
+    "What is the rated output of the turbine generator?",
+    "RAG 평가에서 faithfulness는 답변이 컨텍스트에 근거하는 정도를 측정한다.",
+    "짧은 질문",
+    "The reactor protection system automatically shuts down the reactor when safety limits are exceeded, "
+    "and the emergency core cooling system supplies water to keep the fuel covered.",
+]
+
+
+def cosine_agreement(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """행별 코사인 유사도 (두 백엔드가 같은 문장에 낸 벡터 비교)"""
+    reference = np.asarray(reference, dtype=np.float32)
+    candidate = np.asarray(candidate, dtype=np.float32)
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    return np.sum(reference * candidate, axis=1) / np.maximum(norms, 1e-12)
+
+
+def default_intra_op_threads() -> int:
+    """연산 내부 병렬 스레드 기본값 (물리 코어 수 - 하이퍼스레딩은 행렬 연산에 이득이 적음)"""
+    try:
+        import psutil
+
+        return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    except ImportError:
+        return os.cpu_count() or 1
+
+
+def read_onnx_config(onnx_dir: str | Path) -> Dict[str, Any]:
+    """내보낸 디렉토리의 설정 읽기
+
+    Raises:
+        FileNotFoundError: 내보낸 모델이 없는 경우
+    """
+    config_path = Path(onnx_dir) / ONNX_CONFIG_FILE
+    if not config_path.exists():
+        raise FileNotFoundError(f"ONNX 모델 설정이 없습니다: {config_path} (python hello.py --export-onnx로 내보내기)")
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def onnxruntime_available() -> bool:
+    """onnxruntime 설치 여부 (모듈을 불러오지 않고 확인)"""
+    return importlib.util.find_spec("onnxruntime") is not None
+
+
+def check_onnx_export(onnx_dir: str | Path, min_cosine: Optional[float] = None) -> Dict[str, Any]:
+    """내보낸 모델 설정을 읽고 PyTorch 백엔드와의 일치도가 기준 이상인지 확인
+
+    Args:
+        onnx_dir: export_bge_m3_onnx 출력 디렉토리
+        min_cosine: 요구하는 최소 코사인 유사도 (None이면 내보낼 때의 기준)
+
+    Returns:
+        내보낸 모델 설정
+
+    Raises:
+        FileNotFoundError: 내보낸 모델이 없는 경우
+        ValueError: 저장된 최소 코사인이 기준보다 낮은 경우
+    """
+    config = read_onnx_config(onnx_dir)
+    validation = config.get("validation") or {}
+    required = validation.get("min_required") if min_cosine is None else min_cosine
+    measured = validation.get("min_cosine")
+    if measured is None or required is None or measured < required:
+        raise ValueError(
+            f"ONNX 모델이 PyTorch 백엔드와의 일치도 검증을 통과하지 못했습니다 "
+            f"(최소 코사인 {measured}, 기준 {required})"
+        )
+    return config
+
+
+def _write_onnx_config(onnx_dir: Path, config: Dict[str, Any]) -> None:
+    with open(onnx_dir / ONNX_CONFIG_FILE, "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+
+class OnnxBgeM3Encoder:
+    """ONNX Runtime으로 BGE-M3 밀집 벡터를 계산하는 인코더
+
+    SentenceTransformer와 같은 `encode`/`similarity`/`max_seq_length`를 제공하므로
+    BgeM3EmbeddingAdapter가 백엔드와 무관하게 같은 코드로 호출합니다.
+    """
+
+    def __init__(self, session: Any, tokenizer: Any, pooling: str = "cls", max_seq_length: int = 8192):
+        """
+        Args:
+            session: onnxruntime.InferenceSession (입력 input_ids/attention_mask, 출력 last_hidden_state)
+            tokenizer: Hugging Face 토크나이저
+            pooling: 문장 벡터 풀링 방식 (cls, mean - BGE-M3는 cls)
+            max_seq_length: 최대 토큰 수 (초과분은 잘림)
+        """
+        if pooling not in SUPPORTED_POOLING:
+            raise ValueError(f"지원하지 않는 풀링 방식: {pooling}. 지원되는 방식: {SUPPORTED_POOLING}")
+        self.session = session
+        self.tokenizer = tokenizer
+        self.pooling = pooling
+        self.max_seq_length = max_seq_length
+        self._input_names = {item.name for item in session.get_inputs()}
+
+    @classmethod
+    def load(
+        cls,
+        onnx_dir: str | Path,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+        min_cosine: Optional[float] = None,
+    ) -> "OnnxBgeM3Encoder":
+        """내보낸 디렉토리에서 인코더 생성
+
+        Args:
+            onnx_dir: export_bge_m3_onnx 출력 디렉토리
+            intra_op_threads: 연산 내부 병렬 스레드 수 (None이면 물리 코어 수)
+            inter_op_threads: 연산 간 병렬 스레드 수 (순차 실행 그래프이므로 기본 1)
+            min_cosine: 요구하는 최소 코사인 유사도 (None이면 내보낼 때의 기준)
+
+        Raises:
+            FileNotFoundError: 내보낸 모델이 없는 경우
+            ValueError: PyTorch 백엔드와의 일치도가 기준보다 낮은 경우
+            ImportError: onnxruntime이 설치되지 않은 경우
+        """
+        onnx_dir = Path(onnx_dir)
+        config = check_onnx_export(onnx_dir, min_cosine)
+        return cls._open(onnx_dir, config, intra_op_threads, inter_op_threads)
+
+    @classmethod
+    def _open(
+        cls,
+        onnx_dir: Path,
+        config: Dict[str, Any],
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+    ) -> "OnnxBgeM3Encoder":
+        """검증 여부와 관계없이 ONNX Runtime 세션 생성"""
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = intra_op_threads or default_intra_op_threads()
+        options.inter_op_num_threads = inter_op_threads
+        session = ort.InferenceSession(
+            str(onnx_dir / config["model_file"]), options, providers=["CPUExecutionProvider"]
+        )
+        tokenizer = AutoTokenizer.from_pretrained(str(onnx_dir))
+        return cls(session, tokenizer, pooling=config["pooling"], max_seq_length=config["max_seq_length"])
+
+    def _pool(self, hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        if self.pooling == "cls":
+            return hidden[:, 0]
+        mask = attention_mask[..., None].astype(hidden.dtype)
+        return (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+    def encode(
+        self,
+        sentences: str | Sequence[str],
+        batch_size: int = 16,
+        normalize_embeddings: bool = True,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """문장 임베딩 (SentenceTransformer.encode 호환, 나머지 인자는 무시)
+
+        길이순으로 정렬해 배치를 만들므로 패딩 토큰 계산이 줄어들고, 결과는 입력 순서로 돌려줍니다.
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        order = sorted(range(len(texts)), key=lambda index: -len(texts[index]))
+        vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            encoded = self.tokenizer(
+                [texts[index] for index in indices],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feeds = {
+                name: np.asarray(value, dtype=np.int64)
+                for name, value in encoded.items()
+                if name in self._input_names
+            }
+            hidden = self.session.run(None, feeds)[0]
+            pooled = self._pool(hidden, encoded["attention_mask"])
+            if normalize_embeddings:
+                pooled = pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+            for index, vector in zip(indices, pooled, strict=True):
+                vectors[index] = vector.astype(np.float32)
+
+        result = np.stack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+        return result[0] if single else result
+
+    def similarity(self, embeddings1: Any, embeddings2: Any) -> np.ndarray:
+        """코사인 유사도 행렬"""
+        a = np.asarray(embeddings1, dtype=np.float32)
+        b = np.asarray(embeddings2, dtype=np.float32)
+        a = a / np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+        b = b / np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+        return a @ b.T
+
+
+def _pooling_mode(model: Any) -> str:
+    """SentenceTransformer 풀링 모듈의 방식"""
+    for module in model:
+        get_mode = getattr(module, "get_pooling_mode_str", None)
+        if get_mode is not None:
+            mode = get_mode()
+            if mode not in SUPPORTED_POOLING:
+                raise ValueError(f"ONNX 백엔드가 지원하지 않는 풀링 방식: {mode}")
+            return mode
+    return "cls"
+
+
+def export_bge_m3_onnx(
+    model_path: str,
+    output_dir: str | Path,
+    quantize: bool = True,
+    min_cosine: float = 0.99,
+    validation_texts: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """BGE-M3(SentenceTransformer) 모델을 ONNX로 내보내고 PyTorch 백엔드와의 일치도 검증
+
+    Args:
+        model_path: SentenceTransformer 모델 경로 또는 Hugging Face 이름
+        output_dir: ONNX 모델, 토크나이저, 설정(onnx_config.json)을 저장할 디렉토리
+        quantize: 가중치 int8 동적 양자화 여부 (CPU 추론 속도 향상, 용량 약 1/4)
+        min_cosine: 검증 문장 전체에서 요구하는 최소 코사인 유사도
+        validation_texts: 검증 문장 (None이면 VALIDATION_TEXTS)
+
+    Returns:
+        onnx_config.json에 저장한 설정 (validation.passed로 검증 통과 여부 확인)
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    texts = validation_texts or VALIDATION_TEXTS
+
+    print(f"🔄 ONNX 내보내기 준비: {model_path}")
+    model = SentenceTransformer(model_path, device="cpu")
+    transformer = model[0]
+    pooling = _pooling_mode(model)
+    reference = model.encode(texts, convert_to_tensor=False, normalize_embeddings=True)
+
+    class _HiddenStates(torch.nn.Module):
+        """last_hidden_state만 반환하는 내보내기용 래퍼"""
+
+        def __init__(self, auto_model):
+            super().__init__()
+            self.auto_model = auto_model
+
+        def forward(self, input_ids, attention_mask):
+            return self.auto_model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+    start_time = time.time()
+    sample = transformer.tokenizer(texts[:2], padding=True, return_tensors="pt")
+    fp32_path = output_dir / ONNX_MODEL_FILE
+    with torch.no_grad():
+        torch.onnx.export(
+            _HiddenStates(transformer.auto_model).eval(),
+            (sample["input_ids"], sample["attention_mask"]),
+            str(fp32_path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=17,
+            dynamo=False,
+        )
+    transformer.tokenizer.save_pretrained(str(output_dir))
+    print(f"✅ ONNX 내보내기 완료 ({time.time() - start_time:.1f}초): {fp32_path}")
+
+    model_file = ONNX_MODEL_FILE
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(str(fp32_path), str(output_dir / QUANTIZED_MODEL_FILE), weight_type=QuantType.QInt8)
+        model_file = QUANTIZED_MODEL_FILE
+        print(f"✅ int8 동적 양자화 완료: {output_dir / QUANTIZED_MODEL_FILE}")
+
+    config: Dict[str, Any] = {
+        "source_model": str(model_path),
+        "model_file": model_file,
+        "quantized": quantize,
+        "pooling": pooling,
+        "max_seq_length": transformer.max_seq_length,
+    }
+
+    # PyTorch 백엔드와 같은 문장으로 비교
+    encoder = OnnxBgeM3Encoder._open(output_dir, config)
+    cosines = cosine_agreement(reference, encoder.encode(texts))
+    config["validation"] = {
+        "passed": bool(cosines.min() >= min_cosine),
+        "min_cosine": round(float(cosines.min()), 6),
+        "mean_cosine": round(float(cosines.mean()), 6),
+        "min_required": min_cosine,
+        "texts": len(texts),
+    }
+    _write_onnx_config(output_dir, config)
+
+    status = "✅" if config["validation"]["passed"] else "❌"
+    print(
+        f"{status} PyTorch 백엔드 일치도: 최소 코사인 {cosines.min():.5f}, 평균 {cosines.mean():.5f} "
+        f"(기준 {min_cosine})"
+    )
+    return config
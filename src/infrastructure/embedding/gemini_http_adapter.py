@@ -3,22 +3,31 @@ HTTP를 통한 직접 Google Gemini Embedding API 호출 어댑터
 langchain-google-genai의 타임아웃 문제를 해결하기 위한 대안
 """
 
+import asyncio
 import json
 import time
-from typing import List, Optional
+from typing import Any, Dict, List
 
+import httpx
 import requests
 from langchain_core.embeddings import Embeddings
 
+from src.infrastructure.network import HEDGE_EMBEDDING, RetryPolicy, get_transport
+
 
 class GeminiHttpEmbeddingAdapter(Embeddings):
     """HTTP를 통해 Google Gemini Embedding API를 직접 호출하는 어댑터"""
+
+    # 재시도 정책 (고정 1초 간격)
+    RETRY_POLICY = RetryPolicy(max_retries=2, base_delay=1.0, multiplier=1.0)
+    # 비동기 문서 임베딩의 동시 요청 수
+    MAX_CONCURRENCY = 8
     
     def __init__(self, api_key: str, model_name: str = "models/text-embedding-004"):
         self.api_key = api_key
         self.model_name = model_name
         self.timeout = 20  # 20초 타임아웃
-        self.max_retries = 2
+        self.max_retries = self.RETRY_POLICY.max_retries
         
         # 모델명 정리 (models/ 프리픽스 제거)
         clean_model_name = model_name.replace("models/", "")
@@ -52,21 +61,27 @@ class GeminiHttpEmbeddingAdapter(Embeddings):
             # 실패한 경우 빈 벡터로 처리 (768차원)
             return [0.0] * 768
 
-    def _embed_single_text(self, text: str) -> List[float]:
-        """단일 텍스트를 HTTP API로 임베딩합니다."""
+    @staticmethod
+    def _build_request(text: str) -> tuple:
+        """embedContent 요청 헤더와 본문 구성"""
         headers = {
             "Content-Type": "application/json"
         }
         
-        data = {
+        data: Dict[str, Any] = {
             "content": {
                 "parts": [{"text": text}]
             }
         }
-        
+        return headers, data
+
+    def _embed_single_text(self, text: str) -> List[float]:
+        """단일 텍스트를 HTTP API로 임베딩합니다."""
+        headers, data = self._build_request(text)
+        transport = get_transport()
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = transport.post(
                     self.api_url,
                     json=data,
                     headers=headers,
@@ -80,19 +95,66 @@ class GeminiHttpEmbeddingAdapter(Embeddings):
                 else:
                     if attempt == self.max_retries - 1:
                         raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
-                    time.sleep(1)
+                    time.sleep(self.RETRY_POLICY.delay(attempt))
                     
             except requests.exceptions.RequestException as e:
                 if attempt == self.max_retries - 1:
-                    raise RuntimeError(f"HTTP 요청 실패: {str(e)}")
-                time.sleep(1)
+                    raise RuntimeError(f"HTTP 요청 실패: {str(e)}") from e
+                time.sleep(self.RETRY_POLICY.delay(attempt))
+                
+        raise RuntimeError("모든 재시도 실패")
+
+    async def _aembed_single_text(self, text: str) -> List[float]:
+        """_embed_single_text의 비동기 버전 (공유 전송 계층의 AsyncClient 사용)
+
+        임베딩 요청은 멱등이므로 느린 요청에는 중복 요청을 보냅니다.
+        """
+        headers, data = self._build_request(text)
+        transport = get_transport()
+        for attempt in range(self.max_retries):
+            try:
+                response = await transport.apost(
+                    self.api_url,
+                    json=data,
+                    headers=headers,
+                    timeout=self.timeout,
+                    hedge=HEDGE_EMBEDDING
+                )
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    return result["embedding"]["values"]
+                if attempt == self.max_retries - 1:
+                    raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+                await asyncio.sleep(self.RETRY_POLICY.delay(attempt))
+                    
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries - 1:
+                    raise RuntimeError(f"HTTP 요청 실패: {str(e)}") from e
+                await asyncio.sleep(self.RETRY_POLICY.delay(attempt))
                 
         raise RuntimeError("모든 재시도 실패")
 
     async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
-        """비동기 문서 임베딩 (동기 버전으로 폴백)"""
-        return self.embed_documents(texts)
+        """비동기 문서 임베딩 (최대 MAX_CONCURRENCY개 동시 요청, 이벤트 루프를 막지 않음)"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def embed(text: str) -> List[float]:
+            async with semaphore:
+                try:
+                    return await self._aembed_single_text(text)
+                except Exception as e:
+                    print(f"⚠️ 임베딩 실패 ({text[:50]}...): {e}")
+                    # 실패한 경우 빈 벡터로 처리 (768차원)
+                    return [0.0] * 768
+
+        return list(await asyncio.gather(*(embed(text) for text in texts)))
 
     async def aembed_query(self, text: str) -> List[float]:
-        """비동기 쿼리 임베딩 (동기 버전으로 폴백)"""
-        return self.embed_query(text)
\ No newline at end of file
+        """비동기 쿼리 임베딩"""
+        try:
+            return await self._aembed_single_text(text)
+        except Exception as e:
+            print(f"⚠️ 쿼리 임베딩 실패: {e}")
+            # 실패한 경우 빈 벡터로 처리 (768차원)
+            return [0.0] * 768
\ No newline at end of file
@@ -1,19 +1,23 @@
+import asyncio
 from typing import List
+
+import httpx
 import requests
-import threading
-import time
 from langchain_core.embeddings import Embeddings
 
-# HCX 임베딩 API 요청 제한
-_hcx_embedding_semaphore = threading.Semaphore(1)
-_last_hcx_embedding_request_time = 0
-_min_embedding_request_interval = 1.0  # 임베딩은 1초 간격
+from src.infrastructure.network import HEDGE_EMBEDDING, RetryPolicy, get_rate_limiter, get_transport
 
 
 class HcxEmbeddingAdapter(Embeddings):
     """
     CLOVA Studio Embedding v2 API를 위한 LangChain 호환 어댑터
     """
+
+    # 재시도 정책 (429 응답 간격은 속도 제한기가 조절)
+    RETRY_POLICY = RetryPolicy(max_retries=6, base_delay=3.0, multiplier=2.0)
+    # 비동기 문서 임베딩의 동시 요청 수 (실제 전송 속도는 속도 제한기가 조절)
+    MAX_CONCURRENCY = 8
+
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("CLOVA_STUDIO_API_KEY가 HcxEmbeddingAdapter에 필요합니다.")
@@ -22,69 +26,107 @@ class HcxEmbeddingAdapter(Embeddings):
         # 작동하는 엔드포인트 사용
         self.api_url = "https://clovastudio.stream.ntruss.com/testapp/v1/api-tools/embedding/v2"
         self.model_name = "HCX-Embedding"
+        # 프로세스 내 모든 HCX 임베딩 요청이 공유하는 적응형 속도 제한기
+        self.rate_limiter = get_rate_limiter("hcx", "embedding", api_key=self.api_key)
         
         print(f"✅ HCX 임베딩 어댑터 초기화 완료: {self.model_name}")
 
     def _embed(self, text: str) -> List[float]:
         """단일 텍스트에 대한 임베딩을 수행합니다."""
-        global _last_hcx_embedding_request_time
-        
-        # 글로벌 세마포어로 동시 요청 제한
-        with _hcx_embedding_semaphore:
-            # 최소 간격 보장
-            current_time = time.time()
-            elapsed = current_time - _last_hcx_embedding_request_time
-            if elapsed < _min_embedding_request_interval:
-                sleep_time = _min_embedding_request_interval - elapsed
-                print(f"⏱️ HCX 임베딩 API 요청 간격 조절: {sleep_time:.1f}초 대기")
-                time.sleep(sleep_time)
-            
-            _last_hcx_embedding_request_time = time.time()
-            return self._make_embedding_request(text)
+        return self._make_embedding_request(text)
     
-    def _make_embedding_request(self, text: str) -> List[float]:
-        """실제 임베딩 API 요청 수행"""
+    def _build_request(self, text: str) -> tuple:
+        """임베딩 요청 헤더와 본문 구성"""
         import uuid
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "X-NCP-CLOVASTUDIO-REQUEST-ID": str(uuid.uuid4()),
         }
-        body = {"text": text}
+        return headers, {"text": text}
+    
+    def _make_embedding_request(self, text: str) -> List[float]:
+        """실제 임베딩 API 요청 수행"""
+        headers, body = self._build_request(text)
 
         import time
-        import random
         
-        max_retries = 6   # 재시도 횟수 증가
-        base_delay = 3    # 기본 지연 시간 증가
+        policy = self.RETRY_POLICY
+        max_retries = policy.max_retries
+        transport = get_transport()
         
         for attempt in range(max_retries):
             try:
-                response = requests.post(self.api_url, headers=headers, json=body, timeout=20)
+                self.rate_limiter.acquire()
+                response = transport.post(self.api_url, headers=headers, json=body, timeout=20)
                 
                 if response.status_code == 429:  # Too Many Requests
+                    # 속도 제한기가 속도를 낮추고 다음 요청 시점을 조절
+                    self.rate_limiter.on_throttle()
                     if attempt < max_retries - 1:
-                        delay = min(base_delay * (2 ** attempt) + random.uniform(1.0, 3.0), 60)  # 최대 1분
-                        print(f"⚠️ HCX 임베딩 API 요청 한도 초과 (429). {delay:.1f}초 후 재시도... (시도 {attempt + 1}/{max_retries})")
-                        time.sleep(delay)
+                        print(f"⚠️ HCX 임베딩 API 요청 한도 초과 (429). 현재 {self.rate_limiter.current_rate:.2f} req/s로 재시도... (시도 {attempt + 1}/{max_retries})")
                         continue
                     else:
-                        raise RuntimeError(f"HCX 임베딩 API 요청 한도 초과: 최대 재시도 횟수 초과")
+                        raise RuntimeError("HCX 임베딩 API 요청 한도 초과: 최대 재시도 횟수 초과")
                 
                 response.raise_for_status()
+                self.rate_limiter.on_success()
                 result = response.json()
                 return result["result"]["embedding"]
                 
             except requests.exceptions.RequestException as e:
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
+                    delay = policy.delay(attempt)
                     print(f"⚠️ HCX 임베딩 API 요청 실패: {e}. {delay}초 후 재시도... (시도 {attempt + 1}/{max_retries})")
                     time.sleep(delay)
                     continue
                 else:
-                    raise RuntimeError(f"HCX Embedding API 요청 실패: {e}")
-            except KeyError:
-                raise RuntimeError(f"HCX Embedding API의 응답 형식이 예상과 다릅니다: {response.text}")
+                    raise RuntimeError(f"HCX Embedding API 요청 실패: {e}") from e
+            except KeyError as e:
+                raise RuntimeError(f"HCX Embedding API의 응답 형식이 예상과 다릅니다: {response.text}") from e
+
+    async def _amake_embedding_request(self, text: str) -> List[float]:
+        """_make_embedding_request의 비동기 버전 (공유 전송 계층의 AsyncClient 사용)"""
+        headers, body = self._build_request(text)
+        policy = self.RETRY_POLICY
+        max_retries = policy.max_retries
+        transport = get_transport()
+        
+        for attempt in range(max_retries):
+            try:
+                await self.rate_limiter.aacquire()
+                response = await transport.apost(
+                    self.api_url,
+                    headers=headers,
+                    json=body,
+                    timeout=20,
+                    hedge=HEDGE_EMBEDDING,
+                    limiter=self.rate_limiter,
+                )
+                
+                if response.status_code == 429:  # Too Many Requests
+                    await self.rate_limiter.aon_throttle()
+                    if attempt < max_retries - 1:
+                        print(f"⚠️ HCX 임베딩 API 요청 한도 초과 (429). 현재 {self.rate_limiter.current_rate:.2f} req/s로 재시도... (시도 {attempt + 1}/{max_retries})")
+                        continue
+                    else:
+                        raise RuntimeError("HCX 임베딩 API 요청 한도 초과: 최대 재시도 횟수 초과")
+                
+                response.raise_for_status()
+                await self.rate_limiter.aon_success()
+                result = response.json()
+                return result["result"]["embedding"]
+                
+            except httpx.HTTPError as e:
+                if attempt < max_retries - 1:
+                    delay = policy.delay(attempt)
+                    print(f"⚠️ HCX 임베딩 API 요청 실패: {e}. {delay}초 후 재시도... (시도 {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(delay)
+                    continue
+                else:
+                    raise RuntimeError(f"HCX Embedding API 요청 실패: {e}") from e
+            except KeyError as e:
+                raise RuntimeError(f"HCX Embedding API의 응답 형식이 예상과 다릅니다: {response.text}") from e
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """여러 문서를 하나씩 임베딩합니다."""
@@ -92,4 +134,18 @@ class HcxEmbeddingAdapter(Embeddings):
 
     def embed_query(self, text: str) -> List[float]:
         """단일 질문을 임베딩합니다."""
-        return self._embed(text) 
\ No newline at end of file
+        return self._embed(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """비동기 문서 임베딩 (최대 MAX_CONCURRENCY개 동시 요청, 이벤트 루프를 막지 않음)"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def embed(text: str) -> List[float]:
+            async with semaphore:
+                return await self._amake_embedding_request(text)
+
+        return list(await asyncio.gather(*(embed(text) for text in texts)))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """비동기 쿼리 임베딩"""
+        return await self._amake_embedding_request(text)
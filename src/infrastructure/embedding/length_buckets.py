@@ -0,0 +1,45 @@
+"""
+토큰 길이 기반 배치 계획
+
+배치는 가장 긴 텍스트 길이로 패딩되므로, 긴 기술 문서 컨텍스트 하나가 짧은 질문들과 같은 배치에
+들어가면 배치 전체가 수천 토큰으로 늘어납니다. 텍스트를 토큰 수 순으로 정렬해 연속 구간(버킷)으로
+나누고, 버킷마다 (가장 긴 토큰 수 × 배치 크기)가 토큰 예산을 넘지 않도록 배치 크기를 정합니다.
+짧은 텍스트는 큰 배치로, 긴 텍스트는 작은 배치로 처리됩니다. 배치의 가장 긴 텍스트보다 크게 짧은
+텍스트(min_fill 미만)는 다음 버킷으로 넘겨 큰 배치에서도 패딩 비율을 제한합니다.
+"""
+
+from typing import List, Sequence
+
+
+def plan_token_batches(
+    lengths: Sequence[int], token_budget: int, max_batch_size: int, min_fill: float = 0.75
+) -> List[List[int]]:
+    """토큰 예산 안에서 길이순 배치 계획
+
+    Args:
+        lengths: 텍스트별 토큰 수 (잘림 적용 후)
+        token_budget: 배치당 패딩 포함 최대 토큰 수 (가장 긴 텍스트가 예산보다 길면 1개씩)
+        max_batch_size: 배치당 최대 텍스트 수
+        min_fill: 배치에 넣을 텍스트의 최소 길이 비율 (가장 긴 텍스트 대비, 0이면 예산과 최대 수로만 나눔)
+
+    Returns:
+        배치별 원래 인덱스 목록 (긴 배치부터, 배치 안은 긴 텍스트부터)
+    """
+    order = sorted(range(len(lengths)), key=lambda index: -lengths[index])
+    batches: List[List[int]] = []
+    start = 0
+    while start < len(order):
+        longest = max(lengths[order[start]], 1)
+        end = min(len(order), start + max(1, min(max_batch_size, token_budget // longest)))
+        cutoff = longest * min_fill
+        stop = start + 1
+        while stop < end and lengths[order[stop]] >= cutoff:
+            stop += 1
+        batches.append(order[start:stop])
+        start = stop
+    return batches
+
+
+def padded_tokens(lengths: Sequence[int], batches: Sequence[Sequence[int]]) -> int:
+    """배치 계획의 패딩 포함 전체 토큰 수 (실제 토큰 수 대비 비율로 패딩 낭비 확인)"""
+    return sum(len(batch) * max(lengths[index] for index in batch) for batch in batches if batch)
@@ -0,0 +1,206 @@
+"""
+임베딩 쿼리 마이크로 배치
+
+RAGAS answer_relevancy는 셀마다 질문 1개를 embed_query로 따로 임베딩하므로, 로컬 모델(BGE-M3)은
+문장 1개씩 인코딩하고 HTTP 임베딩(Gemini, HCX)은 질문마다 요청을 보냅니다.
+MicroBatchingEmbeddings는 동시에 들어온 단일 텍스트 요청을 최대 max_batch_size개 또는
+max_wait_ms 동안 모아 embed_documents 한 번으로 처리하고, 각 요청에 자기 벡터를 돌려줍니다.
+
+이 프로젝트의 임베딩 모델은 모두 쿼리와 문서를 같은 방식으로 임베딩하므로
+(instruction/task type 구분 없음) 쿼리를 문서 배치로 처리해도 결과가 같습니다.
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+
+def _in_event_loop() -> bool:
+    """현재 스레드에서 이벤트 루프가 실행 중인지 여부"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _AsyncQueue:
+    """이벤트 루프별 대기 요청"""
+
+    def __init__(self):
+        self.pending: List[Tuple[str, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.tasks: set = set()
+
+
+class MicroBatchingEmbeddings(Embeddings):
+    """동시에 들어온 embed_query 요청을 배치로 묶는 LangChain Embeddings 래퍼
+
+    비동기 요청은 이벤트 루프마다, 동기 요청은 스레드 간에 모읍니다.
+    embed_documents/aembed_documents는 이미 배치이므로 그대로 전달합니다.
+    """
+
+    def __init__(self, embeddings: Embeddings, max_batch_size: int = 32, max_wait_ms: float = 10.0):
+        """
+        Args:
+            embeddings: 원래 임베딩 어댑터
+            max_batch_size: 한 배치의 최대 텍스트 수 (1 이하이면 배치하지 않음)
+            max_wait_ms: 첫 요청 후 배치를 보내기까지 기다리는 최대 시간
+        """
+        self.embeddings = embeddings
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._async_queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncQueue]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self.requests = 0
+        self.batches = 0
+        self.encoded = 0
+
+    def __getattr__(self, name):
+        # 원래 임베딩의 속성(model_name, device 등)으로 전달
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    @property
+    def enabled(self) -> bool:
+        """배치 사용 여부"""
+        return self.max_batch_size > 1
+
+    def _record_batch(self, requests: int, encoded: int) -> None:
+        with self._lock:
+            self.requests += requests
+            self.batches += 1
+            self.encoded += encoded
+
+    # ------------------------------------------------------------------
+    # 동기 경로 (스레드 간 배치)
+    # ------------------------------------------------------------------
+
+    def _take_pending(self) -> List[Tuple[str, Future]]:
+        """대기 요청을 모두 꺼냄 (self._lock 안에서 호출)"""
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            batch = self._take_pending()
+        self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        if not batch:
+            return
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = dict(zip(texts, self.embeddings.embed_documents(texts), strict=True))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        self._record_batch(len(batch), len(texts))
+        for text, future in batch:
+            future.set_result(vectors[text])
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (그대로 전달)"""
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩 (다른 스레드의 요청과 묶어서 처리)"""
+        if not self.enabled or _in_event_loop():
+            # 이벤트 루프 스레드의 동기 호출은 기다리는 동안 같은 루프의 요청이 대기열에 들어올 수 없으므로 바로 처리
+            return self.embeddings.embed_query(text)
+
+        future: Future = Future()
+        batch = None
+        with self._lock:
+            self._pending.append((text, future))
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            # 배치를 채운 요청의 스레드가 직접 처리
+            self._run_batch(batch)
+        return future.result()
+
+    # ------------------------------------------------------------------
+    # 비동기 경로 (이벤트 루프별 배치)
+    # ------------------------------------------------------------------
+
+    def _async_queue(self, loop: asyncio.AbstractEventLoop) -> _AsyncQueue:
+        with self._lock:
+            queue = self._async_queues.get(loop)
+            if queue is None:
+                queue = self._async_queues[loop] = _AsyncQueue()
+            return queue
+
+    def _flush_async(self, queue: _AsyncQueue) -> None:
+        """대기 요청을 배치 작업으로 보냄 (이벤트 루프 스레드에서 호출)"""
+        batch, queue.pending = queue.pending, []
+        if queue.timer is not None:
+            queue.timer.cancel()
+            queue.timer = None
+        if batch:
+            task = asyncio.ensure_future(self._arun_batch(batch))
+            # 완료 전에 작업이 가비지 컬렉션되지 않도록 참조 유지
+            queue.tasks.add(task)
+            task.add_done_callback(queue.tasks.discard)
+
+    async def _arun_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = dict(zip(texts, await self.embeddings.aembed_documents(texts), strict=True))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self._record_batch(len(batch), len(texts))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(vectors[text])
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """비동기 문서 임베딩 (그대로 전달)"""
+        return await self.embeddings.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """비동기 쿼리 임베딩 (같은 이벤트 루프의 동시 요청과 묶어서 처리)"""
+        if not self.enabled:
+            return await self.embeddings.aembed_query(text)
+
+        loop = asyncio.get_running_loop()
+        queue = self._async_queue(loop)
+        future = loop.create_future()
+        queue.pending.append((text, future))
+        if len(queue.pending) >= self.max_batch_size:
+            self._flush_async(queue)
+        elif queue.timer is None:
+            queue.timer = loop.call_later(self.max_wait, self._flush_async, queue)
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """배치 통계 (요청 수, 배치 수, 평균 배치 크기)"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "batches": self.batches,
+                "encoded": self.encoded,
+                "average_batch_size": self.requests / self.batches if self.batches else 0.0,
+            }
@@ -0,0 +1,62 @@
+"""
+부하/규모 테스트용 시뮬레이션 임베딩
+
+외부 서비스 없이 텍스트의 글자 3-gram을 해시한 단위 벡터를 돌려주고, 요청(배치)마다
+시뮬레이션 LLM과 같은 설정의 지연 시간과 429/타임아웃을 주입합니다.
+성분이 모두 0 이상이므로 코사인 유사도는 0~1이고 글자가 많이 겹치는 텍스트일수록 가깝습니다.
+같은 텍스트는 항상 같은 벡터이므로 answer_relevancy 등의 점수가 재실행해도 같습니다.
+"""
+
+import hashlib
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.llm.simulated_adapter import SimulatedCalls, SimulationProfile
+
+
+class SimulatedEmbeddingAdapter(Embeddings):
+    """외부 호출 없이 지연 시간과 오류를 흉내 내는 임베딩 어댑터 (부하/규모 테스트용)"""
+
+    def __init__(self, dimension: int = 1024, profile: Optional[SimulationProfile] = None):
+        self.dimension = dimension
+        self.model_name = "simulated-embedding"
+        self.profile = profile or SimulationProfile.from_settings()
+        self.simulator = SimulatedCalls(self.profile, "simulated")
+        print(f"✅ 시뮬레이션 임베딩 초기화 완료: {self.dimension}차원")
+
+    def _vector(self, text: str) -> List[float]:
+        """글자 3-gram 해시 빈도로 정해지는 음이 아닌 단위 벡터"""
+        # 빈 텍스트도 0 벡터가 되지 않도록 모든 텍스트에 공통 성분을 더함
+        vector = np.full(self.dimension, 0.01)
+        normalized = text.lower()
+        for start in range(max(1, len(normalized) - 2)):
+            gram = normalized[start:start + 3]
+            digest = hashlib.blake2b(f"{self.profile.seed}:{gram}".encode("utf-8"), digest_size=8).digest()
+            vector[int.from_bytes(digest, "big") % self.dimension] += 1.0
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (배치 1회 호출)
+
+        Raises:
+            ProviderError: 주입된 429/타임아웃이 재시도 후에도 계속된 경우
+        """
+        self.simulator.call()
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩"""
+        self.simulator.call()
+        return self._vector(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """비동기 문서 임베딩"""
+        await self.simulator.acall()
+        return [self._vector(text) for text in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """비동기 쿼리 임베딩"""
+        await self.simulator.acall()
+        return self._vector(text)
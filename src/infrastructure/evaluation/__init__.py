@@ -1,6 +1,7 @@
 """Infrastructure evaluation adapters module"""
 
 from .ragas_adapter import RagasEvalAdapter
+from .sharded_adapter import ShardedEvalAdapter
 from .factory import RagasEvalAdapterFactory
 
-__all__ = ["RagasEvalAdapter", "RagasEvalAdapterFactory"]
+__all__ = ["RagasEvalAdapter", "RagasEvalAdapterFactory", "ShardedEvalAdapter"]
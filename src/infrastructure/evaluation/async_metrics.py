@@ -0,0 +1,51 @@
+"""
+비동기 임베딩을 사용하는 RAGAS 메트릭
+
+RAGAS 0.2의 ResponseRelevancy(answer_relevancy)는 비동기 _ascore 안에서 동기
+embed_query/embed_documents를 호출하므로, 임베딩하는 동안 이벤트 루프의 다른 셀이 모두 멈추고
+셀마다 쿼리를 하나씩 임베딩합니다. 여기의 메트릭은 같은 점수를 aembed_*로 계산하여
+임베딩이 다른 셀의 LLM 호출과 겹치고, 동시에 계산되는 셀의 질문 임베딩이 마이크로 배치로 묶이게 합니다.
+"""
+
+import asyncio
+import typing as t
+
+import numpy as np
+from ragas.metrics import AnswerRelevancy
+from ragas.metrics._answer_relevance import ResponseRelevanceInput, ResponseRelevanceOutput
+
+
+class AsyncAnswerRelevancy(AnswerRelevancy):
+    """역생성 질문과 원래 질문을 비동기로 임베딩하는 answer_relevancy (점수 계산은 RAGAS와 동일)"""
+
+    async def acalculate_similarity(self, question: str, generated_questions: t.List[str]) -> np.ndarray:
+        """원래 질문과 역생성 질문들의 코사인 유사도"""
+        assert self.embeddings is not None, f"Error: '{self.name}' requires embeddings to be set."
+        question_vector, generated_vectors = await asyncio.gather(
+            self.embeddings.aembed_query(question),
+            self.embeddings.aembed_documents(generated_questions),
+        )
+        question_vec = np.asarray(question_vector).reshape(1, -1)
+        gen_question_vec = np.asarray(generated_vectors).reshape(len(generated_questions), -1)
+        norm = np.linalg.norm(gen_question_vec, axis=1) * np.linalg.norm(question_vec, axis=1)
+        return np.dot(gen_question_vec, question_vec.T).reshape(-1) / norm
+
+    async def _acalculate_score(self, answers: t.Sequence[ResponseRelevanceOutput], row: t.Dict) -> float:
+        gen_questions = [answer.question for answer in answers]
+        committal = np.any([answer.noncommittal for answer in answers])
+        if all(question == "" for question in gen_questions):
+            return np.nan
+        cosine_sim = await self.acalculate_similarity(row["user_input"], gen_questions)
+        return cosine_sim.mean() * int(not committal)
+
+    async def _ascore(self, row: t.Dict, callbacks: t.Any) -> float:
+        assert self.llm is not None, "LLM is not set"
+
+        prompt_input = ResponseRelevanceInput(response=row["response"])
+        responses = await asyncio.gather(
+            *(
+                self.question_generation.generate(data=prompt_input, llm=self.llm, callbacks=callbacks)
+                for _ in range(self.strictness)
+            )
+        )
+        return await self._acalculate_score(responses, row)
@@ -0,0 +1,84 @@
+"""
+평가 실패 셀 사유 수집
+
+RAGAS Executor는 raise_exceptions=False일 때 작업 예외를 로그로만 남기고 NaN을 반환합니다.
+이 로그를 작업 번호(행 순서 × 메트릭 순서)와 함께 수집하여 NaN 셀마다 실패 사유를 남깁니다.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.network import deadline_expired
+
+RAGAS_EXECUTOR_LOGGER = "ragas.executor"
+
+# 실패 사유
+REASON_CELL_DEADLINE = "cell_deadline"  # (행, 메트릭) 셀 마감 시간 초과로 취소
+REASON_RUN_DEADLINE = "run_deadline"  # 전체 실행 마감 시간 초과로 중단
+REASON_UNKNOWN = "evaluation_failed"  # 사유를 알 수 없는 실패
+
+
+def classify_failure(exception_name: str, message: str) -> str:
+    """RAGAS 작업 예외 이름과 메시지로 실패 사유 결정"""
+    if exception_name == "DeadlineExceeded":
+        return REASON_RUN_DEADLINE
+    if exception_name == "TimeoutError":
+        # asyncio.wait_for가 셀 마감 시간(RunConfig.timeout)을 넘긴 작업을 취소한 경우
+        return REASON_RUN_DEADLINE if deadline_expired() else REASON_CELL_DEADLINE
+    detail = f"{exception_name}: {message}" if message else exception_name
+    return f"error: {detail[:200]}"
+
+
+class CellFailureRecorder(logging.Handler):
+    """with 블록 동안 현재 스레드에서 발생한 RAGAS 작업 예외를 작업 번호별로 수집"""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.failures: Dict[int, str] = {}
+        self._thread_id: Optional[int] = None
+
+    def __enter__(self) -> "CellFailureRecorder":
+        self._thread_id = threading.get_ident()
+        logging.getLogger(RAGAS_EXECUTOR_LOGGER).addHandler(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        logging.getLogger(RAGAS_EXECUTOR_LOGGER).removeHandler(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Executor 로그 형식: "Exception raised in Job[%s]: %s(%s)"
+        if record.thread != self._thread_id or not str(record.msg).startswith("Exception raised in Job"):
+            return
+        if not isinstance(record.args, tuple) or len(record.args) != 3:
+            return
+        job, exception_name, message = record.args
+        self.failures[int(job)] = classify_failure(str(exception_name), str(message))
+
+    def reasons(self, num_rows: int, metric_names: List[str]) -> List[Dict[str, str]]:
+        """행별 {메트릭 이름: 실패 사유} 목록 (RAGAS는 행마다 메트릭 순서대로 작업을 제출)"""
+        rows: List[Dict[str, str]] = [{} for _ in range(num_rows)]
+        if not metric_names:
+            return rows
+        for job, reason in self.failures.items():
+            row, column = divmod(job, len(metric_names))
+            if row < num_rows:
+                rows[row][metric_names[column]] = reason
+        return rows
+
+
+def fill_failure_reasons(
+    individual_scores: List[Dict[str, Optional[float]]],
+    recorded: List[Dict[str, str]],
+    metric_names: List[str],
+) -> List[Dict[str, str]]:
+    """점수가 없는(None) 셀만 남긴 행별 실패 사유 (수집된 사유가 없으면 기본 사유)"""
+    default = REASON_RUN_DEADLINE if deadline_expired() else REASON_UNKNOWN
+    return [
+        {
+            name: (recorded[idx].get(name) if idx < len(recorded) else None) or default
+            for name in metric_names
+            if scores.get(name) is None
+        }
+        for idx, scores in enumerate(individual_scores)
+    ]
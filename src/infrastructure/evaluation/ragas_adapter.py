@@ -4,7 +4,7 @@ Ragas Adapter using Strategy Pattern
 Strategy 패턴을 적용한 리팩토링된 Ragas 어댑터입니다.
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import datetime
 import uuid
 
@@ -12,9 +12,13 @@ import pandas as pd
 from datasets import Dataset
 from langchain_core.embeddings import Embeddings
 
+from src.config import settings
 from src.domain.prompts import PromptType
+from src.infrastructure.cache import get_score_cache
+from src.infrastructure.evaluation.cell_failures import CellFailureRecorder, fill_failure_reasons
 from src.infrastructure.evaluation.parsing_strategies import ResultParser
 from src.infrastructure.evaluation.strategies import EvaluationContext
+from src.infrastructure.network import get_transport
 
 
 class RagasEvalAdapter:
@@ -49,11 +53,175 @@ class RagasEvalAdapter:
     def evaluate(self, dataset: Dataset) -> dict[str, float]:
         """
         주어진 데이터셋과 LLM, Embedding을 사용하여 Ragas 평가를 수행합니다.
+        점수 캐시에 있는 (샘플, 메트릭) 점수는 재사용하고 나머지만 평가하여
+        원래 순서대로 individual_scores에 합칩니다.
+        끝내 점수를 얻지 못한 셀의 사유는 행별로 cell_failures에 기록합니다.
+        평가가 끝나면 RAGAS 이벤트 루프에서 연 비동기 연결 풀을 닫습니다.
         (오류 처리는 상위 계층으로 위임)
         """
+        try:
+            return self._evaluate_dataset(dataset)
+        finally:
+            get_transport().close_async_clients()
+
+    def _evaluate_dataset(self, dataset: Dataset) -> dict[str, float]:
+        """evaluate 본체 (점수 캐시 적용)"""
+        score_cache = get_score_cache()
+        metric_names = [metric.name for metric in self.evaluation_context.get_metrics()]
+        if not score_cache.enabled:
+            metrics = self.evaluation_context.get_metrics()
+            parsed_result = self._evaluate_subset(dataset, list(range(len(dataset))), metrics, len(metrics))
+            recorded_failures = parsed_result.pop("cell_failures")
+            if self._repair_failed_cells(dataset, parsed_result["individual_scores"], metrics):
+                parsed_result = self._summarize_scores(parsed_result["individual_scores"], metrics)
+            parsed_result["cell_failures"] = fill_failure_reasons(
+                parsed_result["individual_scores"], recorded_failures, metric_names
+            )
+            return parsed_result
+
+        metrics = self.evaluation_context.get_metrics()
+        rows = dataset.to_list()
+        score_keys = [
+            {metric.name: self._score_key(row, metric.name) for metric in metrics}
+            for row in rows
+        ]
+        cached = score_cache.get_many(key for row_keys in score_keys for key in row_keys.values())
+        individual_scores = [
+            {name: cached.get(key) for name, key in row_keys.items()}
+            for row_keys in score_keys
+        ]
+
+        # 누락된 메트릭 조합별로 행을 묶어 필요한 부분만 평가
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for idx, scores in enumerate(individual_scores):
+            missing = tuple(name for name, score in scores.items() if score is None)
+            if missing:
+                groups.setdefault(missing, []).append(idx)
+
+        pending_rows = sum(len(indices) for indices in groups.values())
+        print(f"♻️ 점수 캐시: {len(rows)}개 행 중 {len(rows) - pending_rows}개 재사용, {pending_rows}개 평가")
+
+        evaluated_cells = []
+        recorded: List[Dict[str, str]] = [{} for _ in rows]
+        for missing_names, indices in groups.items():
+            group_metrics = [metric for metric in metrics if metric.name in missing_names]
+            group_result = self._evaluate_subset(dataset, indices, group_metrics, len(metrics))
+            for local_idx, idx in enumerate(indices):
+                recorded[idx].update(group_result["cell_failures"][local_idx])
+                for metric in group_metrics:
+                    individual_scores[idx][metric.name] = group_result["individual_scores"][local_idx].get(metric.name)
+                    evaluated_cells.append((idx, metric.name))
+
+        # 캐시된 점수는 실패(None)가 없으므로 남은 None은 이번에 평가한 셀
+        self._repair_failed_cells(dataset, individual_scores, metrics)
+        score_cache.put_many(
+            (score_keys[idx][name], name, individual_scores[idx][name]) for idx, name in evaluated_cells
+        )
+
+        return self._summarize_scores(
+            individual_scores, metrics, fill_failure_reasons(individual_scores, recorded, metric_names)
+        )
+
+    def _repair_failed_cells(
+        self, dataset: Dataset, individual_scores: List[Dict[str, Optional[float]]], metrics: List[Any]
+    ) -> int:
+        """실패한(None) (행, 메트릭) 셀만 폴백 전략으로 다시 평가하여 individual_scores에 병합
+
+        Returns:
+            복구된 셀 수
+        """
+        if not settings.EVALUATION_REPAIR_FAILED:
+            return 0
+
+        fallback = self.evaluation_context.fallback_strategy
+        fallback_metrics = {metric.name: metric for metric in fallback.get_metrics()}
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for idx, scores in enumerate(individual_scores):
+            missing = tuple(
+                metric.name for metric in metrics
+                if scores.get(metric.name) is None and metric.name in fallback_metrics
+            )
+            if missing:
+                groups.setdefault(missing, []).append(idx)
+        if not groups:
+            return 0
+
+        failed_cells = sum(len(names) * len(indices) for names, indices in groups.items())
+        print(f"🩹 실패한 {failed_cells}개 (행, 메트릭) 셀을 폴백 설정으로 재평가합니다.")
+
+        repaired = 0
+        for missing_names, indices in groups.items():
+            group_metrics = [fallback_metrics[name] for name in missing_names]
+            subset = dataset.select(indices)
+            try:
+                raw_result = fallback.run_evaluation(subset, metrics=group_metrics)
+                group_result = self.result_parser.parse_result(raw_result, subset, group_metrics)
+            except Exception as e:
+                print(f"⚠️ 폴백 재평가 실패 (행 {indices}): {e}")
+                continue
+            for local_idx, idx in enumerate(indices):
+                for name in missing_names:
+                    score = group_result["individual_scores"][local_idx].get(name)
+                    if score is not None:
+                        individual_scores[idx][name] = score
+                        repaired += 1
+
+        print(f"🩹 폴백 재평가 결과: {repaired}/{failed_cells}개 셀 복구")
+        return repaired
+
+    def _evaluate_subset(self, dataset: Dataset, indices: List[int], metrics: List[Any], total_metrics: int) -> dict:
+        """일부 행과 메트릭만 평가하고 파싱된 결과 반환 (RAGAS가 기록한 셀별 실패 사유 포함)"""
         strategy = self.evaluation_context.primary_strategy
-        raw_result = strategy.run_evaluation(dataset)
-        return self._parse_result(raw_result, dataset)
+        subset = dataset if len(indices) == len(dataset) else dataset.select(indices)
+        with CellFailureRecorder() as recorder:
+            if len(metrics) == total_metrics:
+                raw_result = strategy.run_evaluation(subset)
+            else:
+                raw_result = strategy.run_evaluation(subset, metrics=metrics)
+        parsed_result = self.result_parser.parse_result(raw_result, subset, metrics)
+        parsed_result["cell_failures"] = recorder.reasons(len(subset), [metric.name for metric in metrics])
+        return parsed_result
+
+    def _score_key(self, row: Dict[str, Any], metric_name: str) -> str:
+        """점수 캐시 키 생성 (평가 LLM, 임베딩, 프롬프트 타입 포함)"""
+        embedding_model = (
+            getattr(self.embeddings, "model_name", None)
+            or getattr(self.embeddings, "model_path", None)
+            or type(self.embeddings).__name__
+        )
+        return get_score_cache().make_key(
+            row,
+            metric_name,
+            judge_model=str(getattr(self.llm, "model", type(self.llm).__name__)),
+            embedding_model=str(embedding_model),
+            prompt_type=self.prompt_type.value,
+        )
+
+    def _summarize_scores(
+        self,
+        individual_scores: List[Dict[str, Optional[float]]],
+        metrics: List[Any],
+        cell_failures: Optional[List[Dict[str, str]]] = None,
+    ) -> dict:
+        """개별 점수로 메트릭별 평균 계산 - 실패한 항목(None)은 제외
+
+        cell_failures(행별 {메트릭: 실패 사유})가 주어지면 결과에 함께 담습니다.
+        """
+        result_dict: Dict[str, Any] = {}
+        for metric in metrics:
+            valid_scores = [
+                score for score in (scores.get(metric.name) for scores in individual_scores) if score is not None
+            ]
+            if valid_scores:
+                result_dict[metric.name] = sum(valid_scores) / len(valid_scores)
+                print(f"✅ {metric.name} 평균: {result_dict[metric.name]:.4f} ({len(valid_scores)}/{len(individual_scores)}개 성공)")
+            else:
+                result_dict[metric.name] = 0.0
+                print(f"❌ {metric.name}: 모든 평가 실패")
+        result_dict["individual_scores"] = individual_scores
+        if cell_failures is not None:
+            result_dict["cell_failures"] = cell_failures
+        return result_dict
 
     def _parse_result(self, result, dataset: Dataset) -> dict:
         """결과 파싱 - 오류 처리는 상위 계층으로 위임"""
@@ -0,0 +1,138 @@
+"""
+샤드 단위 멀티프로세스 평가 어댑터
+
+데이터셋을 N개의 연속 구간(샤드)으로 나누어 샤드마다 별도 프로세스에서
+RagasEvalAdapter.evaluate를 실행하고, 결과를 입력 순서대로 병합합니다.
+각 워커는 자체 LLM/임베딩 어댑터와 속도 제한 예산의 1/N을 사용하며,
+한 샤드의 실패는 해당 구간의 점수만 None으로 남기고 나머지 샤드에 영향을 주지 않습니다.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from datasets import Dataset
+
+from src.infrastructure.evaluation.ragas_adapter import RagasEvalAdapter
+from src.infrastructure.network import remaining_time, set_rate_limit_share, set_run_deadline
+
+
+def shard_bounds(total: int, num_shards: int) -> List[Tuple[int, int]]:
+    """total개 행을 최대 num_shards개의 연속 구간 [start, end)로 분할
+
+    앞쪽 샤드가 나머지 행을 1개씩 더 가지며 빈 샤드는 만들지 않습니다.
+    """
+    num_shards = max(1, min(num_shards, total))
+    base, extra = divmod(total, num_shards)
+    bounds = []
+    start = 0
+    for index in range(num_shards):
+        end = start + base + (1 if index < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+# 워커 프로세스 상태 (샤드 실패를 격리하기 위해 어댑터는 첫 작업에서 생성)
+_worker_builder: Optional[Callable[[], Any]] = None
+_worker_adapter: Any = None
+
+
+def _init_worker(
+    adapter_builder: Callable[[], Any], rate_share: float, run_deadline: Optional[float] = None
+) -> None:
+    """워커 프로세스 초기화 (메인 프로세스의 남은 실행 마감 시간을 이어받음)"""
+    global _worker_builder
+    _worker_builder = adapter_builder
+    set_rate_limit_share(rate_share)
+    set_run_deadline(run_deadline)
+
+
+def _evaluate_shard(rows: List[dict]) -> dict:
+    """워커 프로세스에서 샤드 1개 평가"""
+    global _worker_adapter
+    if _worker_adapter is None:
+        _worker_adapter = _worker_builder()
+    return _worker_adapter.evaluate(Dataset.from_list(rows))
+
+
+class ShardedEvalAdapter:
+    """RagasEvalAdapter를 샤드별 프로세스로 병렬 실행하는 어댑터
+
+    RunEvaluationCommand가 사용하는 llm, evaluation_context 속성은
+    메인 프로세스의 기준 어댑터를 그대로 노출합니다.
+    """
+
+    def __init__(
+        self,
+        base_adapter: RagasEvalAdapter,
+        adapter_builder: Callable[[], Any],
+        num_shards: int,
+        start_method: str = "spawn",
+    ):
+        """샤드 어댑터 초기화
+
+        Args:
+            base_adapter: 메타데이터/메트릭 정보 및 단일 샤드 평가에 사용할 어댑터
+            adapter_builder: 워커 프로세스에서 어댑터를 생성하는 pickle 가능한 함수
+            num_shards: 샤드(프로세스) 수
+            start_method: 멀티프로세싱 시작 방식 (기본값: spawn)
+        """
+        self.base_adapter = base_adapter
+        self.adapter_builder = adapter_builder
+        self.num_shards = max(1, num_shards)
+        self.start_method = start_method
+
+        self.llm = base_adapter.llm
+        self.embeddings = base_adapter.embeddings
+        self.prompt_type = base_adapter.prompt_type
+        self.evaluation_context = base_adapter.evaluation_context
+
+    def evaluate(self, dataset: Dataset) -> dict[str, float]:
+        """샤드별 병렬 평가 후 입력 순서대로 병합"""
+        bounds = shard_bounds(len(dataset), self.num_shards)
+        if len(bounds) <= 1:
+            return self.base_adapter.evaluate(dataset)
+
+        rows = dataset.to_list()
+        metrics = self.evaluation_context.get_metrics()
+        individual_scores: List[dict] = [{} for _ in rows]
+        cell_failures: List[dict] = [{} for _ in rows]
+        failed_shards = []
+
+        print(f"🧩 {len(rows)}개 행을 {len(bounds)}개 샤드로 나누어 프로세스별 병렬 평가")
+        context = multiprocessing.get_context(self.start_method)
+        with ProcessPoolExecutor(
+            max_workers=len(bounds),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.adapter_builder, 1.0 / len(bounds), remaining_time()),
+        ) as executor:
+            futures = [executor.submit(_evaluate_shard, rows[start:end]) for start, end in bounds]
+
+            # 완료 순서와 관계없이 샤드 순서대로 수집하여 결정적으로 병합
+            for shard_index, ((start, end), future) in enumerate(zip(bounds, futures, strict=True)):
+                label = f"샤드 {shard_index + 1}/{len(bounds)} (행 {start}-{end - 1})"
+                try:
+                    shard_result = future.result()
+                    shard_scores = shard_result["individual_scores"]
+                    if len(shard_scores) != end - start:
+                        raise ValueError(f"개별 점수 {len(shard_scores)}개, 예상 {end - start}개")
+                    shard_failures = shard_result.get("cell_failures") or [{} for _ in shard_scores]
+                    print(f"✅ {label} 완료")
+                except Exception as e:
+                    print(f"❌ {label} 평가 실패: {e}")
+                    failed_shards.append(shard_index)
+                    shard_scores = [{metric.name: None for metric in metrics} for _ in range(end - start)]
+                    shard_failures = [
+                        {metric.name: f"shard_failed: {e}" for metric in metrics} for _ in range(end - start)
+                    ]
+                individual_scores[start:end] = shard_scores
+                cell_failures[start:end] = shard_failures
+
+        if len(failed_shards) == len(bounds):
+            raise RuntimeError("모든 샤드 평가가 실패했습니다.")
+        if failed_shards:
+            print(f"⚠️ {len(failed_shards)}개 샤드 실패 - 해당 행은 평균 계산에서 제외됩니다.")
+
+        return self.base_adapter._summarize_scores(individual_scores, metrics, cell_failures)
@@ -0,0 +1,185 @@
+"""
+메트릭 간 중간 산출물 공유
+
+faithfulness와 answer_correctness는 같은 프롬프트로 답변을 문장 단위로 분해하고,
+answer_relevancy는 답변에서 질문을 역생성한 뒤 임베딩합니다. 이 모듈은 메트릭의 프롬프트와
+임베딩을 ArtifactStore를 거치도록 감싸서, 같은 샘플의 같은 중간 산출물은 한 번만 계산하고
+재실행 시에는 저장된 값을 사용하게 합니다.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.cache.artifact_store import ArtifactStore, get_artifact_store
+from src.infrastructure.cache.embedding_cache import CachedEmbeddings
+
+
+# 메트릭 프롬프트 속성 -> 산출물 종류
+SHARED_PROMPT_ATTRIBUTES = {
+    "statement_generator_prompt": "statements",  # faithfulness, answer_correctness
+    "nli_statements_prompt": "nli_verdicts",  # faithfulness
+    "question_generation": "generated_questions",  # answer_relevancy
+}
+
+# 같은 입력으로 여러 번 호출해 서로 다른 결과를 기대하는 산출물 (answer_relevancy의 strictness)
+SAMPLED_ARTIFACT_KINDS = {"generated_questions"}
+
+
+def _is_empty_output(value: Dict[str, Any]) -> bool:
+    """파싱 실패로 빈 결과가 나온 경우 (재실행 시 다시 계산하도록 저장하지 않음)"""
+    return not any(value.values())
+
+
+class ArtifactPrompt:
+    """RAGAS PydanticPrompt를 감싸 generate 결과를 중간 산출물로 공유하는 래퍼
+
+    키는 (산출물 종류, 평가 모델, 프롬프트 식별값, 입력)이므로 faithfulness와 answer_correctness처럼
+    같은 프롬프트를 같은 입력으로 호출하는 메트릭끼리 결과를 공유합니다.
+    """
+
+    def __init__(self, prompt: Any, kind: str, judge_model: str, store: ArtifactStore):
+        self._prompt = prompt
+        self._kind = kind
+        self._judge_model = judge_model
+        self._store = store
+        self._fingerprint = f"{type(prompt).__name__}:{getattr(prompt, 'language', '')}:{hash(prompt)}"
+        self._slots: Dict[str, int] = defaultdict(int)
+        self._slots_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # generate 외의 속성은 원본 프롬프트로 전달
+        return getattr(self._prompt, name)
+
+    def _next_slot(self, payload_key: str) -> int:
+        """같은 입력으로 여러 번 생성하는 산출물의 호출 순번"""
+        if self._kind not in SAMPLED_ARTIFACT_KINDS:
+            return 0
+        with self._slots_lock:
+            slot = self._slots[payload_key]
+            self._slots[payload_key] += 1
+        return slot
+
+    async def generate(
+        self,
+        llm: Any,
+        data: Any,
+        temperature: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        callbacks: Any = None,
+        retries_left: int = 3,
+    ) -> Any:
+        """저장된 산출물이 있으면 반환하고, 없으면 원본 프롬프트로 생성"""
+        payload = data.model_dump()
+        payload_key = ArtifactStore.make_key(self._kind, self._judge_model, self._fingerprint, payload)
+        key = ArtifactStore.make_key(
+            self._kind, self._judge_model, self._fingerprint, {"input": payload_key, "slot": self._next_slot(payload_key)}
+        )
+
+        async def compute():
+            output = await self._prompt.generate(
+                llm=llm,
+                data=data,
+                temperature=temperature,
+                stop=stop,
+                callbacks=callbacks,
+                retries_left=retries_left,
+            )
+            return output.model_dump()
+
+        value = await self._store.aget_or_compute(
+            key, self._kind, compute, should_store=lambda value: not _is_empty_output(value)
+        )
+        return self._prompt.output_model.model_validate(value)
+
+
+class ArtifactEmbeddings(Embeddings):
+    """임베딩 결과를 텍스트별 중간 산출물로 공유하는 래퍼"""
+
+    def __init__(self, embeddings: Embeddings, store: ArtifactStore):
+        self.embeddings = embeddings
+        self.store = store
+        self.model_name = getattr(embeddings, "model_name", None) or getattr(embeddings, "model", None)
+        self._model_key = f"{type(embeddings).__name__}:{self.model_name}"
+
+    def _key(self, text: str) -> str:
+        return ArtifactStore.make_key("embedding", self._model_key, "", text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (저장되지 않은 텍스트만 원본 임베딩 호출)"""
+        vectors = [self.store.get(self._key(text)) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            computed = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, computed, strict=True):
+                vectors[i] = list(vector)
+                self.store.put(self._key(texts[i]), "embedding", vectors[i])
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 임베딩"""
+        vector = self.store.get(self._key(text))
+        if vector is None:
+            vector = list(self.embeddings.embed_query(text))
+            self.store.put(self._key(text), "embedding", vector)
+        return vector
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """비동기 문서 임베딩 (같은 텍스트의 동시 요청은 한 번만 계산)"""
+
+        async def embed_one(text: str):
+            async def compute():
+                return list((await self.embeddings.aembed_documents([text]))[0])
+
+            return await self.store.aget_or_compute(self._key(text), "embedding", compute)
+
+        return list(await asyncio.gather(*(embed_one(text) for text in texts)))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """비동기 쿼리 임베딩"""
+
+        async def compute():
+            return list(await self.embeddings.aembed_query(text))
+
+        return await self.store.aget_or_compute(self._key(text), "embedding", compute)
+
+
+def attach_shared_artifacts(
+    metrics: List[Any],
+    embeddings: Embeddings,
+    judge_model: str,
+    store: Optional[ArtifactStore] = None,
+) -> Embeddings:
+    """메트릭의 프롬프트를 중간 산출물 공유 래퍼로 교체
+
+    메트릭 인스턴스는 이번 실행 전용이어야 합니다 (select_metrics 결과).
+
+    Args:
+        metrics: 평가에 사용할 메트릭 목록 (프롬프트 속성이 제자리에서 교체됨)
+        embeddings: 평가에 사용할 임베딩
+        judge_model: 평가 LLM 모델명 (다른 모델의 산출물과 섞이지 않도록 키에 포함)
+        store: 산출물 저장소 (None이면 전역 저장소)
+
+    Returns:
+        RAGAS evaluate에 전달할 임베딩 (저장소가 꺼져 있으면 원본)
+    """
+    store = store or get_artifact_store()
+    if not store.enabled:
+        return embeddings
+
+    for metric in metrics:
+        for attribute, kind in SHARED_PROMPT_ATTRIBUTES.items():
+            prompt = getattr(metric, attribute, None)
+            if prompt is None or isinstance(prompt, ArtifactPrompt) or not hasattr(prompt, "output_model"):
+                continue
+            setattr(metric, attribute, ArtifactPrompt(prompt, kind, judge_model, store))
+
+    if embeddings is None or isinstance(embeddings, ArtifactEmbeddings):
+        return embeddings
+    # 영구 임베딩 캐시가 켜져 있으면 벡터는 그쪽에 저장 (산출물 저장소에 JSON으로 중복 저장하지 않음)
+    if isinstance(embeddings, CachedEmbeddings) and embeddings.store.enabled:
+        return embeddings
+    return ArtifactEmbeddings(embeddings, store)
@@ -4,11 +4,34 @@ Base Evaluation Strategy
 평가 전략의 기본 인터페이스를 정의합니다.
 """
 
+import dataclasses
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 from datasets import Dataset
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseLanguageModel
+from ragas.metrics import AnswerCorrectness, ContextPrecision, ContextRecall, Faithfulness
+from ragas.run_config import RunConfig
+
+from src.config import settings
+from src.infrastructure.evaluation.async_metrics import AsyncAnswerRelevancy
+from src.infrastructure.evaluation.shared_artifacts import attach_shared_artifacts
+from src.infrastructure.network import remaining_time
+
+
+def default_metrics() -> List[Any]:
+    """기본 RAGAS 메트릭의 새 인스턴스 목록
+
+    ragas.metrics 모듈의 메트릭 객체는 프로세스 전역 싱글턴이고 evaluate가 실행 중
+    llm/embeddings를 설정하므로, 동시에 실행되는 평가끼리 공유하지 않도록 매번 새로 만듭니다.
+    """
+    return [
+        Faithfulness(),
+        AsyncAnswerRelevancy(),
+        ContextRecall(),
+        ContextPrecision(),
+        AnswerCorrectness(),
+    ]
 
 
 class EvaluationStrategy(ABC):
@@ -20,12 +43,32 @@ class EvaluationStrategy(ABC):
     
     @abstractmethod
     def get_metrics(self) -> List[Any]:
-        """사용할 메트릭 목록 반환"""
+        """사용할 메트릭 목록 반환 (호출마다 새 인스턴스)"""
         pass
     
+    def select_metrics(self, metrics: Optional[List[Any]] = None) -> List[Any]:
+        """이번 실행 전용 메트릭 인스턴스 반환
+
+        호출자가 넘긴 메트릭 객체는 다른 평가와 공유될 수 있으므로 RAGAS에 그대로 넘기지 않고,
+        같은 이름의 새 인스턴스를 get_metrics() 순서대로 돌려줍니다.
+
+        Args:
+            metrics: 평가할 메트릭 (None이면 get_metrics() 전체)
+        """
+        run_metrics = self.get_metrics()
+        if metrics is None:
+            return run_metrics
+        requested = {metric.name for metric in metrics}
+        return [metric for metric in run_metrics if metric.name in requested]
+    
     @abstractmethod
-    def run_evaluation(self, dataset: Dataset) -> Any:
-        """평가 실행"""
+    def run_evaluation(self, dataset: Dataset, metrics: Optional[List[Any]] = None) -> Any:
+        """평가 실행
+        
+        Args:
+            dataset: 평가할 데이터셋
+            metrics: 평가할 메트릭 (None이면 get_metrics() 전체)
+        """
         pass
     
     @abstractmethod
@@ -33,6 +76,30 @@ class EvaluationStrategy(ABC):
         """전략 이름 반환"""
         pass
     
+    def with_cell_deadline(self, run_config: RunConfig) -> RunConfig:
+        """셀 마감 시간을 적용한 RunConfig 반환
+
+        RAGAS는 RunConfig.timeout을 (행, 메트릭) 셀마다 적용하므로 마감을 넘긴 셀은
+        취소되고 NaN으로 기록됩니다. 전체 실행 마감까지 남은 시간을 넘지 않습니다.
+        """
+        timeout = settings.JUDGE_CELL_DEADLINE
+        remaining = remaining_time()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        return dataclasses.replace(run_config, timeout=timeout)
+    
+    def with_shared_artifacts(self, metrics: List[Any]) -> Embeddings:
+        """메트릭이 같은 샘플의 중간 산출물(문장 분해, NLI 판정, 역생성 질문, 임베딩)을 공유하도록 설정
+
+        Args:
+            metrics: 이번 실행 전용 메트릭 인스턴스 (select_metrics 결과)
+
+        Returns:
+            evaluate에 전달할 임베딩
+        """
+        judge_model = str(getattr(self.llm, 'model', type(self.llm).__name__))
+        return attach_shared_artifacts(metrics, self.embeddings, judge_model)
+    
     def print_strategy_info(self):
         """전략 정보 출력"""
         print(f"🔧 평가 전략: {self.get_strategy_name()}")
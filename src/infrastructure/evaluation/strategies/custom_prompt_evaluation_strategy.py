@@ -4,11 +4,14 @@ Custom Prompt Evaluation Strategy
 커스텀 프롬프트를 사용한 평가 전략입니다.
 """
 
-from typing import Any, List
+import copy
+from typing import Any, List, Optional
 from datasets import Dataset
 from ragas import evaluate
+from ragas.metrics import AnswerCorrectness, ContextPrecision
 from ragas.run_config import RunConfig
 
+from src.config import settings
 from src.domain.prompts import PromptType
 from src.infrastructure.evaluation.custom_prompts import CustomPromptFactory
 from .base_strategy import EvaluationStrategy
@@ -22,12 +25,12 @@ class CustomPromptEvaluationStrategy(EvaluationStrategy):
         self.prompt_type = prompt_type
         # HCX 사용 시 순차 처리로 API 한도 방지
         max_workers = 1
-        timeout = 600  # HCX 사용 시 타임아웃 증가
+        # 작업 전체가 아닌 (행, 메트릭) 셀 단위 마감 시간
+        timeout = settings.JUDGE_CELL_DEADLINE
         
         # LLM이 HCX가 아닌 경우 더 많은 워커 사용 가능
         if hasattr(llm, 'model') and 'HCX' not in str(llm.model):
             max_workers = 4
-            timeout = 300
         
         self.run_config = RunConfig(
             timeout=timeout,
@@ -37,22 +40,23 @@ class CustomPromptEvaluationStrategy(EvaluationStrategy):
             log_tenacity=True
         )
         
-        # 커스텀 메트릭 생성
+        # 커스텀 메트릭 원본 (평가에는 get_metrics()의 복사본 사용)
         self.custom_metrics = CustomPromptFactory.create_custom_metrics(self.prompt_type)
     
     def get_metrics(self) -> List[Any]:
-        """커스텀 메트릭 반환 (Context Precision과 Answer Correctness는 기본 메트릭 사용)"""
-        from ragas.metrics import context_precision, answer_correctness
-        
+        """커스텀 메트릭 반환 (Context Precision과 Answer Correctness는 기본 메트릭 사용)
+
+        동시에 실행되는 평가끼리 메트릭 상태를 공유하지 않도록 호출마다 새 인스턴스를 만듭니다.
+        """
         return [
-            self.custom_metrics['faithfulness'],
-            self.custom_metrics['answer_relevancy'],
-            self.custom_metrics['context_recall'],
-            context_precision,  # 기본 메트릭 사용으로 안정성 확보
-            answer_correctness,  # 기본 메트릭 사용 (ground_truth 비교 필요)
+            copy.deepcopy(self.custom_metrics['faithfulness']),
+            copy.deepcopy(self.custom_metrics['answer_relevancy']),
+            copy.deepcopy(self.custom_metrics['context_recall']),
+            ContextPrecision(),  # 기본 메트릭 사용으로 안정성 확보
+            AnswerCorrectness(),  # 기본 메트릭 사용 (ground_truth 비교 필요)
         ]
     
-    def run_evaluation(self, dataset: Dataset) -> Any:
+    def run_evaluation(self, dataset: Dataset, metrics: Optional[List[Any]] = None) -> Any:
         """커스텀 프롬프트 평가 실행"""
         prompt_description = CustomPromptFactory.get_prompt_type_description(self.prompt_type)
         print(f"🚀 커스텀 프롬프트 평가 실행 중: {prompt_description}")
@@ -67,12 +71,15 @@ class CustomPromptEvaluationStrategy(EvaluationStrategy):
             embedding_info += f" (디바이스: {self.embeddings.device})"
         print(embedding_info)
         
+        run_metrics = self.select_metrics(metrics)
+        embeddings = self.with_shared_artifacts(run_metrics)
+        
         return evaluate(
             dataset=dataset,
-            metrics=self.get_metrics(),
+            metrics=run_metrics,
             llm=self.llm,
-            embeddings=self.embeddings,
-            run_config=self.run_config,
+            embeddings=embeddings,
+            run_config=self.with_cell_deadline(self.run_config),
             raise_exceptions=False,
         )
     
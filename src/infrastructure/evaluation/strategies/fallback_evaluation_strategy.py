@@ -4,13 +4,12 @@ Fallback Evaluation Strategy
 평가 실패 시 사용되는 폴백 전략입니다.
 """
 
-from typing import Any, List
+from typing import Any, List, Optional
 from datasets import Dataset
 from ragas import evaluate
-from ragas.metrics import faithfulness, answer_relevancy, context_recall, context_precision
 from ragas.run_config import RunConfig
 
-from .base_strategy import EvaluationStrategy
+from .base_strategy import EvaluationStrategy, default_metrics
 
 
 class FallbackEvaluationStrategy(EvaluationStrategy):
@@ -28,15 +27,10 @@ class FallbackEvaluationStrategy(EvaluationStrategy):
         )
     
     def get_metrics(self) -> List[Any]:
-        """기본 메트릭 반환 (보수적)"""
-        return [
-            faithfulness,
-            answer_relevancy,
-            context_recall,
-            context_precision,
-        ]
+        """기본 메트릭 반환 (보수적, 호출마다 새 인스턴스)"""
+        return default_metrics()
     
-    def run_evaluation(self, dataset: Dataset) -> Any:
+    def run_evaluation(self, dataset: Dataset, metrics: Optional[List[Any]] = None) -> Any:
         """폴백 평가 실행"""
         print("🔄 폴백 평가 전략 실행 중...")
         print("⚠️  더 보수적인 설정으로 재시도합니다")
@@ -46,10 +40,10 @@ class FallbackEvaluationStrategy(EvaluationStrategy):
         
         return evaluate(
             dataset=dataset,
-            metrics=self.get_metrics(),
+            metrics=self.select_metrics(metrics),
             llm=self.llm,
             embeddings=self.embeddings,
-            run_config=self.run_config,
+            run_config=self.with_cell_deadline(self.run_config),
             raise_exceptions=False,
         )
     
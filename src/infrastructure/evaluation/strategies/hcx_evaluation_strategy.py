@@ -4,16 +4,15 @@ HCX Model Evaluation Strategy
 HCX 모델 전용 평가 전략으로, HCX API의 응답 특성을 고려한 커스텀 파싱 로직을 포함합니다.
 """
 
-from typing import Any, List
+from typing import Any, List, Optional
 from datasets import Dataset
 from ragas import evaluate
-from ragas.metrics import faithfulness, answer_relevancy, context_recall, context_precision, answer_correctness
 from ragas.run_config import RunConfig
-import os
 import json
 import re
 
-from .base_strategy import EvaluationStrategy
+from src.config import settings
+from .base_strategy import EvaluationStrategy, default_metrics
 
 
 class HcxEvaluationStrategy(EvaluationStrategy):
@@ -24,7 +23,7 @@ class HcxEvaluationStrategy(EvaluationStrategy):
         
         # HCX 전용 설정: 순차 처리 및 타임아웃 증가
         self.run_config = RunConfig(
-            timeout=1200,  # 20분 타임아웃 (HCX는 느림)
+            timeout=settings.JUDGE_CELL_DEADLINE,  # (행, 메트릭) 셀 단위 마감 시간
             max_retries=3,  # 재시도 횟수
             max_workers=1,  # 순차 처리 강제
             max_wait=300,   # 대기 시간 증가
@@ -35,19 +34,20 @@ class HcxEvaluationStrategy(EvaluationStrategy):
         # 설정 확인 로그
         print(f"⚙️ HCX 전용 RAGAS 설정 적용됨:")
         print(f"   - LLM 모델: {getattr(llm, 'model', 'HCX')}")
-        print(f"   - 워커 수: 1 (순차 처리)")
-        print(f"   - 타임아웃: 1200초 (20분)")
-        print(f"   - 재시도: 3회")
+        print(f"   - 워커 수: {self.run_config.max_workers} (순차 처리)")
+        print(f"   - 셀 마감 시간: {self.run_config.timeout}초")
+        print(f"   - 재시도: {self.run_config.max_retries}회")
         print(f"   - 파싱 오류 허용 모드 활성화")
     
     def get_metrics(self) -> List[Any]:
         """HCX에 최적화된 메트릭 반환"""
         # 커스텀 메트릭 생성 (파싱 오류 처리 포함)
-        from ragas.metrics import Faithfulness, AnswerRelevancy, ContextRecall, ContextPrecision, AnswerCorrectness
+        from ragas.metrics import Faithfulness, ContextRecall, ContextPrecision, AnswerCorrectness
+        from src.infrastructure.evaluation.async_metrics import AsyncAnswerRelevancy
         
         # HCX 전용 파서를 가진 메트릭 생성
         custom_faithfulness = self._create_hcx_metric(Faithfulness())
-        custom_answer_relevancy = self._create_hcx_metric(AnswerRelevancy())
+        custom_answer_relevancy = self._create_hcx_metric(AsyncAnswerRelevancy())
         custom_context_recall = self._create_hcx_metric(ContextRecall())
         custom_context_precision = self._create_hcx_metric(ContextPrecision())
         custom_answer_correctness = self._create_hcx_metric(AnswerCorrectness())
@@ -148,7 +148,7 @@ class HcxEvaluationStrategy(EvaluationStrategy):
             print(f"⚠️ 기본 형식 변환도 실패: {e} - 원본 데이터셋 사용")
             return dataset
     
-    def run_evaluation(self, dataset: Dataset) -> Any:
+    def run_evaluation(self, dataset: Dataset, metrics: Optional[List[Any]] = None) -> Any:
         """HCX 전용 평가 실행"""
         print("🚀 HCX 전용 RAGAS 평가 실행 중...")
         print(f"📊 데이터셋 크기: {len(dataset)}개 QA 쌍")
@@ -162,82 +162,34 @@ class HcxEvaluationStrategy(EvaluationStrategy):
             embedding_info += f" (디바이스: {self.embeddings.device})"
         print(embedding_info)
         
-        # HCX 전용 환경 변수 설정
-        original_env = {}
-        env_vars = {
-            'RAGAS_MAX_WORKERS': '1',
-            'NUMEXPR_MAX_THREADS': '1',
-            'RAGAS_PARSING_RETRIES': '5',  # 파싱 재시도 증가
-            'RAGAS_ALLOW_PARSING_ERRORS': 'true',  # 파싱 오류 허용
-        }
-        
-        for key, value in env_vars.items():
-            original_env[key] = os.environ.get(key, '')
-            os.environ[key] = value
-        
-        print("🔧 HCX 전용 환경 설정 적용")
-        
         try:
             # SingleTurnSample 타입 문제를 해결하기 위해 데이터셋 변환
             converted_dataset = self._convert_dataset_format(dataset)
             print("🔄 데이터셋을 RAGAS 호환 형식으로 변환 완료")
             
-            from ragas.metrics import faithfulness, answer_relevancy, context_recall, context_precision, answer_correctness
+            # 이번 실행 전용 메트릭 인스턴스 (모듈 싱글턴을 변경하지 않아 동시 평가와 격리됨)
+            basic_metrics = default_metrics()
+            print("🔄 기본 RAGAS 메트릭 사용 (faithfulness 포함)")
             
-            # HCX에서 faithfulness 파싱 문제 해결을 위한 설정
-            try:
-                # faithfulness 메트릭의 파서 설정 조정
-                if hasattr(faithfulness, 'llm'):
-                    faithfulness.llm = self.llm
-                
-                basic_metrics = [
-                    faithfulness,
-                    answer_relevancy, 
-                    context_recall,
-                    context_precision,
-                    answer_correctness,
-                ]
-                print("🔄 기본 RAGAS 메트릭 사용 (faithfulness 포함)")
-                
-            except Exception as metric_error:
-                print(f"⚠️ Faithfulness 메트릭 설정 오류: {metric_error}")
-                # faithfulness 제외하고 평가
-                basic_metrics = [
-                    answer_relevancy, 
-                    context_recall,
-                    context_precision,
-                    answer_correctness,
-                ]
-                print("🔄 Faithfulness 제외하고 평가 진행")
+            # 일부 메트릭만 요청된 경우 해당 메트릭만 평가
+            if metrics is not None:
+                requested_names = {metric.name for metric in metrics}
+                basic_metrics = [metric for metric in basic_metrics if metric.name in requested_names]
+            
+            # 같은 샘플의 문장 분해/역생성 질문/임베딩을 메트릭끼리 공유
+            embeddings = self.with_shared_artifacts(basic_metrics)
             
             try:
-                # HCX용 run_config 설정 확인
-                try:
-                    # run_config가 있고 LLM이 set_run_config를 지원하는지 확인
-                    if self.run_config and hasattr(self.llm, 'set_run_config'):
-                        print("🔧 RunConfig를 LLM에 설정 중...")
-                        self.llm.set_run_config(self.run_config)
-                    
-                    result = evaluate(
-                        dataset=converted_dataset,
-                        metrics=basic_metrics,
-                        llm=self.llm,
-                        embeddings=self.embeddings,
-                        run_config=None,  # HCX는 자체 설정 사용
-                        raise_exceptions=False,  # 예외 발생 방지
-                        show_progress=True,
-                    )
-                except Exception as config_error:
-                    print(f"⚠️ RunConfig 설정 오류: {config_error}")
-                    # RunConfig 없이 평가 시도
-                    result = evaluate(
-                        dataset=converted_dataset,
-                        metrics=basic_metrics,
-                        llm=self.llm,
-                        embeddings=self.embeddings,
-                        raise_exceptions=False,  # 예외 발생 방지
-                        show_progress=True,
-                    )
+                # RunConfig는 evaluate 호출마다 전달 (공유 LLM 객체에 설정하지 않음)
+                result = evaluate(
+                    dataset=converted_dataset,
+                    metrics=basic_metrics,
+                    llm=self.llm,
+                    embeddings=embeddings,
+                    run_config=self.with_cell_deadline(self.run_config),
+                    raise_exceptions=False,  # 예외 발생 방지
+                    show_progress=True,
+                )
                 
                 # 파싱 오류가 있어도 부분 결과 반환
                 return self._handle_partial_results(result, dataset)
@@ -259,14 +211,7 @@ class HcxEvaluationStrategy(EvaluationStrategy):
             print(f"📝 오류 상세: SingleTurnSample 호환성 문제 - 부분 점수로 폴백")
             # 오류 발생 시 부분 점수 반환
             return self._create_partial_result(dataset)
-            
-        finally:
-            # 환경 변수 복원
-            for key, value in original_env.items():
-                if value:
-                    os.environ[key] = value
-                elif key in os.environ:
-                    del os.environ[key]
+
     
     def _handle_partial_results(self, result, dataset):
         """부분 결과 처리 - NaN이나 파싱 실패를 부분 점수로 대체"""
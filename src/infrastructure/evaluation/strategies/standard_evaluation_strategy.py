@@ -4,19 +4,13 @@ Standard Evaluation Strategy
 기본 RAGAS 메트릭을 사용한 표준 평가 전략입니다.
 """
 
-from typing import Any, List
+from typing import Any, List, Optional
 from datasets import Dataset
 from ragas import evaluate
-from ragas.metrics import (
-    faithfulness, 
-    answer_relevancy, 
-    context_recall, 
-    context_precision, 
-    answer_correctness
-)
 from ragas.run_config import RunConfig
 
-from .base_strategy import EvaluationStrategy
+from src.config import settings
+from .base_strategy import EvaluationStrategy, default_metrics
 
 
 class StandardEvaluationStrategy(EvaluationStrategy):
@@ -27,12 +21,12 @@ class StandardEvaluationStrategy(EvaluationStrategy):
         
         # HCX 사용 시 순차 처리로 API 한도 방지
         max_workers = 1
-        timeout = 600  # HCX 사용 시 타임아웃 증가
+        # 작업 전체가 아닌 (행, 메트릭) 셀 단위 마감 시간
+        timeout = settings.JUDGE_CELL_DEADLINE
         
         # LLM이 HCX가 아닌 경우 더 많은 워커 사용 가능
         if hasattr(llm, 'model') and 'HCX' not in str(llm.model):
             max_workers = 4
-            timeout = 300
         
         self.run_config = RunConfig(
             timeout=timeout,
@@ -46,20 +40,14 @@ class StandardEvaluationStrategy(EvaluationStrategy):
         print(f"⚙️ RAGAS 설정 적용됨:")
         print(f"   - LLM 모델: {getattr(llm, 'model', 'Unknown')}")
         print(f"   - 워커 수: {max_workers}")
-        print(f"   - 타임아웃: {timeout}초")
+        print(f"   - 셀 마감 시간: {timeout}초")
         print(f"   - 재시도: 5회")
     
     def get_metrics(self) -> List[Any]:
-        """기본 RAGAS 메트릭 반환"""
-        return [
-            faithfulness,
-            answer_relevancy,
-            context_recall,
-            context_precision,
-            answer_correctness,
-        ]
+        """기본 RAGAS 메트릭 반환 (호출마다 새 인스턴스)"""
+        return default_metrics()
     
-    def run_evaluation(self, dataset: Dataset) -> Any:
+    def run_evaluation(self, dataset: Dataset, metrics: Optional[List[Any]] = None) -> Any:
         """기본 RAGAS 평가 실행"""
         print("🚀 표준 RAGAS 평가 실행 중...")
         print(f"📊 데이터셋 크기: {len(dataset)}개 QA 쌍")
@@ -73,47 +61,31 @@ class StandardEvaluationStrategy(EvaluationStrategy):
             embedding_info += f" (디바이스: {self.embeddings.device})"
         print(embedding_info)
         
-        # HCX 사용 시 추가 환경 변수 설정으로 강제 순차 처리
-        import os
-        original_env = {}
+        # HCX 사용 시 이번 실행의 RunConfig로만 순차 처리 강제 (프로세스 환경 변수는 변경하지 않음)
+        run_config = self.run_config
         if 'HCX' in str(self.llm.model):
             print("🔧 HCX 모델 감지 - 순차 처리 강제 적용")
-            # 스레드 풀 크기 제한
-            original_env['RAGAS_MAX_WORKERS'] = os.environ.get('RAGAS_MAX_WORKERS', '')
-            original_env['NUMEXPR_MAX_THREADS'] = os.environ.get('NUMEXPR_MAX_THREADS', '')
-            os.environ['RAGAS_MAX_WORKERS'] = '1'
-            os.environ['NUMEXPR_MAX_THREADS'] = '1'
-        
-        try:
-            # HCX 사용 시 파싱 오류 허용도 증가
-            run_config = self.run_config
-            if 'HCX' in str(self.llm.model):
-                from ragas.run_config import RunConfig
-                run_config = RunConfig(
-                    timeout=self.run_config.timeout,
-                    max_retries=self.run_config.max_retries,
-                    max_workers=1,  # 강제로 1로 설정
-                    max_wait=self.run_config.max_wait,
-                    log_tenacity=True,
-                    exception_types=(Exception,),  # 더 넓은 예외 허용
-                )
-                print(f"🔧 HCX 전용 RunConfig 적용: 워커={run_config.max_workers}")
-            
-            result = evaluate(
-                dataset=dataset,
-                metrics=self.get_metrics(),
-                llm=self.llm,
-                embeddings=self.embeddings,
-                run_config=run_config,
-                raise_exceptions=False,
+            run_config = RunConfig(
+                timeout=self.run_config.timeout,
+                max_retries=self.run_config.max_retries,
+                max_workers=1,  # 강제로 1로 설정
+                max_wait=self.run_config.max_wait,
+                log_tenacity=True,
+                exception_types=(Exception,),  # 더 넓은 예외 허용
             )
-        finally:
-            # 환경 변수 복원
-            for key, value in original_env.items():
-                if value:
-                    os.environ[key] = value
-                elif key in os.environ:
-                    del os.environ[key]
+            print(f"🔧 HCX 전용 RunConfig 적용: 워커={run_config.max_workers}")
+        
+        run_metrics = self.select_metrics(metrics)
+        embeddings = self.with_shared_artifacts(run_metrics)
+        
+        result = evaluate(
+            dataset=dataset,
+            metrics=run_metrics,
+            llm=self.llm,
+            embeddings=embeddings,
+            run_config=self.with_cell_deadline(run_config),
+            raise_exceptions=False,
+        )
         
         return result
     
@@ -1,6 +1,7 @@
 from typing import List
 
 from src.application.ports.llm import LlmPort
+from src.domain.exceptions import ProviderError
 from src.infrastructure.llm.http_gemini_wrapper import HttpGeminiWrapper
 
 
@@ -48,6 +49,8 @@ class GeminiAdapter(LlmPort):
         try:
             response = llm.invoke(prompt)
             return response.content if hasattr(response, 'content') else str(response)
+        except ProviderError:
+            raise
         except Exception as e:
             raise RuntimeError(f"답변 생성 중 오류 발생: {str(e)}") from e
 
@@ -1,25 +1,46 @@
+import asyncio
 import requests
-from typing import List, Any, Dict
-import threading
+import httpx
+from typing import List, Any, Dict, Optional, Tuple
 import time
 import json
 import re
+import uuid
 
 from src.application.ports.llm import LlmPort
+from src.config import settings
+from src.domain.exceptions import (
+    ProviderError,
+    ProviderAuthError,
+    ProviderNetworkError,
+    ProviderRateLimitError,
+    ProviderResponseError,
+    provider_error_for_status,
+)
+from src.infrastructure.cache import get_llm_cache
+from src.infrastructure.llm.json_repair import repair_judge_output
+from src.infrastructure.llm.output_budget import OutputBudget, get_output_budget_stats, resolve_output_budget
+from src.infrastructure.network import HEDGE_LLM, RetryPolicy, get_rate_limiter, get_transport
 from langchain_core.language_models.llms import LLM
 from langchain_core.outputs import GenerationChunk, Generation, LLMResult
 from langchain_core.prompt_values import StringPromptValue
 
 
-# 글로벌 HCX API 요청 제한을 위한 세마포어
-_hcx_semaphore = threading.Semaphore(1)  # 동시에 1개 요청만 허용
-_last_hcx_request_time = 0
-_min_request_interval = 1.0  # 최소 1초 간격으로 줄임
-
-
 class HcxAdapter(LlmPort):
     """Naver Cloud CLOVA Studio HCX 모델 연동을 위한 어댑터"""
 
+    # 요청 생성 파라미터 (캐시 키에도 사용)
+    GENERATION_PARAMS = {
+        "maxTokens": 4096,
+        "temperature": 0.5,
+        "topP": 0.8,
+        "topK": 0,
+        "repetitionPenalty": 1.1,
+        "stop": [],
+    }
+    # 재시도 정책 (429 응답 간격은 속도 제한기가 조절)
+    RETRY_POLICY = RetryPolicy(max_retries=3, base_delay=2.0, multiplier=1.5, jitter=1.0)
+
     def __init__(
         self,
         api_key: str,
@@ -34,37 +55,84 @@ class HcxAdapter(LlmPort):
         self.model = self.model_name  # RagasEvalAdapter 호환성을 위해 추가
         # 작동하는 엔드포인트 사용 (테스트로 확인됨)
         self.api_url = f"https://clovastudio.stream.ntruss.com/testapp/v3/chat-completions/{self.model_name}"
+        # 프로세스 내 모든 HCX 채팅 요청이 공유하는 적응형 속도 제한기
+        self.rate_limiter = get_rate_limiter("hcx", "chat", api_key=self.api_key)
         
         # 디버그: API 키와 URL 확인
         print(f"🔧 HCX 어댑터 초기화: {self.model_name}")
         print(f"   API URL: {self.api_url}")
         print(f"   API 키 확인: {self.api_key[:10]}...{self.api_key[-5:]}")
 
-    def generate_answer(self, question: str, contexts: List[str]) -> str:
+    def generate_answer(
+        self,
+        question: str,
+        contexts: List[str],
+        output_budget: Optional[OutputBudget] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
         """
         HCX 모델을 사용하여 질문과 컨텍스트 기반의 답변을 생성합니다.
+
+        output_budget이 주어지면 기본 maxTokens 대신 해당 예산을 사용합니다 (평가 프롬프트).
+        timeout을 주지 않으면 답변 생성 타임아웃(LLM_GENERATION_TIMEOUT)을 사용합니다.
         """
-        global _last_hcx_request_time
-        
-        # 글로벌 세마포어로 동시 요청 제한
-        with _hcx_semaphore:
-            # 최소 간격 보장
-            current_time = time.time()
-            elapsed = current_time - _last_hcx_request_time
-            if elapsed < _min_request_interval:
-                sleep_time = _min_request_interval - elapsed
-                # 로그 출력 제거 - 너무 많은 로그 방지
-                time.sleep(sleep_time)
-            
-            _last_hcx_request_time = time.time()
-            return self._make_api_request(question, contexts)
-    
-    def _make_api_request(self, question: str, contexts: List[str]) -> str:
-        """실제 API 요청 수행"""
+        # 동일한 요청의 캐시된 응답이 있으면 API 호출 생략
+        messages = self._build_messages(question, contexts)
+        cache = get_llm_cache()
+        cache_key = self._make_cache_key(messages, output_budget)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 실패는 ProviderError로 전달되므로 오류 메시지가 답변이나 캐시에 저장되지 않음
+        content = self._make_api_request(messages, output_budget, timeout)
+        cache.put(cache_key, self.model_name, content)
+        return content
+
+    async def agenerate_answer(
+        self,
+        question: str,
+        contexts: List[str],
+        output_budget: Optional[OutputBudget] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        generate_answer의 비동기 버전입니다.
+
+        이벤트 루프를 막지 않고 속도 제한 대기와 네트워크 대기를 수행합니다.
+        """
+        messages = self._build_messages(question, contexts)
+        cache = get_llm_cache()
+        cache_key = self._make_cache_key(messages, output_budget)
+        # 캐시 조회/저장은 SQLite 쓰기 잠금을 기다릴 수 있으므로 이벤트 루프 밖에서 실행
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            return cached
+
+        content = await self._amake_api_request(messages, output_budget, timeout)
+        await asyncio.to_thread(cache.put, cache_key, self.model_name, content)
+        return content
+
+    def _make_cache_key(self, messages: List[Dict[str, str]], output_budget: Optional[OutputBudget] = None) -> str:
+        """요청 메시지와 생성 파라미터로 캐시 키 생성"""
+        return get_llm_cache().make_key(
+            self.model_name,
+            json.dumps(messages, ensure_ascii=False),
+            self.GENERATION_PARAMS["temperature"],
+            self._max_tokens(output_budget),
+            self.GENERATION_PARAMS["stop"],
+        )
+
+    def _max_tokens(self, output_budget: Optional[OutputBudget]) -> int:
+        """요청의 최대 출력 토큰 (예산이 없으면 기본값)"""
+        return output_budget.max_tokens if output_budget else self.GENERATION_PARAMS["maxTokens"]
+
+    def _build_messages(self, question: str, contexts: List[str]) -> List[Dict[str, str]]:
+        """질문과 컨텍스트로 요청 메시지 구성"""
         context_text = "\\n\\n".join(contexts)
         
         # HCX API 간단한 형식으로 시작 (문제 해결 후 Array 형식으로 변경 가능)
-        messages = [
+        return [
             {
                 "role": "system",
                 "content": "당신은 도움이 되는 AI 어시스턴트입니다. 주어진 컨텍스트를 바탕으로 질문에 정확하고 간결하게 답변하세요."
@@ -82,7 +150,10 @@ class HcxAdapter(LlmPort):
             }
         ]
 
-        import uuid
+    def _build_request(
+        self, messages: List[Dict[str, str]], output_budget: Optional[OutputBudget] = None
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """요청 헤더와 본문 구성"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "X-NCP-CLOVASTUDIO-API-KEY": self.api_key,
@@ -94,26 +165,72 @@ class HcxAdapter(LlmPort):
 
         body = {
             "messages": messages,
-            "maxTokens": 4096,
-            "temperature": 0.5,
-            "topP": 0.8,
-            "topK": 0,
-            "repetitionPenalty": 1.1,
-            "stop": [],
+            **self.GENERATION_PARAMS,
+            "maxTokens": self._max_tokens(output_budget),
             "includeAiFilters": False,  # AI 필터 비활성화로 응답 속도 개선
         }
+        return headers, body
 
-        import random
-        
-        max_retries = 3   # 재시도 횟수 더 줄임
-        base_delay = 2    # 기본 지연 시간 더 줄임
+    def _parse_api_result(
+        self, result: Dict[str, Any], attempt: int, output_budget: Optional[OutputBudget] = None
+    ) -> str:
+        """API v3 응답에서 답변 추출 및 후처리 (구조를 해석할 수 없으면 ProviderResponseError)"""
+        # API v3 응답 구조에 맞게 수정
+        if "result" in result and "message" in result["result"]:
+            payload = result["result"]
+        elif "message" in result:
+            payload = result
+        else:
+            print(f"❌ 예상하지 못한 HCX API 응답 구조: {result}")
+            raise ProviderResponseError(f"HCX 응답 구조를 파싱할 수 없습니다: {result}", "hcx")
+        content = payload["message"]["content"]
+
+        # 출력 토큰 예산 때문에 잘린 응답 집계 (finishReason == "length")
+        if output_budget:
+            get_output_budget_stats().record(output_budget, truncated=payload.get("finishReason") == "length")
+
+        # RAGAS 파싱을 위한 응답 후처리
+        content = self._post_process_response(content)
+        if attempt == 0:  # 첫 번째 성공 시에만 로그
+            print("✅ HCX API 응답 받음")
+        return content
+
+    def _make_api_request(
+        self,
+        messages: List[Dict[str, str]],
+        output_budget: Optional[OutputBudget] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """실제 API 요청 수행 (마감 시간 초과 DeadlineExceeded는 그대로 전파)
+
+        Args:
+            messages: 요청 메시지
+            output_budget: 출력 토큰 예산 (None이면 기본 maxTokens)
+            timeout: 요청 1건의 타임아웃 (초, None이면 LLM_GENERATION_TIMEOUT)
+
+        Returns:
+            응답 내용
+
+        Raises:
+            ProviderError: 재시도 후에도 실패한 경우 (권한, 한도 초과, 네트워크, 응답 형식)
+        """
+        headers, body = self._build_request(messages, output_budget)
+        policy = self.RETRY_POLICY
+        max_retries = policy.max_retries
+        transport = get_transport()
         
         for attempt in range(max_retries):
             try:
                 # 첫 번째 시도와 재시도만 로그 출력
                 if attempt == 0 or attempt == max_retries - 1:
                     print(f"🔄 HCX API 호출 {'(최종)' if attempt == max_retries - 1 else ''}")
-                response = requests.post(self.api_url, headers=headers, json=body, timeout=60)
+                self.rate_limiter.acquire()
+                response = transport.post(
+                    self.api_url,
+                    headers=headers,
+                    json=body,
+                    timeout=timeout or settings.LLM_GENERATION_TIMEOUT,
+                )
                 
                 # 상태 코드 로그 (디버깅용)
                 if attempt == max_retries - 1 or response.status_code != 200:
@@ -121,59 +238,112 @@ class HcxAdapter(LlmPort):
                 
                 if response.status_code == 403:  # Forbidden
                     if attempt == max_retries - 1:
-                        print(f"❌ HCX API 403 오류 - API 키 확인 필요")
-                        return "API 권한 오류로 인해 평가를 완료할 수 없습니다."
-                    else:
-                        delay = base_delay * (1.5 ** attempt) + random.uniform(0.5, 1.0)
-                        time.sleep(delay)
-                        continue
+                        print("❌ HCX API 403 오류 - API 키 확인 필요")
+                        raise ProviderAuthError("HCX API 권한 오류 (API 키 확인 필요)", "hcx", 403)
+                    time.sleep(policy.delay(attempt))
+                    continue
                 
                 if response.status_code == 429:  # Too Many Requests
+                    # 속도 제한기가 속도를 낮추므로 재시도 간격은 제한기가 결정
+                    self.rate_limiter.on_throttle()
                     if attempt == max_retries - 1:
-                        print(f"⚠️ HCX API 사용량 초과")
-                        return "API 한도 초과"
-                    else:
-                        delay = min(base_delay * (2 ** attempt) + random.uniform(2.0, 5.0), 30)  # 최대 30초
-                        time.sleep(delay)
-                        continue
+                        print("⚠️ HCX API 사용량 초과")
+                        raise ProviderRateLimitError("HCX API 사용량 한도 초과", "hcx", 429)
+                    continue
                 
                 response.raise_for_status()  # 다른 HTTP 오류 발생 시 예외 발생
-                
-                result = response.json()
-                # API v3 응답 구조에 맞게 수정
-                content = ""
-                if "result" in result and "message" in result["result"]:
-                    content = result["result"]["message"]["content"]
-                elif "message" in result:
-                    content = result["message"]["content"]
-                else:
-                    print(f"❌ 예상하지 못한 HCX API 응답 구조: {result}")
-                    return "응답 구조를 파싱할 수 없습니다."
-                
-                # RAGAS 파싱을 위한 응답 후처리
-                content = self._post_process_response(content)
-                if attempt == 0:  # 첫 번째 성공 시에만 로그
-                    print(f"✅ HCX API 응답 받음")
-                return content
+                self.rate_limiter.on_success()
+                return self._parse_api_result(response.json(), attempt, output_budget)
                 
             except requests.exceptions.RequestException as e:
                 if attempt == max_retries - 1:
                     print(f"❌ HCX API 네트워크 오류: {str(e)}")
                     print(f"   URL: {self.api_url}")
                     print(f"   API 키 형식: {self.api_key[:15]}...")
-                    return "네트워크 오류로 인해 평가를 완료할 수 없습니다."
-                else:
-                    delay = base_delay * (1.5 ** attempt) + random.uniform(0.5, 1.0)
-                    time.sleep(delay)
-                    continue
-            except (KeyError, json.JSONDecodeError):
+                    raise self._request_error(e) from e
+                time.sleep(policy.delay(attempt))
+            except (KeyError, json.JSONDecodeError) as e:
                 if attempt == max_retries - 1:
-                    print(f"❌ HCX API 응답 파싱 실패")
-                    return "응답 형식 오류"
-                else:
-                    time.sleep(base_delay)
+                    print("❌ HCX API 응답 파싱 실패")
+                    raise ProviderResponseError("HCX API 응답 형식 오류", "hcx") from e
+                time.sleep(policy.base_delay)
+
+        raise ProviderError("HCX API 모든 재시도 실패", "hcx")
+
+    async def _amake_api_request(
+        self,
+        messages: List[Dict[str, str]],
+        output_budget: Optional[OutputBudget] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """_make_api_request의 비동기 버전 (공유 전송 계층의 AsyncClient 사용)
+
+        느린 요청에는 중복 요청을 보냅니다. 취소(asyncio.CancelledError)와
+        마감 시간 초과(DeadlineExceeded)는 잡지 않고 그대로 전파합니다.
+        """
+        headers, body = self._build_request(messages, output_budget)
+        policy = self.RETRY_POLICY
+        max_retries = policy.max_retries
+        transport = get_transport()
+
+        for attempt in range(max_retries):
+            try:
+                if attempt == 0 or attempt == max_retries - 1:
+                    print(f"🔄 HCX API 비동기 호출 {'(최종)' if attempt == max_retries - 1 else ''}")
+                await self.rate_limiter.aacquire()
+                response = await transport.apost(
+                    self.api_url,
+                    headers=headers,
+                    json=body,
+                    timeout=timeout or settings.LLM_GENERATION_TIMEOUT,
+                    hedge=HEDGE_LLM,
+                    limiter=self.rate_limiter,
+                )
+
+                if attempt == max_retries - 1 or response.status_code != 200:
+                    print(f"   응답 코드: {response.status_code}")
+
+                if response.status_code == 403:
+                    if attempt == max_retries - 1:
+                        print("❌ HCX API 403 오류 - API 키 확인 필요")
+                        raise ProviderAuthError("HCX API 권한 오류 (API 키 확인 필요)", "hcx", 403)
+                    await asyncio.sleep(policy.delay(attempt))
                     continue
 
+                if response.status_code == 429:
+                    await self.rate_limiter.aon_throttle()
+                    if attempt == max_retries - 1:
+                        print("⚠️ HCX API 사용량 초과")
+                        raise ProviderRateLimitError("HCX API 사용량 한도 초과", "hcx", 429)
+                    continue
+
+                response.raise_for_status()
+                await self.rate_limiter.aon_success()
+                return self._parse_api_result(response.json(), attempt, output_budget)
+
+            except httpx.HTTPError as e:
+                if attempt == max_retries - 1:
+                    print(f"❌ HCX API 네트워크 오류: {str(e)}")
+                    print(f"   URL: {self.api_url}")
+                    raise self._request_error(e) from e
+                await asyncio.sleep(policy.delay(attempt))
+            except (KeyError, json.JSONDecodeError) as e:
+                if attempt == max_retries - 1:
+                    print("❌ HCX API 응답 파싱 실패")
+                    raise ProviderResponseError("HCX API 응답 형식 오류", "hcx") from e
+                await asyncio.sleep(policy.base_delay)
+
+        raise ProviderError("HCX API 모든 재시도 실패", "hcx")
+
+    @staticmethod
+    def _request_error(error: Exception) -> ProviderError:
+        """HTTP 라이브러리 예외를 프로바이더 예외로 변환 (HTTP 상태 오류는 상태 코드 기준)"""
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if status_code is not None:
+            return provider_error_for_status(status_code, f"HCX API HTTP {status_code} 오류: {error}", "hcx")
+        return ProviderNetworkError(f"HCX API 네트워크 오류: {error}", "hcx")
+
     def _post_process_response(self, content: str) -> str:
         """RAGAS 파싱을 위한 응답 후처리 (강화된 버전)"""
         import re
@@ -260,8 +430,26 @@ class HcxLangChainCompat(LLM):
         else:
             prompt_str = str(prompt)
         
-        result = self.adapter.generate_answer(question=prompt_str, contexts=[])
-        return self.adapter._post_process_response(result)
+        # RAGAS 프롬프트의 출력 스키마에 맞는 출력 토큰 예산 적용
+        output_budget = resolve_output_budget(prompt_str, self.adapter.GENERATION_PARAMS["maxTokens"])
+        result = self.adapter.generate_answer(
+            question=prompt_str, contexts=[], output_budget=output_budget, timeout=settings.JUDGE_CALL_TIMEOUT
+        )
+        # RAGAS 출력 스키마에 맞게 로컬 복구 (실패 시에만 RAGAS가 LLM에 형식 수정을 재요청)
+        return repair_judge_output(self.adapter._post_process_response(result), prompt_str)
+
+    async def _acall(self, prompt, stop: List[str] | None = None, run_manager=None, **kwargs: Any) -> str:
+        """비동기 호출 - 스레드 풀 대신 네이티브 비동기 요청 사용"""
+        if hasattr(prompt, 'to_string'):
+            prompt_str = prompt.to_string()
+        else:
+            prompt_str = str(prompt)
+
+        output_budget = resolve_output_budget(prompt_str, self.adapter.GENERATION_PARAMS["maxTokens"])
+        result = await self.adapter.agenerate_answer(
+            question=prompt_str, contexts=[], output_budget=output_budget, timeout=settings.JUDGE_CALL_TIMEOUT
+        )
+        return repair_judge_output(self.adapter._post_process_response(result), prompt_str)
         
     @property
     def _identifying_params(self) -> Dict[str, Any]:
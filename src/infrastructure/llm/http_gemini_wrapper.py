@@ -3,17 +3,33 @@ HTTP를 통한 직접 Google Gemini API 호출 래퍼
 google-generativeai 라이브러리의 타임아웃 문제를 해결하기 위한 대안
 """
 
+import asyncio
 import json
 import time
-from typing import List, Any, Dict, Optional
+from typing import ClassVar, List, Any, Dict, Optional
 
+import httpx
 import requests
 from langchain_core.language_models.llms import LLM
 from langchain_core.outputs import Generation
 
+from src.domain.exceptions import (
+    ProviderError,
+    ProviderNetworkError,
+    ProviderResponseError,
+    provider_error_for_status,
+)
+from src.infrastructure.cache import get_llm_cache
+from src.infrastructure.llm.json_repair import repair_judge_output
+from src.infrastructure.llm.output_budget import OutputBudget, get_output_budget_stats, resolve_output_budget
+from src.infrastructure.network import HEDGE_LLM, RetryPolicy, get_rate_limiter, get_transport
+
 
 class HttpGeminiWrapper(LLM):
     """HTTP를 통해 Google Gemini API를 직접 호출하는 LangChain 호환 래퍼"""
+
+    # 재시도 정책 (max_retries 속성과 함께 사용)
+    RETRY_POLICY: ClassVar[RetryPolicy] = RetryPolicy(max_retries=2, base_delay=1.0, multiplier=2.0)
     
     def __init__(self, api_key: str, model_name: str, **kwargs):
         super().__init__(**kwargs)
@@ -21,7 +37,10 @@ class HttpGeminiWrapper(LLM):
         object.__setattr__(self, 'api_key', api_key)
         object.__setattr__(self, 'model_name', model_name)
         object.__setattr__(self, 'timeout', 20)  # 20초 타임아웃
-        object.__setattr__(self, 'max_retries', 2)
+        object.__setattr__(self, 'max_retries', self.RETRY_POLICY.max_retries)
+        object.__setattr__(self, 'max_output_tokens', 1024)
+        # 답변 생성 워커와 평가가 같은 API 키의 요청 속도를 함께 조절하도록 공유 제한기 사용
+        object.__setattr__(self, 'rate_limiter', get_rate_limiter("gemini", "chat", api_key=api_key))
         
         # 모델명 정리 (models/ 프리픽스 제거)
         clean_model_name = model_name.replace("models/", "")
@@ -59,78 +78,195 @@ class HttpGeminiWrapper(LLM):
         }
 
     def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> str:
-        """단일 프롬프트 처리"""
-        return self._generate_with_http(prompt)
+        """단일 프롬프트 처리 (RAGAS 출력 스키마에 맞게 로컬 복구)"""
+        return repair_judge_output(self._generate_with_http(prompt, stop=stop), prompt)
         
     def _generate(self, prompts: List[str], stop: Optional[List[str]] = None, **kwargs: Any) -> List[Generation]:
         """배치 프롬프트 처리"""
         generations = []
         for prompt in prompts:
             try:
-                text = self._generate_with_http(prompt)
+                text = repair_judge_output(self._generate_with_http(prompt, stop=stop), prompt)
                 generations.append(Generation(text=text))
+            except ProviderError:
+                # 프로바이더 실패는 빈 응답으로 바꾸지 않고 전달 (빈 응답은 RAGAS 형식 수정 재요청을 유발)
+                raise
             except Exception as e:
                 print(f"⚠️ 프롬프트 생성 실패: {e}")
                 # 실패한 경우 빈 텍스트로 처리
                 generations.append(Generation(text=""))
         return generations
 
-    def _generate_with_http(self, prompt: str) -> str:
-        """HTTP를 통한 직접 API 호출"""
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        data = {
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> str:
+        """단일 프롬프트 비동기 처리 (스레드 풀 폴백 대신 네이티브 비동기 요청)"""
+        return repair_judge_output(await self._agenerate_with_http(prompt, stop=stop), prompt)
+
+    def _cache_key(
+        self, prompt: str, stop: Optional[List[str]] = None, output_budget: Optional[OutputBudget] = None
+    ) -> str:
+        """요청 내용으로 캐시 키 생성"""
+        return get_llm_cache().make_key(
+            self.model_name, prompt, self.temperature, self._max_tokens(output_budget), stop
+        )
+
+    def _max_tokens(self, output_budget: Optional[OutputBudget]) -> int:
+        """요청의 최대 출력 토큰 (평가 프롬프트는 출력 스키마별 예산, 그 외는 기본값)"""
+        return output_budget.max_tokens if output_budget else self.max_output_tokens
+
+    def _build_request_data(self, prompt: str, output_budget: Optional[OutputBudget] = None) -> Dict[str, Any]:
+        """generateContent 요청 본문 구성"""
+        return {
             "contents": [{
                 "parts": [{"text": prompt}]
             }],
             "generationConfig": {
                 "temperature": self.temperature,
-                "maxOutputTokens": 1024,
+                "maxOutputTokens": self._max_tokens(output_budget),
             }
         }
+
+    def _record_truncation(self, result: Dict[str, Any], output_budget: Optional[OutputBudget]) -> None:
+        """출력 토큰 예산 때문에 잘린 응답 집계 (finishReason == "MAX_TOKENS")"""
+        if not output_budget:
+            return
+        candidates = result.get("candidates") or [{}]
+        get_output_budget_stats().record(output_budget, truncated=candidates[0].get("finishReason") == "MAX_TOKENS")
+
+    def _extract_text(self, result: Dict[str, Any]) -> str:
+        """응답 JSON에서 생성된 텍스트 추출"""
+        # 응답 구조 안전하게 확인
+        if "candidates" not in result or not result["candidates"]:
+            raise RuntimeError(f"Gemini API 응답에 candidates가 없습니다: {result}")
+        
+        candidate = result["candidates"][0]
+        if "content" not in candidate:
+            raise RuntimeError(f"Candidate에 content가 없습니다: {candidate}")
+        
+        content = candidate["content"]
+        if "parts" not in content or not content["parts"]:
+            raise RuntimeError(f"Content에 parts가 없습니다: {content}")
+        
+        if "text" not in content["parts"][0]:
+            raise RuntimeError(f"Parts에 text가 없습니다: {content['parts'][0]}")
+        
+        return content["parts"][0]["text"]
+
+    @staticmethod
+    def _provider_error(error: Exception) -> ProviderError:
+        """재시도 후에도 남은 오류를 프로바이더 예외로 변환"""
+        message = f"Gemini API 호출 실패: {error}"
+        if isinstance(error, (KeyError, RuntimeError)):
+            return ProviderResponseError(message, "gemini")
+        return ProviderNetworkError(message, "gemini")
+
+    def _generate_with_http(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        """HTTP를 통한 직접 API 호출 (동일 요청은 캐시된 응답 사용)"""
+        output_budget = resolve_output_budget(prompt, self.max_output_tokens)
+        cache = get_llm_cache()
+        cache_key = self._cache_key(prompt, stop, output_budget)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        headers = {
+            "Content-Type": "application/json"
+        }
+        data = self._build_request_data(prompt, output_budget)
+        transport = get_transport()
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                self.rate_limiter.acquire()
+                response = transport.post(
                     self.api_url,
                     json=data,
                     headers=headers,
                     timeout=self.timeout
                 )
                 
+                if response.status_code == 429:
+                    self.rate_limiter.on_throttle()
                 if response.status_code == 200:
+                    self.rate_limiter.on_success()
                     result = response.json()
-                    
-                    # 응답 구조 안전하게 확인
-                    if "candidates" not in result or not result["candidates"]:
-                        raise RuntimeError(f"Gemini API 응답에 candidates가 없습니다: {result}")
-                    
-                    candidate = result["candidates"][0]
-                    if "content" not in candidate:
-                        raise RuntimeError(f"Candidate에 content가 없습니다: {candidate}")
-                    
-                    content = candidate["content"]
-                    if "parts" not in content or not content["parts"]:
-                        raise RuntimeError(f"Content에 parts가 없습니다: {content}")
-                    
-                    if "text" not in content["parts"][0]:
-                        raise RuntimeError(f"Parts에 text가 없습니다: {content['parts'][0]}")
-                    
-                    return content["parts"][0]["text"]
+                    text = self._extract_text(result)
+                    self._record_truncation(result, output_budget)
+                    cache.put(cache_key, self.model_name, text)
+                    return text
                 else:
                     if attempt == self.max_retries - 1:
-                        raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
-                    time.sleep(1)
+                        raise provider_error_for_status(
+                            response.status_code,
+                            f"Gemini API 호출 실패: HTTP {response.status_code}: {response.text}",
+                            "gemini",
+                        )
+                    time.sleep(self.RETRY_POLICY.base_delay)
                     
             except (requests.exceptions.RequestException, KeyError, RuntimeError) as e:
                 print(f"⚠️ Gemini API 호출 실패 (시도 {attempt + 1}/{self.max_retries}): {str(e)}")
                 if attempt == self.max_retries - 1:
-                    raise RuntimeError(f"Gemini API 호출 실패: {str(e)}")
-                time.sleep(2 ** attempt)  # 지수 백오프
+                    raise self._provider_error(e) from e
+                time.sleep(self.RETRY_POLICY.delay(attempt))  # 지수 백오프
                 
-        raise RuntimeError("모든 재시도 실패")
+        raise ProviderError("Gemini API 모든 재시도 실패", "gemini")
+
+    async def _agenerate_with_http(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        """_generate_with_http의 비동기 버전 (공유 전송 계층의 AsyncClient 사용)
+
+        느린 요청에는 중복 요청을 보냅니다. 취소(asyncio.CancelledError)와
+        마감 시간 초과(DeadlineExceeded)는 잡지 않고 그대로 전파합니다.
+        """
+        output_budget = resolve_output_budget(prompt, self.max_output_tokens)
+        cache = get_llm_cache()
+        cache_key = self._cache_key(prompt, stop, output_budget)
+        # 캐시 조회/저장은 SQLite 쓰기 잠금을 기다릴 수 있으므로 이벤트 루프 밖에서 실행
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            return cached
+
+        headers = {
+            "Content-Type": "application/json"
+        }
+        data = self._build_request_data(prompt, output_budget)
+        transport = get_transport()
+
+        for attempt in range(self.max_retries):
+            try:
+                await self.rate_limiter.aacquire()
+                response = await transport.apost(
+                    self.api_url,
+                    json=data,
+                    headers=headers,
+                    timeout=self.timeout,
+                    hedge=HEDGE_LLM,
+                    limiter=self.rate_limiter
+                )
+
+                if response.status_code == 429:
+                    await self.rate_limiter.aon_throttle()
+                if response.status_code == 200:
+                    await self.rate_limiter.aon_success()
+                    result = response.json()
+                    text = self._extract_text(result)
+                    self._record_truncation(result, output_budget)
+                    await asyncio.to_thread(cache.put, cache_key, self.model_name, text)
+                    return text
+                else:
+                    if attempt == self.max_retries - 1:
+                        raise provider_error_for_status(
+                            response.status_code,
+                            f"Gemini API 호출 실패: HTTP {response.status_code}: {response.text}",
+                            "gemini",
+                        )
+                    await asyncio.sleep(self.RETRY_POLICY.base_delay)
+
+            except (httpx.HTTPError, KeyError, RuntimeError) as e:
+                print(f"⚠️ Gemini API 비동기 호출 실패 (시도 {attempt + 1}/{self.max_retries}): {str(e)}")
+                if attempt == self.max_retries - 1:
+                    raise self._provider_error(e) from e
+                await asyncio.sleep(self.RETRY_POLICY.delay(attempt))  # 지수 백오프
+
+        raise ProviderError("Gemini API 모든 재시도 실패", "gemini")
 
     def invoke(self, prompt: str) -> Any:
         """ChatGoogleGenerativeAI 호환성을 위한 invoke 메서드"""
@@ -0,0 +1,381 @@
+"""
+평가 LLM 응답의 로컬 JSON 복구
+
+RAGAS는 판정 응답이 출력 스키마에 맞지 않으면 "출력 형식 수정" 프롬프트로 LLM을 다시 호출합니다.
+HCX 응답은 끝의 쉼표, 이스케이프되지 않은 따옴표, 한국어 키, 잘린 배열 등으로 파싱에 자주 실패하므로,
+RAGAS에 응답을 넘기기 전에 프롬프트에 포함된 JSON 스키마를 기준으로 로컬에서 복구하여
+재요청 호출을 줄입니다.
+"""
+
+import json
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+# RAGAS PydanticPrompt가 출력 스키마 앞에 붙이는 문구
+SCHEMA_MARKER = "as specified in JSON Schema:\n"
+# RAGAS가 파싱 실패 시 LLM에 다시 보내는 출력 형식 수정 프롬프트
+FIX_OUTPUT_INSTRUCTION = "The output string did not satisfy the constraints given in the prompt."
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_BARE_KEY = re.compile(r"[^\s\"'{}\[\],:]+")
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+class JsonRepairStats:
+    """응답 복구 통계 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.valid = 0
+        self.repaired = 0
+        self.unrepaired = 0
+        self.reprompted = 0
+
+    def record(self, outcome: str) -> None:
+        """결과 기록 (valid, repaired, unrepaired, reprompted)"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def get_stats(self) -> Dict[str, int]:
+        """통계 반환"""
+        with self._lock:
+            return {
+                "valid": self.valid,
+                "repaired": self.repaired,
+                "unrepaired": self.unrepaired,
+                "reprompted": self.reprompted,
+            }
+
+    def print_stats(self) -> None:
+        """통계 출력"""
+        stats = self.get_stats()
+        if not any(stats.values()):
+            return
+        print(
+            f"🩹 판정 응답 JSON: 정상 {stats['valid']}건, 로컬 복구 {stats['repaired']}건, "
+            f"복구 실패 {stats['unrepaired']}건, RAGAS 재요청 {stats['reprompted']}건"
+        )
+
+
+_stats = JsonRepairStats()
+
+
+def get_json_repair_stats() -> JsonRepairStats:
+    """전역 응답 복구 통계 반환"""
+    return _stats
+
+
+def extract_output_schema(prompt: str) -> Optional[Dict[str, Any]]:
+    """RAGAS 프롬프트에 포함된 출력 JSON 스키마 추출 (없으면 None)"""
+    index = prompt.find(SCHEMA_MARKER)
+    if index == -1:
+        return None
+    try:
+        schema, _ = json.JSONDecoder().raw_decode(prompt, index + len(SCHEMA_MARKER))
+    except json.JSONDecodeError:
+        return None
+    return schema if isinstance(schema, dict) else None
+
+
+def is_fix_output_prompt(prompt: str) -> bool:
+    """RAGAS의 출력 형식 수정(재요청) 프롬프트인지 확인"""
+    return FIX_OUTPUT_INSTRUCTION in prompt
+
+
+def repair_json_text(text: str) -> Optional[Any]:
+    """문법 오류가 있는 JSON 텍스트를 복구하여 파싱 (복구할 수 없으면 None)
+
+    코드 블록, 앞뒤 설명문, 끝의 쉼표, 이스케이프되지 않은 따옴표와 줄바꿈,
+    따옴표 없는 키, 작은따옴표 문자열, Python 리터럴, 잘린 배열/객체를 처리합니다.
+    """
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+    if not starts:
+        return None
+    text = text[min(starts):]
+
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text)
+        return value
+    except json.JSONDecodeError:
+        pass
+
+    try:
+        return json.loads(_rewrite(text))
+    except json.JSONDecodeError:
+        return None
+
+
+def _rewrite(text: str) -> str:
+    """토큰 단위로 JSON 문법을 정리하고 잘린 끝부분을 닫음"""
+    out: List[str] = []
+    stack: List[str] = []
+    i, length = 0, len(text)
+
+    while i < length and (stack or not out):
+        char = text[i]
+        if char in "\"'":
+            string, i, closed = _read_string(text, i)
+            if not closed:
+                # 잘린 문자열: 배열 요소면 버리고, 객체 값이면 닫아서 유지
+                if stack and stack[-1] == "]":
+                    break
+                out.append(json.dumps(string, ensure_ascii=False))
+                break
+            out.append(json.dumps(string, ensure_ascii=False))
+            continue
+        if char in "{[":
+            stack.append("}" if char == "{" else "]")
+            out.append(char)
+        elif char in "}]":
+            _strip_trailing_comma(out)
+            if stack:
+                out.append(stack.pop())
+        elif char in ",:":
+            out.append(char)
+        elif char.isspace():
+            pass
+        else:
+            match = _BARE_KEY.match(text, i)
+            token = match.group(0)
+            i = match.end()
+            if token in _LITERALS:
+                out.append(_LITERALS[token])
+            elif _is_json_scalar(token):
+                out.append(token)
+            else:
+                out.append(json.dumps(token, ensure_ascii=False))
+            continue
+        i += 1
+
+    _close_truncated(out, stack)
+    return "".join(out)
+
+
+def _read_string(text: str, start: int):
+    """start의 따옴표로 시작하는 문자열을 읽어 (내용, 다음 위치, 닫힘 여부) 반환
+
+    닫는 따옴표 뒤에 , : } ] 또는 끝이 오지 않으면 문자열 안의 따옴표로 간주합니다.
+    """
+    quote = text[start]
+    chars: List[str] = []
+    i = start + 1
+    while i < len(text):
+        char = text[i]
+        if char == "\\" and i + 1 < len(text):
+            escaped = text[i + 1]
+            try:
+                chars.append(json.loads(f'"\\{escaped}"') if escaped != "u" else json.loads(f'"{text[i:i + 6]}"'))
+                i += 6 if escaped == "u" else 2
+            except json.JSONDecodeError:
+                chars.append(escaped)
+                i += 2
+            continue
+        if char == quote:
+            rest = text[i + 1:].lstrip()
+            if not rest or rest[0] in ",:}]":
+                return "".join(chars), i + 1, True
+        chars.append(char)
+        i += 1
+    return "".join(chars), i, False
+
+
+def _is_json_scalar(token: str) -> bool:
+    if token in ("true", "false", "null"):
+        return True
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def _strip_trailing_comma(out: List[str]) -> None:
+    while out and out[-1] == ",":
+        out.pop()
+
+
+def _close_truncated(out: List[str], stack: List[str]) -> None:
+    """잘린 응답의 미완성 항목을 제거하고 열린 괄호를 닫음"""
+    while out and out[-1] in (",", ":"):
+        if out[-1] == ":":
+            out.pop()  # 값이 없는 키 제거
+            if out:
+                out.pop()
+        else:
+            out.pop()
+    if stack and stack[-1] == "}" and out and out[-1] not in ("{",) and _dangling_key(out):
+        out.pop()
+        _strip_trailing_comma(out)
+    while stack:
+        out.append(stack.pop())
+
+
+def _dangling_key(out: List[str]) -> bool:
+    """객체 안에서 값 없이 끝난 키인지 (직전 토큰이 { 또는 ,)"""
+    return len(out) >= 2 and out[-2] in ("{", ",")
+
+
+def coerce_to_schema(value: Any, schema: Dict[str, Any], root: Optional[Dict[str, Any]] = None) -> Any:
+    """파싱된 값을 JSON 스키마에 맞게 보정
+
+    알 수 없는 키(예: 한국어로 번역된 키)는 같은 타입의 누락된 스키마 키에 순서대로 대응시키고,
+    스키마 속성이 하나뿐인 객체에 배열이 오면 감싸며, 숫자/불리언 문자열을 변환합니다.
+    """
+    root = root or schema
+    schema = resolve_schema_ref(schema, root)
+    expected = schema.get("type")
+
+    if expected == "object" or "properties" in schema:
+        properties = schema.get("properties", {})
+        if isinstance(value, list) and len(properties) == 1:
+            value = {next(iter(properties)): value}
+        if not isinstance(value, dict):
+            return value
+        value = _rename_unknown_keys(value, properties, root)
+        return {
+            key: coerce_to_schema(item, properties[key], root) if key in properties else item
+            for key, item in value.items()
+        }
+
+    if expected == "array":
+        if isinstance(value, dict) and len(value) == 1 and isinstance(next(iter(value.values())), list):
+            value = next(iter(value.values()))
+        if not isinstance(value, list):
+            return value
+        items = schema.get("items", {})
+        value = [coerce_to_schema(item, items, root) for item in value]
+        # 잘린 응답의 마지막 요소가 필수 필드를 모두 갖추지 못했으면 제거
+        if value and not _satisfies_required(value[-1], resolve_schema_ref(items, root)):
+            value = value[:-1]
+        return value
+
+    return _coerce_scalar(value, expected)
+
+
+def resolve_schema_ref(schema: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    """$ref 및 단일 allOf 해석"""
+    ref = schema.get("$ref")
+    if ref and ref.startswith("#/"):
+        node: Any = root
+        for part in ref[2:].split("/"):
+            node = node.get(part, {})
+        return node
+    if len(schema.get("allOf", [])) == 1:
+        return resolve_schema_ref(schema["allOf"][0], root)
+    return schema
+
+
+def _matches(value: Any, schema: Dict[str, Any], root: Dict[str, Any]) -> bool:
+    expected = resolve_schema_ref(schema, root).get("type")
+    if expected is None:
+        return True
+    if expected in ("integer", "number", "boolean") and isinstance(value, str):
+        return _coerce_scalar(value, expected) is not value
+    return isinstance(value, _JSON_TYPES.get(expected, (object,)))
+
+
+def _rename_unknown_keys(value: Dict[str, Any], properties: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    missing = [key for key in properties if key not in value]
+    unknown = [key for key in value if key not in properties]
+    if not missing or not unknown:
+        return value
+
+    renamed = dict(value)
+    for key in unknown:
+        target = next((name for name in missing if _matches(value[key], properties[name], root)), None)
+        if target is None:
+            continue
+        missing.remove(target)
+        renamed[target] = renamed.pop(key)
+    return renamed
+
+
+def _coerce_scalar(value: Any, expected: Optional[str]) -> Any:
+    if expected == "integer":
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ("yes", "true", "예"):
+                return 1
+            if lowered in ("no", "false", "아니오", "아니요"):
+                return 0
+            if re.fullmatch(r"-?\d+", lowered):
+                return int(lowered)
+    elif expected == "number" and isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return value
+    elif expected == "boolean" and isinstance(value, (str, int)) and not isinstance(value, bool):
+        lowered = str(value).strip().lower()
+        if lowered in ("true", "yes", "1", "예"):
+            return True
+        if lowered in ("false", "no", "0", "아니오", "아니요"):
+            return False
+    return value
+
+
+def _satisfies_required(value: Any, schema: Dict[str, Any]) -> bool:
+    if not isinstance(value, dict):
+        return schema.get("type") != "object"
+    return all(key in value for key in schema.get("required", []))
+
+
+def repair_judge_output(text: str, prompt: str) -> str:
+    """평가 프롬프트 응답을 프롬프트의 출력 스키마에 맞게 복구
+
+    스키마가 없는 프롬프트(답변 생성 등)나 복구할 수 없는 응답은 그대로 반환하여
+    RAGAS의 기존 처리(출력 형식 수정 재요청)를 따릅니다.
+
+    Args:
+        text: LLM 응답 텍스트
+        prompt: 응답을 생성한 프롬프트
+
+    Returns:
+        스키마에 맞게 직렬화된 JSON 또는 원본 텍스트
+    """
+    if is_fix_output_prompt(prompt):
+        _stats.record("reprompted")
+        return text
+
+    schema = extract_output_schema(prompt)
+    if schema is None:
+        return text
+
+    try:
+        original = json.loads(text)
+    except json.JSONDecodeError:
+        original = None
+    if original is not None and _satisfies_required(original, schema) and coerce_to_schema(original, schema) == original:
+        _stats.record("valid")
+        return text
+
+    # 후처리 단계에서 {"answer": 원문}으로 감싼 응답은 원문으로 복구
+    properties = schema.get("properties", {})
+    if isinstance(original, dict) and set(original) == {"answer"} and "answer" not in properties:
+        text = original["answer"]
+        original = None
+
+    value = original if original is not None else repair_json_text(text)
+    if value is not None:
+        value = coerce_to_schema(value, schema)
+    if value is None or not _satisfies_required(value, schema):
+        _stats.record("unrepaired")
+        return text
+
+    _stats.record("repaired")
+    return json.dumps(value, ensure_ascii=False)
@@ -0,0 +1,111 @@
+"""
+평가 프롬프트별 출력 토큰 예산
+
+RAGAS 프롬프트에 포함된 출력 JSON 스키마로 응답 길이를 추정하여 요청의 최대 출력 토큰을 정합니다.
+배열이 없는 스키마(예/아니오 분류, 단일 질문)는 짧게, 문장/판정 목록을 반환하는 스키마는 길게
+잡으며, 출력 모델 이름별 값은 JUDGE_OUTPUT_TOKEN_BUDGETS 설정으로 바꿀 수 있습니다.
+예산 때문에 응답이 잘린 비율은 OutputBudgetStats로 집계합니다.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.infrastructure.llm.json_repair import extract_output_schema
+
+# 입력 내용을 다시 출력하는 스키마의 기본 예산 (출력 모델 이름 기준)
+DEFAULT_OUTPUT_BUDGETS = {
+    "NLIStatementOutput": 2048,  # faithfulness: 문장별 근거와 판정
+    "ClassificationWithReason": 2048,  # answer_correctness: TP/FP/FN 문장과 근거
+    "StringIO": 2048,  # RAGAS 출력 형식 수정 재요청: 원래 출력 전체를 다시 작성
+}
+# 예산 초과로 잘린 응답 비율이 이 값을 넘으면 통계 출력 시 경고
+TRUNCATION_WARNING_RATE = 0.05
+
+
+@dataclass(frozen=True)
+class OutputBudget:
+    """프롬프트의 출력 토큰 예산"""
+
+    name: str  # RAGAS 출력 모델 이름 (예: NLIStatementOutput)
+    max_tokens: int
+
+
+def _has_array(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        return schema.get("type") == "array" or any(_has_array(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(_has_array(value) for value in schema)
+    return False
+
+
+def resolve_output_budget(prompt: str, ceiling: int) -> Optional[OutputBudget]:
+    """프롬프트의 출력 스키마로 출력 토큰 예산 결정
+
+    Args:
+        prompt: LLM에 보낼 프롬프트
+        ceiling: 어댑터의 최대 출력 토큰 (예산은 이 값을 넘지 않음)
+
+    Returns:
+        출력 토큰 예산 (스키마가 없는 답변 생성 프롬프트 등은 None - 어댑터 기본값 사용)
+    """
+    from src.config import settings
+
+    schema = extract_output_schema(prompt)
+    if schema is None:
+        return None
+
+    name = schema.get("title", "unknown")
+    budgets = {**DEFAULT_OUTPUT_BUDGETS, **settings.JUDGE_OUTPUT_TOKEN_BUDGETS}
+    if name in budgets:
+        max_tokens = budgets[name]
+    elif _has_array(schema):
+        max_tokens = settings.JUDGE_LIST_OUTPUT_TOKENS
+    else:
+        max_tokens = settings.JUDGE_SCALAR_OUTPUT_TOKENS
+    return OutputBudget(name=name, max_tokens=min(max_tokens, ceiling))
+
+
+class OutputBudgetStats:
+    """출력 모델별 호출 수와 예산 초과로 잘린 응답 수 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, budget: OutputBudget, truncated: bool) -> None:
+        """응답 결과 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(budget.name, {"calls": 0, "truncated": 0, "max_tokens": budget.max_tokens})
+            stats["calls"] += 1
+            stats["truncated"] += int(truncated)
+            stats["max_tokens"] = budget.max_tokens
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """출력 모델별 통계 반환 (truncation_rate 포함)"""
+        with self._lock:
+            return {
+                name: {**stats, "truncation_rate": stats["truncated"] / stats["calls"]}
+                for name, stats in self._stats.items()
+            }
+
+    def print_stats(self) -> None:
+        """통계 출력"""
+        stats = self.get_stats()
+        if not stats:
+            return
+        print("✂️ 판정 출력 토큰 예산:")
+        for name, item in sorted(stats.items()):
+            warning = " ⚠️ 예산 상향 검토" if item["truncation_rate"] > TRUNCATION_WARNING_RATE else ""
+            print(
+                f"   {name}: {item['max_tokens']}토큰, {item['calls']}건 중 {item['truncated']}건 잘림 "
+                f"({item['truncation_rate'] * 100:.1f}%){warning}"
+            )
+
+
+_stats = OutputBudgetStats()
+
+
+def get_output_budget_stats() -> OutputBudgetStats:
+    """전역 출력 토큰 예산 통계 반환"""
+    return _stats
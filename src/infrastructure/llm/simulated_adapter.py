@@ -0,0 +1,280 @@
+"""
+부하/규모 테스트용 시뮬레이션 LLM
+
+외부 서비스 없이 대용량 평가를 실행하여 파이프라인 오버헤드, 체크포인트, 저장소 확장성을
+측정하기 위한 어댑터입니다. 응답 지연 시간은 로그 정규 분포에서 뽑고, 설정한 비율로
+429(사용량 초과)와 타임아웃을 주입하며, 평가 프롬프트에는 프롬프트에 포함된 RAGAS 출력
+JSON 스키마에 맞는 응답을 돌려줍니다. 응답 내용은 (시드, 프롬프트)로 정해지므로 재실행해도 같습니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.llms import LLM
+
+from src.application.ports.llm import LlmPort
+from src.domain.exceptions import ProviderNetworkError, ProviderRateLimitError
+from src.infrastructure.llm.json_repair import extract_output_schema, resolve_schema_ref
+from src.infrastructure.network import RetryPolicy
+
+# 입력 문장 분리 기준 (마침표/물음표/느낌표/줄바꿈)
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+|\n+")
+# RAGAS 프롬프트의 마지막 입력 블록
+_INPUT_MARKER = "input: "
+_OUTPUT_MARKER = "Output: "
+# 정수 속성별 1이 나올 확률 (RAGAS 판정 필드, 그 외는 GENERIC_POSITIVE_RATE)
+POSITIVE_RATES = {"verdict": 0.8, "attributed": 0.8, "noncommittal": 0.1}
+GENERIC_POSITIVE_RATE = 0.5
+
+
+@dataclass(frozen=True)
+class SimulationProfile:
+    """시뮬레이션 프로바이더의 지연 시간과 오류 주입 설정"""
+
+    latency_ms: float = 200.0  # 지연 시간 중앙값
+    latency_sigma: float = 0.5  # 로그 정규 분포 표준편차 (0이면 고정 지연)
+    rate_limit_rate: float = 0.0  # 429 주입 비율
+    timeout_rate: float = 0.0  # 타임아웃 주입 비율
+    timeout_seconds: float = 5.0  # 타임아웃 주입 시 응답 없이 기다리는 시간
+    seed: int = 0
+
+    @classmethod
+    def from_settings(cls) -> "SimulationProfile":
+        """SIMULATED_* 설정값으로 생성"""
+        from src.config import settings
+
+        return cls(
+            latency_ms=settings.SIMULATED_LATENCY_MS,
+            latency_sigma=settings.SIMULATED_LATENCY_SIGMA,
+            rate_limit_rate=settings.SIMULATED_RATE_LIMIT_RATE,
+            timeout_rate=settings.SIMULATED_TIMEOUT_RATE,
+            timeout_seconds=settings.SIMULATED_TIMEOUT_SECONDS,
+            seed=settings.SIMULATED_SEED,
+        )
+
+
+class SimulatedCalls:
+    """요청 1건의 지연 시간과 주입 오류를 뽑고 재시도 정책대로 재시도하는 호출기 (스레드 안전)"""
+
+    # 재시도 정책 (주입된 429/타임아웃만 재시도)
+    RETRY_POLICY = RetryPolicy(max_retries=3, base_delay=0.1, multiplier=2.0)
+
+    def __init__(self, profile: SimulationProfile, provider: str):
+        self.profile = profile
+        self.provider = provider
+        self._rng = random.Random(profile.seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.injected_rate_limits = 0
+        self.injected_timeouts = 0
+
+    def _draw(self) -> tuple:
+        """(지연 시간 초, 주입할 오류) 추첨"""
+        profile = self.profile
+        with self._lock:
+            self.calls += 1
+            latency = profile.latency_ms / 1000
+            if profile.latency_sigma > 0:
+                latency *= self._rng.lognormvariate(0.0, profile.latency_sigma)
+            roll = self._rng.random()
+            if roll < profile.rate_limit_rate:
+                self.injected_rate_limits += 1
+                return latency, ProviderRateLimitError(
+                    f"{self.provider} 시뮬레이션 사용량 초과", self.provider, 429
+                )
+            if roll < profile.rate_limit_rate + profile.timeout_rate:
+                self.injected_timeouts += 1
+                return profile.timeout_seconds, ProviderNetworkError(
+                    f"{self.provider} 시뮬레이션 타임아웃", self.provider
+                )
+        return latency, None
+
+    def call(self) -> None:
+        """동기 호출 1건 (재시도 후에도 실패하면 ProviderError)"""
+        policy = self.RETRY_POLICY
+        for attempt in range(policy.max_retries):
+            delay, error = self._draw()
+            time.sleep(delay)
+            if error is None:
+                return
+            if policy.is_last(attempt):
+                raise error
+            time.sleep(policy.delay(attempt))
+
+    async def acall(self) -> None:
+        """비동기 호출 1건 (재시도 후에도 실패하면 ProviderError)"""
+        policy = self.RETRY_POLICY
+        for attempt in range(policy.max_retries):
+            delay, error = self._draw()
+            await asyncio.sleep(delay)
+            if error is None:
+                return
+            if policy.is_last(attempt):
+                raise error
+            await asyncio.sleep(policy.delay(attempt))
+
+    def get_stats(self) -> Dict[str, int]:
+        """호출 및 오류 주입 통계"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "injected_rate_limits": self.injected_rate_limits,
+                "injected_timeouts": self.injected_timeouts,
+            }
+
+
+def _content_rng(seed: int, text: str) -> random.Random:
+    """(시드, 텍스트)로 정해지는 난수 생성기"""
+    digest = hashlib.sha256(f"{seed}:{text}".encode("utf-8")).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _input_sentences(prompt: str) -> List[str]:
+    """프롬프트의 마지막 입력 블록에서 문장 추출 (응답에 쓸 문장 후보)"""
+    start = prompt.rfind(_INPUT_MARKER)
+    text = prompt[start + len(_INPUT_MARKER):] if start != -1 else prompt
+    end = text.rfind(_OUTPUT_MARKER)
+    text = text[:end] if end != -1 else text
+    try:
+        values = json.loads(text)
+        text = "\n".join(_flatten_strings(values))
+    except json.JSONDecodeError:
+        pass
+    sentences = [sentence.strip(" \"'{}[],") for sentence in _SENTENCE_SPLIT.split(text)]
+    return [sentence for sentence in sentences if len(sentence) > 3] or ["시뮬레이션 문장입니다."]
+
+
+def _flatten_strings(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _flatten_strings(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _flatten_strings(item)]
+    return []
+
+
+def sample_from_schema(
+    schema: Dict[str, Any],
+    rng: random.Random,
+    sentences: List[str],
+    root: Optional[Dict[str, Any]] = None,
+    name: str = "",
+) -> Any:
+    """JSON 스키마를 만족하는 값 생성
+
+    Args:
+        schema: 출력 JSON 스키마 (RAGAS 출력 모델의 model_json_schema)
+        rng: 난수 생성기
+        sentences: 문자열 값에 사용할 문장 후보
+        root: $ref 해석용 최상위 스키마
+        name: 현재 값의 속성 이름 (판정 필드의 1 비율 결정에 사용)
+    """
+    root = root or schema
+    schema = resolve_schema_ref(schema, root)
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    for key in ("anyOf", "oneOf"):
+        options = [
+            option for option in schema.get(key, []) if resolve_schema_ref(option, root).get("type") != "null"
+        ]
+        if options:
+            return sample_from_schema(options[0], rng, sentences, root, name)
+
+    expected = schema.get("type")
+    if expected == "object" or "properties" in schema:
+        return {
+            key: sample_from_schema(value, rng, sentences, root, key)
+            for key, value in schema.get("properties", {}).items()
+        }
+    if expected == "array":
+        minimum = max(1, schema.get("minItems", 1))
+        count = rng.randint(minimum, minimum + 2)
+        return [sample_from_schema(schema.get("items", {}), rng, sentences, root, name) for _ in range(count)]
+    if expected == "integer":
+        return int(rng.random() < POSITIVE_RATES.get(name, GENERIC_POSITIVE_RATE))
+    if expected == "number":
+        return round(rng.random(), 3)
+    if expected == "boolean":
+        return rng.random() < POSITIVE_RATES.get(name, GENERIC_POSITIVE_RATE)
+    if name == "reason":
+        return "시뮬레이션 판정 근거입니다."
+    return rng.choice(sentences)
+
+
+class SimulatedLlmAdapter(LlmPort):
+    """외부 호출 없이 지연 시간과 오류를 흉내 내는 LLM 어댑터 (부하/규모 테스트용)"""
+
+    def __init__(self, model_name: str = "simulated", profile: Optional[SimulationProfile] = None):
+        self.model_name = model_name
+        self.profile = profile or SimulationProfile.from_settings()
+        self.simulator = SimulatedCalls(self.profile, "simulated")
+        print(
+            f"✅ 시뮬레이션 LLM 초기화 완료: 지연 {self.profile.latency_ms:.0f}ms (σ={self.profile.latency_sigma}), "
+            f"429 {self.profile.rate_limit_rate:.1%}, 타임아웃 {self.profile.timeout_rate:.1%}"
+        )
+
+    def respond(self, prompt: str) -> str:
+        """프롬프트에 대한 응답 내용 (출력 스키마가 있으면 스키마에 맞는 JSON)"""
+        rng = _content_rng(self.profile.seed, prompt)
+        sentences = _input_sentences(prompt)
+        schema = extract_output_schema(prompt)
+        if schema is None:
+            return " ".join(rng.sample(sentences, min(2, len(sentences))))
+        return json.dumps(sample_from_schema(schema, rng, sentences), ensure_ascii=False)
+
+    def generate_answer(self, question: str, contexts: List[str]) -> str:
+        """컨텍스트 문장으로 답변 생성
+
+        Raises:
+            ProviderError: 주입된 429/타임아웃이 재시도 후에도 계속된 경우
+        """
+        self.simulator.call()
+        if not contexts:
+            return self.respond(question)
+        rng = _content_rng(self.profile.seed, question)
+        sentences = [sentence for context in contexts for sentence in _input_sentences(context)]
+        return " ".join(rng.sample(sentences, min(2, len(sentences))))
+
+    def get_llm(self) -> Any:
+        """RAGAS 평가에 사용할 LangChain 호환 LLM 반환"""
+        return SimulatedLangChainLLM(adapter=self)
+
+
+class SimulatedLangChainLLM(LLM):
+    """SimulatedLlmAdapter를 LangChain LLM처럼 사용하기 위한 래퍼"""
+
+    def __init__(self, adapter: SimulatedLlmAdapter, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, "adapter", adapter)
+        object.__setattr__(self, "model", adapter.model_name)
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated"
+
+    def set_run_config(self, run_config):
+        """RAGAS RunConfig 설정 - 시뮬레이션은 무시"""
+        pass
+
+    def _call(self, prompt, stop: List[str] | None = None, run_manager=None, **kwargs: Any) -> str:
+        prompt_str = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+        self.adapter.simulator.call()
+        return self.adapter.respond(prompt_str)
+
+    async def _acall(self, prompt, stop: List[str] | None = None, run_manager=None, **kwargs: Any) -> str:
+        prompt_str = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+        await self.adapter.simulator.acall()
+        return self.adapter.respond(prompt_str)
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        """모델 식별을 위한 파라미터 반환"""
+        return {"model_name": self.adapter.model_name}
@@ -0,0 +1,69 @@
+"""Infrastructure network module"""
+
+from .cassette import (
+    Cassette,
+    CassetteMissError,
+    CassetteMode,
+    CassetteTransport,
+    configure_cassette,
+    current_cassette_config,
+)
+from .deadline import (
+    DeadlineExceeded,
+    clamp_timeout,
+    deadline_expired,
+    hedged,
+    remaining_time,
+    reset_run_deadline,
+    run_deadline_scope,
+    set_run_deadline,
+)
+from .rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    SharedRateLimiter,
+    get_rate_limiter,
+    print_rate_limiter_stats,
+    set_rate_limit_share,
+    set_rate_limiter,
+)
+from .transport import (
+    HEDGE_EMBEDDING,
+    HEDGE_LLM,
+    HttpTransport,
+    RetryPolicy,
+    TransportMetrics,
+    get_transport,
+    set_transport,
+)
+
+__all__ = [
+    "HEDGE_EMBEDDING",
+    "HEDGE_LLM",
+    "AdaptiveRateLimiter",
+    "Cassette",
+    "CassetteMissError",
+    "CassetteMode",
+    "CassetteTransport",
+    "DeadlineExceeded",
+    "HttpTransport",
+    "RateLimiter",
+    "RetryPolicy",
+    "SharedRateLimiter",
+    "TransportMetrics",
+    "clamp_timeout",
+    "configure_cassette",
+    "current_cassette_config",
+    "deadline_expired",
+    "get_rate_limiter",
+    "get_transport",
+    "hedged",
+    "print_rate_limiter_stats",
+    "remaining_time",
+    "reset_run_deadline",
+    "run_deadline_scope",
+    "set_rate_limit_share",
+    "set_rate_limiter",
+    "set_run_deadline",
+    "set_transport",
+]
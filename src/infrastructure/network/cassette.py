@@ -0,0 +1,286 @@
+"""
+요청/응답 기록(카세트) 전송 계층
+
+record 모드에서는 실제 프로바이더에 보낸 요청과 응답(상태 코드, 본문, 지연 시간)을
+JSONL 카세트 파일에 기록하고, replay 모드에서는 네트워크 없이 카세트의 응답을
+되돌려줍니다. 재생 시 기록된 지연 시간에 배율을 곱해 그대로 기다리므로, 실제 API 없이도
+같은 평가 실행을 결정적으로 재현하고 처리량을 측정할 수 있습니다.
+
+요청은 URL(쿼리의 API 키 제외)과 JSON 본문으로 식별하며, 헤더(인증 키, 요청 ID)는 기록하지 않습니다.
+같은 요청이 여러 번 기록되었으면 기록된 순서대로 재생하고, 모두 사용하면 마지막 응답을 반복합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+
+from .transport import HttpTransport, _host_of
+
+
+# URL에서 제거할 인증 쿼리 파라미터
+SECRET_QUERY_PARAMS = {"key", "api_key"}
+
+
+class CassetteMode(str, Enum):
+    """카세트 모드"""
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CassetteMissError(LookupError):
+    """replay 모드에서 카세트에 없는 요청을 보낸 경우"""
+
+
+def _redact_url(url: str) -> str:
+    """URL 쿼리에서 API 키 제거"""
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query) if name not in SECRET_QUERY_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _request_payload(kwargs: Dict[str, Any]) -> Any:
+    """요청 본문 (json 인자 우선, 없으면 data/content 문자열)"""
+    if "json" in kwargs:
+        return kwargs["json"]
+    body = kwargs.get("data", kwargs.get("content"))
+    if isinstance(body, bytes):
+        return body.decode("utf-8", errors="replace")
+    return body
+
+
+class Cassette:
+    """JSONL 카세트 파일 (한 줄에 요청/응답 1건)"""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cursors: Dict[str, int] = defaultdict(int)
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(url: str, payload: Any) -> str:
+        """요청 식별 키 (API 키를 제외한 URL과 본문의 해시)"""
+        serialized = json.dumps({"url": _redact_url(url), "body": payload}, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def load(self) -> int:
+        """카세트 파일 읽기 - 읽은 요청/응답 수 반환"""
+        count = 0
+        with self._lock:
+            self._interactions.clear()
+            self._cursors.clear()
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    interaction = json.loads(line)
+                    self._interactions[interaction["key"]].append(interaction)
+                    count += 1
+        return count
+
+    def record(self, url: str, payload: Any, status_code: int, headers: Dict[str, str], body: str, latency: float) -> None:
+        """요청/응답 1건을 카세트 파일 끝에 추가"""
+        interaction = {
+            "key": self.make_key(url, payload),
+            "url": _redact_url(url),
+            "request": payload,
+            "status_code": status_code,
+            "headers": headers,
+            "body": body,
+            "latency": latency,
+        }
+        line = json.dumps(interaction, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 한 번의 write로 추가하여 여러 프로세스(샤드)가 같은 파일에 기록해도 줄이 섞이지 않게 함
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+            self.recorded += 1
+
+    def next_response(self, url: str, payload: Any) -> Dict[str, Any]:
+        """요청에 대한 다음 기록 응답
+
+        Raises:
+            CassetteMissError: 카세트에 없는 요청인 경우
+        """
+        key = self.make_key(url, payload)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                self.misses += 1
+                raise CassetteMissError(f"카세트에 없는 요청입니다: {_redact_url(url)} ({self.path})")
+            cursor = self._cursors[key]
+            self._cursors[key] = cursor + 1
+            self.replayed += 1
+            return interactions[min(cursor, len(interactions) - 1)]
+
+
+class CassetteTransport(HttpTransport):
+    """요청/응답을 카세트에 기록하거나 카세트에서 재생하는 전송 계층"""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: CassetteMode | str = CassetteMode.REPLAY,
+        latency_scale: float = 1.0,
+        **kwargs: Any,
+    ):
+        """카세트 전송 계층 초기화
+
+        Args:
+            cassette: 기록/재생할 카세트
+            mode: record(실제 요청 후 기록) 또는 replay(카세트 응답 재생)
+            latency_scale: 재생 시 기록된 지연 시간에 곱할 배율 (0이면 기다리지 않음)
+            **kwargs: HttpTransport 인자
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.mode = CassetteMode(mode)
+        if self.mode == CassetteMode.OFF:
+            raise ValueError("CassetteTransport에는 record 또는 replay 모드가 필요합니다.")
+        self.latency_scale = max(0.0, latency_scale)
+        if self.mode == CassetteMode.REPLAY:
+            self.cassette.load()
+            # 중복 요청은 카세트의 다음 응답을 소비하므로 재생 결과가 달라지지 않도록 사용 안 함
+            self.hedge_percentile = None
+            self.embedding_hedge_percentile = None
+
+    def post(self, url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        """동기 POST 요청 (record: 실제 요청 후 기록, replay: 카세트 응답 반환)"""
+        payload = _request_payload(kwargs)
+        if self.mode == CassetteMode.REPLAY:
+            interaction = self.cassette.next_response(url, payload)
+            delay = interaction["latency"] * self.latency_scale
+            if delay > 0:
+                time.sleep(delay)
+            self.metrics.record(_host_of(url), delay, interaction["status_code"])
+            return self._to_requests_response(url, interaction)
+
+        start = time.perf_counter()
+        response = super().post(url, timeout=timeout, **kwargs)
+        self.cassette.record(
+            url, payload, response.status_code, self._content_type(response.headers), response.text,
+            time.perf_counter() - start,
+        )
+        return response
+
+    async def _apost_once(self, host: str, url: str, timeout: float, **kwargs: Any) -> httpx.Response:
+        """비동기 POST 요청 1건 (record: 실제 요청 후 기록, replay: 카세트 응답 반환)"""
+        payload = _request_payload(kwargs)
+        if self.mode == CassetteMode.REPLAY:
+            interaction = self.cassette.next_response(url, payload)
+            delay = interaction["latency"] * self.latency_scale
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.metrics.record(host, delay, interaction["status_code"])
+            return httpx.Response(
+                interaction["status_code"],
+                headers=interaction["headers"],
+                content=interaction["body"].encode("utf-8"),
+                request=httpx.Request("POST", url),
+            )
+
+        start = time.perf_counter()
+        response = await super()._apost_once(host, url, timeout, **kwargs)
+        self.cassette.record(
+            url, payload, response.status_code, self._content_type(response.headers), response.text,
+            time.perf_counter() - start,
+        )
+        return response
+
+    @staticmethod
+    def _content_type(headers: Any) -> Dict[str, str]:
+        content_type = headers.get("Content-Type")
+        return {"Content-Type": content_type} if content_type else {}
+
+    @staticmethod
+    def _to_requests_response(url: str, interaction: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = interaction["status_code"]
+        response.headers.update(interaction["headers"])
+        response._content = interaction["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+    def print_stats(self) -> None:
+        """호스트별 요청 통계와 카세트 통계 출력"""
+        super().print_stats()
+        cassette = self.cassette
+        if self.mode == CassetteMode.RECORD:
+            print(f"📼 카세트 기록 ({cassette.path}): {cassette.recorded}건")
+        else:
+            print(
+                f"📼 카세트 재생 ({cassette.path}): {cassette.replayed}건, 없는 요청 {cassette.misses}건 "
+                f"(지연 시간 배율 {self.latency_scale:g})"
+            )
+
+
+def build_cassette_transport(
+    mode: CassetteMode | str, path: Path | str, latency_scale: float = 1.0
+) -> CassetteTransport:
+    """설정값(연결 풀, 중복 요청)으로 카세트 전송 계층 생성
+
+    Raises:
+        FileNotFoundError: replay 모드에서 카세트 파일이 없는 경우
+    """
+    from src.config import settings
+
+    return CassetteTransport(
+        Cassette(path),
+        mode=mode,
+        latency_scale=latency_scale,
+        pool_sizes=settings.HTTP_POOL_SIZES,
+        default_pool_size=settings.HTTP_DEFAULT_POOL_SIZE,
+        hedge_percentile=settings.JUDGE_HEDGE_PERCENTILE,
+        hedge_min_samples=settings.JUDGE_HEDGE_MIN_SAMPLES,
+        embedding_hedge_percentile=settings.EMBEDDING_HEDGE_PERCENTILE,
+    )
+
+
+def configure_cassette(
+    mode: CassetteMode | str, path: Path | str, latency_scale: float = 1.0
+) -> Optional[CassetteTransport]:
+    """전역 전송 계층을 카세트 전송 계층으로 교체 (CLI 옵션용, off이면 다음 조회 때 기본 전송 계층 생성)
+
+    Args:
+        mode: off, record, replay
+        path: 카세트 파일 경로
+        latency_scale: 재생 시 기록된 지연 시간 배율
+
+    Raises:
+        FileNotFoundError: replay 모드에서 카세트 파일이 없는 경우
+    """
+    from .transport import set_transport
+
+    if CassetteMode(mode) == CassetteMode.OFF:
+        set_transport(None)
+        return None
+    transport = build_cassette_transport(mode, path, latency_scale)
+    set_transport(transport)
+    return transport
+
+
+def current_cassette_config() -> Optional[Tuple[str, str, float]]:
+    """현재 전역 전송 계층의 카세트 설정 (mode, path, latency_scale) - 샤드 워커 전달용"""
+    from .transport import get_transport
+
+    transport = get_transport()
+    if not isinstance(transport, CassetteTransport):
+        return None
+    return transport.mode.value, str(transport.cassette.path), transport.latency_scale
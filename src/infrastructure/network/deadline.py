@@ -0,0 +1,113 @@
+"""
+요청 마감 시간과 중복(hedged) 요청
+
+전체 실행 마감 시간을 실행 단위 컨텍스트 변수(contextvars)로 보관하여 그 실행의 HTTP 요청
+타임아웃을 남은 시간 이하로 줄이고, 마감이 지나면 새 요청을 보내지 않도록 합니다.
+같은 프로세스에서 동시에 진행되는 다른 실행(대시보드 세션 등)에는 영향을 주지 않습니다.
+asyncio 작업은 컨텍스트를 자동으로 이어받지만, 스레드에서 요청을 보낼 때는
+contextvars.copy_context().run으로 실행해야 마감 시간이 적용됩니다.
+느린 비동기 요청에는 중복 요청을 보내 먼저 끝난 응답을 사용하고 나머지는 취소합니다.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """전체 실행 마감 시간이 지나 요청을 보낼 수 없음"""
+
+
+# time.monotonic() 기준 마감 시각 (실행 컨텍스트별)
+_run_deadline: ContextVar[Optional[float]] = ContextVar("run_deadline", default=None)
+
+
+def set_run_deadline(seconds: Optional[float]) -> Token:
+    """현재 컨텍스트에서 지금부터 seconds초 뒤를 전체 실행 마감 시간으로 설정 (None이면 해제)
+
+    Returns:
+        이전 마감 시간으로 되돌릴 때 사용할 토큰 (reset_run_deadline)
+    """
+    return _run_deadline.set(None if seconds is None else time.monotonic() + max(0.0, seconds))
+
+
+def reset_run_deadline(token: Token) -> None:
+    """set_run_deadline 이전의 마감 시간으로 되돌림"""
+    _run_deadline.reset(token)
+
+
+@contextmanager
+def run_deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """블록 안에서만 전체 실행 마감 시간을 적용"""
+    token = set_run_deadline(seconds)
+    try:
+        yield
+    finally:
+        reset_run_deadline(token)
+
+
+def remaining_time() -> Optional[float]:
+    """마감까지 남은 시간(초) - 마감 시간이 없으면 None"""
+    deadline = _run_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def deadline_expired() -> bool:
+    """전체 실행 마감 시간이 지났는지 여부"""
+    remaining = remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+def clamp_timeout(timeout: float) -> float:
+    """요청 타임아웃을 마감까지 남은 시간 이하로 제한
+
+    Raises:
+        DeadlineExceeded: 마감 시간이 이미 지난 경우
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded("전체 실행 마감 시간이 지났습니다.")
+    return min(timeout, remaining)
+
+
+async def hedged(
+    call: Callable[[], Awaitable[Any]],
+    hedge_after: float,
+    on_hedge: Optional[Callable[[], None]] = None,
+) -> Any:
+    """hedge_after초 안에 끝나지 않으면 같은 요청을 한 번 더 보내 먼저 성공한 결과 반환
+
+    남은 요청은 취소합니다. 두 요청이 모두 실패하면 먼저 보낸 요청의 예외를 전파합니다.
+
+    Args:
+        call: 요청 코루틴을 만드는 함수 (두 번 호출될 수 있음)
+        hedge_after: 중복 요청을 보내기 전 대기 시간 (초)
+        on_hedge: 중복 요청을 보낼 때 호출할 함수 (통계용)
+    """
+    primary = asyncio.ensure_future(call())
+    tasks = [primary]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        if on_hedge:
+            on_hedge()
+        tasks.append(asyncio.ensure_future(call()))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        return primary.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,441 @@
+"""
+적응형 요청 속도 제한기
+
+프로바이더/엔드포인트별 토큰 버킷에 AIMD(가산 증가, 곱셈 감소) 제어를 적용하여
+고정된 요청 간격 대신 실제 API 할당량에 맞춰 처리량이 수렴하도록 합니다.
+여러 RAGTrace 프로세스(대시보드, CLI)가 같은 API 키를 쓰는 경우
+SQLite 예약 장부를 공유하는 SharedRateLimiter로 전체 요청 속도를 맞춥니다.
+"""
+
+import asyncio
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.paths import CACHE_DIR, ensure_directory_exists
+
+
+RATE_LIMIT_DB_PATH = CACHE_DIR / "rate_limits.db"
+
+
+class RateLimiter(ABC):
+    """요청 속도 제한기 인터페이스"""
+
+    @abstractmethod
+    def acquire(self) -> None:
+        """요청 1건을 보낼 수 있을 때까지 대기 (동기)"""
+
+    @abstractmethod
+    async def aacquire(self) -> None:
+        """요청 1건을 보낼 수 있을 때까지 대기 (비동기)"""
+
+    @abstractmethod
+    def on_success(self) -> None:
+        """요청 성공을 알림"""
+
+    @abstractmethod
+    def on_throttle(self) -> None:
+        """요청이 제한(429)되었음을 알림"""
+
+    async def aon_success(self) -> None:
+        """요청 성공을 알림 (비동기)"""
+        self.on_success()
+
+    async def aon_throttle(self) -> None:
+        """요청이 제한(429)되었음을 알림 (비동기)"""
+        self.on_throttle()
+
+    @property
+    @abstractmethod
+    def current_rate(self) -> float:
+        """현재 허용 속도 (요청/초)"""
+
+    @property
+    @abstractmethod
+    def queue_depth(self) -> int:
+        """토큰을 기다리는 요청 수"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """제한기 상태 반환"""
+        return {
+            "rate": round(self.current_rate, 3),
+            "queue_depth": self.queue_depth,
+        }
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """AIMD 토큰 버킷 속도 제한기
+
+    성공할 때마다 속도를 increase_step만큼 올리고, 429 응답을 받으면
+    decrease_factor를 곱해 줄입니다. 동시에 도착한 여러 429 응답으로
+    속도가 연속해서 깎이지 않도록 감소 후 잠시 추가 감소를 무시합니다.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.2,
+        max_rate: float = 10.0,
+        burst: float = 1.0,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        name: str = "",
+    ):
+        """속도 제한기 초기화
+
+        Args:
+            initial_rate: 시작 속도 (요청/초)
+            min_rate: 최소 속도 (요청/초)
+            max_rate: 최대 속도 (요청/초)
+            burst: 버킷 용량 (연속으로 즉시 보낼 수 있는 요청 수)
+            increase_step: 성공 1건당 속도 증가량 (요청/초)
+            decrease_factor: 제한 응답 시 속도에 곱할 값 (0~1)
+            name: 통계 출력용 이름
+        """
+        if not 0 < min_rate <= max_rate:
+            raise ValueError("속도 제한 설정 오류: 0 < min_rate <= max_rate 이어야 합니다.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("속도 제한 설정 오류: decrease_factor는 0과 1 사이여야 합니다.")
+
+        self.name = name
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = max(burst, 1.0)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self._rate = min(max(initial_rate, min_rate), max_rate)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+        self.successes = 0
+        self.throttles = 0
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def _reserve(self) -> float:
+        """토큰 1개를 예약하고 사용 가능해질 때까지의 대기 시간(초)을 반환
+
+        토큰이 부족하면 잔량이 음수가 되어 이후 요청이 순서대로 뒤에 예약됩니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        wait_time = self._reserve()
+        if wait_time <= 0:
+            return
+        with self._lock:
+            self._waiting += 1
+        try:
+            time.sleep(wait_time)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    async def aacquire(self) -> None:
+        wait_time = self._reserve()
+        if wait_time <= 0:
+            return
+        with self._lock:
+            self._waiting += 1
+        try:
+            await asyncio.sleep(wait_time)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.successes += 1
+            self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttles += 1
+            now = time.monotonic()
+            # 직전 감소 이후 한 요청 간격 안에 들어온 429는 같은 혼잡으로 간주
+            if now - self._last_decrease < 1.0 / self._rate:
+                return
+            self._last_decrease = now
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            # 남은 버스트를 비워 바로 이어지는 요청도 새 속도를 따르게 함
+            self._tokens = min(self._tokens, 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats.update({"successes": self.successes, "throttles": self.throttles})
+        return stats
+
+
+class SharedRateLimiter(AdaptiveRateLimiter):
+    """SQLite 예약 장부 기반 프로세스 간 공유 속도 제한기
+
+    같은 키를 쓰는 모든 프로세스가 한 행(현재 속도, 다음 예약 시각)을
+    트랜잭션으로 갱신하므로 AIMD 상태와 요청 간격이 프로세스 간에 공유됩니다.
+    """
+
+    def __init__(self, key: str, db_path: Path | None = None, **kwargs: Any):
+        """공유 속도 제한기 초기화
+
+        Args:
+            key: 장부 행 키 (프로바이더/엔드포인트/API 키 해시)
+            db_path: 장부 데이터베이스 경로 (None이면 data/cache/rate_limits.db)
+            **kwargs: AdaptiveRateLimiter 설정 인자
+        """
+        super().__init__(**kwargs)
+        self.key = key
+        self.db_path = Path(db_path) if db_path else RATE_LIMIT_DB_PATH
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """장부 테이블 생성"""
+        ensure_directory_exists(self.db_path.parent)
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limits (
+                    key TEXT PRIMARY KEY,
+                    rate REAL NOT NULL,
+                    next_slot REAL NOT NULL,
+                    last_decrease REAL NOT NULL DEFAULT 0,
+                    successes INTEGER NOT NULL DEFAULT 0,
+                    throttles INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute(
+                "INSERT OR IGNORE INTO rate_limits (key, rate, next_slot) VALUES (?, ?, 0)",
+                (self.key, self._rate),
+            )
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 잡은 트랜잭션 (다른 프로세스의 갱신과 직렬화)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def _read_row(self, conn: sqlite3.Connection) -> Tuple[float, float, float]:
+        row = conn.execute(
+            "SELECT rate, next_slot, last_decrease FROM rate_limits WHERE key = ?", (self.key,)
+        ).fetchone()
+        if row is None:
+            conn.execute(
+                "INSERT INTO rate_limits (key, rate, next_slot) VALUES (?, ?, 0)",
+                (self.key, self._rate),
+            )
+            return self._rate, 0.0, 0.0
+        rate, next_slot, last_decrease = row
+        # 프로세스마다 설정이 다를 수 있으므로 자신의 범위로 제한
+        return min(max(rate, self.min_rate), self.max_rate), next_slot, last_decrease
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    @property
+    def queue_depth(self) -> int:
+        """모든 프로세스에서 아직 시각이 오지 않은 예약 수"""
+        try:
+            with self._transaction() as conn:
+                rate, next_slot, _ = self._read_row(conn)
+        except sqlite3.Error:
+            return self._waiting
+        self._rate = rate
+        return max(0, math.ceil((next_slot - time.time()) * rate))
+
+    def _reserve(self) -> float:
+        """장부에서 다음 요청 시각을 예약하고 대기 시간(초)을 반환"""
+        with self._transaction() as conn:
+            rate, next_slot, _ = self._read_row(conn)
+            now = time.time()
+            # 버스트만큼은 과거 시각으로 당겨 연속 요청 허용
+            slot = max(now - (self.burst - 1) / rate, next_slot)
+            conn.execute(
+                "UPDATE rate_limits SET next_slot = ? WHERE key = ?", (slot + 1.0 / rate, self.key)
+            )
+        self._rate = rate
+        return max(0.0, slot - now)
+
+    async def aacquire(self) -> None:
+        # 장부 트랜잭션은 쓰기 잠금을 최대 30초 기다릴 수 있으므로 이벤트 루프 밖에서 실행
+        wait_time = await asyncio.to_thread(self._reserve)
+        if wait_time <= 0:
+            return
+        with self._lock:
+            self._waiting += 1
+        try:
+            await asyncio.sleep(wait_time)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def on_success(self) -> None:
+        with self._transaction() as conn:
+            rate, _, _ = self._read_row(conn)
+            rate = min(self.max_rate, rate + self.increase_step)
+            conn.execute(
+                "UPDATE rate_limits SET rate = ?, successes = successes + 1 WHERE key = ?",
+                (rate, self.key),
+            )
+        self._rate = rate
+        self.successes += 1
+
+    def on_throttle(self) -> None:
+        with self._transaction() as conn:
+            rate, next_slot, last_decrease = self._read_row(conn)
+            now = time.time()
+            conn.execute("UPDATE rate_limits SET throttles = throttles + 1 WHERE key = ?", (self.key,))
+            # 다른 프로세스가 이미 같은 혼잡에 대해 속도를 낮췄으면 생략
+            if now - last_decrease >= 1.0 / rate:
+                rate = max(self.min_rate, rate * self.decrease_factor)
+                conn.execute(
+                    "UPDATE rate_limits SET rate = ?, last_decrease = ?, next_slot = ? WHERE key = ?",
+                    (rate, now, max(next_slot, now), self.key),
+                )
+        self._rate = rate
+        self.throttles += 1
+
+    async def aon_success(self) -> None:
+        await asyncio.to_thread(self.on_success)
+
+    async def aon_throttle(self) -> None:
+        await asyncio.to_thread(self.on_throttle)
+
+
+# 프로바이더/엔드포인트별 기본 설정 (settings.RATE_LIMITS로 덮어쓰기 가능)
+DEFAULT_RATE_LIMITS: Dict[str, Dict[str, float]] = {
+    "hcx.chat": {"initial_rate": 1.0, "min_rate": 0.2, "max_rate": 10.0},
+    "hcx.embedding": {"initial_rate": 1.0, "min_rate": 0.2, "max_rate": 10.0},
+    "gemini.chat": {"initial_rate": 2.0, "min_rate": 0.2, "max_rate": 20.0},
+}
+
+# 프로세스 전역 제한기 레지스트리 (키: 프로바이더, 엔드포인트, API 키 해시)
+_rate_limiters: Dict[Tuple[str, str, str], RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+# 이 프로세스가 사용할 로컬 속도 예산 비율 (샤드 워커는 1/N)
+_rate_share = 1.0
+_RATE_KEYS = {"initial_rate": 1.0, "min_rate": 0.2, "max_rate": 10.0}
+
+
+def _limiter_config(provider: str, endpoint: str) -> Dict[str, float]:
+    """기본값과 설정값을 합쳐 제한기 설정 구성"""
+    from src.config import settings
+
+    key = f"{provider}.{endpoint}"
+    config = dict(DEFAULT_RATE_LIMITS.get(key, {}))
+    config.update(settings.RATE_LIMITS.get(provider, {}))
+    config.update(settings.RATE_LIMITS.get(key, {}))
+    return config
+
+
+def _api_key_hash(api_key: Optional[str]) -> str:
+    """API 키를 장부 키에 쓰기 위한 해시 (원문은 저장하지 않음)"""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def get_rate_limiter(provider: str, endpoint: str, api_key: Optional[str] = None) -> RateLimiter:
+    """프로바이더/엔드포인트(/API 키)별 공유 속도 제한기 반환
+
+    settings.RATE_LIMIT_BACKEND가 "shared"이면 같은 API 키를 쓰는
+    모든 프로세스가 공유하는 SharedRateLimiter를 반환합니다.
+
+    Args:
+        provider: 프로바이더 이름 (예: "hcx")
+        endpoint: 엔드포인트 이름 (예: "chat", "embedding")
+        api_key: 할당량 단위가 되는 API 키 (None이면 프로바이더 단위)
+    """
+    from src.config import settings
+
+    key = (provider, endpoint, _api_key_hash(api_key))
+    with _registry_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            name = f"{provider}.{endpoint}"
+            config = _limiter_config(provider, endpoint)
+            if settings.RATE_LIMIT_BACKEND == "shared":
+                limiter = SharedRateLimiter(key=":".join(filter(None, key)), name=name, **config)
+            else:
+                # 공유 장부는 프로세스 합계를 이미 제한하므로 로컬 제한기만 비율 적용
+                if _rate_share < 1.0:
+                    for rate_key, default in _RATE_KEYS.items():
+                        config[rate_key] = config.get(rate_key, default) * _rate_share
+                limiter = AdaptiveRateLimiter(name=name, **config)
+            _rate_limiters[key] = limiter
+    return limiter
+
+
+def set_rate_limit_share(share: float) -> None:
+    """이 프로세스의 로컬 속도 예산 비율 설정 (샤드 워커용)
+
+    이미 생성된 로컬 제한기는 제거되어 다음 조회 때 비율을 반영해 다시 생성됩니다.
+
+    Args:
+        share: 0 초과 1 이하의 비율 (예: 샤드 4개이면 0.25)
+    """
+    global _rate_share
+    if not 0 < share <= 1:
+        raise ValueError("속도 예산 비율은 0 초과 1 이하여야 합니다.")
+    with _registry_lock:
+        _rate_share = share
+        for key, limiter in list(_rate_limiters.items()):
+            if not isinstance(limiter, SharedRateLimiter):
+                del _rate_limiters[key]
+
+
+def set_rate_limiter(
+    provider: str, endpoint: str, limiter: Optional[RateLimiter], api_key: Optional[str] = None
+) -> None:
+    """제한기 교체 (None이면 제거하여 다음 조회 때 설정값으로 다시 생성)"""
+    key = (provider, endpoint, _api_key_hash(api_key))
+    with _registry_lock:
+        if limiter is None:
+            _rate_limiters.pop(key, None)
+        else:
+            _rate_limiters[key] = limiter
+
+
+def print_rate_limiter_stats() -> None:
+    """사용된 속도 제한기들의 상태 출력"""
+    with _registry_lock:
+        limiters = list(_rate_limiters.items())
+    for (provider, endpoint, _), limiter in limiters:
+        stats = limiter.get_stats()
+        backend = "공유" if isinstance(limiter, SharedRateLimiter) else "로컬"
+        print(
+            f"🚦 {provider}.{endpoint} 속도 제한({backend}): 현재 {stats['rate']:.2f} req/s, "
+            f"대기 {stats['queue_depth']}건, "
+            f"성공 {stats.get('successes', 0)}건, 제한 {stats.get('throttles', 0)}건"
+        )
@@ -0,0 +1,406 @@
+"""
+공유 HTTP 전송 계층
+
+모든 프로바이더 어댑터가 호스트별 keep-alive 연결 풀(동기: requests.Session,
+비동기: httpx.AsyncClient)을 재사용하도록 하여 요청마다 TCP/TLS 핸드셰이크를
+반복하지 않게 합니다. 재시도 정책과 요청별 지연 시간 통계도 함께 제공합니다.
+모든 요청의 타임아웃은 전체 실행 마감 시간까지 남은 시간 이하로 제한됩니다.
+"""
+
+import asyncio
+import random
+import statistics
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from .deadline import clamp_timeout, hedged
+from .rate_limiter import RateLimiter
+
+
+# 호스트별 풀 크기 기본값 (settings.HTTP_POOL_SIZES로 덮어쓰기 가능)
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30.0
+
+# 중복 요청 종류 (종류별 백분위 설정 사용)
+HEDGE_LLM = "llm"
+HEDGE_EMBEDDING = "embedding"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """재시도 횟수와 지수 백오프 간격 정책
+
+    attempt번째 실패 후 대기 시간은
+    min(base_delay * multiplier ** attempt, max_delay) + uniform(0, jitter) 입니다.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    multiplier: float = 2.0
+    max_delay: float = 60.0
+    jitter: float = 0.0
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(0부터) 실패 후 대기 시간(초)"""
+        delay = min(self.base_delay * (self.multiplier ** attempt), self.max_delay)
+        if self.jitter > 0:
+            delay += random.uniform(0, self.jitter)
+        return delay
+
+    def is_last(self, attempt: int) -> bool:
+        """마지막 시도 여부"""
+        return attempt >= self.max_retries - 1
+
+
+class TransportMetrics:
+    """호스트별 요청 수, 오류 수, 지연 시간 통계"""
+
+    # 백분위 계산을 위해 보관할 호스트별 최근 지연 시간 수
+    WINDOW = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.WINDOW))
+        self._requests: Dict[str, int] = defaultdict(int)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._status_counts: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._hedges: Dict[str, int] = defaultdict(int)
+
+    def record(self, host: str, seconds: float, status_code: Optional[int]) -> None:
+        """요청 1건 기록 (status_code가 None이면 네트워크 오류)"""
+        with self._lock:
+            self._requests[host] += 1
+            self._latencies[host].append(seconds)
+            if status_code is None:
+                self._errors[host] += 1
+            else:
+                self._status_counts[host][status_code] += 1
+
+    def record_hedge(self, host: str) -> None:
+        """중복(hedged) 요청 1건 기록"""
+        with self._lock:
+            self._hedges[host] += 1
+
+    def latency_percentile(self, host: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """호스트의 최근 지연 시간 백분위(초) - 표본이 min_samples개 미만이면 None"""
+        with self._lock:
+            latencies = sorted(self._latencies.get(host, ()))
+        if len(latencies) < max(1, min_samples):
+            return None
+        return _percentile(latencies, q)
+
+    def reset(self) -> None:
+        """통계 초기화"""
+        with self._lock:
+            self._latencies.clear()
+            self._requests.clear()
+            self._errors.clear()
+            self._status_counts.clear()
+            self._hedges.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 통계 반환"""
+        with self._lock:
+            stats = {}
+            for host, count in self._requests.items():
+                latencies = sorted(self._latencies[host])
+                stats[host] = {
+                    "requests": count,
+                    "errors": self._errors[host],
+                    "hedged": self._hedges.get(host, 0),
+                    "status_counts": dict(self._status_counts[host]),
+                    "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+                    "p50_ms": _percentile(latencies, 0.5) * 1000,
+                    "p95_ms": _percentile(latencies, 0.95) * 1000,
+                }
+            return stats
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _host_of(url: str) -> str:
+    return urlsplit(url).netloc
+
+
+class HttpTransport:
+    """호스트별 연결 풀을 공유하는 HTTP 전송 계층"""
+
+    def __init__(
+        self,
+        pool_sizes: Optional[Dict[str, int]] = None,
+        default_pool_size: int = DEFAULT_POOL_SIZE,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        embedding_hedge_percentile: Optional[float] = None,
+    ):
+        """전송 계층 초기화
+
+        Args:
+            pool_sizes: 호스트별 연결 풀 크기 (예: {"clovastudio.stream.ntruss.com": 20})
+            default_pool_size: pool_sizes에 없는 호스트의 풀 크기
+            default_timeout: 요청별 timeout이 없을 때 사용할 타임아웃 (초)
+            async_transport: 비동기 클라이언트에 사용할 httpx 전송 객체 (테스트용)
+            hedge_percentile: LLM 요청에 중복 요청을 보낼 지연 시간 백분위 (None이면 사용 안 함)
+            hedge_min_samples: 백분위 계산에 필요한 최소 표본 수
+            embedding_hedge_percentile: 임베딩 요청에 중복 요청을 보낼 지연 시간 백분위 (None이면 사용 안 함)
+        """
+        self.pool_sizes = dict(pool_sizes or {})
+        self.default_pool_size = default_pool_size
+        self.default_timeout = default_timeout
+        self.metrics = TransportMetrics()
+        self._async_transport = async_transport
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.embedding_hedge_percentile = embedding_hedge_percentile
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        # httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 관리
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # 루프를 실행한 스레드 (close_async_clients는 호출 스레드의 루프만 정리)
+        self._loop_threads: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+        # 루프 종료 시 그 루프의 클라이언트를 닫는 비동기 제너레이터 (루프별 1개)
+        self._loop_closers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncIterator[None]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_lock = threading.Lock()
+
+    def pool_size_for(self, host: str) -> int:
+        """호스트의 연결 풀 크기"""
+        return self.pool_sizes.get(host, self.default_pool_size)
+
+    def _get_session(self, host: str) -> requests.Session:
+        """호스트별 keep-alive 세션 반환"""
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                pool_size = self.pool_size_for(host)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _get_async_client(self, host: str) -> httpx.AsyncClient:
+        """현재 이벤트 루프와 호스트에 대한 AsyncClient 반환"""
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            clients = self._async_clients.setdefault(loop, {})
+            self._loop_threads[loop] = threading.get_ident()
+            client = clients.get(host)
+            if client is None or client.is_closed:
+                pool_size = self.pool_size_for(host)
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=pool_size, max_keepalive_connections=pool_size
+                    ),
+                    transport=self._async_transport,
+                )
+                clients[host] = client
+            return client
+
+    async def _aget_async_client(self, host: str) -> httpx.AsyncClient:
+        """_get_async_client와 같지만, 처음 쓰는 루프이면 루프 종료 시 클라이언트가 닫히도록 등록"""
+        client = self._get_async_client(host)
+        loop = asyncio.get_running_loop()
+        closer = None
+        with self._async_lock:
+            if loop not in self._loop_closers:
+                closer = self._close_on_loop_shutdown()
+                self._loop_closers[loop] = closer
+        if closer is not None:
+            # 첫 반복에서 루프의 비동기 제너레이터로 등록되고, 루프가 끝날 때까지 yield에서 대기
+            await closer.__anext__()
+        return client
+
+    async def _close_on_loop_shutdown(self) -> AsyncIterator[None]:
+        """루프 종료(asyncio.run의 shutdown_asyncgens) 시 그 루프의 비동기 클라이언트를 닫음
+
+        RAGAS evaluate()와 스트리밍 배치는 실행마다 새 루프를 만들므로, 닫지 않으면
+        루프마다 연결 풀이 남아 GC될 때까지 연결이 열려 있습니다.
+        """
+        try:
+            yield
+        finally:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # 루프 밖에서 GC로 정리되는 경우 (훅이 없는 루프) - 닫을 루프가 없음
+                pass
+            else:
+                await self.aclose()
+
+    def hedge_delay(self, host: str, kind: str = HEDGE_LLM) -> Optional[float]:
+        """중복 요청을 보내기 전 대기 시간 - 설정이 없거나 표본이 부족하면 None"""
+        percentile = self.embedding_hedge_percentile if kind == HEDGE_EMBEDDING else self.hedge_percentile
+        if percentile is None:
+            return None
+        return self.metrics.latency_percentile(host, percentile, self.hedge_min_samples)
+
+    def post(self, url: str, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        """동기 POST 요청 (requests 예외는 그대로 전파)
+
+        Raises:
+            DeadlineExceeded: 전체 실행 마감 시간이 지난 경우
+        """
+        host = _host_of(url)
+        timeout = clamp_timeout(timeout or self.default_timeout)
+        session = self._get_session(host)
+        start = time.perf_counter()
+        try:
+            response = session.post(url, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            self.metrics.record(host, time.perf_counter() - start, None)
+            raise
+        self.metrics.record(host, time.perf_counter() - start, response.status_code)
+        return response
+
+    async def apost(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        hedge: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """비동기 POST 요청 (httpx 예외와 취소는 그대로 전파)
+
+        hedge(HEDGE_LLM, HEDGE_EMBEDDING)를 주면 호스트 지연 시간이 해당 종류의 백분위를 넘긴 요청에
+        중복 요청을 한 번 더 보내 먼저 성공한 응답을 사용합니다 (멱등 요청에만 사용).
+        limiter를 주면 중복 요청도 토큰을 하나 더 받은 뒤 보냅니다 (첫 요청의 토큰은 호출자가 받음).
+
+        Raises:
+            DeadlineExceeded: 전체 실행 마감 시간이 지난 경우
+        """
+        host = _host_of(url)
+        timeout = clamp_timeout(timeout or self.default_timeout)
+        hedge_after = self.hedge_delay(host, hedge) if hedge else None
+        if hedge_after is None:
+            return await self._apost_once(host, url, timeout, **kwargs)
+
+        calls = 0
+
+        async def call() -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls > 1 and limiter is not None:
+                await limiter.aacquire()
+            return await self._apost_once(host, url, timeout, **kwargs)
+
+        return await hedged(call, hedge_after, on_hedge=lambda: self.metrics.record_hedge(host))
+
+    async def _apost_once(self, host: str, url: str, timeout: float, **kwargs: Any) -> httpx.Response:
+        """비동기 POST 요청 1건 (지연 시간 기록)"""
+        client = await self._aget_async_client(host)
+        start = time.perf_counter()
+        try:
+            response = await client.post(url, timeout=timeout, **kwargs)
+        except httpx.HTTPError:
+            self.metrics.record(host, time.perf_counter() - start, None)
+            raise
+        self.metrics.record(host, time.perf_counter() - start, response.status_code)
+        return response
+
+    def close(self) -> None:
+        """동기 세션 종료"""
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 비동기 클라이언트 종료"""
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            clients = self._async_clients.pop(loop, {})
+        await self._aclose_clients(clients)
+
+    def close_async_clients(self) -> None:
+        """호출 스레드에서 실행했던, 지금은 실행 중이 아닌 이벤트 루프의 비동기 클라이언트 종료
+
+        동기 코드에서 평가 실행(RAGAS evaluate)이 끝난 뒤 호출합니다. RAGAS는 nest_asyncio를
+        적용하므로 asyncio.run이 루프를 닫지 않고 재사용하며, 이 경우 루프 종료 시 정리
+        (_close_on_loop_shutdown)가 일어나지 않습니다. 이미 닫힌 루프의 클라이언트는
+        종료할 수 없으므로 목록에서만 제거합니다.
+        """
+        thread_id = threading.get_ident()
+        with self._async_lock:
+            idle = [
+                loop for loop in list(self._async_clients.keys())
+                if self._loop_threads.get(loop) == thread_id and not loop.is_running()
+            ]
+            pending = [(loop, self._async_clients.pop(loop)) for loop in idle]
+        for loop, clients in pending:
+            if not loop.is_closed():
+                loop.run_until_complete(self._aclose_clients(clients))
+
+    @staticmethod
+    async def _aclose_clients(clients: Dict[str, httpx.AsyncClient]) -> None:
+        for client in clients.values():
+            if not client.is_closed:
+                await client.aclose()
+
+    def print_stats(self) -> None:
+        """호스트별 요청 통계 출력"""
+        for host, stats in self.metrics.get_stats().items():
+            print(
+                f"🌐 {host}: 요청 {stats['requests']}건 (오류 {stats['errors']}건, 중복 요청 {stats['hedged']}건), "
+                f"평균 {stats['mean_ms']:.0f}ms, p50 {stats['p50_ms']:.0f}ms, p95 {stats['p95_ms']:.0f}ms"
+            )
+
+
+# 프로세스 전역 전송 계층 (지연 초기화)
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """전역 HTTP 전송 계층 반환 (설정값으로 지연 생성, CASSETTE_MODE가 off가 아니면 카세트 전송 계층)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                from src.config import settings
+
+                if settings.CASSETTE_MODE != "off":
+                    from .cassette import build_cassette_transport
+
+                    _transport = build_cassette_transport(
+                        settings.CASSETTE_MODE, settings.CASSETTE_PATH, settings.CASSETTE_LATENCY_SCALE
+                    )
+                else:
+                    _transport = HttpTransport(
+                        pool_sizes=settings.HTTP_POOL_SIZES,
+                        default_pool_size=settings.HTTP_DEFAULT_POOL_SIZE,
+                        hedge_percentile=settings.JUDGE_HEDGE_PERCENTILE,
+                        hedge_min_samples=settings.JUDGE_HEDGE_MIN_SAMPLES,
+                        embedding_hedge_percentile=settings.EMBEDDING_HEDGE_PERCENTILE,
+                    )
+    return _transport
+
+
+def set_transport(transport: Optional[HttpTransport]) -> None:
+    """전역 전송 계층 교체 (None이면 다음 조회 때 다시 생성)"""
+    global _transport
+    with _transport_lock:
+        _transport = transport
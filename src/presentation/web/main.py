@@ -8,6 +8,7 @@ import json
 import random
 import sqlite3
 from datetime import datetime
+from typing import Optional
 import warnings
 
 # torch 관련 경고 무시
@@ -769,6 +770,16 @@ def show_new_evaluation_page():
     with col4:
         st.write(f"**📊 데이터셋:** {selected_dataset}")
     
+    # 누락된 답변 동시 생성 워커 수
+    from src.config import settings
+    generation_workers = st.number_input(
+        "⚡ 답변 동시 생성 워커 수 (누락된 답변이 있을 때만 사용)",
+        min_value=1,
+        max_value=32,
+        value=settings.GENERATION_MAX_WORKERS,
+        key="generation_workers_input"
+    )
+    
     st.markdown("---")
     
     # 평가 실행 버튼들
@@ -781,7 +792,10 @@ def show_new_evaluation_page():
     
     with col2:
         if st.button("🚀 평가 시작", type="primary", use_container_width=True, key="new_eval_start_btn"):
-            execute_evaluation(selected_prompt_type, selected_dataset, selected_llm, selected_embedding)
+            execute_evaluation(
+                selected_prompt_type, selected_dataset, selected_llm, selected_embedding,
+                generation_workers=int(generation_workers)
+            )
     
     with col3:
         st.write("")  # 빈 공간
@@ -844,7 +858,8 @@ def show_prompt_selector():
         return next(p for p in prompt_options if p.value == selected)
 
 
-def execute_evaluation(prompt_type: PromptType, dataset_name: str, llm_type: str, embedding_type: str):
+def execute_evaluation(prompt_type: PromptType, dataset_name: str, llm_type: str, embedding_type: str,
+                       generation_workers: Optional[int] = None):
     """평가 실행 로직"""
     with st.spinner("🔄 평가를 실행 중입니다..."):
         try:
@@ -911,7 +926,8 @@ def execute_evaluation(prompt_type: PromptType, dataset_name: str, llm_type: str
             request = EvaluationRequest(
                 llm_type=llm_type,
                 embedding_type=embedding_type,
-                prompt_type=prompt_type
+                prompt_type=prompt_type,
+                generation_workers=generation_workers
             )
             evaluation_use_case, llm_adapter, embedding_adapter = container.create_evaluation_use_case(request)
             
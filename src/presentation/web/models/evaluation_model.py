@@ -18,6 +18,7 @@ class EvaluationConfig:
     embedding_type: str
     prompt_type: PromptType
     dataset_name: str
+    generation_workers: Optional[int] = None
 
 
 @dataclass
@@ -37,13 +38,15 @@ class EvaluationModel:
     """평가 관련 비즈니스 로직"""
     
     @staticmethod
-    def create_config(llm_type: str, embedding_type: str, prompt_type: PromptType, dataset_name: str) -> EvaluationConfig:
+    def create_config(llm_type: str, embedding_type: str, prompt_type: PromptType, dataset_name: str,
+                      generation_workers: Optional[int] = None) -> EvaluationConfig:
         """평가 설정 생성"""
         return EvaluationConfig(
             llm_type=llm_type,
             embedding_type=embedding_type,
             prompt_type=prompt_type,
-            dataset_name=dataset_name
+            dataset_name=dataset_name,
+            generation_workers=generation_workers
         )
     
     @staticmethod
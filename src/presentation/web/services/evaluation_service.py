@@ -25,7 +25,8 @@ class EvaluationService:
         request = EvaluationRequest(
             llm_type=config.llm_type,
             embedding_type=config.embedding_type,
-            prompt_type=config.prompt_type
+            prompt_type=config.prompt_type,
+            generation_workers=config.generation_workers
         )
         
         # 평가 시작 시간 기록
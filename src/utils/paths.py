@@ -57,6 +57,7 @@ SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 # 데이터 관련 경로들
 DB_DIR = DATA_DIR / "db"
 TEMP_DIR = DATA_DIR / "temp"
+CACHE_DIR = DATA_DIR / "cache"
 
 # 주요 파일 경로들
 DATABASE_PATH = DB_DIR / "evaluations.db"
@@ -0,0 +1,168 @@
+"""답변 생성 서비스 테스트"""
+
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.application.services.generation_service import GenerationService
+from src.domain.entities.evaluation_data import EvaluationData
+from src.domain.exceptions import ProviderAuthError, ProviderRateLimitError
+
+
+_run_marker: contextvars.ContextVar = contextvars.ContextVar("run_marker", default=None)
+
+
+class FakeAnswerGenerator:
+    """질문을 그대로 답변으로 돌려주는 생성기 (지연/실패 시뮬레이션)"""
+
+    def __init__(self, delay: float = 0.0, fail_on: tuple = ()):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate_answer(self, question, contexts):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if question in self.fail_on:
+                raise RuntimeError(f"생성 실패: {question}")
+            return f"답변: {question}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class FlakyProviderGenerator:
+    """지정한 질문에서 처음 한 번은 지정한 공급자 오류를 내는 생성기"""
+
+    def __init__(self, errors: dict):
+        self.errors = dict(errors)
+        self.calls = []
+
+    def generate_answer(self, question, contexts):
+        self.calls.append(question)
+        error = self.errors.pop(question, None)
+        if error:
+            raise error
+        return f"답변: {question}"
+
+
+def _make_data(count: int, answered: tuple = ()) -> list:
+    data_list = []
+    for i in range(count):
+        data = EvaluationData(
+            question=f"질문{i}", contexts=["컨텍스트"], answer="기존 답변", ground_truth="정답"
+        )
+        if i not in answered:
+            data.answer = ""
+        data_list.append(data)
+    return data_list
+
+
+class TestGenerationService:
+    """답변 생성 서비스 테스트"""
+
+    def test_sequential_generation_fills_missing_answers(self):
+        data_list = _make_data(3, answered=(1,))
+        result = GenerationService(FakeAnswerGenerator()).generate_missing_answers(data_list)
+
+        assert [d.answer for d in data_list] == ["답변: 질문0", "기존 답변", "답변: 질문2"]
+        assert result.successes == 3
+        assert result.failures == 0
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_failures_are_recorded_in_item_order(self, max_workers):
+        data_list = _make_data(6)
+        generator = FakeAnswerGenerator(fail_on=("질문4", "질문1"))
+        result = GenerationService(generator, max_workers=max_workers).generate_missing_answers(data_list)
+
+        assert result.failures == 2
+        assert result.successes == 4
+        assert [f["item_index"] for f in result.failure_details] == [2, 5]
+        assert data_list[1].answer == ""
+        assert data_list[5].answer == "답변: 질문5"
+
+    def test_concurrent_generation_overlaps_and_preserves_order(self):
+        data_list = _make_data(8)
+        generator = FakeAnswerGenerator(delay=0.1)
+
+        start = time.perf_counter()
+        result = GenerationService(generator, max_workers=4).generate_missing_answers(data_list)
+        elapsed = time.perf_counter() - start
+
+        assert [d.answer for d in data_list] == [f"답변: 질문{i}" for i in range(8)]
+        assert result.successes == 8
+        assert generator.max_active == 4
+        assert elapsed < 0.5
+
+    def test_concurrent_generation_prints_one_progress_line_per_item(self, capsys):
+        GenerationService(FakeAnswerGenerator(), max_workers=4).generate_missing_answers(_make_data(5))
+
+        output = capsys.readouterr().out
+        assert output.count("진행:") == 5
+        assert "답변 생성 완료 (" not in output
+
+    def test_worker_threads_inherit_run_context(self):
+        seen = []
+
+        class ContextRecordingGenerator(FakeAnswerGenerator):
+            def generate_answer(self, question, contexts):
+                seen.append(_run_marker.get())
+                return super().generate_answer(question, contexts)
+
+        service = GenerationService(ContextRecordingGenerator(), max_workers=3)
+        token = _run_marker.set("run-1")
+        try:
+            service.generate_missing_answers(_make_data(3))
+            list(service.iter_generated(_make_data(3)))
+        finally:
+            _run_marker.reset(token)
+
+        # 실행 마감 시간 같은 실행 단위 컨텍스트 변수가 생성 스레드에도 적용됨
+        assert seen == ["run-1"] * 6
+
+    def test_invalid_worker_count_falls_back_to_sequential(self):
+        assert GenerationService(FakeAnswerGenerator(), max_workers=0).max_workers == 1
+
+    def test_iter_generated_yields_existing_answers_first_and_bounds_in_flight(self):
+        data_list = _make_data(6, answered=(4,))
+        generator = FakeAnswerGenerator(delay=0.02)
+        service = GenerationService(generator, max_workers=2)
+
+        results = list(service.iter_generated(data_list))
+
+        assert results[0] == (4, None)
+        assert sorted(index for index, _ in results) == list(range(6))
+        assert generator.max_active <= 2
+        assert all(d.answer for d in data_list)
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_retryable_provider_failures_are_retried_once(self, max_workers):
+        data_list = _make_data(4)
+        generator = FlakyProviderGenerator({
+            "질문1": ProviderRateLimitError("429", provider="hcx", status_code=429),
+            "질문3": ProviderAuthError("403", provider="hcx", status_code=403),
+        })
+        result = GenerationService(generator, max_workers=max_workers).generate_missing_answers(data_list)
+
+        assert data_list[1].answer == "답변: 질문1"
+        assert generator.calls.count("질문1") == 2
+        assert generator.calls.count("질문3") == 1
+        assert result.failures == 1
+        assert result.failure_details[0]["error_type"] == "ProviderAuthError"
+        assert result.failed_row_reasons() == {3: "generation_failed: ProviderAuthError"}
+
+    def test_iter_generated_retries_retryable_failures_last(self):
+        data_list = _make_data(3)
+        generator = FlakyProviderGenerator({"질문0": ProviderRateLimitError("429", provider="gemini")})
+
+        results = list(GenerationService(generator).iter_generated(data_list))
+
+        assert results == [(1, None), (2, None), (0, None)]
+        assert data_list[0].answer == "답변: 질문0"
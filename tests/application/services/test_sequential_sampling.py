@@ -0,0 +1,124 @@
+"""순차 표본 추출 서비스 테스트"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.application.services.sequential_sampling import (
+    SequentialSamplingConfig,
+    confidence_intervals,
+    sampling_order,
+    targets_reached,
+)
+from src.domain.entities.evaluation_data import EvaluationData
+
+
+def _make_data(contexts):
+    return [
+        EvaluationData(question=f"질문{i}", contexts=[ctx], answer="답변", ground_truth="정답")
+        for i, ctx in enumerate(contexts)
+    ]
+
+
+class TestSamplingOrder:
+    """평가 순서 테스트"""
+
+    def test_order_is_a_seeded_permutation(self):
+        data = _make_data(["c"] * 20)
+        order = sampling_order(data, seed=7)
+
+        assert sorted(order) == list(range(20))
+        assert order == sampling_order(data, seed=7)
+        assert order != sampling_order(data, seed=8)
+
+    def test_stratified_prefix_keeps_stratum_proportions(self):
+        data = _make_data(["A"] * 30 + ["B"] * 10)
+        order = sampling_order(data, stratify_by="contexts", seed=1)
+
+        prefix = [data[i].contexts[0] for i in order[:8]]
+        assert prefix.count("A") == 6
+        assert prefix.count("B") == 2
+
+
+class TestConfidenceIntervals:
+    """신뢰구간 계산 테스트"""
+
+    def test_t_interval_matches_formula(self):
+        values = [0.2, 0.4, 0.6, 0.8]
+        rows = [{"faithfulness": v} for v in values]
+        interval = confidence_intervals(rows, ["faithfulness"])["faithfulness"]
+
+        expected = 3.182446 * np.std(values, ddof=1) / 2
+        assert interval["mean"] == pytest.approx(0.5)
+        assert interval["half_width"] == pytest.approx(expected, rel=1e-4)
+
+    def test_failed_scores_are_excluded(self):
+        rows = [{"faithfulness": 0.5}, {"faithfulness": None}, {"faithfulness": 0.7}]
+        interval = confidence_intervals(rows, ["faithfulness"])["faithfulness"]
+
+        assert interval["n"] == 2
+        assert interval["mean"] == pytest.approx(0.6)
+
+    @pytest.mark.parametrize("method", ["t", "bootstrap"])
+    def test_interval_narrows_with_more_samples(self, method):
+        rng = random.Random(0)
+        rows = [{"faithfulness": rng.random(), "context_recall": rng.random()} for _ in range(400)]
+
+        small = confidence_intervals(rows[:25], ["faithfulness", "context_recall"], method=method)
+        large = confidence_intervals(rows, ["faithfulness", "context_recall"], method=method)
+
+        assert large["ragas_score"]["half_width"] < small["ragas_score"]["half_width"]
+        assert large["ragas_score"]["lower"] <= large["ragas_score"]["mean"] <= large["ragas_score"]["upper"]
+
+    def test_ragas_score_interval_is_centered_on_reported_estimate(self):
+        rows = [
+            {"a": 0.9, "b": None},
+            {"a": 0.8, "b": 0.1},
+            {"a": 0.85, "b": 0.2},
+            {"a": 0.95, "b": None},
+        ]
+        interval = confidence_intervals(rows, ["a", "b"])["ragas_score"]
+
+        assert interval["mean"] == pytest.approx(0.5125)
+        assert interval["lower"] == pytest.approx(interval["mean"] - interval["half_width"])
+        assert interval["upper"] == pytest.approx(interval["mean"] + interval["half_width"])
+
+    def test_ragas_score_interval_matches_row_means_without_missing_values(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.uniform(0.1, 1.0, size=(50, 3))
+        rows = [dict(zip("abc", row)) for row in matrix]
+
+        interval = confidence_intervals(rows, list("abc"))["ragas_score"]
+        row_means = matrix.mean(axis=1)
+
+        assert interval["mean"] == pytest.approx(row_means.mean())
+        assert interval["half_width"] == pytest.approx(2.009575 * row_means.std(ddof=1) / np.sqrt(50), rel=1e-4)
+
+    def test_bounds_are_clipped_to_score_range(self):
+        rows = [{"faithfulness": v} for v in (0.0, 0.05, 1.0)]
+        interval = confidence_intervals(rows, ["faithfulness"])["faithfulness"]
+
+        assert interval["lower"] == 0.0
+        assert interval["upper"] == 1.0
+
+    def test_single_sample_has_infinite_width(self):
+        intervals = confidence_intervals([{"faithfulness": 0.5}], ["faithfulness"])
+        assert intervals["ragas_score"]["half_width"] == float("inf")
+
+
+class TestTargetsReached:
+    """종료 조건 테스트"""
+
+    def test_requires_min_samples_and_all_requested_metrics(self):
+        config = SequentialSamplingConfig(target_half_width=0.05, metrics=("ragas_score", "faithfulness"), min_samples=10)
+        intervals = {"ragas_score": {"half_width": 0.01}, "faithfulness": {"half_width": 0.08}}
+
+        assert not targets_reached(intervals, config, evaluated=50)
+        intervals["faithfulness"]["half_width"] = 0.04
+        assert not targets_reached(intervals, config, evaluated=5)
+        assert targets_reached(intervals, config, evaluated=50)
+
+    def test_invalid_config_raises(self):
+        with pytest.raises(ValueError):
+            SequentialSamplingConfig(target_half_width=0.0)
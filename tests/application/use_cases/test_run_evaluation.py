@@ -1,8 +1,12 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from datasets import Dataset
 
+from src.application.services.generation_service import GenerationResult
 from src.application.use_cases import RunEvaluationUseCase
+from src.application.use_cases.commands import EvaluationContext, RunEvaluationCommand
 from src.domain import EvaluationData, EvaluationError, EvaluationResult
 from src.domain.prompts import PromptType
 
@@ -59,4 +63,32 @@ def test_run_evaluation_basic_dependency_injection(mock_dependencies):
     assert use_case.repository_factory is not None
     assert use_case.data_validator is not None
     assert use_case.generation_service is not None
-    assert use_case.result_conversion_service is not None
\ No newline at end of file
+    assert use_case.result_conversion_service is not None
+
+def test_generation_failed_rows_are_not_judged():
+    """답변 생성에 실패한 행은 평가하지 않고 abandoned_cells에 사유를 남기는지 테스트합니다."""
+    runner = MagicMock()
+    runner.llm = SimpleNamespace(model="judge", temperature=0.0)
+    runner.evaluation_context.get_metrics.return_value = [SimpleNamespace(name="faithfulness")]
+    runner.evaluate.side_effect = lambda dataset: {
+        "faithfulness": 0.5,
+        "individual_scores": [{"faithfulness": 0.5} for _ in range(len(dataset))],
+    }
+    context = EvaluationContext(dataset_name="test", raw_data=[])
+    context.ragas_dataset = Dataset.from_dict({"question": ["q0", "q1", "q2"]})
+    context.generation_result = GenerationResult(
+        failures=1,
+        successes=2,
+        failure_details=[{"item_index": 2, "error_type": "ProviderAuthError", "error_message": "403"}],
+    )
+
+    with patch("builtins.print"):
+        RunEvaluationCommand(runner).execute(context)
+
+    evaluated = runner.evaluate.call_args.kwargs["dataset"]
+    assert list(evaluated["question"]) == ["q0", "q2"]
+    report = context.evaluation_result_dict
+    assert [row["faithfulness"] for row in report["individual_scores"]] == [0.5, None, 0.5]
+    assert report["metadata"]["abandoned_cells"] == [
+        {"row": 1, "metric": "faithfulness", "reason": "generation_failed: ProviderAuthError"}
+    ]
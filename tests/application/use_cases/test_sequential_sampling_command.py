@@ -0,0 +1,81 @@
+"""순차 표본 평가 명령 테스트"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.application.services.generation_service import GenerationService
+from src.application.services.sequential_sampling import SequentialSamplingConfig
+from src.application.use_cases.commands import EvaluationContext, SequentialSamplingEvaluationCommand
+from src.domain import EvaluationData
+
+METRIC_NAMES = ["faithfulness", "context_recall"]
+
+
+class ScoreRunner:
+    """질문 번호로 점수를 정하는 평가기 (spread가 클수록 분산 증가)"""
+
+    def __init__(self, spread):
+        self.spread = spread
+        self.evaluated = 0
+        self.llm = SimpleNamespace(model="judge", temperature=0.0)
+        metrics = [SimpleNamespace(name=name) for name in METRIC_NAMES]
+        strategy = SimpleNamespace(get_strategy_name=lambda: "fake")
+        self.evaluation_context = SimpleNamespace(get_metrics=lambda: metrics, primary_strategy=strategy)
+
+    def evaluate(self, dataset):
+        self.evaluated += len(dataset)
+        scores = []
+        for question in dataset["question"]:
+            offset = (int(question.removeprefix("질문")) % 2 - 0.5) * self.spread
+            scores.append({name: 0.5 + offset for name in METRIC_NAMES})
+        return {"individual_scores": scores}
+
+
+class EchoGenerator:
+    def generate_answer(self, question, contexts):
+        return f"답변: {question}"
+
+
+def _run(runner, count, **config_kwargs):
+    data = []
+    for i in range(count):
+        item = EvaluationData(question=f"질문{i}", contexts=["컨텍스트"], answer="답변", ground_truth="정답")
+        item.answer = ""
+        data.append(item)
+    config = SequentialSamplingConfig(batch_size=10, min_samples=20, **config_kwargs)
+    command = SequentialSamplingEvaluationCommand(GenerationService(EchoGenerator()), runner, config)
+    context = EvaluationContext(dataset_name="test", raw_data=data)
+    with patch("builtins.print"):
+        command.execute(context)
+    return context, data
+
+
+class TestSequentialSamplingCommand:
+    """순차 표본 평가 명령 테스트"""
+
+    def test_stops_early_when_target_is_reached(self):
+        runner = ScoreRunner(spread=0.02)
+        context, data = _run(runner, 200, target_half_width=0.02)
+        report = context.evaluation_result_dict
+        sampling = report["metadata"]["sequential_sampling"]
+
+        assert runner.evaluated == 20
+        assert sampling["stopped_early"] is True
+        assert sampling["evaluated_rows"] == 20
+        assert sampling["confidence_intervals"]["ragas_score"]["half_width"] <= 0.02
+        assert sampling["sample_indices"] == sorted(sampling["sample_indices"])
+        assert len(report["individual_scores"]) == len(context.ragas_dataset) == 20
+        assert report["ragas_score"] == pytest.approx(0.5, abs=0.01)
+        # 평가하지 않은 행은 답변도 생성하지 않음
+        assert sum(1 for item in data if item.answer) == 20
+
+    def test_evaluates_all_rows_when_target_is_unreachable(self):
+        runner = ScoreRunner(spread=0.8)
+        context, _ = _run(runner, 50, target_half_width=0.001, metrics=("faithfulness",))
+        sampling = context.evaluation_result_dict["metadata"]["sequential_sampling"]
+
+        assert runner.evaluated == 50
+        assert sampling["stopped_early"] is False
+        assert context.generation_result.successes == 50
@@ -0,0 +1,128 @@
+"""스트리밍 생성-평가 명령 테스트"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.application.services.generation_service import GenerationService
+from src.application.use_cases import RunEvaluationUseCase
+from src.application.use_cases.commands import EvaluationContext, StreamingEvaluationCommand
+from src.domain import EvaluationData
+
+METRIC_NAMES = ["faithfulness", "answer_relevancy"]
+
+
+class SlowGenerator:
+    """지연 후 답변을 돌려주는 생성기 (완료 시각 기록)"""
+
+    def __init__(self, delay=0.05, fail_on=()):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.finished_at = []
+
+    def generate_answer(self, question, contexts):
+        time.sleep(self.delay)
+        self.finished_at.append(time.monotonic())
+        if question in self.fail_on:
+            raise RuntimeError("생성 실패")
+        return f"답변: {question}"
+
+
+class RecordingRunner:
+    """평가한 배치와 시각을 기록하고 질문 번호를 점수로 돌려주는 평가기"""
+
+    def __init__(self, fail_batch_with=None):
+        self.batches = []
+        self.started_at = []
+        self.fail_batch_with = fail_batch_with
+        self.llm = SimpleNamespace(model="judge", temperature=0.0)
+        metrics = [SimpleNamespace(name=name) for name in METRIC_NAMES]
+        strategy = SimpleNamespace(get_strategy_name=lambda: "fake")
+        self.evaluation_context = SimpleNamespace(get_metrics=lambda: metrics, primary_strategy=strategy)
+
+    def evaluate(self, dataset):
+        self.started_at.append(time.monotonic())
+        questions = list(dataset["question"])
+        self.batches.append(questions)
+        if self.fail_batch_with in questions:
+            raise RuntimeError("평가 실패")
+        scores = [{name: int(q.removeprefix("질문")) / 10 for name in METRIC_NAMES} for q in questions]
+        return {"individual_scores": scores}
+
+
+def _make_data(count, answered=()):
+    data_list = []
+    for i in range(count):
+        data = EvaluationData(
+            question=f"질문{i}", contexts=["컨텍스트"], answer="기존 답변", ground_truth="정답"
+        )
+        if i not in answered:
+            data.answer = ""
+        data_list.append(data)
+    return data_list
+
+
+def _run(command, data):
+    context = EvaluationContext(dataset_name="test", raw_data=data)
+    with patch("builtins.print"):
+        command.execute(context)
+    return context
+
+
+class TestStreamingEvaluationCommand:
+    """스트리밍 명령 테스트"""
+
+    def test_evaluation_starts_before_generation_finishes(self):
+        generator = SlowGenerator()
+        runner = RecordingRunner()
+        command = StreamingEvaluationCommand(
+            GenerationService(generator, max_workers=2), runner, batch_size=2, flush_interval=0.01
+        )
+        context = _run(command, _make_data(8))
+
+        assert runner.started_at[0] < max(generator.finished_at)
+        assert sorted(q for batch in runner.batches for q in batch) == sorted(f"질문{i}" for i in range(8))
+
+    def test_scores_are_merged_in_input_order(self):
+        command = StreamingEvaluationCommand(
+            GenerationService(SlowGenerator(delay=0.0), max_workers=3), RecordingRunner(), batch_size=3
+        )
+        context = _run(command, _make_data(7, answered=(5,)))
+        report = context.evaluation_result_dict
+
+        assert [s["faithfulness"] for s in report["individual_scores"]] == [i / 10 for i in range(7)]
+        assert report["faithfulness"] == pytest.approx(0.3)
+        assert report["ragas_score"] == pytest.approx(0.3)
+        assert len(context.ragas_dataset) == 7
+        assert context.generation_result.successes == 7
+
+    def test_generation_and_batch_failures_are_isolated(self):
+        generator = SlowGenerator(delay=0.0, fail_on=("질문2",))
+        command = StreamingEvaluationCommand(
+            GenerationService(generator), RecordingRunner(fail_batch_with="질문4"), batch_size=2
+        )
+        context = _run(command, _make_data(6))
+        scores = context.evaluation_result_dict["individual_scores"]
+
+        assert context.generation_result.failures == 1
+        assert context.generation_result.failure_details[0]["item_index"] == 3
+        # 답변 생성에 실패한 질문2는 평가하지 않고 사유만 기록
+        assert [s["faithfulness"] for s in scores] == [0.0, 0.1, None, 0.3, None, None]
+        assert all("질문2" not in batch for batch in command.evaluation_runner.batches)
+        abandoned = context.evaluation_result_dict["metadata"]["abandoned_cells"]
+        assert any(cell["reason"].startswith("generation_failed") for cell in abandoned)
+
+    def test_use_case_builds_streaming_pipeline(self):
+        dependencies = {
+            name: MagicMock()
+            for name in [
+                "llm_port", "evaluation_runner_factory", "repository_factory",
+                "data_validator", "generation_service", "result_conversion_service",
+            ]
+        }
+        use_case = RunEvaluationUseCase(**dependencies, streaming=True)
+
+        assert "스트리밍" in use_case.get_pipeline_info()
+        assert len(use_case.pipeline.commands) == 4
@@ -213,11 +213,11 @@ class TestConfigAndEnvironment:
         # 유효한 LLM
         for llm in SUPPORTED_LLM_TYPES:
             # 검증 함수가 있다면 테스트
-            assert llm in ['gemini', 'hcx']
+            assert llm in ['gemini', 'hcx', 'simulated']
         
         # 유효한 임베딩 모델
         for embedding in SUPPORTED_EMBEDDING_TYPES:
-            assert embedding in ['gemini', 'hcx', 'bge_m3']
+            assert embedding in ['gemini', 'hcx', 'bge_m3', 'simulated']
 
     def test_configuration_consistency(self):
         """설정 일관성 테스트"""
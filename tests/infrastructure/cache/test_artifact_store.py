@@ -0,0 +1,131 @@
+"""중간 산출물 저장소 테스트"""
+
+import asyncio
+import threading
+
+from src.infrastructure.cache.artifact_store import ArtifactStore
+
+
+def _store(tmp_path, mode="read-write"):
+    return ArtifactStore(tmp_path / "artifacts.db", mode=mode)
+
+
+class ThreadRecordingStore(ArtifactStore):
+    """SQLite 조회/저장이 실행된 스레드를 기록하는 저장소"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.io_threads = []
+
+    def get(self, key):
+        self.io_threads.append(("get", threading.get_ident()))
+        return super().get(key)
+
+    def put(self, key, kind, value):
+        self.io_threads.append(("put", threading.get_ident()))
+        super().put(key, kind, value)
+
+
+class TestArtifactStore:
+    """저장/조회와 모드별 동작 테스트"""
+
+    def test_key_depends_on_every_part(self):
+        key = ArtifactStore.make_key("statements", "HCX-005", "prompt", {"answer": "답변"})
+        assert key == ArtifactStore.make_key("statements", "HCX-005", "prompt", {"answer": "답변"})
+        assert key != ArtifactStore.make_key("nli_verdicts", "HCX-005", "prompt", {"answer": "답변"})
+        assert key != ArtifactStore.make_key("statements", "gemini-2.5-flash", "prompt", {"answer": "답변"})
+        assert key != ArtifactStore.make_key("statements", "HCX-005", "prompt", {"answer": "다른 답변"})
+
+    def test_persists_across_instances(self, tmp_path):
+        _store(tmp_path).put("k", "statements", {"statements": ["문장"]})
+        assert _store(tmp_path).get("k") == {"statements": ["문장"]}
+
+    def test_read_only_keeps_values_in_memory_only(self, tmp_path):
+        store = _store(tmp_path, mode="read-only")
+        store.put("k", "statements", {"statements": ["문장"]})
+
+        assert store.get("k") == {"statements": ["문장"]}
+        assert _store(tmp_path).get("k") is None
+
+    def test_off_mode_always_computes(self, tmp_path):
+        store = _store(tmp_path, mode="off")
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return [0.1]
+
+        async def run():
+            await store.aget_or_compute("k", "embedding", compute)
+            await store.aget_or_compute("k", "embedding", compute)
+
+        asyncio.run(run())
+        assert len(calls) == 2
+        assert not (tmp_path / "artifacts.db").exists()
+
+
+class TestAgetOrCompute:
+    """동시 요청 공유 테스트"""
+
+    def test_concurrent_requests_share_one_computation(self, tmp_path):
+        store = _store(tmp_path)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"statements": ["문장"]}
+
+        async def run():
+            return await asyncio.gather(*(store.aget_or_compute("k", "statements", compute) for _ in range(3)))
+
+        assert asyncio.run(run()) == [{"statements": ["문장"]}] * 3
+        assert len(calls) == 1
+        assert store.get_stats()["shared"] == 2
+
+    def test_failed_computation_lets_waiters_retry(self, tmp_path):
+        store = _store(tmp_path)
+        attempts = []
+
+        async def compute():
+            attempts.append(1)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise RuntimeError("판정 실패")
+            return {"statements": ["문장"]}
+
+        async def run():
+            return await asyncio.gather(
+                store.aget_or_compute("k", "statements", compute),
+                store.aget_or_compute("k", "statements", compute),
+                return_exceptions=True,
+            )
+
+        first, second = asyncio.run(run())
+        assert isinstance(first, RuntimeError)
+        assert second == {"statements": ["문장"]}
+
+    def test_rejected_value_is_not_stored(self, tmp_path):
+        store = _store(tmp_path)
+
+        async def compute():
+            return {"statements": []}
+
+        asyncio.run(store.aget_or_compute("k", "statements", compute, should_store=lambda value: False))
+        assert store.get("k") is None
+
+    def test_store_io_runs_off_event_loop(self, tmp_path):
+        store = ThreadRecordingStore(tmp_path / "artifacts.db")
+
+        async def compute():
+            return {"statements": ["문장"]}
+
+        async def run():
+            loop_thread = threading.get_ident()
+            value = await store.aget_or_compute("k", "statements", compute)
+            return loop_thread, value
+
+        loop_thread, value = asyncio.run(run())
+        assert value == {"statements": ["문장"]}
+        assert [operation for operation, _ in store.io_threads] == ["get", "put"]
+        assert all(thread != loop_thread for _, thread in store.io_threads)
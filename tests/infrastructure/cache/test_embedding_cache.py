@@ -0,0 +1,141 @@
+"""영구 임베딩 캐시 테스트"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.cache.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+
+class CountingEmbeddings(Embeddings):
+    """배치 호출 내역을 기록하는 가짜 임베딩"""
+
+    model_name = "counting"
+
+    def __init__(self):
+        self.batches = []
+
+    def _vector(self, text):
+        return [float(len(text)), 0.5, -0.25]
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.batches.append([text])
+        return self._vector(text)
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+def _cached(tmp_path, mode="read-write", dtype="float32"):
+    inner = CountingEmbeddings()
+    return CachedEmbeddings(inner, EmbeddingCache(tmp_path, mode=mode, dtype=dtype)), inner
+
+
+class TestEmbeddingCache:
+    """조회/저장과 모드별 동작 테스트"""
+
+    def test_only_missing_texts_are_sent_in_one_batch(self, tmp_path):
+        embeddings, inner = _cached(tmp_path)
+        embeddings.embed_documents(["가", "나나"])
+
+        result = embeddings.embed_documents(["나나", "다다다", "가", "다다다"])
+
+        assert inner.batches == [["가", "나나"], ["다다다"]]
+        assert result == [[2.0, 0.5, -0.25], [3.0, 0.5, -0.25], [1.0, 0.5, -0.25], [3.0, 0.5, -0.25]]
+        stats = embeddings.store.get_stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (2, 3, 3)
+        assert stats["bytes_saved"] == 2 * 3 * 4
+
+    def test_persists_across_instances(self, tmp_path):
+        _cached(tmp_path)[0].embed_query("질문")
+
+        embeddings, inner = _cached(tmp_path)
+
+        assert embeddings.embed_query("질문") == [2.0, 0.5, -0.25]
+        assert inner.batches == []
+
+    def test_float16_round_trip_is_approximate(self, tmp_path):
+        store = EmbeddingCache(tmp_path, dtype="float16")
+        store.put_many("m", {"가": [0.1234567, -0.7654321]})
+
+        vector = EmbeddingCache(tmp_path, dtype="float16").get_many("m", ["가"])["가"]
+
+        assert vector == pytest.approx([0.1234567, -0.7654321], abs=1e-3)
+        assert store.get_stats()["file_bytes"] == 2 * 2
+        # 형식별로 따로 저장
+        assert EmbeddingCache(tmp_path).get_many("m", ["가"]) == {}
+
+    def test_zero_vectors_are_not_stored(self, tmp_path):
+        embeddings, inner = _cached(tmp_path)
+        inner._vector = lambda text: [0.0, 0.0, 0.0]
+
+        embeddings.embed_documents(["실패"])
+        embeddings.embed_documents(["실패"])
+
+        assert inner.batches == [["실패"], ["실패"]]
+
+    def test_read_only_does_not_write(self, tmp_path):
+        embeddings, inner = _cached(tmp_path, mode="read-only")
+        embeddings.embed_documents(["가"])
+        embeddings.embed_documents(["가"])
+
+        assert len(inner.batches) == 2
+        assert not (tmp_path / "embeddings_float32.bin").exists()
+
+    def test_off_mode_forwards_directly(self, tmp_path):
+        embeddings, inner = _cached(tmp_path, mode="off")
+        embeddings.embed_documents(["가"])
+
+        assert inner.batches == [["가"]]
+        assert not (tmp_path / "embeddings.db").exists()
+
+    def test_model_id_separates_models(self, tmp_path):
+        embeddings, _ = _cached(tmp_path)
+        embeddings.embed_query("가")
+
+        assert embeddings.model_id == "CountingEmbeddings:counting"
+        assert embeddings.model_name == "counting"
+        assert embeddings.store.get_many("OtherEmbeddings:counting", ["가"]) == {}
+
+    def test_async_documents_use_cache(self, tmp_path):
+        embeddings, inner = _cached(tmp_path)
+
+        first = asyncio.run(embeddings.aembed_documents(["가", "나나"]))
+        second = asyncio.run(embeddings.aembed_documents(["나나"]))
+
+        assert second == [first[1]]
+        assert inner.batches == [["가", "나나"]]
+
+    def test_async_lookup_and_store_do_not_block_event_loop(self, tmp_path):
+        embeddings, _ = _cached(tmp_path)
+        store = embeddings.store
+        get_many, put_many = store.get_many, store.put_many
+
+        def slow_get_many(*args):
+            time.sleep(0.1)
+            return get_many(*args)
+
+        def slow_put_many(*args):
+            time.sleep(0.1)
+            return put_many(*args)
+
+        store.get_many, store.put_many = slow_get_many, slow_put_many
+
+        async def run():
+            ticks = 0
+            task = asyncio.ensure_future(embeddings.aembed_documents(["가", "나나"]))
+            while not task.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return ticks, task.result()
+
+        ticks, vectors = asyncio.run(run())
+
+        assert len(vectors) == 2
+        assert ticks >= 10
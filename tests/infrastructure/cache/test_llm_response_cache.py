@@ -0,0 +1,108 @@
+"""LLM 응답 캐시 테스트"""
+
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.infrastructure.cache.llm_response_cache import LlmCacheMode, LlmResponseCache
+
+
+@pytest.fixture
+def temp_cache_path():
+    """임시 캐시 데이터베이스 경로 생성"""
+    with TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "llm_responses.db"
+
+
+class TestLlmResponseCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_same_request_produces_same_key(self):
+        key1 = LlmResponseCache.make_key("HCX-005", "질문", 0.5, 4096, [])
+        key2 = LlmResponseCache.make_key("HCX-005", "질문", 0.5, 4096, None)
+        assert key1 == key2
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("gemini-2.5-flash", "질문", 0.5, 4096, []),
+            ("HCX-005", "다른 질문", 0.5, 4096, []),
+            ("HCX-005", "질문", 0.1, 4096, []),
+            ("HCX-005", "질문", 0.5, 1024, []),
+            ("HCX-005", "질문", 0.5, 4096, ["\n"]),
+        ],
+    )
+    def test_any_parameter_change_produces_new_key(self, changed):
+        base = LlmResponseCache.make_key("HCX-005", "질문", 0.5, 4096, [])
+        assert LlmResponseCache.make_key(*changed) != base
+
+
+class TestLlmResponseCacheModes:
+    """캐시 모드별 동작 테스트"""
+
+    def test_read_write_roundtrip_and_counters(self, temp_cache_path):
+        cache = LlmResponseCache(db_path=temp_cache_path)
+        key = cache.make_key("HCX-005", "질문", 0.5, 4096)
+
+        assert cache.get(key) is None
+        cache.put(key, "HCX-005", '{"answer": "응답"}')
+        assert cache.get(key) == '{"answer": "응답"}'
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["writes"] == 1
+        assert stats["entries"] == 1
+
+    def test_read_only_does_not_store(self, temp_cache_path):
+        LlmResponseCache(db_path=temp_cache_path).put("existing", "m", "저장된 응답")
+
+        cache = LlmResponseCache(db_path=temp_cache_path, mode=LlmCacheMode.READ_ONLY)
+        cache.put("new", "m", "새 응답")
+
+        assert cache.get("existing") == "저장된 응답"
+        assert cache.get("new") is None
+
+    def test_off_mode_skips_database(self, temp_cache_path):
+        cache = LlmResponseCache(db_path=temp_cache_path, mode="off")
+        cache.put("key", "m", "응답")
+
+        assert cache.get("key") is None
+        assert not temp_cache_path.exists()
+
+    def test_invalid_mode_raises(self, temp_cache_path):
+        with pytest.raises(ValueError):
+            LlmResponseCache(db_path=temp_cache_path, mode="write-only")
+
+
+class TestLlmResponseCacheEviction:
+    """캐시 정리 테스트"""
+
+    def test_expired_entries_are_ignored_and_evicted(self, temp_cache_path):
+        cache = LlmResponseCache(db_path=temp_cache_path, max_age_days=1)
+        cache.put("old", "m", "오래된 응답")
+
+        with cache._get_connection() as conn:
+            conn.execute(
+                "UPDATE llm_responses SET created_at = ?", (time.time() - 2 * 86400,)
+            )
+
+        assert cache.get("old") is None
+        assert cache.evict() == 1
+
+    def test_size_limit_removes_least_recently_used(self, temp_cache_path):
+        cache = LlmResponseCache(db_path=temp_cache_path, max_size_mb=0)
+        payload = "x" * 600
+        for i in range(3):
+            cache.put(f"key{i}", "m", payload)
+            with cache._get_connection() as conn:
+                conn.execute(
+                    "UPDATE llm_responses SET last_access = ? WHERE key = ?", (i, f"key{i}")
+                )
+
+        cache.max_size_mb = 1300 / (1024 * 1024)
+        assert cache.evict() == 1
+        assert cache.get("key0") is None
+        assert cache.get("key2") == payload
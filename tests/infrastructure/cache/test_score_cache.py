@@ -0,0 +1,90 @@
+"""샘플별 점수 캐시 테스트"""
+
+import pytest
+
+from src.infrastructure.cache.score_cache import ScoreCache
+
+SAMPLE = {
+    "question": "질문",
+    "contexts": ["컨텍스트"],
+    "answer": "답변",
+    "ground_truth": "정답",
+}
+
+
+def _key(sample=SAMPLE, metric="faithfulness", judge="HCX-005", embedding="bge-m3", prompt="default"):
+    return ScoreCache.make_key(sample, metric, judge, embedding, prompt)
+
+
+class TestScoreCacheKey:
+    """점수 키 생성 테스트"""
+
+    def test_same_inputs_produce_same_key(self):
+        assert _key() == _key(sample=dict(SAMPLE, extra="무시되는 필드"))
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"sample": dict(SAMPLE, answer="다른 답변")},
+            {"sample": dict(SAMPLE, contexts=["다른 컨텍스트"])},
+            {"metric": "answer_relevancy"},
+            {"judge": "gemini-2.5-flash"},
+            {"embedding": "text-embedding-004"},
+            {"prompt": "korean_tech"},
+        ],
+    )
+    def test_any_input_change_produces_new_key(self, changed):
+        assert _key(**changed) != _key()
+
+    @pytest.mark.parametrize("metric", ["context_recall", "context_precision"])
+    def test_answer_independent_metric_ignores_answer(self, metric):
+        variant = dict(SAMPLE, answer="다른 답변")
+        assert _key(sample=variant, metric=metric) == _key(metric=metric)
+
+    def test_answer_relevancy_ignores_contexts_but_not_answer(self):
+        assert _key(sample=dict(SAMPLE, contexts=["다른 컨텍스트"]), metric="answer_relevancy") == _key(
+            metric="answer_relevancy"
+        )
+        assert _key(sample=dict(SAMPLE, answer="다른 답변"), metric="answer_relevancy") != _key(
+            metric="answer_relevancy"
+        )
+
+    def test_unknown_metric_depends_on_all_fields(self):
+        assert _key(sample=dict(SAMPLE, ground_truth="다른 정답"), metric="custom_metric") != _key(
+            metric="custom_metric"
+        )
+
+
+class TestScoreCacheStorage:
+    """점수 저장/조회 테스트"""
+
+    def test_put_and_get_many(self, tmp_path):
+        cache = ScoreCache(db_path=tmp_path / "scores.db")
+        cache.put_many([("k1", "faithfulness", 0.8), ("k2", "faithfulness", 0.0)])
+
+        assert cache.get_many(["k1", "k2", "k3"]) == {"k1": 0.8, "k2": 0.0}
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 1
+
+    def test_failed_scores_are_not_stored(self, tmp_path):
+        cache = ScoreCache(db_path=tmp_path / "scores.db")
+        cache.put_many([("none", "faithfulness", None), ("nan", "faithfulness", float("nan"))])
+
+        assert cache.get_many(["none", "nan"]) == {}
+        assert cache.writes == 0
+
+    def test_read_only_mode_does_not_write(self, tmp_path):
+        db_path = tmp_path / "scores.db"
+        ScoreCache(db_path=db_path).put_many([("k1", "faithfulness", 0.5)])
+
+        read_only = ScoreCache(db_path=db_path, mode="read-only")
+        read_only.put_many([("k2", "faithfulness", 0.7)])
+        assert read_only.get_many(["k1", "k2"]) == {"k1": 0.5}
+
+    def test_off_mode_skips_database(self, tmp_path):
+        db_path = tmp_path / "scores.db"
+        cache = ScoreCache(db_path=db_path, mode="off")
+        cache.put_many([("k1", "faithfulness", 0.5)])
+
+        assert cache.get_many(["k1"]) == {}
+        assert not db_path.exists()
@@ -0,0 +1,142 @@
+"""임베딩 어댑터의 비동기(이벤트 루프 비차단) 경로 테스트"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+
+from src.infrastructure.embedding.bge_m3_adapter import BgeM3EmbeddingAdapter
+from src.infrastructure.embedding.gemini_http_adapter import GeminiHttpEmbeddingAdapter
+from src.infrastructure.embedding.hcx_adapter import HcxEmbeddingAdapter
+from src.infrastructure.network.rate_limiter import AdaptiveRateLimiter
+from src.infrastructure.network.transport import HttpTransport, RetryPolicy
+
+DELAY = 0.2
+
+
+class SlowModel:
+    """CPU 인코딩을 흉내 내는 느린 동기 모델"""
+
+    max_seq_length = 8192
+
+    def __init__(self):
+        self.threads = []
+
+    def encode(self, sentences, **kwargs):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(DELAY)
+        if isinstance(sentences, str):
+            return np.ones(4, dtype=np.float32)
+        return np.ones((len(sentences), 4), dtype=np.float32)
+
+
+async def _ticks_during(coroutine):
+    """coroutine이 실행되는 동안 이벤트 루프가 처리한 틱 수와 결과"""
+    ticks = 0
+    task = asyncio.ensure_future(coroutine)
+    while not task.done():
+        ticks += 1
+        await asyncio.sleep(0.01)
+    return ticks, task.result()
+
+
+def _mock_transport(handler):
+    return HttpTransport(async_transport=httpx.MockTransport(handler))
+
+
+class TestBgeM3Async:
+    """BGE-M3 비동기 임베딩 테스트"""
+
+    def _adapter(self):
+        adapter = BgeM3EmbeddingAdapter(device="cpu")
+        adapter.model = SlowModel()
+        adapter._initialized = True
+        return adapter
+
+    def test_encoding_runs_off_the_event_loop(self):
+        adapter = self._adapter()
+
+        ticks, vectors = asyncio.run(_ticks_during(adapter.aembed_documents(["가", "나"])))
+
+        assert vectors == [[1.0] * 4, [1.0] * 4]
+        assert ticks >= 5
+        assert adapter.model.threads == ["bge-m3-encode_0"]
+
+    def test_query_uses_same_dedicated_thread(self):
+        adapter = self._adapter()
+
+        async def run():
+            return await asyncio.gather(adapter.aembed_query("가"), adapter.aembed_query("나"))
+
+        assert asyncio.run(run()) == [[1.0] * 4, [1.0] * 4]
+        assert set(adapter.model.threads) == {"bge-m3-encode_0"}
+
+
+class TestHttpEmbeddingsAsync:
+    """HTTP 임베딩 어댑터의 네이티브 비동기 요청 테스트"""
+
+    def test_gemini_documents_are_requested_concurrently(self):
+        async def handler(request):
+            await asyncio.sleep(DELAY)
+            return httpx.Response(200, json={"embedding": {"values": [0.1, 0.2]}})
+
+        adapter = GeminiHttpEmbeddingAdapter(api_key="fake-key", model_name="text-embedding-004")
+        with patch(
+            "src.infrastructure.embedding.gemini_http_adapter.get_transport",
+            return_value=_mock_transport(handler),
+        ):
+            start = time.perf_counter()
+            vectors = asyncio.run(adapter.aembed_documents(["가", "나", "다", "라"]))
+            elapsed = time.perf_counter() - start
+
+        assert vectors == [[0.1, 0.2]] * 4
+        assert elapsed < DELAY * 3
+
+    def test_gemini_failure_returns_zero_vector(self):
+        async def handler(request):
+            return httpx.Response(500, text="error")
+
+        adapter = GeminiHttpEmbeddingAdapter(api_key="fake-key", model_name="text-embedding-004")
+        with patch(
+            "src.infrastructure.embedding.gemini_http_adapter.get_transport",
+            return_value=_mock_transport(handler),
+        ), patch.object(GeminiHttpEmbeddingAdapter, "RETRY_POLICY", RetryPolicy(max_retries=2, base_delay=0.0)):
+            assert asyncio.run(adapter.aembed_query("가")) == [0.0] * 768
+
+    def test_hcx_documents_are_requested_concurrently(self):
+        async def handler(request):
+            await asyncio.sleep(DELAY)
+            return httpx.Response(200, json={"result": {"embedding": [0.3]}})
+
+        limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000, burst=100)
+        with patch("src.infrastructure.embedding.hcx_adapter.get_rate_limiter", return_value=limiter):
+            adapter = HcxEmbeddingAdapter(api_key="fake-key")
+        with patch(
+            "src.infrastructure.embedding.hcx_adapter.get_transport",
+            return_value=_mock_transport(handler),
+        ):
+            start = time.perf_counter()
+            vectors = asyncio.run(adapter.aembed_documents(["가", "나", "다"]))
+            elapsed = time.perf_counter() - start
+
+        assert vectors == [[0.3]] * 3
+        assert elapsed < DELAY * 2
+
+    def test_hcx_throttle_slows_rate_limiter(self):
+        responses = [httpx.Response(429), httpx.Response(200, json={"result": {"embedding": [0.3]}})]
+
+        async def handler(request):
+            return responses.pop(0)
+
+        limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000, burst=100)
+        with patch("src.infrastructure.embedding.hcx_adapter.get_rate_limiter", return_value=limiter):
+            adapter = HcxEmbeddingAdapter(api_key="fake-key")
+        with patch(
+            "src.infrastructure.embedding.hcx_adapter.get_transport",
+            return_value=_mock_transport(handler),
+        ):
+            assert asyncio.run(adapter.aembed_query("가")) == [0.3]
+        assert limiter.current_rate < 1000
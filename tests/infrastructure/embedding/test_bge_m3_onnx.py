@@ -0,0 +1,178 @@
+"""BGE-M3 ONNX Runtime 백엔드 테스트"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.infrastructure.embedding.bge_m3_adapter import BgeM3EmbeddingAdapter
+from src.infrastructure.embedding.bge_m3_onnx import (
+    ONNX_CONFIG_FILE,
+    OnnxBgeM3Encoder,
+    check_onnx_export,
+    cosine_agreement,
+    export_bge_m3_onnx,
+)
+
+
+class FakeTokenizer:
+    """텍스트 길이를 토큰 ID로, 글자 수를 토큰 수로 쓰는 가짜 토크나이저 (0은 패딩)"""
+
+    def __call__(self, texts, padding, truncation, max_length, return_tensors):
+        width = min(max(len(text) for text in texts), max_length)
+        input_ids = np.zeros((len(texts), width), dtype=np.int64)
+        attention_mask = np.zeros((len(texts), width), dtype=np.int64)
+        for row, text in enumerate(texts):
+            length = min(len(text), max_length)
+            input_ids[row, :length] = len(text)
+            attention_mask[row, :length] = 1
+        return {"input_ids": input_ids, "attention_mask": attention_mask, "token_type_ids": input_ids * 0}
+
+
+class FakeSession:
+    """토큰마다 [토큰 ID, 1]을 출력하는 가짜 ONNX 세션"""
+
+    def __init__(self):
+        self.batches = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, feeds):
+        self.batches.append(sorted(feeds))
+        ids = feeds["input_ids"].astype(np.float32)
+        return [np.stack([ids, np.ones_like(ids)], axis=-1)]
+
+
+def _write_validated_export(onnx_dir, min_cosine=0.999, min_required=0.99):
+    """검증 결과만 담은 내보내기 설정 작성"""
+    (onnx_dir / ONNX_CONFIG_FILE).write_text(
+        json.dumps({
+            "model_file": "model_int8.onnx",
+            "validation": {"passed": min_cosine >= min_required, "min_cosine": min_cosine, "min_required": min_required},
+        }),
+        encoding="utf-8",
+    )
+
+
+def _encoder(pooling="cls"):
+    return OnnxBgeM3Encoder(FakeSession(), FakeTokenizer(), pooling=pooling, max_seq_length=16)
+
+
+class TestOnnxBgeM3Encoder:
+    """인코더 풀링/정렬/검증 테스트"""
+
+    def test_results_keep_input_order_across_length_sorted_batches(self):
+        encoder = _encoder()
+
+        vectors = encoder.encode(["aaa", "a", "aa"], batch_size=2, normalize_embeddings=False)
+
+        assert vectors.tolist() == [[3.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+        assert len(encoder.session.batches) == 2
+        # 세션이 받지 않는 입력(token_type_ids)은 넘기지 않음
+        assert encoder.session.batches[0] == ["attention_mask", "input_ids"]
+
+    def test_mean_pooling_ignores_padding_and_normalizes(self):
+        vectors = _encoder(pooling="mean").encode(["aaaa", "a"])
+
+        assert vectors[1] == pytest.approx(np.array([1.0, 1.0]) / np.sqrt(2))
+        assert np.linalg.norm(vectors, axis=1) == pytest.approx([1.0, 1.0])
+
+    def test_single_text_returns_one_vector(self):
+        assert _encoder().encode("aa", normalize_embeddings=False).tolist() == [2.0, 1.0]
+
+    def test_cosine_agreement_per_row(self):
+        cosines = cosine_agreement([[1.0, 0.0], [0.0, 2.0]], [[1.0, 0.0], [2.0, 0.0]])
+
+        assert cosines.tolist() == pytest.approx([1.0, 0.0])
+
+    def test_load_requires_export(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            OnnxBgeM3Encoder.load(tmp_path)
+
+    def test_load_refuses_export_that_failed_validation(self, tmp_path):
+        (tmp_path / ONNX_CONFIG_FILE).write_text(
+            json.dumps({"model_file": "model_int8.onnx", "validation": {"passed": False, "min_cosine": 0.9}}),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError):
+            OnnxBgeM3Encoder.load(tmp_path)
+
+    def test_stored_cosine_is_checked_against_current_setting(self, tmp_path):
+        _write_validated_export(tmp_path, min_cosine=0.97, min_required=0.95)
+
+        assert check_onnx_export(tmp_path)["validation"]["passed"]
+        assert check_onnx_export(tmp_path, min_cosine=0.96)
+        with pytest.raises(ValueError):
+            check_onnx_export(tmp_path, min_cosine=0.99)
+
+
+class TestBgeM3Backend:
+    """어댑터 백엔드 선택 테스트"""
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            BgeM3EmbeddingAdapter(backend="tensorrt")
+
+    def test_onnx_vectors_use_separate_cache_identity(self, tmp_path):
+        _write_validated_export(tmp_path)
+        with patch("src.infrastructure.embedding.bge_m3_onnx.onnxruntime_available", return_value=True):
+            adapter = BgeM3EmbeddingAdapter(backend="onnx", onnx_path=str(tmp_path))
+
+        assert BgeM3EmbeddingAdapter().model_name == "BAAI/bge-m3"
+        assert adapter.backend == "onnx"
+        assert adapter.model_name == "BAAI/bge-m3@onnx"
+
+    def test_missing_onnx_export_falls_back_to_torch_identity(self, tmp_path):
+        with patch("src.infrastructure.embedding.bge_m3_onnx.onnxruntime_available", return_value=True):
+            adapter = BgeM3EmbeddingAdapter(backend="onnx", onnx_path=str(tmp_path))
+
+        assert adapter.backend == "torch"
+        assert adapter.model_name == "BAAI/bge-m3"
+
+    def test_export_below_current_setting_falls_back_to_torch(self, tmp_path):
+        _write_validated_export(tmp_path, min_cosine=0.97, min_required=0.95)
+        with patch("src.infrastructure.embedding.bge_m3_onnx.onnxruntime_available", return_value=True):
+            adapter = BgeM3EmbeddingAdapter(backend="onnx", onnx_path=str(tmp_path), onnx_min_cosine=0.99)
+
+        assert adapter.model_name == "BAAI/bge-m3"
+
+    def test_missing_onnxruntime_falls_back_to_torch_identity(self, tmp_path):
+        _write_validated_export(tmp_path)
+        with patch("src.infrastructure.embedding.bge_m3_onnx.onnxruntime_available", return_value=False):
+            adapter = BgeM3EmbeddingAdapter(backend="onnx", onnx_path=str(tmp_path))
+
+        assert adapter.model_name == "BAAI/bge-m3"
+
+
+def test_export_matches_torch_backend(tmp_path):
+    """작은 임의 BERT 모델로 내보내기 -> 양자화 -> 검증 -> 로드 전체 경로 확인"""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+    from sentence_transformers import SentenceTransformer, models
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    bert_dir = tmp_path / "bert"
+    bert_dir.mkdir()
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + list("abcdefghijklmnopqrstuvwxyz원자력수발전.?")
+    (bert_dir / "vocab.txt").write_text("\n".join(vocab), encoding="utf-8")
+    BertTokenizerFast(vocab_file=str(bert_dir / "vocab.txt")).save_pretrained(str(bert_dir))
+    config = BertConfig(
+        vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2, num_attention_heads=2,
+        intermediate_size=64, max_position_embeddings=128,
+    )
+    BertModel(config).save_pretrained(str(bert_dir))
+    transformer = models.Transformer(str(bert_dir), max_seq_length=64)
+    SentenceTransformer(modules=[transformer, models.Pooling(32, "cls"), models.Normalize()]).save(
+        str(tmp_path / "st")
+    )
+
+    result = export_bge_m3_onnx(str(tmp_path / "st"), tmp_path / "onnx", quantize=True, min_cosine=0.95)
+
+    assert result["validation"]["passed"]
+    assert result["model_file"] == "model_int8.onnx"
+    encoder = OnnxBgeM3Encoder.load(tmp_path / "onnx", intra_op_threads=1)
+    assert encoder.encode(["원자력 발전", "a"]).shape == (2, 32)
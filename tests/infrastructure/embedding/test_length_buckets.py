@@ -0,0 +1,112 @@
+"""토큰 길이 기반 배치 계획과 BGE-M3 길이별 배치 임베딩 테스트"""
+
+import numpy as np
+
+from src.infrastructure.embedding.bge_m3_adapter import BgeM3EmbeddingAdapter
+from src.infrastructure.embedding.length_buckets import padded_tokens, plan_token_batches
+
+
+class TestPlanTokenBatches:
+    """배치 계획 테스트"""
+
+    def test_every_index_is_planned_once(self):
+        lengths = [5, 300, 12, 7, 300, 40, 1]
+
+        batches = plan_token_batches(lengths, token_budget=100, max_batch_size=4)
+
+        assert sorted(index for batch in batches for index in batch) == list(range(len(lengths)))
+
+    def test_batches_respect_budget_and_max_size(self):
+        lengths = [10] * 20 + [50] * 6
+
+        batches = plan_token_batches(lengths, token_budget=100, max_batch_size=8)
+
+        for batch in batches:
+            assert len(batch) <= 8
+            assert len(batch) * max(lengths[index] for index in batch) <= 100
+        # 긴 텍스트는 작은 배치로, 짧은 텍스트는 큰 배치로
+        assert [len(batch) for batch in batches] == [2, 2, 2, 8, 8, 4]
+
+    def test_text_longer_than_budget_gets_own_batch(self):
+        batches = plan_token_batches([500, 3, 3], token_budget=100, max_batch_size=8)
+
+        assert batches == [[0], [1, 2]]
+
+    def test_much_shorter_texts_start_new_bucket(self):
+        batches = plan_token_batches([100, 90, 30, 28, 5], token_budget=10_000, max_batch_size=8)
+
+        assert batches == [[0, 1], [2, 3], [4]]
+        assert plan_token_batches([100, 90, 30, 28, 5], 10_000, 8, min_fill=0) == [[0, 1, 2, 3, 4]]
+
+    def test_sorting_reduces_padding(self):
+        lengths = [10, 1000, 10, 1000]
+        input_order = [[0, 1], [2, 3]]
+
+        assert padded_tokens(lengths, plan_token_batches(lengths, 2000, 2)) < padded_tokens(lengths, input_order)
+
+
+class FakeTokenizer:
+    """문자 1개를 토큰 1개로 세는 토크나이저"""
+
+    def __call__(self, texts, add_special_tokens=True, truncation=False, max_length=None):
+        ids = [[0] * len(text) for text in texts]
+        if truncation:
+            ids = [row[:max_length] for row in ids]
+        return {"input_ids": ids}
+
+
+class FakeModel:
+    """인코딩 배치를 기록하고 텍스트 길이를 벡터로 돌려주는 모델"""
+
+    def __init__(self):
+        self.tokenizer = FakeTokenizer()
+        self.max_seq_length = 8192
+        self.calls = []
+
+    def encode(self, sentences, batch_size=32, **kwargs):
+        self.calls.append((list(sentences), batch_size))
+        return np.array([[float(len(text)), 1.0] for text in sentences], dtype=np.float32)
+
+
+class TestBgeM3LengthBucketing:
+    """BGE-M3 어댑터의 길이별 배치 임베딩 테스트"""
+
+    def _adapter(self, **kwargs):
+        adapter = BgeM3EmbeddingAdapter(device="cpu", **kwargs)
+        adapter.model = FakeModel()
+        adapter._initialized = True
+        return adapter
+
+    def test_original_order_is_restored(self):
+        adapter = self._adapter(batch_token_budget=20)
+        texts = ["a" * 15, "b", "c" * 8, "dd", "e" * 15]
+
+        vectors = adapter.embed_documents(texts)
+
+        assert vectors == [[float(len(text)), 1.0] for text in texts]
+
+    def test_each_batch_is_encoded_within_budget(self):
+        adapter = self._adapter(batch_token_budget=20)
+
+        adapter.embed_documents(["a" * 15, "b", "c" * 8, "d" * 7, "e" * 15])
+
+        for sentences, batch_size in adapter.model.calls:
+            assert batch_size == len(sentences)
+            assert len(sentences) * max(len(text) for text in sentences) <= 20
+        assert [len(sentences) for sentences, _ in adapter.model.calls] == [1, 1, 2, 1]
+
+    def test_max_seq_length_truncates_lengths_and_model(self):
+        adapter = self._adapter(max_seq_length=4)
+        adapter._apply_max_seq_length()
+
+        assert adapter.model.max_seq_length == 4
+        assert adapter._token_lengths(["a" * 10, "bb"]) == [4, 2]
+
+    def test_truncation_length_is_part_of_cache_identity(self):
+        assert BgeM3EmbeddingAdapter().model_name == "BAAI/bge-m3"
+        assert BgeM3EmbeddingAdapter(max_seq_length=512).model_name == "BAAI/bge-m3@max512"
+
+    def test_device_default_budget(self):
+        adapter = self._adapter()
+
+        assert adapter._batch_limits() == BgeM3EmbeddingAdapter.BATCH_LIMITS["cpu"]
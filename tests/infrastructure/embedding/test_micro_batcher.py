@@ -0,0 +1,142 @@
+"""임베딩 쿼리 마이크로 배치 테스트"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.cache.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.infrastructure.embedding.micro_batcher import MicroBatchingEmbeddings
+
+
+class RecordingEmbeddings(Embeddings):
+    """배치 호출 내역을 기록하는 가짜 임베딩"""
+
+    model_name = "recording"
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.queries = []
+        self.fail = fail
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("임베딩 실패")
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return [float(len(text))]
+
+    async def aembed_documents(self, texts):
+        await asyncio.sleep(0)
+        return self.embed_documents(texts)
+
+
+def _gather_queries(embeddings, texts):
+    async def run():
+        return await asyncio.gather(*(embeddings.aembed_query(text) for text in texts))
+
+    return asyncio.run(run())
+
+
+class TestAsyncMicroBatching:
+    """비동기 쿼리 배치 테스트"""
+
+    def test_concurrent_queries_become_one_batch(self):
+        inner = RecordingEmbeddings()
+        embeddings = MicroBatchingEmbeddings(inner, max_batch_size=32, max_wait_ms=20)
+
+        vectors = _gather_queries(embeddings, ["a", "bb", "ccc"])
+
+        assert vectors == [[1.0], [2.0], [3.0]]
+        assert inner.batches == [["a", "bb", "ccc"]]
+        assert embeddings.get_stats()["average_batch_size"] == 3
+
+    def test_full_batches_are_sent_without_waiting(self):
+        inner = RecordingEmbeddings()
+        embeddings = MicroBatchingEmbeddings(inner, max_batch_size=4, max_wait_ms=10_000)
+        texts = [str(index) * (index + 1) for index in range(8)]
+
+        start = time.perf_counter()
+        vectors = _gather_queries(embeddings, texts)
+
+        assert time.perf_counter() - start < 1.0
+        assert vectors == [[float(len(text))] for text in texts]
+        assert [len(batch) for batch in inner.batches] == [4, 4]
+
+    def test_partial_batch_waits_at_most_max_wait(self):
+        inner = RecordingEmbeddings()
+        embeddings = MicroBatchingEmbeddings(inner, max_batch_size=32, max_wait_ms=50)
+
+        start = time.perf_counter()
+        assert _gather_queries(embeddings, ["a"]) == [[1.0]]
+
+        assert 0.04 <= time.perf_counter() - start < 1.0
+
+    def test_duplicate_texts_are_encoded_once(self):
+        inner = RecordingEmbeddings()
+        embeddings = MicroBatchingEmbeddings(inner, max_batch_size=32, max_wait_ms=10)
+
+        assert _gather_queries(embeddings, ["a", "a", "bb"]) == [[1.0], [1.0], [2.0]]
+        assert inner.batches == [["a", "bb"]]
+
+    def test_batch_error_reaches_every_caller(self):
+        embeddings = MicroBatchingEmbeddings(RecordingEmbeddings(fail=True), max_wait_ms=10)
+
+        async def run():
+            return await asyncio.gather(
+                embeddings.aembed_query("a"), embeddings.aembed_query("b"), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_batch_size_one_disables_batching(self):
+        inner = RecordingEmbeddings()
+        embeddings = MicroBatchingEmbeddings(inner, max_batch_size=1)
+
+        _gather_queries(embeddings, ["a", "b"])
+
+        assert inner.batches == []
+        assert inner.queries == ["a", "b"]
+
+
+class TestSyncMicroBatching:
+    """스레드 간 동기 쿼리 배치 테스트"""
+
+    def test_queries_from_threads_are_batched(self):
+        inner = RecordingEmbeddings()
+        embeddings = MicroBatchingEmbeddings(inner, max_batch_size=32, max_wait_ms=100)
+        barrier = threading.Barrier(6)
+        results = {}
+
+        def query(index):
+            barrier.wait()
+            results[index] = embeddings.embed_query("x" * (index + 1))
+
+        threads = [threading.Thread(target=query, args=(index,)) for index in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {index: [float(index + 1)] for index in range(6)}
+        assert len(inner.batches) == 1
+
+    def test_sync_error_is_raised_to_caller(self):
+        embeddings = MicroBatchingEmbeddings(RecordingEmbeddings(fail=True), max_wait_ms=5)
+
+        with pytest.raises(RuntimeError):
+            embeddings.embed_query("a")
+
+
+def test_cache_identifies_model_behind_batcher(tmp_path):
+    batched = MicroBatchingEmbeddings(RecordingEmbeddings())
+    cached = CachedEmbeddings(batched, EmbeddingCache(tmp_path))
+
+    assert cached.model_id == "RecordingEmbeddings:recording"
+    assert batched.model_name == "recording"
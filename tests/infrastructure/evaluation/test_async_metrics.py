@@ -0,0 +1,93 @@
+"""비동기 임베딩 answer_relevancy 테스트"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+from ragas.embeddings import LangchainEmbeddingsWrapper
+from ragas.metrics._answer_relevance import ResponseRelevanceOutput
+
+from src.infrastructure.embedding.micro_batcher import MicroBatchingEmbeddings
+from src.infrastructure.evaluation.async_metrics import AsyncAnswerRelevancy
+from src.infrastructure.evaluation.strategies.base_strategy import default_metrics
+
+
+class LengthEmbeddings(Embeddings):
+    """[글자 수, 1] 벡터를 돌려주고 배치 호출을 기록하는 가짜 임베딩"""
+
+    def __init__(self):
+        self.batches = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        raise AssertionError("동기 임베딩이 호출되면 안 됨")
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+class FixedQuestions:
+    """항상 같은 역생성 질문을 돌려주는 가짜 프롬프트"""
+
+    def __init__(self, question, noncommittal=0):
+        self.output = ResponseRelevanceOutput(question=question, noncommittal=noncommittal)
+
+    async def generate(self, data, llm, callbacks=None):
+        await asyncio.sleep(0)
+        return self.output
+
+
+def _metric(embeddings, question="abc", noncommittal=0):
+    metric = AsyncAnswerRelevancy()
+    metric.llm = object()
+    metric.embeddings = LangchainEmbeddingsWrapper(embeddings)
+    metric.question_generation = FixedQuestions(question, noncommittal)
+    return metric
+
+
+def _expected(question, generated):
+    q = np.array([len(question), 1.0])
+    g = np.array([len(generated), 1.0])
+    return float(q @ g / (np.linalg.norm(q) * np.linalg.norm(g)))
+
+
+class TestAsyncAnswerRelevancy:
+    """점수 계산과 비동기 임베딩 사용 테스트"""
+
+    def test_score_matches_ragas_formula_without_sync_embeddings(self):
+        metric = _metric(LengthEmbeddings(), question="abc")
+
+        score = asyncio.run(metric._ascore({"user_input": "a", "response": "답변"}, callbacks=None))
+
+        assert score == pytest.approx(_expected("a", "abc"))
+
+    def test_noncommittal_answer_scores_zero(self):
+        metric = _metric(LengthEmbeddings(), noncommittal=1)
+
+        assert asyncio.run(metric._ascore({"user_input": "a", "response": "답변"}, callbacks=None)) == 0
+
+    def test_concurrent_cells_share_one_query_batch(self):
+        inner = LengthEmbeddings()
+        metric = _metric(MicroBatchingEmbeddings(inner, max_batch_size=32, max_wait_ms=20))
+        rows = [{"user_input": "q" * (index + 1), "response": "답변"} for index in range(4)]
+
+        async def run():
+            return await asyncio.gather(*(metric._ascore(row, callbacks=None) for row in rows))
+
+        scores = asyncio.run(run())
+
+        assert scores == pytest.approx([_expected(row["user_input"], "abc") for row in rows])
+        query_batches = [batch for batch in inner.batches if batch[0].startswith("q")]
+        assert query_batches == [[row["user_input"] for row in rows]]
+
+    def test_default_metrics_use_async_answer_relevancy(self):
+        metric = next(metric for metric in default_metrics() if metric.name == "answer_relevancy")
+
+        assert isinstance(metric, AsyncAnswerRelevancy)
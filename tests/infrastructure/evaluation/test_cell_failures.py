@@ -0,0 +1,171 @@
+"""평가 실패 셀 사유 기록 테스트"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from datasets import Dataset
+from ragas.executor import Executor
+
+from src.application.use_cases.commands.base_command import EvaluationContext as PipelineContext
+from src.application.use_cases.commands.run_evaluation_command import RunEvaluationCommand
+from src.infrastructure.cache.score_cache import ScoreCache
+from src.infrastructure.evaluation.cell_failures import (
+    REASON_CELL_DEADLINE,
+    REASON_RUN_DEADLINE,
+    REASON_UNKNOWN,
+    CellFailureRecorder,
+    classify_failure,
+)
+from src.infrastructure.evaluation.ragas_adapter import RagasEvalAdapter
+from src.infrastructure.network import set_run_deadline
+
+METRIC_NAMES = ["faithfulness", "answer_relevancy"]
+
+
+@pytest.fixture(autouse=True)
+def reset_deadline():
+    set_run_deadline(None)
+    yield
+    set_run_deadline(None)
+
+
+class TimeoutStrategy:
+    """failing의 (행, 메트릭) 셀에서 RAGAS처럼 작업 예외를 로그로 남기고 NaN을 반환하는 전략"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+
+    def get_metrics(self):
+        return [SimpleNamespace(name=name) for name in METRIC_NAMES]
+
+    def run_evaluation(self, dataset, metrics=None):
+        metrics = metrics or self.get_metrics()
+        logger = logging.getLogger("ragas.executor")
+        for row in range(len(dataset)):
+            for column, metric in enumerate(metrics):
+                if (row, metric.name) in self.failing:
+                    logger.error("Exception raised in Job[%s]: %s(%s)", row * len(metrics) + column, "TimeoutError", "")
+        frame = pd.DataFrame(
+            {
+                m.name: [float("nan") if (row, m.name) in self.failing else 0.8 for row in range(len(dataset))]
+                for m in metrics
+            }
+        )
+        return SimpleNamespace(to_pandas=lambda: frame)
+
+
+def _dataset(count):
+    return Dataset.from_dict(
+        {
+            "question": [f"질문{i}" for i in range(count)],
+            "contexts": [["컨텍스트"]] * count,
+            "answer": ["답변"] * count,
+            "ground_truth": ["정답"] * count,
+        }
+    )
+
+
+def _adapter(strategy):
+    llm = MagicMock()
+    llm.model = "test-model"
+    adapter = RagasEvalAdapter(llm=llm, embeddings=MagicMock())
+    adapter.evaluation_context.primary_strategy = strategy
+    adapter.evaluation_context.get_metrics = strategy.get_metrics
+    return adapter
+
+
+class TestClassifyFailure:
+    """실패 사유 분류 테스트"""
+
+    def test_cell_timeout(self):
+        assert classify_failure("TimeoutError", "") == REASON_CELL_DEADLINE
+
+    def test_run_deadline(self):
+        assert classify_failure("DeadlineExceeded", "마감") == REASON_RUN_DEADLINE
+        set_run_deadline(0)
+        assert classify_failure("TimeoutError", "") == REASON_RUN_DEADLINE
+
+    def test_other_error_keeps_name(self):
+        assert classify_failure("RuntimeError", "HTTP 500") == "error: RuntimeError: HTTP 500"
+
+
+class TestCellFailureRecorder:
+    """RAGAS Executor 로그 수집 테스트"""
+
+    def test_records_real_executor_failures_by_job(self):
+        async def job(value):
+            if value == 3:
+                await asyncio.wait_for(asyncio.sleep(1), timeout=0.01)
+            return value
+
+        executor = Executor(desc="test", raise_exceptions=False, show_progress=False)
+        for value in range(4):
+            executor.submit(job, value)
+
+        with CellFailureRecorder() as recorder:
+            results = executor.results()
+
+        assert results[3] != results[3]  # NaN
+        assert recorder.reasons(2, METRIC_NAMES) == [{}, {"answer_relevancy": REASON_CELL_DEADLINE}]
+        assert recorder not in logging.getLogger("ragas.executor").handlers
+
+
+class TestAdapterCellFailures:
+    """어댑터 결과의 셀별 실패 사유 테스트"""
+
+    def test_failed_cells_get_reasons(self):
+        adapter = _adapter(TimeoutStrategy(failing={(1, "faithfulness")}))
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=ScoreCache(mode="off")), \
+             patch("src.infrastructure.evaluation.ragas_adapter.settings.EVALUATION_REPAIR_FAILED", False):
+            result = adapter.evaluate(_dataset(2))
+
+        assert result["individual_scores"][1]["faithfulness"] is None
+        assert result["cell_failures"] == [{}, {"faithfulness": REASON_CELL_DEADLINE}]
+
+    def test_cached_path_maps_reasons_to_original_rows(self, tmp_path):
+        adapter = _adapter(TimeoutStrategy())
+        cache = ScoreCache(tmp_path / "scores.db")
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=cache), \
+             patch("src.infrastructure.evaluation.ragas_adapter.settings.EVALUATION_REPAIR_FAILED", False):
+            adapter.evaluate(_dataset(2))
+            # 행 2만 새로 평가되며 부분 데이터셋의 0번 행이 원래 2번 행
+            adapter.evaluation_context.primary_strategy = TimeoutStrategy(failing={(0, "answer_relevancy")})
+            result = adapter.evaluate(_dataset(3))
+
+        assert result["cell_failures"] == [{}, {}, {"answer_relevancy": REASON_CELL_DEADLINE}]
+
+    def test_unlogged_failure_uses_default_reason(self):
+        strategy = TimeoutStrategy()
+        frame = pd.DataFrame({"faithfulness": [float("nan")], "answer_relevancy": [0.5]})
+        strategy.run_evaluation = lambda dataset, metrics=None: SimpleNamespace(to_pandas=lambda: frame)
+        adapter = _adapter(strategy)
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=ScoreCache(mode="off")), \
+             patch("src.infrastructure.evaluation.ragas_adapter.settings.EVALUATION_REPAIR_FAILED", False):
+            result = adapter.evaluate(_dataset(1))
+
+        assert result["cell_failures"] == [{"faithfulness": REASON_UNKNOWN}]
+
+    def test_final_report_moves_reasons_to_metadata(self):
+        runner = MagicMock()
+        runner.llm.model = "test-model"
+        runner.evaluate.return_value = {
+            "faithfulness": 0.8,
+            "answer_relevancy": 0.6,
+            "individual_scores": [{"faithfulness": 0.8, "answer_relevancy": None}],
+            "cell_failures": [{"answer_relevancy": REASON_RUN_DEADLINE}],
+        }
+        context = PipelineContext(dataset_name="test")
+        context.ragas_dataset = _dataset(1)
+
+        RunEvaluationCommand(runner).execute(context)
+
+        report = context.evaluation_result_dict
+        assert "cell_failures" not in report
+        assert report["ragas_score"] == pytest.approx(0.7)
+        assert report["metadata"]["abandoned_cells"] == [
+            {"row": 0, "metric": "answer_relevancy", "reason": REASON_RUN_DEADLINE}
+        ]
@@ -0,0 +1,118 @@
+"""실패 셀 폴백 재평가 테스트"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from datasets import Dataset
+
+from src.infrastructure.cache.score_cache import ScoreCache
+from src.infrastructure.evaluation.ragas_adapter import RagasEvalAdapter
+
+METRIC_NAMES = ["faithfulness", "answer_relevancy"]
+
+
+class FakeStrategy:
+    """(질문, 메트릭) 조합이 failing에 있으면 NaN을 돌려주는 전략"""
+
+    def __init__(self, score, failing=()):
+        self.score = score
+        self.failing = set(failing)
+        self.calls = []
+
+    def get_metrics(self):
+        return [SimpleNamespace(name=name) for name in METRIC_NAMES]
+
+    def run_evaluation(self, dataset, metrics=None):
+        metrics = metrics or self.get_metrics()
+        self.calls.append((list(dataset["question"]), [m.name for m in metrics]))
+        frame = pd.DataFrame(
+            {
+                m.name: [
+                    float("nan") if (q, m.name) in self.failing else self.score
+                    for q in dataset["question"]
+                ]
+                for m in metrics
+            }
+        )
+        return SimpleNamespace(to_pandas=lambda: frame)
+
+
+def _dataset(count):
+    return Dataset.from_dict(
+        {
+            "question": [f"질문{i}" for i in range(count)],
+            "contexts": [["컨텍스트"]] * count,
+            "answer": ["답변"] * count,
+            "ground_truth": ["정답"] * count,
+        }
+    )
+
+
+def _adapter(primary, fallback):
+    llm = MagicMock()
+    llm.model = "test-model"
+    adapter = RagasEvalAdapter(llm=llm, embeddings=MagicMock())
+    adapter.evaluation_context.primary_strategy = primary
+    adapter.evaluation_context.fallback_strategy = fallback
+    return adapter
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with patch("builtins.print"):
+        yield
+
+
+class TestFailedCellRepair:
+    """실패 셀 재평가 테스트"""
+
+    def test_only_failed_cells_are_rerun_and_merged(self):
+        primary = FakeStrategy(0.5, failing={("질문1", "faithfulness"), ("질문3", "faithfulness"), ("질문3", "answer_relevancy")})
+        fallback = FakeStrategy(0.9)
+        adapter = _adapter(primary, fallback)
+
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=ScoreCache(mode="off")):
+            result = adapter.evaluate(_dataset(4))
+
+        assert sorted(fallback.calls) == [(["질문1"], ["faithfulness"]), (["질문3"], METRIC_NAMES)]
+        assert [s["faithfulness"] for s in result["individual_scores"]] == [0.5, 0.9, 0.5, 0.9]
+        assert result["faithfulness"] == pytest.approx(0.7)
+
+    def test_unrepaired_cells_stay_none(self):
+        primary = FakeStrategy(0.5, failing={("질문0", "faithfulness")})
+        fallback = FakeStrategy(0.9, failing={("질문0", "faithfulness")})
+        adapter = _adapter(primary, fallback)
+
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=ScoreCache(mode="off")):
+            result = adapter.evaluate(_dataset(2))
+
+        assert result["individual_scores"][0]["faithfulness"] is None
+        assert result["faithfulness"] == pytest.approx(0.5)
+
+    def test_repaired_scores_are_cached(self, tmp_path):
+        primary = FakeStrategy(0.5, failing={("질문1", "answer_relevancy")})
+        fallback = FakeStrategy(0.9)
+        adapter = _adapter(primary, fallback)
+        cache = ScoreCache(db_path=tmp_path / "scores.db")
+
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=cache):
+            adapter.evaluate(_dataset(2))
+            second = adapter.evaluate(_dataset(2))
+
+        assert len(primary.calls) == 1
+        assert len(fallback.calls) == 1
+        assert second["individual_scores"][1]["answer_relevancy"] == 0.9
+
+    def test_repair_can_be_disabled(self):
+        primary = FakeStrategy(0.5, failing={("질문0", "faithfulness")})
+        fallback = FakeStrategy(0.9)
+        adapter = _adapter(primary, fallback)
+
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=ScoreCache(mode="off")), \
+             patch("src.infrastructure.evaluation.ragas_adapter.settings.EVALUATION_REPAIR_FAILED", False):
+            result = adapter.evaluate(_dataset(2))
+
+        assert fallback.calls == []
+        assert result["individual_scores"][0]["faithfulness"] is None
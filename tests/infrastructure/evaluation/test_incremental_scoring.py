@@ -0,0 +1,126 @@
+"""점수 캐시를 이용한 증분 평가 테스트"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from datasets import Dataset
+
+from src.infrastructure.cache.score_cache import ScoreCache
+from src.infrastructure.evaluation.ragas_adapter import RagasEvalAdapter
+
+METRIC_NAMES = ["faithfulness", "answer_relevancy", "context_recall"]
+ANSWER_METRICS = ["faithfulness", "answer_relevancy"]
+
+
+class FakeStrategy:
+    """답변 길이를 점수로 돌려주고 평가한 질문을 기록하는 전략"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_metrics(self):
+        return [SimpleNamespace(name=name) for name in METRIC_NAMES]
+
+    def run_evaluation(self, dataset, metrics=None):
+        metrics = metrics or self.get_metrics()
+        self.calls.append((list(dataset["question"]), [m.name for m in metrics]))
+        frame = pd.DataFrame(
+            {m.name: [len(answer) / 10 for answer in dataset["answer"]] for m in metrics}
+        )
+        return SimpleNamespace(to_pandas=lambda: frame)
+
+
+def _dataset(answers):
+    return Dataset.from_dict(
+        {
+            "question": [f"질문{i}" for i in range(len(answers))],
+            "contexts": [["컨텍스트"]] * len(answers),
+            "answer": answers,
+            "ground_truth": ["정답"] * len(answers),
+        }
+    )
+
+
+@pytest.fixture
+def adapter_and_strategy(tmp_path):
+    llm = MagicMock()
+    llm.model = "test-model"
+    adapter = RagasEvalAdapter(llm=llm, embeddings=MagicMock())
+    strategy = FakeStrategy()
+    adapter.evaluation_context.primary_strategy = strategy
+    cache = ScoreCache(db_path=tmp_path / "scores.db")
+    with patch("src.infrastructure.evaluation.ragas_adapter.get_score_cache", return_value=cache), \
+         patch("builtins.print"):
+        yield adapter, strategy
+
+
+class TestIncrementalScoring:
+    """증분 평가 테스트"""
+
+    def test_rerun_evaluates_only_changed_rows(self, adapter_and_strategy):
+        adapter, strategy = adapter_and_strategy
+        adapter.evaluate(_dataset(["a", "bb", "ccc"]))
+        result = adapter.evaluate(_dataset(["a", "bbbb", "ccc"]))
+
+        assert strategy.calls[-1] == (["질문1"], ANSWER_METRICS)
+        assert [s["faithfulness"] for s in result["individual_scores"]] == [0.1, 0.4, 0.3]
+        assert [s["context_recall"] for s in result["individual_scores"]] == [0.1, 0.2, 0.3]
+        assert result["faithfulness"] == pytest.approx(0.8 / 3)
+        assert set(result) == set(METRIC_NAMES) | {"individual_scores", "cell_failures"}
+
+    def test_unchanged_dataset_skips_evaluation(self, adapter_and_strategy):
+        adapter, strategy = adapter_and_strategy
+        first = adapter.evaluate(_dataset(["a", "bb"]))
+        second = adapter.evaluate(_dataset(["a", "bb"]))
+
+        assert len(strategy.calls) == 1
+        assert second == first
+
+    def test_failed_scores_are_retried(self, adapter_and_strategy):
+        adapter, strategy = adapter_and_strategy
+        original_run = strategy.run_evaluation
+
+        def fail_relevancy(dataset, metrics=None):
+            result = original_run(dataset, metrics)
+            frame = result.to_pandas()
+            frame["answer_relevancy"] = float("nan")
+            return SimpleNamespace(to_pandas=lambda: frame)
+
+        strategy.run_evaluation = fail_relevancy
+        first = adapter.evaluate(_dataset(["a", "bb"]))
+        strategy.run_evaluation = original_run
+        second = adapter.evaluate(_dataset(["a", "bb"]))
+
+        assert first["individual_scores"][0]["answer_relevancy"] is None
+        assert strategy.calls[-1] == (["질문0", "질문1"], ["answer_relevancy"])
+        assert second["individual_scores"][1] == {
+            "faithfulness": 0.2, "answer_relevancy": 0.2, "context_recall": 0.2
+        }
+
+    def test_answer_variant_reuses_answer_independent_metrics(self, adapter_and_strategy):
+        adapter, strategy = adapter_and_strategy
+        adapter.evaluate(_dataset(["a", "bb"]))
+        variant = adapter.evaluate(_dataset(["xyz", "w"]))
+
+        assert len(strategy.calls) == 2
+        assert strategy.calls[-1] == (["질문0", "질문1"], ANSWER_METRICS)
+        assert [s["answer_relevancy"] for s in variant["individual_scores"]] == [0.3, 0.1]
+        # 컨텍스트 메트릭은 기준 데이터셋 결과 재사용
+        assert [s["context_recall"] for s in variant["individual_scores"]] == [0.1, 0.2]
+
+
+class TestRunCleanup:
+    """평가 실행 후 비동기 연결 풀 정리 테스트"""
+
+    def test_evaluate_closes_async_clients_even_on_failure(self, adapter_and_strategy):
+        adapter, strategy = adapter_and_strategy
+        transport = MagicMock()
+        with patch("src.infrastructure.evaluation.ragas_adapter.get_transport", return_value=transport):
+            adapter.evaluate(_dataset(["a"]))
+            strategy.run_evaluation = MagicMock(side_effect=RuntimeError("평가 실패"))
+            with pytest.raises(RuntimeError):
+                adapter.evaluate(_dataset(["새 답변"]))
+
+        assert transport.close_async_clients.call_count == 2
@@ -0,0 +1,91 @@
+"""샤드 단위 멀티프로세스 평가 테스트"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from datasets import Dataset
+
+from src.infrastructure.evaluation.ragas_adapter import RagasEvalAdapter
+from src.infrastructure.evaluation.sharded_adapter import ShardedEvalAdapter, shard_bounds
+
+METRIC_NAMES = ["faithfulness", "context_recall"]
+
+
+class FakeStrategy:
+    def get_metrics(self):
+        return [SimpleNamespace(name=name) for name in METRIC_NAMES]
+
+
+class FakeShardAdapter:
+    """질문 번호를 점수로 돌려주는 워커용 어댑터 ("실패" 답변이 있으면 예외)"""
+
+    def evaluate(self, dataset):
+        if any("실패" in answer for answer in dataset["answer"]):
+            raise RuntimeError("샤드 평가 오류")
+        scores = [
+            {name: int(q.removeprefix("질문")) / 100 for name in METRIC_NAMES}
+            for q in dataset["question"]
+        ]
+        for score in scores:
+            score["pid"] = os.getpid()
+        return {"individual_scores": scores}
+
+
+def build_fake_adapter():
+    return FakeShardAdapter()
+
+
+def _dataset(count, failing=()):
+    return Dataset.from_dict(
+        {
+            "question": [f"질문{i}" for i in range(count)],
+            "contexts": [["컨텍스트"]] * count,
+            "answer": ["실패" if i in failing else "답변" for i in range(count)],
+            "ground_truth": ["정답"] * count,
+        }
+    )
+
+
+@pytest.fixture
+def sharded_adapter():
+    base = RagasEvalAdapter(llm=MagicMock(), embeddings=MagicMock())
+    base.evaluation_context.primary_strategy = FakeStrategy()
+    return ShardedEvalAdapter(base, build_fake_adapter, num_shards=3, start_method="fork")
+
+
+class TestShardBounds:
+    """샤드 분할 테스트"""
+
+    def test_bounds_cover_all_rows_contiguously(self):
+        assert shard_bounds(10, 3) == [(0, 4), (4, 7), (7, 10)]
+
+    def test_no_empty_shards(self):
+        assert shard_bounds(2, 4) == [(0, 1), (1, 2)]
+
+
+class TestShardedEvalAdapter:
+    """샤드 병렬 평가 테스트"""
+
+    def test_results_are_merged_in_input_order(self, sharded_adapter):
+        with patch("builtins.print"):
+            result = sharded_adapter.evaluate(_dataset(7))
+
+        scores = result["individual_scores"]
+        assert [s["faithfulness"] for s in scores] == [i / 100 for i in range(7)]
+        assert result["context_recall"] == pytest.approx(0.03)
+        assert len({s["pid"] for s in scores}) > 1
+        assert os.getpid() not in {s["pid"] for s in scores}
+
+    def test_failed_shard_is_isolated(self, sharded_adapter):
+        with patch("builtins.print"):
+            result = sharded_adapter.evaluate(_dataset(6, failing=(3,)))
+
+        scores = result["individual_scores"]
+        assert [s["faithfulness"] for s in scores] == [0.0, 0.01, None, None, 0.04, 0.05]
+        assert result["faithfulness"] == pytest.approx(0.025)
+
+    def test_all_shards_failing_raises(self, sharded_adapter):
+        with patch("builtins.print"), pytest.raises(RuntimeError):
+            sharded_adapter.evaluate(_dataset(3, failing=(0, 1, 2)))
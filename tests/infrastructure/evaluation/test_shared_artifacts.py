@@ -0,0 +1,121 @@
+"""메트릭 간 중간 산출물 공유 테스트"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from ragas.metrics import AnswerCorrectness, AnswerRelevancy, Faithfulness
+from ragas.metrics._answer_relevance import ResponseRelevanceInput, ResponseRelevancePrompt
+from ragas.metrics._faithfulness import StatementGeneratorInput, StatementGeneratorPrompt
+
+from src.infrastructure.cache.artifact_store import ArtifactStore
+from src.infrastructure.evaluation.shared_artifacts import (
+    ArtifactEmbeddings,
+    ArtifactPrompt,
+    attach_shared_artifacts,
+)
+
+STATEMENT_INPUT = StatementGeneratorInput(question="질문", answer="답변입니다. 두 번째 문장입니다.")
+
+
+class CountingStatementPrompt(StatementGeneratorPrompt):
+    """LLM 대신 호출 횟수를 세는 문장 분해 프롬프트"""
+
+    calls = 0
+
+    async def generate(self, llm, data, temperature=None, stop=None, callbacks=None, retries_left=3):
+        type(self).calls += 1
+        return self.output_model(statements=data.answer.split(". "))
+
+
+class CountingQuestionPrompt(ResponseRelevancePrompt):
+    """호출마다 다른 질문을 역생성하는 프롬프트"""
+
+    calls = 0
+
+    async def generate(self, llm, data, temperature=None, stop=None, callbacks=None, retries_left=3):
+        type(self).calls += 1
+        return self.output_model(question=f"질문{type(self).calls}", noncommittal=0)
+
+
+def _metrics():
+    faithfulness, correctness = Faithfulness(), AnswerCorrectness()
+    faithfulness.statement_generator_prompt = CountingStatementPrompt()
+    correctness.statement_generator_prompt = CountingStatementPrompt()
+    return [faithfulness, correctness]
+
+
+def test_statements_are_computed_once_across_metrics(tmp_path):
+    CountingStatementPrompt.calls = 0
+    store = ArtifactStore(tmp_path / "artifacts.db")
+    metrics = _metrics()
+    attach_shared_artifacts(metrics, MagicMock(), "HCX-005", store=store)
+
+    async def run():
+        return await asyncio.gather(
+            *(metric.statement_generator_prompt.generate(llm=None, data=STATEMENT_INPUT) for metric in metrics)
+        )
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert first.statements == ["답변입니다", "두 번째 문장입니다."]
+    assert CountingStatementPrompt.calls == 1
+    assert all(isinstance(metric.statement_generator_prompt, ArtifactPrompt) for metric in metrics)
+
+
+def test_statements_persist_for_reruns_per_judge_model(tmp_path):
+    CountingStatementPrompt.calls = 0
+
+    def run_once(judge_model):
+        metrics = _metrics()
+        attach_shared_artifacts(metrics, MagicMock(), judge_model, store=ArtifactStore(tmp_path / "artifacts.db"))
+        return asyncio.run(metrics[0].statement_generator_prompt.generate(llm=None, data=STATEMENT_INPUT))
+
+    run_once("HCX-005")
+    run_once("HCX-005")
+    assert CountingStatementPrompt.calls == 1
+
+    run_once("gemini-2.5-flash")
+    assert CountingStatementPrompt.calls == 2
+
+
+def test_repeated_question_generation_keeps_distinct_samples(tmp_path):
+    CountingQuestionPrompt.calls = 0
+
+    def run_once():
+        metric = AnswerRelevancy(question_generation=CountingQuestionPrompt())
+        attach_shared_artifacts([metric], MagicMock(), "HCX-005", store=ArtifactStore(tmp_path / "artifacts.db"))
+        data = ResponseRelevanceInput(response="답변")
+
+        async def run():
+            return await asyncio.gather(
+                *(metric.question_generation.generate(llm=None, data=data) for _ in range(metric.strictness))
+            )
+
+        return sorted(output.question for output in asyncio.run(run()))
+
+    assert run_once() == ["질문1", "질문2", "질문3"]
+    assert run_once() == ["질문1", "질문2", "질문3"]  # 재실행 시 저장된 질문 재사용
+    assert CountingQuestionPrompt.calls == 3
+
+
+def test_embeddings_are_cached_per_text(tmp_path):
+    inner = MagicMock()
+    inner.model_name = "bge-m3"
+    inner.embed_documents.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    inner.embed_query.side_effect = lambda text: [float(len(text))]
+    embeddings = ArtifactEmbeddings(inner, ArtifactStore(tmp_path / "artifacts.db"))
+
+    assert embeddings.embed_documents(["가", "나다"]) == [[1.0], [2.0]]
+    assert embeddings.embed_documents(["나다", "라마바"]) == [[2.0], [3.0]]
+    assert embeddings.embed_query("가") == [1.0]
+
+    inner.embed_documents.assert_called_with(["라마바"])
+    inner.embed_query.assert_not_called()
+
+
+def test_off_mode_leaves_metrics_untouched(tmp_path):
+    metrics = _metrics()
+    embeddings = MagicMock()
+
+    assert attach_shared_artifacts(metrics, embeddings, "HCX-005", store=ArtifactStore(mode="off")) is embeddings
+    assert isinstance(metrics[0].statement_generator_prompt, CountingStatementPrompt)
@@ -0,0 +1,124 @@
+"""평가 전략의 실행별 상태 격리 테스트"""
+
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from datasets import Dataset
+from ragas.metrics import faithfulness
+
+from src.domain.prompts import PromptType
+from src.infrastructure.evaluation.strategies import (
+    CustomPromptEvaluationStrategy,
+    FallbackEvaluationStrategy,
+    HcxEvaluationStrategy,
+    StandardEvaluationStrategy,
+)
+
+METRIC_NAMES = ["faithfulness", "answer_relevancy", "context_recall", "context_precision", "answer_correctness"]
+STRATEGY_MODULE = "src.infrastructure.evaluation.strategies"
+
+
+def _llm(model):
+    llm = MagicMock()
+    llm.model = model
+    return llm
+
+
+def _dataset():
+    return Dataset.from_dict(
+        {
+            "question": ["질문"],
+            "contexts": [["컨텍스트"]],
+            "answer": ["답변"],
+            "ground_truth": ["정답"],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy_factory",
+    [
+        lambda: StandardEvaluationStrategy(_llm("gemini"), MagicMock()),
+        lambda: FallbackEvaluationStrategy(_llm("gemini"), MagicMock()),
+        lambda: CustomPromptEvaluationStrategy(_llm("gemini"), MagicMock(), PromptType.KOREAN_FORMAL),
+    ],
+)
+def test_get_metrics_returns_fresh_instances(strategy_factory):
+    strategy = strategy_factory()
+    first, second = strategy.get_metrics(), strategy.get_metrics()
+
+    assert [metric.name for metric in first] == METRIC_NAMES
+    assert not {id(metric) for metric in first} & {id(metric) for metric in second}
+
+
+def test_select_metrics_never_returns_callers_objects():
+    strategy = StandardEvaluationStrategy(_llm("gemini"), MagicMock())
+    requested = [SimpleNamespace(name="answer_correctness"), faithfulness]
+
+    selected = strategy.select_metrics(requested)
+
+    assert [metric.name for metric in selected] == ["faithfulness", "answer_correctness"]
+    assert all(metric is not faithfulness for metric in selected)
+
+
+def test_concurrent_runs_use_isolated_metrics_and_config():
+    strategy = StandardEvaluationStrategy(_llm("HCX-005"), MagicMock())
+    seen = []
+    barrier = threading.Barrier(2)
+    environ_before = dict(os.environ)
+
+    def fake_evaluate(dataset, metrics, llm, embeddings, run_config, raise_exceptions):
+        barrier.wait(timeout=5)  # 두 실행이 동시에 진행 중임을 보장
+        seen.append((metrics, run_config))
+        return SimpleNamespace()
+
+    with patch(f"{STRATEGY_MODULE}.standard_evaluation_strategy.evaluate", side_effect=fake_evaluate):
+        threads = [threading.Thread(target=strategy.run_evaluation, args=(_dataset(),)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    (first_metrics, first_config), (second_metrics, second_config) = seen
+    assert not {id(metric) for metric in first_metrics} & {id(metric) for metric in second_metrics}
+    assert first_config is not second_config and first_config.max_workers == 1
+    assert dict(os.environ) == environ_before
+
+
+def test_hcx_run_does_not_touch_module_singletons_or_environ():
+    strategy = HcxEvaluationStrategy(_llm("HCX-005"), MagicMock())
+    environ_before = dict(os.environ)
+    captured = {}
+
+    def fake_evaluate(dataset, metrics, **kwargs):
+        captured["metrics"] = metrics
+        captured["environ"] = dict(os.environ)
+        return None
+
+    with patch(f"{STRATEGY_MODULE}.hcx_evaluation_strategy.evaluate", side_effect=fake_evaluate):
+        strategy.run_evaluation(_dataset(), metrics=[SimpleNamespace(name="faithfulness")])
+
+    assert [metric.name for metric in captured["metrics"]] == ["faithfulness"]
+    assert captured["metrics"][0] is not faithfulness
+    assert faithfulness.llm is None
+    assert captured["environ"] == environ_before
+
+
+def test_hcx_run_uses_its_sequential_run_config():
+    strategy = HcxEvaluationStrategy(_llm("HCX-005"), MagicMock())
+    captured = {}
+
+    def fake_evaluate(dataset, metrics, run_config, **kwargs):
+        captured["run_config"] = run_config
+        return None
+
+    with patch(f"{STRATEGY_MODULE}.hcx_evaluation_strategy.evaluate", side_effect=fake_evaluate):
+        strategy.run_evaluation(_dataset(), metrics=[SimpleNamespace(name="faithfulness")])
+
+    run_config = captured["run_config"]
+    assert run_config.max_workers == strategy.run_config.max_workers == 1
+    assert run_config.max_retries == strategy.run_config.max_retries
+    assert run_config.max_wait == strategy.run_config.max_wait
@@ -0,0 +1,255 @@
+"""LLM 래퍼의 네이티브 비동기 호출 테스트"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.domain.exceptions import ProviderNetworkError, ProviderRateLimitError
+from src.infrastructure.cache.llm_response_cache import LlmResponseCache
+from src.infrastructure.llm.hcx_adapter import HcxAdapter
+from src.infrastructure.network.rate_limiter import AdaptiveRateLimiter
+from src.infrastructure.network.transport import HttpTransport
+from src.infrastructure.llm.http_gemini_wrapper import HttpGeminiWrapper
+
+
+DELAY = 0.2
+
+
+async def _gemini_handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(DELAY)
+    return httpx.Response(
+        200, json={"candidates": [{"content": {"parts": [{"text": "제미나이 응답"}]}}]}
+    )
+
+
+async def _hcx_handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(DELAY)
+    return httpx.Response(200, json={"result": {"message": {"content": '{"answer": "HCX 응답"}'}}})
+
+
+def _mock_transport(handler):
+    return HttpTransport(async_transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def no_cache():
+    """캐시를 끈 상태로 테스트"""
+    cache = LlmResponseCache(mode="off")
+    with patch("src.infrastructure.llm.http_gemini_wrapper.get_llm_cache", return_value=cache), \
+         patch("src.infrastructure.llm.hcx_adapter.get_llm_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def fast_limiter():
+    """대기 없는 속도 제한기로 HCX 어댑터 생성"""
+    limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000, burst=100)
+    with patch("src.infrastructure.llm.hcx_adapter.get_rate_limiter", return_value=limiter):
+        yield limiter
+
+
+@pytest.fixture
+def fast_gemini_limiter():
+    """대기 없는 속도 제한기로 Gemini 래퍼 생성"""
+    limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000, burst=100)
+    with patch("src.infrastructure.llm.http_gemini_wrapper.get_rate_limiter", return_value=limiter):
+        yield limiter
+
+
+class ThreadRecordingCache(LlmResponseCache):
+    """조회/저장이 실행된 스레드를 기록하는 캐시"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path=db_path)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key, model, response):
+        self.threads.append(threading.get_ident())
+        super().put(key, model, response)
+
+
+@pytest.mark.parametrize(
+    "module, handler, make_call",
+    [
+        (
+            "http_gemini_wrapper",
+            _gemini_handler,
+            lambda: HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")._acall("질문"),
+        ),
+        (
+            "hcx_adapter",
+            _hcx_handler,
+            lambda: HcxAdapter(api_key="nv-test-key", model_name="HCX-005").agenerate_answer("질문", []),
+        ),
+    ],
+)
+def test_async_cache_io_runs_off_event_loop(tmp_path, fast_limiter, fast_gemini_limiter, module, handler, make_call):
+    cache = ThreadRecordingCache(tmp_path / "cache.db")
+
+    async def run():
+        await make_call()
+        return threading.get_ident()
+
+    with patch(f"src.infrastructure.llm.{module}.get_llm_cache", return_value=cache), \
+         patch(f"src.infrastructure.llm.{module}.get_transport", return_value=_mock_transport(handler)):
+        loop_thread = asyncio.run(run())
+
+    # 조회 1회 + 저장 1회 모두 이벤트 루프 스레드 밖에서 실행
+    assert len(cache.threads) == 2
+    assert loop_thread not in cache.threads
+
+
+class TestHttpGeminiWrapperAsync:
+    """HttpGeminiWrapper 비동기 호출 테스트"""
+
+    def test_acall_returns_text(self, no_cache):
+        wrapper = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+        with patch(
+            "src.infrastructure.llm.http_gemini_wrapper.get_transport",
+            return_value=_mock_transport(_gemini_handler),
+        ):
+            result = asyncio.run(wrapper._acall("질문"))
+        assert result == "제미나이 응답"
+
+    def test_concurrent_calls_overlap(self, no_cache, fast_gemini_limiter):
+        wrapper = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+
+        async def run_all():
+            return await asyncio.gather(*(wrapper._acall(f"질문 {i}") for i in range(5)))
+
+        with patch(
+            "src.infrastructure.llm.http_gemini_wrapper.get_transport",
+            return_value=_mock_transport(_gemini_handler),
+        ):
+            start = time.perf_counter()
+            results = asyncio.run(run_all())
+            elapsed = time.perf_counter() - start
+
+        assert results == ["제미나이 응답"] * 5
+        assert elapsed < DELAY * 3
+
+    def test_acall_raises_after_retries(self, no_cache):
+        async def failing_handler(request):
+            return httpx.Response(500, text="error")
+
+        wrapper = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+        with patch(
+            "src.infrastructure.llm.http_gemini_wrapper.get_transport",
+            return_value=_mock_transport(failing_handler),
+        ), patch("src.infrastructure.llm.http_gemini_wrapper.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(ProviderNetworkError, match="Gemini API 호출 실패"):
+                asyncio.run(wrapper._acall("질문"))
+
+    def test_cancellation_propagates(self, no_cache):
+        wrapper = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+
+        async def run_and_cancel():
+            task = asyncio.create_task(wrapper._acall("질문"))
+            await asyncio.sleep(DELAY / 4)
+            task.cancel()
+            await task
+
+        with patch(
+            "src.infrastructure.llm.http_gemini_wrapper.get_transport",
+            return_value=_mock_transport(_gemini_handler),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(run_and_cancel())
+
+    def test_throttled_call_slows_shared_limiter(self, no_cache, fast_gemini_limiter):
+        responses = [
+            httpx.Response(429, text="quota"),
+            httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": "제미나이 응답"}]}}]}),
+        ]
+
+        async def handler(request):
+            return responses.pop(0)
+
+        wrapper = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+        with patch(
+            "src.infrastructure.llm.http_gemini_wrapper.get_transport",
+            return_value=_mock_transport(handler),
+        ), patch("src.infrastructure.llm.http_gemini_wrapper.asyncio.sleep", new_callable=AsyncMock):
+            assert asyncio.run(wrapper._acall("질문")) == "제미나이 응답"
+        assert fast_gemini_limiter.current_rate < 1000
+
+    def test_generation_calls_share_one_limiter_per_api_key(self):
+        first = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+        second = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+
+        assert first.rate_limiter is second.rate_limiter
+
+
+class TestHcxLangChainCompatAsync:
+    """HcxLangChainCompat 비동기 호출 테스트"""
+
+    def test_acall_returns_post_processed_text(self, no_cache, fast_limiter):
+        llm = HcxAdapter(api_key="nv-test-key", model_name="HCX-005").get_llm()
+        with patch(
+            "src.infrastructure.llm.hcx_adapter.get_transport",
+            return_value=_mock_transport(_hcx_handler),
+        ):
+            result = asyncio.run(llm._acall("질문"))
+        assert result == '{"answer": "HCX 응답"}'
+
+    def test_concurrent_calls_overlap_within_rate_limit(self, no_cache, fast_limiter):
+        adapter = HcxAdapter(api_key="nv-test-key", model_name="HCX-005")
+
+        async def run_all():
+            return await asyncio.gather(
+                *(adapter.agenerate_answer(f"질문 {i}", []) for i in range(4))
+            )
+
+        with patch(
+            "src.infrastructure.llm.hcx_adapter.get_transport",
+            return_value=_mock_transport(_hcx_handler),
+        ):
+            start = time.perf_counter()
+            results = asyncio.run(run_all())
+            elapsed = time.perf_counter() - start
+
+        assert len(results) == 4
+        assert elapsed < DELAY * 3
+
+    def test_generation_and_judge_calls_use_separate_timeouts(self, no_cache, fast_limiter):
+        timeouts = []
+
+        async def recording_handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return await _hcx_handler(request)
+
+        adapter = HcxAdapter(api_key="nv-test-key", model_name="HCX-005")
+        with patch(
+            "src.infrastructure.llm.hcx_adapter.get_transport",
+            return_value=_mock_transport(recording_handler),
+        ), patch("src.infrastructure.llm.hcx_adapter.settings.LLM_GENERATION_TIMEOUT", 90.0), \
+             patch("src.infrastructure.llm.hcx_adapter.settings.JUDGE_CALL_TIMEOUT", 15.0):
+            asyncio.run(adapter.agenerate_answer("질문", ["컨텍스트"]))
+            asyncio.run(adapter.get_llm()._acall("평가 프롬프트"))
+
+        assert timeouts == [90.0, 15.0]
+
+    def test_failed_response_is_not_cached(self, tmp_path, fast_limiter):
+        async def throttled_handler(request):
+            return httpx.Response(429, json={})
+
+        cache = LlmResponseCache(db_path=tmp_path / "cache.db")
+        adapter = HcxAdapter(api_key="nv-test-key", model_name="HCX-005")
+        with patch("src.infrastructure.llm.hcx_adapter.get_llm_cache", return_value=cache), \
+             patch(
+                 "src.infrastructure.llm.hcx_adapter.get_transport",
+                 return_value=_mock_transport(throttled_handler),
+             ):
+            with pytest.raises(ProviderRateLimitError):
+                asyncio.run(adapter.agenerate_answer("질문", []))
+
+        assert cache.get_stats()["writes"] == 0
+        assert fast_limiter.throttles == HcxAdapter.RETRY_POLICY.max_retries
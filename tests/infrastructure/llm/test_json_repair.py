@@ -0,0 +1,105 @@
+"""평가 응답 로컬 JSON 복구 테스트"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from ragas.llms import LangchainLLMWrapper
+from ragas.metrics._faithfulness import (
+    NLIStatementInput,
+    NLIStatementPrompt,
+    StatementGeneratorInput,
+    StatementGeneratorPrompt,
+)
+
+from src.infrastructure.llm.hcx_adapter import HcxAdapter
+from src.infrastructure.llm.json_repair import (
+    JsonRepairStats,
+    extract_output_schema,
+    repair_judge_output,
+    repair_json_text,
+)
+
+NLI_PROMPT = NLIStatementPrompt().to_string(NLIStatementInput(context="컨텍스트", statements=["문장"]))
+STATEMENT_PROMPT = StatementGeneratorPrompt().to_string(StatementGeneratorInput(question="질문", answer="답변"))
+VERDICT = {"statements": [{"statement": "a", "reason": "r", "verdict": 1}]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    stats = JsonRepairStats()
+    monkeypatch.setattr("src.infrastructure.llm.json_repair._stats", stats)
+    return stats
+
+
+class TestRepairJsonText:
+    """문법 복구 테스트"""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('{"a": [1, 2,],}', {"a": [1, 2]}),
+            ('설명입니다.\n```json\n{"a": "b"}\n```', {"a": "b"}),
+            ('{"a": "그는 "천재"라고 말했다"}', {"a": '그는 "천재"라고 말했다'}),
+            ("{'a': True, 'b': None}", {"a": True, "b": None}),
+            ('{진술: "줄\n바꿈"}', {"진술": "줄\n바꿈"}),
+            ('{"a": ["x", "y", "잘린', {"a": ["x", "y"]}),
+            ('{"a": 1, "b": ', {"a": 1}),
+        ],
+    )
+    def test_repairs_common_defects(self, text, expected):
+        assert repair_json_text(text) == expected
+
+    def test_returns_none_without_json(self):
+        assert repair_json_text("JSON이 아닌 응답") is None
+
+
+class TestRepairJudgeOutput:
+    """스키마 기반 복구 테스트"""
+
+    def test_extracts_schema_from_ragas_prompt(self):
+        assert extract_output_schema(NLI_PROMPT)["title"] == "NLIStatementOutput"
+        assert extract_output_schema("스키마 없는 프롬프트") is None
+
+    def test_valid_output_is_untouched(self, fresh_stats):
+        text = json.dumps(VERDICT)
+        assert repair_judge_output(text, NLI_PROMPT) == text
+        assert fresh_stats.get_stats()["valid"] == 1
+
+    def test_korean_key_and_string_verdict_are_mapped_to_schema(self, fresh_stats):
+        text = '{"진술": [{"statement": "a", "reason": "r", "verdict": "1"},]}'
+        assert json.loads(repair_judge_output(text, NLI_PROMPT)) == VERDICT
+        assert fresh_stats.get_stats()["repaired"] == 1
+
+    def test_bare_list_is_wrapped_and_truncated_item_dropped(self):
+        text = '[{"statement": "a", "reason": "r", "verdict": 1}, {"statement": "b", "rea'
+        assert json.loads(repair_judge_output(text, NLI_PROMPT)) == VERDICT
+
+    def test_wrapped_answer_from_post_processing_is_unwrapped(self):
+        wrapped = json.dumps({"answer": '{"statements": ["문장1", "문장2",'})
+        assert json.loads(repair_judge_output(wrapped, STATEMENT_PROMPT)) == {"statements": ["문장1", "문장2"]}
+
+    def test_unrepairable_output_is_left_for_ragas(self, fresh_stats):
+        assert repair_judge_output("모르겠습니다", NLI_PROMPT) == "모르겠습니다"
+        assert fresh_stats.get_stats()["unrepaired"] == 1
+
+    def test_prompt_without_schema_is_untouched(self, fresh_stats):
+        assert repair_judge_output("{'a': 1,}", "일반 답변 프롬프트") == "{'a': 1,}"
+        assert not any(fresh_stats.get_stats().values())
+
+
+def test_hcx_judge_call_avoids_ragas_reprompt(fresh_stats):
+    adapter = HcxAdapter(api_key="nv-test-key", model_name="HCX-005")
+    adapter.agenerate_answer = AsyncMock(
+        return_value='```json\n{"진술": [{"statement": "a", "reason": "r", "verdict": "yes"},]}\n```'
+    )
+    llm = LangchainLLMWrapper(adapter.get_llm())
+
+    output = asyncio.run(
+        NLIStatementPrompt().generate(llm=llm, data=NLIStatementInput(context="컨텍스트", statements=["a"]))
+    )
+
+    assert output.model_dump() == VERDICT
+    assert adapter.agenerate_answer.await_count == 1  # 형식 수정 재요청 없음
+    assert fresh_stats.get_stats()["reprompted"] == 0
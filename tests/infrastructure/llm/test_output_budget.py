@@ -0,0 +1,111 @@
+"""평가 프롬프트 출력 토큰 예산 테스트"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from ragas.metrics._answer_relevance import ResponseRelevanceInput, ResponseRelevancePrompt
+from ragas.metrics._context_precision import ContextPrecisionPrompt, QAC
+from ragas.metrics._faithfulness import (
+    NLIStatementInput,
+    NLIStatementPrompt,
+    StatementGeneratorInput,
+    StatementGeneratorPrompt,
+)
+
+from src.infrastructure.cache.llm_response_cache import LlmResponseCache
+from src.infrastructure.llm.hcx_adapter import HcxAdapter
+from src.infrastructure.llm.http_gemini_wrapper import HttpGeminiWrapper
+from src.infrastructure.llm.output_budget import OutputBudgetStats, resolve_output_budget
+from src.infrastructure.network.rate_limiter import AdaptiveRateLimiter
+from src.infrastructure.network.transport import HttpTransport
+
+NLI_PROMPT = NLIStatementPrompt().to_string(NLIStatementInput(context="컨텍스트", statements=["문장"]))
+STATEMENT_PROMPT = StatementGeneratorPrompt().to_string(StatementGeneratorInput(question="질문", answer="답변"))
+QUESTION_PROMPT = ResponseRelevancePrompt().to_string(ResponseRelevanceInput(response="답변"))
+PRECISION_PROMPT = ContextPrecisionPrompt().to_string(QAC(question="질문", context="컨텍스트", answer="답변"))
+
+
+@pytest.fixture
+def stats():
+    stats = OutputBudgetStats()
+    with patch("src.infrastructure.llm.output_budget._stats", stats):
+        yield stats
+
+
+@pytest.fixture
+def no_cache():
+    cache = LlmResponseCache(mode="off")
+    with patch("src.infrastructure.llm.http_gemini_wrapper.get_llm_cache", return_value=cache), \
+         patch("src.infrastructure.llm.hcx_adapter.get_llm_cache", return_value=cache):
+        yield cache
+
+
+class TestResolveOutputBudget:
+    """출력 스키마 기반 예산 결정 테스트"""
+
+    def test_scalar_schemas_get_short_budget(self):
+        assert resolve_output_budget(QUESTION_PROMPT, 4096).max_tokens == 512
+        assert resolve_output_budget(PRECISION_PROMPT, 4096).name == "Verification"
+        assert resolve_output_budget(PRECISION_PROMPT, 4096).max_tokens == 512
+
+    def test_list_schemas_get_longer_budget(self):
+        assert resolve_output_budget(STATEMENT_PROMPT, 4096).max_tokens == 1536
+        assert resolve_output_budget(NLI_PROMPT, 4096).max_tokens == 2048
+
+    def test_budget_never_exceeds_adapter_ceiling(self):
+        assert resolve_output_budget(NLI_PROMPT, 1024).max_tokens == 1024
+
+    def test_prompt_without_schema_uses_adapter_default(self):
+        assert resolve_output_budget("질문에 답변하세요.", 4096) is None
+
+    def test_config_overrides_budget(self):
+        with patch("src.config.settings.JUDGE_OUTPUT_TOKEN_BUDGETS", {"Verification": 128}):
+            assert resolve_output_budget(PRECISION_PROMPT, 4096).max_tokens == 128
+
+
+def test_hcx_judge_call_sends_budget_and_records_truncation(stats, no_cache):
+    bodies = []
+
+    async def handler(request):
+        bodies.append(json.loads(request.content))
+        finish = "length" if len(bodies) == 1 else "stop"
+        return httpx.Response(
+            200, json={"result": {"message": {"content": '{"statements": ["a"]}'}, "finishReason": finish}}
+        )
+
+    limiter = AdaptiveRateLimiter(initial_rate=1000, max_rate=1000, burst=100)
+    with patch("src.infrastructure.llm.hcx_adapter.get_rate_limiter", return_value=limiter), \
+         patch("src.infrastructure.llm.hcx_adapter.get_transport",
+               return_value=HttpTransport(async_transport=httpx.MockTransport(handler))):
+        llm = HcxAdapter(api_key="nv-test-key", model_name="HCX-005").get_llm()
+        asyncio.run(llm._acall(STATEMENT_PROMPT))
+        asyncio.run(llm._acall(STATEMENT_PROMPT + " "))
+        asyncio.run(llm._acall("일반 질문"))
+
+    assert [body["maxTokens"] for body in bodies] == [1536, 1536, 4096]
+    assert stats.get_stats() == {
+        "StatementGeneratorOutput": {"calls": 2, "truncated": 1, "max_tokens": 1536, "truncation_rate": 0.5}
+    }
+
+
+def test_gemini_judge_call_sends_budget(stats, no_cache):
+    bodies = []
+
+    async def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={"candidates": [{"content": {"parts": [{"text": '{"question": "q", "noncommittal": 0}'}]},
+                                  "finishReason": "MAX_TOKENS"}]},
+        )
+
+    wrapper = HttpGeminiWrapper(api_key="fake-key", model_name="gemini-test")
+    with patch("src.infrastructure.llm.http_gemini_wrapper.get_transport",
+               return_value=HttpTransport(async_transport=httpx.MockTransport(handler))):
+        asyncio.run(wrapper._acall(QUESTION_PROMPT))
+
+    assert bodies[0]["generationConfig"]["maxOutputTokens"] == 512
+    assert stats.get_stats()["ResponseRelevanceOutput"]["truncated"] == 1
@@ -0,0 +1,108 @@
+"""시뮬레이션 LLM/임베딩 프로바이더 테스트"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+from ragas.metrics._answer_relevance import ResponseRelevanceInput, ResponseRelevancePrompt
+from ragas.metrics._faithfulness import (
+    NLIStatementInput,
+    NLIStatementPrompt,
+    StatementGeneratorInput,
+    StatementGeneratorPrompt,
+)
+
+from src.container.configuration_container import ConfigurationContainer
+from src.container.providers.embedding_provider_factory import EmbeddingProviderFactory
+from src.container.providers.llm_provider_factory import LlmProviderFactory
+from src.domain.exceptions import ProviderNetworkError, ProviderRateLimitError
+from src.infrastructure.embedding.simulated_adapter import SimulatedEmbeddingAdapter
+from src.infrastructure.llm.simulated_adapter import (
+    SimulatedCalls,
+    SimulatedLlmAdapter,
+    SimulationProfile,
+)
+from src.infrastructure.network import RetryPolicy
+
+FAST = SimulationProfile(latency_ms=0.0, latency_sigma=0.0)
+
+PROMPTS = [
+    (NLIStatementPrompt(), NLIStatementInput(context="서울은 수도이다. 한강이 흐른다.", statements=["서울은 수도이다."])),
+    (StatementGeneratorPrompt(), StatementGeneratorInput(question="수도는?", answer="서울이다. 크다.")),
+    (ResponseRelevancePrompt(), ResponseRelevanceInput(response="서울은 한국의 수도이다.")),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(SimulatedCalls, "RETRY_POLICY", RetryPolicy(max_retries=3, base_delay=0.0))
+
+
+class TestSimulatedLlm:
+    """시뮬레이션 LLM 테스트"""
+
+    @pytest.mark.parametrize("prompt, data", PROMPTS)
+    def test_judge_output_validates_against_ragas_schema(self, prompt, data):
+        llm = SimulatedLlmAdapter(profile=FAST).get_llm()
+
+        output = llm.invoke(prompt.to_string(data))
+
+        prompt.output_model.model_validate(json.loads(output))
+
+    def test_output_is_deterministic_per_seed_and_prompt(self):
+        text = NLIStatementPrompt().to_string(PROMPTS[0][1])
+        first = SimulatedLlmAdapter(profile=FAST).respond(text)
+
+        assert SimulatedLlmAdapter(profile=FAST).respond(text) == first
+
+    def test_answer_uses_context_sentences(self):
+        answer = SimulatedLlmAdapter(profile=FAST).generate_answer("수도는?", ["서울은 수도이다. 한강이 흐른다."])
+
+        assert answer in {"서울은 수도이다. 한강이 흐른다.", "한강이 흐른다. 서울은 수도이다."}
+
+    def test_injected_rate_limits_are_retried_then_raised(self):
+        adapter = SimulatedLlmAdapter(profile=SimulationProfile(latency_ms=0.0, rate_limit_rate=1.0))
+
+        with pytest.raises(ProviderRateLimitError):
+            adapter.generate_answer("질문", ["컨텍스트"])
+        assert adapter.simulator.get_stats()["injected_rate_limits"] == SimulatedCalls.RETRY_POLICY.max_retries
+
+    def test_injected_timeout_waits_before_failing(self):
+        profile = SimulationProfile(latency_ms=0.0, timeout_rate=1.0, timeout_seconds=0.01)
+        llm = SimulatedLlmAdapter(profile=profile).get_llm()
+
+        with pytest.raises(ProviderNetworkError):
+            asyncio.run(llm.ainvoke("질문"))
+
+    def test_factories_create_simulated_providers(self):
+        configuration = ConfigurationContainer()
+
+        llm = LlmProviderFactory(configuration).create_provider("simulated")
+        embeddings = EmbeddingProviderFactory(configuration).create_provider("simulated")
+
+        assert isinstance(llm, SimulatedLlmAdapter)
+        assert isinstance(embeddings.embeddings.embeddings, SimulatedEmbeddingAdapter)
+
+
+class TestSimulatedEmbeddings:
+    """시뮬레이션 임베딩 테스트"""
+
+    def test_vectors_are_deterministic_unit_vectors(self):
+        embeddings = SimulatedEmbeddingAdapter(dimension=16, profile=FAST)
+
+        first, second, other = embeddings.embed_documents(["가", "가", "나"])
+
+        assert len(first) == 16
+        assert first == second != other
+        assert np.linalg.norm(first) == pytest.approx(1.0)
+        assert asyncio.run(embeddings.aembed_query("가")) == first
+
+    def test_similar_texts_have_higher_non_negative_cosine(self):
+        embeddings = SimulatedEmbeddingAdapter(dimension=256, profile=FAST)
+
+        question, similar, unrelated = np.array(
+            embeddings.embed_documents(["서울은 한국의 수도인가요?", "한국의 수도는 서울인가요?", "turbine output"])
+        )
+
+        assert question @ similar > question @ unrelated >= 0
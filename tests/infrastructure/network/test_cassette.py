@@ -0,0 +1,118 @@
+"""요청/응답 카세트 전송 계층 테스트"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from src.infrastructure.network import (
+    Cassette,
+    CassetteMissError,
+    CassetteTransport,
+    configure_cassette,
+    current_cassette_config,
+    get_transport,
+    set_transport,
+)
+
+URL = "https://generativelanguage.googleapis.com/v1beta/models/m:generateContent?key=SECRET"
+
+
+def _counting_transport():
+    """요청마다 호출 순번을 응답하는 httpx 모의 전송 객체"""
+    calls = []
+
+    def handler(request):
+        calls.append(json.loads(request.content))
+        return httpx.Response(200, json={"call": len(calls)})
+
+    return httpx.MockTransport(handler), calls
+
+
+def _record(path, bodies):
+    mock, calls = _counting_transport()
+    transport = CassetteTransport(Cassette(path), mode="record", async_transport=mock)
+
+    async def run():
+        for body in bodies:
+            await transport.apost(URL, json=body)
+        await transport.aclose()
+
+    asyncio.run(run())
+    return transport, calls
+
+
+class TestCassetteTransport:
+    """카세트 기록/재생 테스트"""
+
+    def test_record_writes_interactions_without_api_key(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        transport, calls = _record(path, [{"prompt": "a"}, {"prompt": "b"}])
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert len(calls) == 2
+        assert transport.cassette.recorded == 2
+        assert [line["request"] for line in lines] == [{"prompt": "a"}, {"prompt": "b"}]
+        assert "SECRET" not in path.read_text(encoding="utf-8")
+        assert all(line["latency"] >= 0 for line in lines)
+
+    def test_replay_serves_recorded_responses_in_order(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        _record(path, [{"prompt": "a"}, {"prompt": "a"}, {"prompt": "b"}])
+        replay = CassetteTransport(Cassette(path), mode="replay", latency_scale=0)
+
+        # 다른 API 키로 보내도 같은 요청으로 식별
+        other_key_url = URL.replace("SECRET", "OTHER")
+        sync_results = [replay.post(other_key_url, json={"prompt": "a"}).json()["call"] for _ in range(3)]
+        assert sync_results == [1, 2, 2]
+
+        async def run():
+            response = await replay.apost(URL, json={"prompt": "b"})
+            return response.status_code, response.json()
+
+        assert asyncio.run(run()) == (200, {"call": 3})
+        assert replay.cassette.replayed == 4
+
+    def test_replay_miss_raises(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        _record(path, [{"prompt": "a"}])
+        replay = CassetteTransport(Cassette(path), mode="replay", latency_scale=0)
+
+        with pytest.raises(CassetteMissError):
+            replay.post(URL, json={"prompt": "없는 요청"})
+        assert replay.cassette.misses == 1
+
+    def test_replay_simulates_scaled_latency(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        path.write_text(
+            json.dumps({
+                "key": Cassette.make_key(URL, {"prompt": "a"}), "url": URL, "request": {"prompt": "a"},
+                "status_code": 200, "headers": {"Content-Type": "application/json"}, "body": "{}", "latency": 0.2,
+            }) + "\n",
+            encoding="utf-8",
+        )
+        replay = CassetteTransport(Cassette(path), mode="replay", latency_scale=0.5)
+
+        start = time.perf_counter()
+        replay.post(URL, json={"prompt": "a"})
+        assert 0.09 <= time.perf_counter() - start < 0.5
+        assert replay.hedge_percentile is None
+
+    def test_configure_cassette_replaces_global_transport(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        _record(path, [{"prompt": "a"}])
+        try:
+            transport = configure_cassette("replay", path, latency_scale=0)
+            assert get_transport() is transport
+            assert current_cassette_config() == ("replay", str(path), 0.0)
+
+            configure_cassette("off", path)
+            assert current_cassette_config() is None
+        finally:
+            set_transport(None)
+
+    def test_replay_requires_existing_cassette(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            CassetteTransport(Cassette(tmp_path / "missing.jsonl"), mode="replay")
@@ -0,0 +1,209 @@
+"""실행 마감 시간과 중복(hedged) 요청 테스트"""
+
+import asyncio
+import contextvars
+import threading
+
+import httpx
+import pytest
+
+from src.config import Settings
+from src.infrastructure.network.deadline import (
+    DeadlineExceeded,
+    clamp_timeout,
+    deadline_expired,
+    hedged,
+    remaining_time,
+    run_deadline_scope,
+    set_run_deadline,
+)
+from src.infrastructure.network.rate_limiter import AdaptiveRateLimiter
+from src.infrastructure.network.transport import HEDGE_EMBEDDING, HEDGE_LLM, HttpTransport
+
+
+@pytest.fixture(autouse=True)
+def reset_deadline():
+    set_run_deadline(None)
+    yield
+    set_run_deadline(None)
+
+
+class TestRunDeadline:
+    """전체 실행 마감 시간 테스트"""
+
+    def test_no_deadline_keeps_timeout(self):
+        assert remaining_time() is None
+        assert clamp_timeout(60) == 60
+        assert not deadline_expired()
+
+    def test_timeout_is_clamped_to_remaining_time(self):
+        set_run_deadline(5)
+        assert 0 < clamp_timeout(60) <= 5
+        assert clamp_timeout(1) == 1
+
+    def test_expired_deadline_raises(self):
+        set_run_deadline(0)
+        assert deadline_expired()
+        with pytest.raises(DeadlineExceeded):
+            clamp_timeout(60)
+
+    def test_transport_rejects_requests_after_deadline(self):
+        set_run_deadline(0)
+        with pytest.raises(DeadlineExceeded):
+            HttpTransport().post("http://127.0.0.1:1/api", json={})
+
+    def test_scope_restores_previous_deadline(self):
+        with run_deadline_scope(5):
+            assert remaining_time() <= 5
+        assert remaining_time() is None
+
+    def test_deadline_is_scoped_per_run(self):
+        async def run(seconds):
+            with run_deadline_scope(seconds):
+                await asyncio.sleep(0.01)
+                return deadline_expired()
+
+        async def both():
+            return await asyncio.gather(run(0), run(60))
+
+        # 한 실행의 마감 시간이 동시에 진행 중인 다른 실행에 영향을 주지 않음
+        assert asyncio.run(both()) == [True, False]
+        assert remaining_time() is None
+
+    def test_deadline_reaches_threads_started_with_copied_context(self):
+        seen = []
+
+        def record():
+            seen.append(deadline_expired())
+
+        with run_deadline_scope(0):
+            for target, args in ((contextvars.copy_context().run, (record,)), (record, ())):
+                thread = threading.Thread(target=target, args=args)
+                thread.start()
+                thread.join()
+
+        assert seen == [True, False]
+
+
+class TestHedged:
+    """중복 요청 테스트"""
+
+    def test_fast_call_is_not_hedged(self):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "ok"
+
+        assert asyncio.run(hedged(call, hedge_after=1.0)) == "ok"
+        assert len(calls) == 1
+
+    def test_slow_call_is_hedged_and_straggler_cancelled(self):
+        delays = [5.0, 0.01]
+        cancelled = []
+        hedges = []
+
+        async def call():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        async def run():
+            result = await hedged(call, hedge_after=0.05, on_hedge=lambda: hedges.append(1))
+            await asyncio.sleep(0)  # 취소가 전달될 시간
+            return result
+
+        assert asyncio.run(run()) == 0.01
+        assert hedges == [1]
+        assert cancelled == [5.0]
+
+    def test_failed_duplicate_waits_for_primary(self):
+        results = [("sleep", 0.1), ("fail", 0.0)]
+
+        async def call():
+            kind, delay = results.pop(0)
+            await asyncio.sleep(delay)
+            if kind == "fail":
+                raise RuntimeError("중복 요청 실패")
+            return "primary"
+
+        assert asyncio.run(hedged(call, hedge_after=0.01)) == "primary"
+
+    def test_transport_hedges_slow_requests_after_enough_samples(self):
+        slow_next = []
+
+        async def handler(request):
+            if slow_next:
+                slow_next.pop()
+                await asyncio.sleep(2.0)
+            else:
+                await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        transport = HttpTransport(
+            async_transport=httpx.MockTransport(handler), hedge_percentile=0.9, hedge_min_samples=5
+        )
+
+        async def run():
+            for _ in range(5):
+                await transport.apost("https://judge.example.com/x", json={}, hedge=HEDGE_LLM)
+            slow_next.append(True)
+            await asyncio.wait_for(
+                transport.apost("https://judge.example.com/x", json={}, hedge=HEDGE_LLM), timeout=1.0
+            )
+            await transport.aclose()
+
+        asyncio.run(run())
+        assert transport.metrics.get_stats()["judge.example.com"]["hedged"] == 1
+
+    def test_hedged_request_takes_its_own_limiter_token(self):
+        class CountingLimiter(AdaptiveRateLimiter):
+            acquired = 0
+
+            async def aacquire(self):
+                self.acquired += 1
+
+        slow_next = []
+
+        async def handler(request):
+            if slow_next:
+                slow_next.pop()
+                await asyncio.sleep(2.0)
+            else:
+                await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        transport = HttpTransport(
+            async_transport=httpx.MockTransport(handler), hedge_percentile=0.9, hedge_min_samples=5
+        )
+        limiter = CountingLimiter(initial_rate=1000, max_rate=1000, burst=100)
+
+        async def run():
+            for _ in range(5):
+                await transport.apost("https://judge.example.com/x", json={}, hedge=HEDGE_LLM, limiter=limiter)
+            assert limiter.acquired == 0
+            slow_next.append(True)
+            await asyncio.wait_for(
+                transport.apost("https://judge.example.com/x", json={}, hedge=HEDGE_LLM, limiter=limiter),
+                timeout=1.0,
+            )
+            await transport.aclose()
+
+        asyncio.run(run())
+        assert limiter.acquired == 1
+
+    def test_hedge_percentile_is_chosen_per_request_kind(self):
+        transport = HttpTransport(hedge_percentile=None, embedding_hedge_percentile=0.95, hedge_min_samples=1)
+        transport.metrics.record("api.example.com", 0.5, 200)
+
+        assert transport.hedge_delay("api.example.com", HEDGE_LLM) is None
+        assert transport.hedge_delay("api.example.com", HEDGE_EMBEDDING) == 0.5
+
+    def test_hedging_is_opt_in_for_every_request_kind(self):
+        # 중복 요청은 과금되고 속도 제한 토큰도 쓰므로 LLM과 임베딩 모두 기본값은 꺼짐
+        assert Settings.model_fields["JUDGE_HEDGE_PERCENTILE"].default is None
+        assert Settings.model_fields["EMBEDDING_HEDGE_PERCENTILE"].default is None
@@ -0,0 +1,215 @@
+"""적응형 속도 제한기 테스트"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.network.rate_limiter import (
+    AdaptiveRateLimiter,
+    SharedRateLimiter,
+    get_rate_limiter,
+    set_rate_limit_share,
+    set_rate_limiter,
+)
+
+
+def _acquire_shared(db_path, count):
+    """다른 프로세스에서 공유 제한기 토큰 획득"""
+    limiter = SharedRateLimiter(key="hcx.chat:test", db_path=db_path, initial_rate=20.0, max_rate=20.0)
+    for _ in range(count):
+        limiter.acquire()
+
+
+class TestAdaptiveRateLimiterAimd:
+    """AIMD 속도 조절 테스트"""
+
+    def test_success_increases_rate_additively_up_to_max(self):
+        limiter = AdaptiveRateLimiter(initial_rate=1.0, max_rate=1.25, increase_step=0.1)
+        limiter.on_success()
+        assert limiter.current_rate == pytest.approx(1.1)
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.current_rate == pytest.approx(1.25)
+
+    def test_throttle_decreases_rate_multiplicatively_down_to_min(self):
+        limiter = AdaptiveRateLimiter(initial_rate=4.0, min_rate=0.5, decrease_factor=0.5)
+        limiter.on_throttle()
+        assert limiter.current_rate == pytest.approx(2.0)
+
+        limiter._last_decrease = 0.0
+        limiter.on_throttle()
+        limiter._last_decrease = 0.0
+        limiter.on_throttle()
+        limiter._last_decrease = 0.0
+        limiter.on_throttle()
+        assert limiter.current_rate == pytest.approx(0.5)
+
+    def test_burst_of_throttles_decreases_once(self):
+        limiter = AdaptiveRateLimiter(initial_rate=2.0, decrease_factor=0.5)
+        for _ in range(5):
+            limiter.on_throttle()
+        assert limiter.current_rate == pytest.approx(1.0)
+        assert limiter.throttles == 5
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"min_rate": 0}, {"min_rate": 5, "max_rate": 1}, {"decrease_factor": 1.0}]
+    )
+    def test_invalid_configuration_raises(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(**kwargs)
+
+
+class TestAdaptiveRateLimiterPacing:
+    """토큰 버킷 대기 테스트"""
+
+    def test_acquire_paces_requests_after_burst(self):
+        limiter = AdaptiveRateLimiter(initial_rate=20.0, max_rate=20.0, burst=2)
+        start = time.perf_counter()
+        for _ in range(4):
+            limiter.acquire()
+        elapsed = time.perf_counter() - start
+        # 버스트 2건은 즉시, 나머지 2건은 0.05초 간격
+        assert 0.08 <= elapsed < 0.5
+
+    def test_aacquire_reports_queue_depth(self):
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, max_rate=10.0, burst=1)
+
+        async def run():
+            tasks = [asyncio.create_task(limiter.aacquire()) for _ in range(4)]
+            await asyncio.sleep(0.01)
+            depth = limiter.queue_depth
+            await asyncio.gather(*tasks)
+            return depth
+
+        assert asyncio.run(run()) == 3
+        assert limiter.queue_depth == 0
+
+
+class TestSharedRateLimiter:
+    """프로세스 간 공유 속도 제한기 테스트"""
+
+    def test_instances_share_aimd_state(self, tmp_path):
+        db_path = tmp_path / "rate_limits.db"
+        first = SharedRateLimiter(key="k", db_path=db_path, initial_rate=4.0)
+        second = SharedRateLimiter(key="k", db_path=db_path, initial_rate=4.0)
+
+        first.on_throttle()
+        second.acquire()
+        assert second.current_rate == pytest.approx(2.0)
+
+        second.on_success()
+        first.acquire()
+        assert first.current_rate == pytest.approx(2.1)
+
+    def test_different_keys_are_independent(self, tmp_path):
+        db_path = tmp_path / "rate_limits.db"
+        first = SharedRateLimiter(key="a", db_path=db_path, initial_rate=4.0)
+        second = SharedRateLimiter(key="b", db_path=db_path, initial_rate=4.0)
+
+        first.on_throttle()
+        second.acquire()
+        assert second.current_rate == pytest.approx(4.0)
+
+    def test_reservations_are_spaced_across_instances(self, tmp_path):
+        db_path = tmp_path / "rate_limits.db"
+        first = SharedRateLimiter(key="k", db_path=db_path, initial_rate=10.0, max_rate=10.0)
+        second = SharedRateLimiter(key="k", db_path=db_path, initial_rate=10.0, max_rate=10.0)
+
+        assert first._reserve() == 0.0
+        assert second._reserve() == pytest.approx(0.1, abs=0.02)
+        assert first._reserve() == pytest.approx(0.2, abs=0.02)
+        assert second.queue_depth >= 2
+
+    def test_async_ledger_updates_run_off_event_loop(self, tmp_path):
+        limiter = SharedRateLimiter(key="k", db_path=tmp_path / "rate_limits.db", initial_rate=4.0)
+        threads = []
+        transaction = limiter._transaction
+
+        def recording_transaction():
+            threads.append(threading.get_ident())
+            return transaction()
+
+        async def run():
+            await limiter.aacquire()
+            await limiter.aon_throttle()
+            await limiter.aon_success()
+            return threading.get_ident()
+
+        with patch.object(limiter, "_transaction", recording_transaction):
+            loop_thread = asyncio.run(run())
+
+        assert len(threads) == 3
+        assert loop_thread not in threads
+        assert limiter.current_rate == pytest.approx(2.1)
+
+    def test_aggregate_rate_across_processes(self, tmp_path):
+        db_path = tmp_path / "rate_limits.db"
+        ctx = multiprocessing.get_context("fork")
+        start = time.perf_counter()
+        workers = [ctx.Process(target=_acquire_shared, args=(db_path, 3)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=10)
+        elapsed = time.perf_counter() - start
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        # 6건을 20 req/s로 나누어 보내면 최소 5 간격(0.25초)이 필요
+        assert elapsed >= 0.24
+
+
+class TestRateLimiterRegistry:
+    """프로바이더/엔드포인트별 레지스트리 테스트"""
+
+    def test_same_endpoint_shares_limiter(self):
+        set_rate_limiter("test_provider", "chat", None)
+        try:
+            assert get_rate_limiter("test_provider", "chat") is get_rate_limiter("test_provider", "chat")
+            assert get_rate_limiter("test_provider", "chat") is not get_rate_limiter("test_provider", "embedding")
+        finally:
+            set_rate_limiter("test_provider", "chat", None)
+            set_rate_limiter("test_provider", "embedding", None)
+
+    def test_settings_override_per_provider_and_endpoint(self):
+        overrides = {
+            "test_provider": {"max_rate": 7.0},
+            "test_provider.chat": {"initial_rate": 3.0},
+        }
+        set_rate_limiter("test_provider", "chat", None)
+        with patch("src.config.settings.RATE_LIMITS", overrides):
+            limiter = get_rate_limiter("test_provider", "chat")
+        set_rate_limiter("test_provider", "chat", None)
+
+        assert limiter.max_rate == 7.0
+        assert limiter.current_rate == 3.0
+
+    def test_rate_share_scales_local_limiter_budget(self):
+        overrides = {"test_provider.chat": {"initial_rate": 4.0, "min_rate": 0.4, "max_rate": 8.0}}
+        set_rate_limiter("test_provider", "chat", None)
+        try:
+            with patch("src.config.settings.RATE_LIMITS", overrides):
+                set_rate_limit_share(0.25)
+                limiter = get_rate_limiter("test_provider", "chat")
+        finally:
+            set_rate_limit_share(1.0)
+            set_rate_limiter("test_provider", "chat", None)
+
+        assert limiter.current_rate == pytest.approx(1.0)
+        assert limiter.min_rate == pytest.approx(0.1)
+        assert limiter.max_rate == pytest.approx(2.0)
+
+    def test_shared_backend_keys_limiter_by_api_key(self, tmp_path):
+        with patch("src.config.settings.RATE_LIMIT_BACKEND", "shared"), \
+             patch("src.infrastructure.network.rate_limiter.RATE_LIMIT_DB_PATH", tmp_path / "rl.db"):
+            first = get_rate_limiter("test_provider", "chat", api_key="nv-key-1")
+            second = get_rate_limiter("test_provider", "chat", api_key="nv-key-2")
+        set_rate_limiter("test_provider", "chat", None, api_key="nv-key-1")
+        set_rate_limiter("test_provider", "chat", None, api_key="nv-key-2")
+
+        assert isinstance(first, SharedRateLimiter)
+        assert first is not second
+        assert "nv-key-1" not in first.key
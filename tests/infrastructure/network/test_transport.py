@@ -0,0 +1,159 @@
+"""공유 HTTP 전송 계층 테스트"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.infrastructure.network.transport import HttpTransport, RetryPolicy
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """요청한 클라이언트 포트를 기록하는 HTTP/1.1 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    client_ports: list = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        _EchoHandler.client_ports.append(self.client_address[1])
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """로컬 HTTP 서버 실행"""
+    _EchoHandler.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestRetryPolicy:
+    """재시도 정책 테스트"""
+
+    def test_exponential_delay_is_capped(self):
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=5.0)
+        assert [policy.delay(i) for i in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_is_added_within_bounds(self):
+        policy = RetryPolicy(base_delay=1.0, multiplier=1.0, jitter=0.5)
+        assert all(1.0 <= policy.delay(0) <= 1.5 for _ in range(20))
+
+    def test_is_last(self):
+        policy = RetryPolicy(max_retries=3)
+        assert not policy.is_last(1)
+        assert policy.is_last(2)
+
+
+class TestHttpTransportSync:
+    """동기 연결 풀 테스트"""
+
+    def test_requests_to_same_host_reuse_connection(self, local_server):
+        transport = HttpTransport()
+        for _ in range(5):
+            response = transport.post(f"{local_server}/api", json={"text": "질문"})
+            assert response.json() == {"ok": True}
+        transport.close()
+
+        assert len(_EchoHandler.client_ports) == 5
+        assert len(set(_EchoHandler.client_ports)) == 1
+
+    def test_pool_size_is_configured_per_host(self):
+        transport = HttpTransport(pool_sizes={"a.example.com": 25}, default_pool_size=4)
+        session = transport._get_session("a.example.com")
+
+        assert transport._get_session("a.example.com") is session
+        assert session.get_adapter("https://a.example.com")._pool_maxsize == 25
+        assert transport.pool_size_for("b.example.com") == 4
+
+    def test_metrics_record_latency_and_errors(self, local_server):
+        transport = HttpTransport()
+        transport.post(f"{local_server}/api", json={})
+        with pytest.raises(Exception):
+            transport.post("http://127.0.0.1:1/api", json={}, timeout=1)
+
+        stats = transport.metrics.get_stats()
+        host = local_server.split("//")[1]
+        assert stats[host]["requests"] == 1
+        assert stats[host]["status_counts"] == {200: 1}
+        assert stats[host]["p95_ms"] > 0
+        assert stats["127.0.0.1:1"]["errors"] == 1
+
+
+class TestHttpTransportAsync:
+    """비동기 연결 풀 테스트"""
+
+    def test_apost_reuses_client_per_loop_and_host(self):
+        async def handler(request):
+            return httpx.Response(200, json={"host": request.url.host})
+
+        transport = HttpTransport(async_transport=httpx.MockTransport(handler))
+
+        async def run():
+            first = await transport.apost("https://a.example.com/x", json={})
+            client = transport._get_async_client("a.example.com")
+            await transport.apost("https://a.example.com/y", json={})
+            assert transport._get_async_client("a.example.com") is client
+            assert transport._get_async_client("b.example.com") is not client
+            await transport.aclose()
+            return first.json()
+
+        assert asyncio.run(run()) == {"host": "a.example.com"}
+        assert transport.metrics.get_stats()["a.example.com"]["requests"] == 2
+
+    def _recording_run(self, transport, clients):
+        async def run():
+            await transport.apost("https://a.example.com/x", json={})
+            clients.append(transport._get_async_client("a.example.com"))
+
+        return run
+
+    def test_second_run_leaves_no_open_client(self):
+        async def handler(request):
+            return httpx.Response(200, json={})
+
+        transport = HttpTransport(async_transport=httpx.MockTransport(handler))
+        clients = []
+        run = self._recording_run(transport, clients)
+
+        # 평가 실행(RagasEvalAdapter.evaluate)이 끝날 때마다 호출하는 정리
+        for _ in range(2):
+            asyncio.run(run())
+            transport.close_async_clients()
+
+        assert all(client.is_closed for client in clients)
+        assert len(transport._async_clients) == 0
+
+    def test_loop_shutdown_closes_its_clients(self):
+        if getattr(asyncio, "_nest_patched", False):
+            pytest.skip("nest_asyncio가 적용된 루프는 종료 시 비동기 제너레이터를 정리하지 않음")
+
+        async def handler(request):
+            return httpx.Response(200, json={})
+
+        transport = HttpTransport(async_transport=httpx.MockTransport(handler))
+        clients = []
+        run = self._recording_run(transport, clients)
+
+        for _ in range(2):
+            with asyncio.Runner() as runner:
+                runner.run(run())
+            assert clients[-1].is_closed
+
+        # 두 번째 실행은 새 클라이언트를 만들고, 끝난 루프의 클라이언트는 남지 않음
+        assert clients[0] is not clients[1]
+        assert len(transport._async_clients) == 0